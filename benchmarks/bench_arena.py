@@ -0,0 +1,113 @@
+"""
+Flat AST benchmark: the nodes.py object tree vs an Arena (src/utils/arena.py)
+of the same generated program, for
+
+- memory: tracemalloc total of building each (the arena's column arrays
+  and shared values; the tree's nodes and lists),
+- GC pause: a full gc.collect() with only that representation alive,
+- traversal: counting identifiers (walk() vs the kind column), collecting
+  called function names (walk() vs the IDs of FuncCall nodes), and a
+  BaseVisitor over the tree vs over arena cursors.
+
+Usage:
+    python -m benchmarks.bench_arena [size_in_kb ...]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from src.utils.arena import Arena
+from src.utils.nodes import FuncCall, Identifier
+from src.utils.visitor import BaseVisitor, walk
+from tests.utils import ASTGenerator
+
+
+class Counter(BaseVisitor):
+    def __init__(self):
+        self.count = 0
+
+    def visit_identifier(self, node, o=None):
+        self.count += 1
+
+
+def built_mb(fn):
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, current / 1e6
+
+
+def gc_pause() -> float:
+    def collect():
+        start = time.perf_counter()
+        gc.collect()
+        return time.perf_counter() - start
+
+    return min(collect() for _ in range(3))
+
+
+def tree_passes(tree):
+    return (
+        lambda: sum(1 for n in walk(tree) if type(n) is Identifier),
+        lambda: [n.name for n in walk(tree) if type(n) is FuncCall],
+        lambda: visit(tree),
+    )
+
+
+def arena_passes(arena):
+    return (
+        lambda: len(arena.ids_of(Identifier)),
+        lambda: [arena.values[arena.literal[i]] for i in arena.ids_of(FuncCall)],
+        lambda: visit(arena.node()),
+    )
+
+
+def visit(root):
+    counter = Counter()
+    counter.visit(root)
+    return counter.count
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [256, 2048]
+    rows = []
+    for size_kb in sizes_kb:
+        parsed = ASTGenerator(generate_program_of_size(size_kb * 1024), backend="descent").generate()
+        arena, arena_mb = built_mb(lambda: Arena.from_tree(parsed))
+        del parsed
+        tree, tree_mb = built_mb(lambda: arena.to_tree())
+        tree_times = [best_of(p) for p in tree_passes(tree)]
+        tree_gc = gc_pause()
+        arena_times = [best_of(p) for p in arena_passes(arena)]
+        assert [r for _, r in arena_times] == [r for _, r in tree_times]
+        del tree
+        arena_gc = gc_pause()
+        for name, mb, pause, times in (
+            ("object tree", tree_mb, tree_gc, tree_times),
+            ("arena", arena_mb, arena_gc, arena_times),
+        ):
+            rows.append(
+                (
+                    f"{size_kb} KB",
+                    name,
+                    len(arena),
+                    f"{mb:.1f}",
+                    f"{pause * 1000:.1f}",
+                    *(f"{seconds:.3f}" for seconds, _ in times),
+                )
+            )
+    report(
+        "Object tree vs arena (seconds unless noted)",
+        rows,
+        ("input", "AST", "nodes", "MB", "gc ms", "count ids", "call names", "visitor"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
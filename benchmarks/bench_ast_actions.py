@@ -0,0 +1,100 @@
+"""
+Parse-tree-free AST construction benchmark: TyCParser with the
+ASTGeneration visitor vs TyCASTParser, which builds the same nodes in
+grammar actions with buildParseTrees off.
+
+Both parse the same pre-lexed tokens with warm prediction DFAs. Peak memory
+is the tracemalloc peak of a separate run that keeps its result alive, so it
+includes the parse tree for the visitor route.
+
+Usage:
+    python -m benchmarks.bench_ast_actions [size_in_kb ...]
+"""
+
+import sys
+import tracemalloc
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from antlr4 import CommonTokenStream, InputStream, Token
+from antlr4.ListTokenSource import ListTokenSource
+from build.TyCASTParser import TyCASTParser
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.error_listener import NewErrorListener
+
+
+def lex_all(source: str):
+    lexer = TyCLexer(InputStream(source))
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        tokens.append(token)
+        if token.type == Token.EOF:
+            return tokens
+
+
+def parse(parser_class, tokens):
+    parser = parser_class(CommonTokenStream(ListTokenSource(tokens)))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser.program()
+
+
+def visitor_ast(tokens):
+    tree = parse(TyCParser, tokens)
+    return tree, ASTGeneration().visit(tree)
+
+
+def actions_ast(tokens):
+    return parse(TyCASTParser, tokens).node
+
+
+def peak_mb(fn) -> float:
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak / 1e6
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [64, 512]
+    rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        tokens = lex_all(source)
+        visitor_ast(tokens)  # warm the prediction DFAs
+        actions_ast(tokens)
+        visitor_time, (_, expected) = best_of(lambda: visitor_ast(tokens))
+        actions_time, ast = best_of(lambda: actions_ast(tokens))
+        assert str(ast) == str(expected)
+        del expected, ast
+        visitor_mb = peak_mb(lambda: visitor_ast(tokens))
+        actions_mb = peak_mb(lambda: actions_ast(tokens))
+        for name, seconds, mb in (
+            ("TyCParser + ASTGeneration", visitor_time, visitor_mb),
+            ("TyCASTParser", actions_time, actions_mb),
+        ):
+            rows.append(
+                (
+                    f"{size_kb} KB",
+                    name,
+                    len(tokens),
+                    f"{seconds:.3f}",
+                    f"{visitor_time / seconds:.2f}x",
+                    f"{mb:.1f}",
+                    f"{visitor_mb / mb:.2f}x",
+                )
+            )
+    report(
+        "Tokens to AST",
+        rows,
+        ("input", "backend", "tokens", "parse s", "speedup", "peak MB", "memory saving"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
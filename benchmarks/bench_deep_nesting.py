@@ -0,0 +1,88 @@
+"""
+Deep nesting benchmark: traversal and printing of ASTs with explicit work
+stacks (BaseVisitor.visit, walk, str) vs the recursive versions (a visitor
+that visits every node through accept(), and str_parts printed by
+recursion), on a generated program and on deep else-if chains and
+expressions. The recursive versions fail past Python's recursion limit.
+
+Usage:
+    python -m benchmarks.bench_deep_nesting [size_in_kb] [depth]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from src.utils.printer import render
+from src.utils.visitor import BaseVisitor, walk
+from tests.utils import ASTGenerator
+
+
+class Counter(BaseVisitor):
+    """Counts identifiers; every other node is left to the defaults."""
+
+    def __init__(self):
+        self.count = 0
+
+    def visit_identifier(self, node, o=None):
+        self.count += 1
+
+
+class RecursiveCounter(Counter):
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+def recursive_str(node):
+    if type(node).__str__ is not render:
+        return str(node)
+    return "".join(p if type(p) is str else recursive_str(p) for p in node.str_parts())
+
+
+def count_with(visitor_class, ast):
+    visitor = visitor_class()
+    visitor.visit(ast)
+    return visitor.count
+
+
+def timed(fn):
+    try:
+        seconds, _ = best_of(fn)
+    except RecursionError:
+        return "RecursionError"
+    return f"{seconds:.3f}"
+
+
+def main(argv):
+    size_kb = int(argv[0]) if argv else 512
+    depth = int(argv[1]) if len(argv) > 1 else 10_000
+    inputs = [
+        (f"program {size_kb} KB", generate_program_of_size(size_kb * 1024)),
+        (f"else-if x{depth}", "void main() { if (a) x = 0; " + "else if (a) x = 1; " * depth + "}"),
+        (f"operands x{depth}", f"void main() {{ x = {'1 + (' * depth}1{')' * depth}; }}"),
+        ("else-if x150", "void main() { if (a) x = 0; " + "else if (a) x = 1; " * 150 + "}"),
+    ]
+    rows = []
+    for name, source in inputs:
+        ast = ASTGenerator(source, backend="descent").generate()
+        nodes = sum(1 for _ in walk(ast))
+        rows.append(
+            (
+                name,
+                nodes,
+                timed(lambda: count_with(Counter, ast)),
+                timed(lambda: count_with(RecursiveCounter, ast)),
+                timed(lambda: sum(1 for _ in walk(ast))),
+                timed(lambda: str(ast)),
+                timed(lambda: recursive_str(ast)),
+            )
+        )
+    report(
+        f"Traversal and printing, seconds (recursion limit {sys.getrecursionlimit()})",
+        rows,
+        ("input", "nodes", "visit", "visit (recursive)", "walk", "str", "str (recursive)"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
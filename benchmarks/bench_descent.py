@@ -0,0 +1,96 @@
+"""
+Parser backend benchmark: source to AST with TyCParser and the
+ASTGeneration visitor vs DescentParser, which builds the nodes directly.
+
+Lexing is the same TyCLexer for both and is timed separately, so the
+parse column is the backend alone. Also reported for the ANTLR route: the
+parse tree's context objects (rule invocations) per token.
+
+Usage:
+    python -m benchmarks.bench_descent [size_in_kb ...]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from antlr4 import CommonTokenStream, InputStream, Token
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.ParserRuleContext import ParserRuleContext
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.parser.descent import DescentParser
+from src.utils.error_listener import NewErrorListener
+
+
+def lex_all(source: str):
+    lexer = TyCLexer(InputStream(source))
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        tokens.append(token)
+        if token.type == Token.EOF:
+            return tokens
+
+
+def antlr_ast(tokens):
+    parser = TyCParser(CommonTokenStream(ListTokenSource(tokens)))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    tree = parser.program()
+    return tree, ASTGeneration().visit(tree)
+
+
+def descent_ast(tokens):
+    return DescentParser(ListTokenSource(tokens)).parse()
+
+
+def count_contexts(tree) -> int:
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParserRuleContext):
+            count += 1
+            stack.extend(node.children or ())
+    return count
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [64, 512]
+    rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        mb = len(source.encode("utf-8")) / 1e6
+        lex_time, tokens = best_of(lambda: lex_all(source))
+        antlr_ast(tokens)  # warm the prediction DFA
+        antlr_time, (tree, expected) = best_of(lambda: antlr_ast(tokens))
+        descent_time, ast = best_of(lambda: descent_ast(tokens))
+        assert str(ast) == str(expected)
+        contexts = count_contexts(tree)
+        for name, seconds, extra in (
+            ("TyCParser + ASTGeneration", antlr_time, f"{contexts / len(tokens):.1f}"),
+            ("DescentParser", descent_time, "0"),
+        ):
+            rows.append(
+                (
+                    f"{size_kb} KB",
+                    name,
+                    len(tokens),
+                    extra,
+                    f"{lex_time:.3f}",
+                    f"{seconds:.3f}",
+                    f"{mb / (lex_time + seconds):.2f}",
+                    f"{antlr_time / seconds:.2f}x",
+                )
+            )
+    report(
+        "Source to AST",
+        rows,
+        ("input", "backend", "tokens", "contexts/token", "lex s", "parse s", "MB/s total", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,84 @@
+"""
+Incremental parsing benchmark: latency per edit of IncrementalParser vs a
+full TyCLexer + TyCParser run, on a generated source of ~20k lines.
+
+Each edit kind is applied at random function bodies and then undone, so
+the buffer stays valid and every edit takes the incremental path unless a
+fallback is needed.
+
+Usage:
+    python -m benchmarks.bench_incremental [lines] [edits_per_kind]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.common import best_of, generate_program, report
+
+from tests.utils import Parser
+from src.parser.incremental import IncrementalParser
+
+# (name, anchor to search for in a function body, offset from the anchor,
+# removed length, inserted text)
+EDITS = (
+    ("type a char", "total = total + k", 5, 0, "s"),
+    ("add a statement", "while (total > 100) {", 21, 0, "\n        total = total / 2;"),
+    ("edit a literal", "b >= 1.5e2", 5, 5, "2.75"),
+    ("edit a comment", "/* local state */", 3, 5, "scratch"),
+)
+
+
+def main(argv):
+    lines = int(argv[0]) if argv else 20000
+    per_kind = int(argv[1]) if len(argv) > 1 else 20
+    unit_lines = generate_program(2).count("\n") - generate_program(1).count("\n")
+    source = generate_program(max(1, lines // unit_lines))
+    print(f"{source.count(chr(10)) + 1} lines, {len(source) / 1e6:.2f} MB\n")
+
+    full, _ = best_of(lambda: Parser(source).parse(), repeat=1)
+    start = time.perf_counter()
+    inc = IncrementalParser(source)
+    initial = time.perf_counter() - start
+    rows = [("full parse", "-", f"{full * 1000:.1f}", "-", "-", "1.0x"),
+            ("IncrementalParser()", "-", f"{initial * 1000:.1f}", "-", "-", "-")]
+
+    rng = random.Random(0)
+    for name, anchor, shift, removed, inserted in EDITS:
+        positions = []
+        pos = inc.text.find(anchor)
+        while pos >= 0:
+            positions.append(pos + shift)
+            pos = inc.text.find(anchor, pos + 1)
+        times = []
+        fallbacks = 0
+        relexed = 0
+        for offset in rng.sample(positions, min(per_kind, len(positions))):
+            old = inc.text[offset : offset + removed]
+            for args in ((offset, removed, inserted), (offset, len(inserted), old)):
+                start = time.perf_counter()
+                result = inc.edit(*args)
+                times.append(time.perf_counter() - start)
+                assert result == "success", result
+                fallbacks += inc.stats.full
+                relexed += inc.stats.relexed
+        mean = sum(times) / len(times)
+        rows.append(
+            (
+                name,
+                len(times),
+                f"{mean * 1000:.2f}",
+                f"{relexed / len(times):.0f}",
+                fallbacks,
+                f"{full / mean:.0f}x",
+            )
+        )
+    report(
+        "Latency per edit",
+        rows,
+        ("edit", "edits", "ms/edit", "tokens relexed", "full fallbacks", "vs full parse"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
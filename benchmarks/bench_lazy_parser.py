@@ -0,0 +1,62 @@
+"""
+Lazy parsing benchmark: an outline query (struct members and function
+signatures) answered from a full parse (TyCParser + ASTGeneration, and
+DescentParser) vs from a lazy parse that leaves function bodies unparsed.
+Also timed: the lazy parse with every body forced afterwards, the price of
+laziness when all bodies are needed after all.
+
+Usage:
+    python -m benchmarks.bench_lazy_parser [size_in_kb ...]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from src.utils.nodes import FuncDecl
+from tests.utils import ASTGenerator
+
+
+def outline(ast):
+    """Struct layouts and function signatures of `ast`."""
+    lines = []
+    for decl in ast.decls:
+        if isinstance(decl, FuncDecl):
+            params = ", ".join(str(p.param_type) for p in decl.params)
+            lines.append(f"{decl.line}: {decl.return_type} {decl.name}({params})")
+        else:
+            members = ", ".join(f"{m.member_type} {m.name}" for m in decl.members)
+            lines.append(f"{decl.line}: struct {decl.name} {{{members}}}")
+    return lines
+
+
+def force_all(ast):
+    for decl in ast.decls:
+        if isinstance(decl, FuncDecl):
+            decl.body
+    return ast
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [64, 512]
+    rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        expected = ASTGenerator(source).generate()
+        baseline, full = best_of(lambda: outline(ASTGenerator(source).generate()))
+        runs = (
+            ("full, descent", lambda: outline(ASTGenerator(source, backend="descent").generate())),
+            ("lazy", lambda: outline(ASTGenerator(source).generate_lazy())),
+            ("lazy, all bodies forced", lambda: outline(force_all(ASTGenerator(source).generate_lazy()))),
+        )
+        rows.append((f"{size_kb} KB", "full, TyCParser", len(full), f"{baseline:.3f}", "1.00x"))
+        for name, run in runs:
+            seconds, lines = best_of(run)
+            assert lines == full
+            rows.append((f"{size_kb} KB", name, len(lines), f"{seconds:.3f}", f"{baseline / seconds:.2f}x"))
+        assert str(force_all(ASTGenerator(source).generate_lazy())) == str(expected)
+    report("Outline of struct layouts and function signatures", rows, ("input", "parse", "decls", "seconds", "speedup"))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
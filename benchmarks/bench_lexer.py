@@ -0,0 +1,53 @@
+"""
+Lexer throughput benchmark: ANTLR TyCLexer vs table-driven TyCDFALexer.
+
+Usage:
+    python -m benchmarks.bench_lexer [size_in_kb ...]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from antlr4 import InputStream, Token
+from build.TyCLexer import TyCLexer
+from build.TyCDFALexer import TyCDFALexer
+
+
+def lex(lexer_class, source: str) -> int:
+    lexer = lexer_class(InputStream(source))
+    count = 0
+    while lexer.nextToken().type != Token.EOF:
+        count += 1
+    return count
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [64, 512, 2048]
+    rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        mb = len(source.encode("utf-8")) / 1e6
+        baseline = None
+        for lexer_class in (TyCLexer, TyCDFALexer):
+            seconds, tokens = best_of(lambda: lex(lexer_class, source))
+            baseline = baseline or seconds
+            rows.append(
+                (
+                    f"{size_kb} KB",
+                    lexer_class.__name__,
+                    tokens,
+                    f"{seconds:.3f}",
+                    f"{mb / seconds:.2f}",
+                    f"{baseline / seconds:.2f}x",
+                )
+            )
+    report(
+        "Lexer throughput",
+        rows,
+        ("input", "lexer", "tokens", "seconds", "MB/s", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
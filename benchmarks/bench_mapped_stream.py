@@ -0,0 +1,95 @@
+"""
+Character stream benchmark: peak RSS and time-to-first-token for a source
+file opened through antlr4's FileStream (decode + code point list) vs the
+memory-mapped MappedCharStream, then the time to lex the whole file.
+
+Every measurement runs in a fresh interpreter so the peak RSS (ru_maxrss)
+belongs to that stream alone.
+
+Usage:
+    python -m benchmarks.bench_mapped_stream [size_in_mb ...]
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import generate_program_of_size, report
+
+
+def child(stream_name, path):
+    """Lex `path` once and print timings and peak RSS as JSON."""
+    from antlr4 import FileStream, Token
+    from build.TyCDFALexer import TyCDFALexer
+    from src.lexer.mapped_stream import MappedCharStream
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if stream_name == "FileStream":
+        stream = FileStream(path, encoding="utf-8")
+    else:
+        stream = MappedCharStream(path)
+    lexer = TyCDFALexer(stream)
+    lexer.nextToken()
+    first = time.perf_counter() - start
+    first_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    count = 1
+    while lexer.nextToken().type != Token.EOF:
+        count += 1
+    total = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux.
+    print(json.dumps({
+        "first": first,
+        "total": total,
+        "tokens": count,
+        "first_rss": (first_rss - baseline) / 1024,
+        "peak_rss": (peak - baseline) / 1024,
+    }))
+
+
+def measure(stream_name, path):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_mapped_stream", "--child", stream_name, path],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv):
+    if argv[:1] == ["--child"]:
+        child(*argv[1:3])
+        return
+    sizes_mb = [int(a) for a in argv] or [8, 64]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in sizes_mb:
+            path = os.path.join(tmp, f"bench_{size_mb}mb.tyc")
+            with open(path, "w") as f:
+                f.write(generate_program_of_size(size_mb * 1024 * 1024))
+            for stream_name in ("FileStream", "MappedCharStream"):
+                result = measure(stream_name, path)
+                rows.append((
+                    f"{size_mb} MB",
+                    stream_name,
+                    f"{result['first'] * 1000:.1f}",
+                    f"{result['first_rss']:.1f}",
+                    f"{result['total']:.2f}",
+                    f"{result['peak_rss']:.1f}",
+                ))
+            os.remove(path)
+    report(
+        "Character stream (TyCDFALexer, fresh process per row)",
+        rows,
+        ("input", "stream", "first token ms", "RSS at first MB", "full lex s", "peak RSS MB"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,129 @@
+"""
+AST memory benchmark: bytes per node and RSS of a program of about 1M
+nodes, with the slotted node classes of src/utils/nodes.py vs the same
+nodes keeping their fields in a per-instance __dict__, as they did before.
+
+The "__dict__" layout uses one plain class per node class, with the same
+attributes set in the same order as the constructors do, so its instances
+are what the unslotted classes built. Each layout is measured in a fresh
+interpreter: a parsed program is copied until the AST has the requested
+number of nodes, for the growth of RSS; bytes per node are the tracemalloc
+total of ten more copies (nodes and their lists) over their nodes. Names
+and literal values are shared with the template, as a parser shares them
+with its tokens.
+
+Usage:
+    python -m benchmarks.bench_node_memory [nodes]
+"""
+
+import gc
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import generate_program, report
+
+LAYOUTS = ("__dict__", "__slots__")
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def field_names(cls) -> list:
+    """Slots of `cls` in constructor order (ASTNode's line, column first)."""
+    return [name for base in reversed(cls.__mro__) for name in base.__dict__.get("__slots__", ())]
+
+
+def copier(layout):
+    """A function copying an AST into `layout`."""
+    from src.utils.nodes import ASTNode
+
+    classes = {}
+
+    def target(cls):
+        if cls not in classes:
+            new = cls if layout == "__slots__" else type(cls.__name__, (), {})
+            classes[cls] = (new, field_names(cls))
+        return classes[cls]
+
+    def copy(value):
+        if isinstance(value, list):
+            return [copy(v) for v in value]
+        if not isinstance(value, ASTNode):
+            return value
+        cls, names = target(type(value))
+        node = cls.__new__(cls)
+        for name in names:
+            setattr(node, name, copy(getattr(value, name)))
+        return node
+
+    return copy
+
+
+def child(layout, target_nodes):
+    """Build an AST of `target_nodes` nodes in `layout`; print the figures as JSON."""
+    from src.utils.visitor import walk
+    from tests.utils import ASTGenerator
+
+    template = ASTGenerator(generate_program(20), backend="descent").generate()
+    per_copy = sum(1 for _ in walk(template)) - 1
+    copies = -(-target_nodes // per_copy)
+    copy = copier(layout)
+    gc.collect()
+    rss = rss_bytes()
+    start = time.perf_counter()
+    decls = []
+    for _ in range(copies):
+        decls.extend(copy(template.decls))
+    seconds = time.perf_counter() - start
+    gc.collect()
+    rss = rss_bytes() - rss
+    tracemalloc.start()
+    sample = [copy(template.decls) for _ in range(10)]
+    traced = tracemalloc.get_traced_memory()[0] / (10 * per_copy)
+    tracemalloc.stop()
+    print(json.dumps({"nodes": copies * per_copy, "per_node": traced, "rss": rss, "seconds": seconds}))
+
+
+def measure(layout, nodes):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_node_memory", "--child", layout, str(nodes)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv):
+    if argv[:1] == ["--child"]:
+        child(argv[1], int(argv[2]))
+        return
+    target = int(argv[0]) if argv else 1_000_000
+    results = {layout: measure(layout, target) for layout in LAYOUTS}
+    before = results["__dict__"]
+    rows = []
+    for layout, result in results.items():
+        rows.append(
+            (
+                layout,
+                result["nodes"],
+                f"{result['per_node']:.0f}",
+                f"{result['rss'] / 1e6:.0f}",
+                f"{before['rss'] / result['rss']:.2f}x",
+                f"{result['seconds']:.2f}",
+            )
+        )
+    report(
+        "AST memory (fresh process per row)",
+        rows,
+        ("fields in", "nodes", "bytes/node", "RSS MB", "saving", "build s"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,55 @@
+"""
+Parallel lexing benchmark: time to pull every token from a single TyCLexer
+pass vs ParallelLexer with 1, 2, 4, ... workers (up to the core count, at
+least 2), with the speedup over the single pass.
+
+Usage:
+    python -m benchmarks.bench_parallel_lexer [size_in_mb]
+"""
+
+import os
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from antlr4 import InputStream, Token
+from build.TyCLexer import TyCLexer
+from src.lexer.parallel import ParallelLexer
+
+
+def drain(make_lexer, source):
+    def run():
+        lexer = make_lexer(InputStream(source))
+        count = 1
+        while lexer.nextToken().type != Token.EOF:
+            count += 1
+        return count
+
+    return run
+
+
+def main(argv):
+    size_mb = float(argv[0]) if argv else 4
+    source = generate_program_of_size(int(size_mb * 1024 * 1024))
+    cores = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] < max(cores, 2):
+        worker_counts.append(min(worker_counts[-1] * 2, max(cores, 2)))
+
+    baseline, count = best_of(drain(TyCLexer, source), repeat=1)
+    rows = [("TyCLexer", "-", count, f"{baseline:.2f}", "1.00")]
+    for workers in worker_counts:
+        seconds, _ = best_of(
+            drain(lambda chars: ParallelLexer(chars, TyCLexer, workers=workers), source),
+            repeat=1,
+        )
+        rows.append(("ParallelLexer", workers, count, f"{seconds:.2f}", f"{baseline / seconds:.2f}"))
+    report(
+        f"Lexing {size_mb:g} MB ({cores} cores available)",
+        rows,
+        ("lexer", "workers", "tokens", "seconds", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,46 @@
+"""
+Parallel parsing benchmark: source-to-AST time of one sequential
+TyCParser + ASTGeneration pass vs parse_parallel with 1, 2, 4, ... workers
+(up to the core count, at least 2), with the speedup over the sequential
+pass. One worker parses the whole source as one chunk in-process, which
+shows the cost of the boundary scan alone.
+
+Usage:
+    python -m benchmarks.bench_parallel_parser [size_in_mb]
+"""
+
+import os
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from src.parser.parallel import MIN_CHUNK, scan, split_points
+from tests.utils import ASTGenerator
+
+
+def main(argv):
+    size_mb = float(argv[0]) if argv else 0.5
+    source = generate_program_of_size(int(size_mb * 1024 * 1024))
+    cores = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] < max(cores, 2):
+        worker_counts.append(min(worker_counts[-1] * 2, max(cores, 2)))
+
+    baseline, expected = best_of(lambda: ASTGenerator(source).generate(), repeat=1)
+    decls = len(expected.decls)
+    rows = [("sequential", "-", 1, decls, f"{baseline:.2f}", "1.00")]
+    boundaries, _ = scan(source)
+    for workers in worker_counts:
+        chunks = len(split_points(source, boundaries, workers, MIN_CHUNK))
+        seconds, ast = best_of(lambda: ASTGenerator(source).generate_parallel(workers), repeat=1)
+        assert str(ast) == str(expected)
+        rows.append(("parse_parallel", workers, chunks, decls, f"{seconds:.2f}", f"{baseline / seconds:.2f}"))
+    report(
+        f"Parsing {size_mb:g} MB to an AST ({cores} cores available)",
+        rows,
+        ("parser", "workers", "chunks", "decls", "seconds", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+"""
+Recognizer pool benchmark: many small programs through fresh
+lexer/parser/visitor instances per source (ASTGenerator, the former
+Parser.parse) vs this thread's pooled instances (compile_many, parse_many).
+
+The corpus is the programs of tests/test_parser.py (about 90 characters
+each, a few with errors) repeated up to the requested count.
+
+Usage:
+    python -m benchmarks.bench_pool [num_programs]
+"""
+
+import sys
+
+from benchmarks.common import best_of, parser_test_sources, report
+
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.parser.pool import compile_many, parse_many, pool_for
+from src.utils.error_listener import NewErrorListener
+from tests.utils import ASTGenerator
+
+
+def fresh_parse_many(sources):
+    results = []
+    for source in sources:
+        parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        try:
+            parser.program()
+            results.append("success")
+        except Exception as e:
+            results.append(str(e))
+    return results
+
+
+def fresh_compile_many(sources):
+    return [ASTGenerator(source).generate() for source in sources]
+
+
+def fresh_setup(sources):
+    for source in sources:
+        ASTGenerator(source)
+
+
+def pooled_setup(sources):
+    pool = pool_for()
+    for source in sources:
+        pool.acquire(source)
+
+
+def interleaved(fresh, pooled, sources, repeat=5):
+    """Best times of `fresh` and `pooled`, run alternately and in both
+    orders (drift and noise on a busy machine exceed the difference)."""
+    best = {fresh: None, pooled: None}
+    results = {}
+    for i in range(repeat):
+        for fn in (fresh, pooled) if i % 2 == 0 else (pooled, fresh):
+            seconds, results[fn] = best_of(lambda: fn(sources), 1)
+            best[fn] = seconds if best[fn] is None else min(best[fn], seconds)
+    return best[fresh], best[pooled], results[fresh], results[pooled]
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 10000
+    tests = parser_test_sources()
+    sources = (tests * (count // len(tests) + 1))[:count]
+    compile_many(sources[:100])  # warm the DFAs and create the pool
+    rows = []
+    for name, fresh, pooled in (
+        ("setup only", fresh_setup, pooled_setup),
+        ("parse only", fresh_parse_many, parse_many),
+        ("source to AST", fresh_compile_many, compile_many),
+    ):
+        fresh_time, pooled_time, expected, results = interleaved(fresh, pooled, sources)
+        if expected is not None:
+            assert list(map(str, results)) == list(map(str, expected))
+        for label, seconds in (("fresh instances", fresh_time), ("pool", pooled_time)):
+            rows.append(
+                (
+                    name,
+                    label,
+                    f"{seconds:.3f}",
+                    f"{seconds / count * 1e6:.1f}",
+                    f"{fresh_time / seconds:.2f}x",
+                )
+            )
+    report(
+        f"{count} small programs",
+        rows,
+        ("work", "recognizers", "total s", "us/program", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,223 @@
+"""
+Prediction benchmark: time TyCParser spends in adaptivePredict, and how far
+ahead it looks, on assignment-heavy and call-chain-heavy code, for the
+current grammar and a baseline grammar from git history (by default the
+revision before assignments were left-factored, i.e. before `isLvalue` was
+added to TyC.g4).
+
+The baseline parser is generated into a temporary directory with the ANTLR
+jar from external/ (run `setup` first). Both parsers read tokens from the
+current TyCLexer; parser rule changes do not affect token types.
+
+Usage:
+    python -m benchmarks.bench_prediction [statements] [--baseline REV]
+"""
+
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import best_of, generate_program, project_root, report
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.dfa.DFA import DFA
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.utils.error_listener import NewErrorListener
+
+ANTLR_JAR = os.path.join(project_root, "external", "antlr-4.13.2-complete.jar")
+
+
+def baseline_revision() -> str:
+    out = subprocess.run(
+        ["git", "log", "--reverse", "--format=%H", "-S", "isLvalue", "--", "src/grammar/TyC.g4"],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return f"{out[0]}~1" if out else "HEAD"
+
+
+def load_baseline_parser(rev: str):
+    """Generate TyCParser from TyC.g4 at `rev` and import it under another name."""
+    grammar = subprocess.run(
+        ["git", "show", f"{rev}:src/grammar/TyC.g4"],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    ).stdout
+    out_dir = tempfile.mkdtemp(prefix="tyc-baseline-")
+    with open(os.path.join(out_dir, "TyC.g4"), "w", encoding="utf-8") as f:
+        f.write(grammar)
+    subprocess.run(
+        ["java", "-jar", ANTLR_JAR, "-Dlanguage=Python3", "-no-listener", "-no-visitor", "TyC.g4"],
+        cwd=out_dir, check=True,
+    )
+    spec = importlib.util.spec_from_file_location("baseline_TyCParser", os.path.join(out_dir, "TyCParser.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.TyCParser
+
+
+# -- corpora ------------------------------------------------------------------
+
+def _lvalue(rng, depth=0):
+    r = rng.random()
+    if depth < 2 and r < 0.2:
+        return f"({_lvalue(rng, depth + 1)})"
+    if depth < 2 and r < 0.6:
+        args = ", ".join(_operand(rng, depth + 1) for _ in range(rng.randint(1, 3)))
+        return f"f{rng.randrange(5)}({args})" + "".join(f".m{rng.randrange(3)}" for _ in range(rng.randint(1, 3)))
+    return "v" + "".join(f".m{rng.randrange(3)}" for _ in range(rng.randint(0, 3)))
+
+
+def _operand(rng, depth=0):
+    r = rng.random()
+    if depth < 3 and r < 0.4:
+        args = ", ".join(_operand(rng, depth + 1) for _ in range(rng.randint(0, 3)))
+        return f"g{rng.randrange(5)}({args})" + "".join(f".m{rng.randrange(3)}" for _ in range(rng.randint(0, 2)))
+    if r < 0.6:
+        return _lvalue(rng, depth + 1)
+    return rng.choice(["1", "2.5", "x", '"s"'])
+
+
+def assignment_program(statements: int, seed: int = 0) -> str:
+    """Chained assignments to member, call-chain and parenthesized lvalues."""
+    rng = random.Random(seed)
+    lines = ["void main() {"]
+    for _ in range(statements):
+        targets = " = ".join(_lvalue(rng) for _ in range(rng.randint(1, 3)))
+        lines.append(f"    {targets} = {_operand(rng)} + {_operand(rng)};")
+        if rng.random() < 0.2:
+            update = rng.choice([f"{_lvalue(rng)}++", f"--{_lvalue(rng)}", f"{_lvalue(rng)} = {_operand(rng)}"])
+            lines.append(f"    for ({_lvalue(rng)} = 0; x < 10; {update}) {{ }}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def call_chain_program(statements: int, seed: int = 0) -> str:
+    """Expression statements of nested calls and member chains, with ++/--."""
+    rng = random.Random(seed)
+    lines = ["void main() {"]
+    for _ in range(statements):
+        r = rng.random()
+        if r < 0.6:
+            lines.append(f"    {_operand(rng)} * {_operand(rng)} < {_operand(rng)};")
+        elif r < 0.8:
+            lines.append(f"    ++{_lvalue(rng)};")
+        else:
+            lines.append(f"    {_lvalue(rng)}--;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+# -- measurement -----------------------------------------------------------------
+
+class LookaheadStream(CommonTokenStream):
+    """CommonTokenStream that records the furthest token index consumed."""
+
+    furthest = 0
+
+    def consume(self):
+        super().consume()
+        if self.index > self.furthest:
+            self.furthest = self.index
+
+
+def new_parser(parser_class, source, stream_class=CommonTokenStream):
+    parser = parser_class(stream_class(TyCLexer(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def reset_dfa(parser_class):
+    parser_class.decisionsToDFA = [DFA(s, i) for i, s in enumerate(parser_class.atn.decisionToState)]
+
+
+def timed_parse(parser_class, source):
+    """Parse once; returns (total seconds, seconds in adaptivePredict, predictions)."""
+    parser = new_parser(parser_class, source)
+    interp = parser._interp
+    predict = interp.adaptivePredict
+    spent = [0.0, 0]
+
+    def adaptive_predict(input, decision, outerContext):
+        start = time.perf_counter()
+        try:
+            return predict(input, decision, outerContext)
+        finally:
+            spent[0] += time.perf_counter() - start
+            spent[1] += 1
+
+    interp.adaptivePredict = adaptive_predict
+    start = time.perf_counter()
+    parser.program()
+    return time.perf_counter() - start, spent[0], spent[1]
+
+
+def lookahead(parser_class, source):
+    """Mean and max number of tokens looked at per prediction."""
+    parser = new_parser(parser_class, source, LookaheadStream)
+    stream = parser._input
+    interp = parser._interp
+    predict = interp.adaptivePredict
+    depths = []
+
+    def adaptive_predict(input, decision, outerContext):
+        start = input.index
+        stream.furthest = start
+        alt = predict(input, decision, outerContext)
+        depths.append(stream.furthest - start + 1)
+        return alt
+
+    interp.adaptivePredict = adaptive_predict
+    parser.program()
+    return sum(depths) / len(depths), max(depths)
+
+
+def main(argv):
+    rev = None
+    if "--baseline" in argv:
+        i = argv.index("--baseline")
+        rev = argv[i + 1]
+        argv = argv[:i] + argv[i + 2 :]
+    statements = int(argv[0]) if argv else 2000
+    rev = rev or baseline_revision()
+    parsers = [(f"baseline ({rev[:12]})", load_baseline_parser(rev)), ("current", TyCParser)]
+    corpora = [
+        ("assignment-heavy", assignment_program(statements)),
+        ("call-chain-heavy", call_chain_program(statements)),
+        ("generated", generate_program(max(1, statements // 20))),
+    ]
+
+    rows = []
+    for corpus, source in corpora:
+        for name, parser_class in parsers:
+            reset_dfa(parser_class)
+            _, cold_predict, _ = timed_parse(parser_class, source)
+            _, predict, predictions = min(timed_parse(parser_class, source) for _ in range(3))
+            total, _ = best_of(lambda: new_parser(parser_class, source).program(), repeat=5)
+            mean_la, max_la = lookahead(parser_class, source)
+            rows.append(
+                (
+                    corpus,
+                    name,
+                    predictions,
+                    f"{cold_predict * 1000:.0f}",
+                    f"{predict * 1000:.0f}",
+                    f"{total * 1000:.0f}",
+                    f"{100 * predict / total:.0f}%",
+                    f"{mean_la:.2f}",
+                    max_la,
+                )
+            )
+    report(
+        "Prediction time (ms) and lookahead (tokens per adaptivePredict call)",
+        rows,
+        ("corpus", "grammar", "predictions", "cold predict", "warm predict", "warm parse", "share", "mean LA", "max LA"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
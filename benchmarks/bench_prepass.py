@@ -0,0 +1,83 @@
+"""
+Prepass benchmark: time of the character-class prepass alone (NumPy vs
+regex pass) and lexer throughput of TyCLexer with and without jumping over
+the prepass regions.
+
+Usage:
+    python -m benchmarks.bench_prepass [size_in_kb ...]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from antlr4 import InputStream, Token
+from build.TyCLexer import TyCLexer
+from src.lexer.prepass import Prepass, PrepassMixin, np
+
+
+class NumpyPrepassLexer(PrepassMixin, TyCLexer):
+    prepass_numpy = True
+
+
+class RegexPrepassLexer(PrepassMixin, TyCLexer):
+    prepass_numpy = False
+
+
+def lex(lexer_class, source: str) -> int:
+    lexer = lexer_class(InputStream(source))
+    count = 0
+    while lexer.nextToken().type != Token.EOF:
+        count += 1
+    return count
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [512, 2048]
+    use_numpy = [False] + ([True] if np is not None else [])
+    lexers = [TyCLexer, RegexPrepassLexer] + ([NumpyPrepassLexer] if np is not None else [])
+    prepass_rows = []
+    lexer_rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        mb = len(source.encode("utf-8")) / 1e6
+        for flag in use_numpy:
+            seconds, prepass = best_of(lambda: Prepass(source, use_numpy=flag))
+            skipped = sum(e - s for s, e in zip(prepass.skip_starts, prepass.skip_ends))
+            prepass_rows.append(
+                (
+                    f"{size_kb} KB",
+                    "numpy" if flag else "regex",
+                    f"{seconds * 1000:.1f}",
+                    f"{100 * skipped / len(source):.1f}%",
+                    len(prepass.string_starts),
+                )
+            )
+        baseline = None
+        for lexer_class in lexers:
+            seconds, tokens = best_of(lambda: lex(lexer_class, source), repeat=2)
+            baseline = baseline or seconds
+            lexer_rows.append(
+                (
+                    f"{size_kb} KB",
+                    lexer_class.__name__,
+                    tokens,
+                    f"{seconds:.3f}",
+                    f"{mb / seconds:.2f}",
+                    f"{baseline / seconds:.2f}x",
+                )
+            )
+    report(
+        "Prepass alone",
+        prepass_rows,
+        ("input", "pass", "ms", "skipped chars", "strings"),
+    )
+    report(
+        "Lexer throughput",
+        lexer_rows,
+        ("input", "lexer", "tokens", "seconds", "MB/s", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,101 @@
+"""
+AST printing benchmark: time and peak memory (tracemalloc) of printing a
+generated program of about 500k nodes
+
+- by recursive string building (each node joining the strings of its
+  children, as __str__ did before src/utils/printer.py),
+- with str() (printer.render),
+- with printer.write() to io.StringIO, to a file, and to a stream that only
+  counts characters (the memory of streaming itself).
+
+Usage:
+    python -m benchmarks.bench_printer [nodes]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.common import generate_program_of_size, report
+
+from src.utils.printer import render, write
+from src.utils.visitor import walk
+from tests.utils import ASTGenerator
+
+NODES_PER_KB = 160
+
+
+class Counter:
+    def __init__(self):
+        self.length = 0
+
+    def write(self, text):
+        self.length += len(text)
+
+
+def recursive_str(node):
+    if type(node).__str__ is not render:
+        return str(node)
+    return "".join(p if type(p) is str else recursive_str(p) for p in node.str_parts())
+
+
+def to_string_io(ast):
+    buffer = io.StringIO()
+    write(ast, buffer)
+    return len(buffer.getvalue())
+
+
+def to_file(ast, path):
+    with open(path, "w", encoding="utf-8") as f:
+        write(ast, f)
+    return os.path.getsize(path)
+
+
+def to_counter(ast):
+    stream = Counter()
+    write(ast, stream)
+    return stream.length
+
+
+def measure(fn):
+    """(best seconds of 3, peak traced MB, characters)."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    try:
+        chars = fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak / 2**20, chars
+
+
+def main(argv):
+    target = int(argv[0]) if argv else 500_000
+    ast = ASTGenerator(generate_program_of_size(target // NODES_PER_KB * 1024), backend="descent").generate()
+    nodes = sum(1 for _ in walk(ast))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ast.txt")
+        methods = [
+            ("recursive join", lambda: len(recursive_str(ast))),
+            ("str()", lambda: len(str(ast))),
+            ("write(), StringIO", lambda: to_string_io(ast)),
+            ("write(), file", lambda: to_file(ast, path)),
+            ("write(), counting", lambda: to_counter(ast)),
+        ]
+        rows = []
+        for name, fn in methods:
+            seconds, peak, chars = measure(fn)
+            rows.append((name, nodes, chars, f"{seconds:.3f}", f"{peak:.1f}"))
+    report("Printing an AST", rows, ("method", "nodes", "characters", "seconds", "peak MB"))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
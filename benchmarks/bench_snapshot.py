@@ -0,0 +1,106 @@
+"""
+Warm snapshot benchmark: startup and time of the first N parses in a fresh
+process with cold recognizers (TYC_NO_SNAPSHOT set: empty DFAs) vs
+recognizers that load their DFAs from build/TyC.snapshot at import.
+
+Each run is a new interpreter; the corpus is small generated programs, half
+of them with a few random token edits, none of them in the snapshot's
+warm-up corpus.
+
+Usage:
+    python -m benchmarks.bench_snapshot [num_parses]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import generate_program, mutate_program, project_root, report
+
+from src.parser import snapshot
+
+
+def corpus(count: int):
+    sources = []
+    for i in range(count):
+        source = generate_program(1 + i % 3, seed=100 + i)
+        sources.append(mutate_program(source, 2, seed=i) if i % 2 else source)
+    return sources
+
+
+def worker(mode: str, count: int):
+    sources = corpus(count)
+    start = time.perf_counter()
+    from antlr4 import CommonTokenStream, InputStream
+    from src.utils.files import use_build_dir
+
+    use_build_dir()
+    from build.TyCLexer import TyCLexer
+    from build.TyCParser import TyCParser
+
+    startup = time.perf_counter() - start
+    if mode == "warm" and not any(dfa.states for dfa in TyCParser.decisionsToDFA):
+        raise SystemExit("no valid snapshot in build/, run build first")
+    times = []
+    for source in sources:
+        start = time.perf_counter()
+        parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        try:
+            parser.program()
+        except Exception:
+            pass
+        times.append(time.perf_counter() - start)
+    print(json.dumps({"startup": startup, "times": times}))
+
+
+def run(mode: str, count: int):
+    env = dict(os.environ)
+    env.pop(snapshot.NO_SNAPSHOT, None)
+    if mode == "cold":
+        env[snapshot.NO_SNAPSHOT] = "1"
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_snapshot", "--worker", mode, str(count)],
+        cwd=project_root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def main(argv):
+    if argv[:1] == ["--worker"]:
+        return worker(argv[1], int(argv[2]))
+    count = int(argv[0]) if argv else 500
+    checkpoints = sorted({n for n in (1, 10, 100, count) if n <= count})
+    results = {}
+    for mode in ("cold", "warm"):
+        runs = [run(mode, count) for _ in range(3)]
+        results[mode] = {
+            "startup": min(r["startup"] for r in runs),
+            "first": [min(sum(r["times"][:n]) for r in runs) for n in checkpoints],
+        }
+    rows = []
+    for mode in ("cold", "warm"):
+        result = results[mode]
+        rows.append(
+            [mode, f"{result['startup'] * 1000:.1f}"]
+            + [f"{t * 1000:.1f}" for t in result["first"]]
+        )
+    rows.append(
+        ["speedup", f"{results['cold']['startup'] / results['warm']['startup']:.2f}x"]
+        + [f"{c / w:.2f}x" for c, w in zip(results["cold"]["first"], results["warm"]["first"])]
+    )
+    report(
+        f"Fresh process, first parses ({count} small programs)",
+        rows,
+        ["recognizers", "startup ms"] + [f"first {n} ms" for n in checkpoints],
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,119 @@
+"""
+String pool benchmark: memory held by the decoded values of the string
+literals of literal-heavy programs, decoded once per literal (one string
+object each) vs interned in the lexer's StringPool (one object per distinct
+value plus an index per literal), and the time to decode them for three
+later phases vs one pool lookup each.
+
+Usage:
+    python -m benchmarks.bench_string_pool [literals ...]
+"""
+
+import random
+import sys
+import tracemalloc
+from array import array
+
+from benchmarks.common import best_of, report
+
+from antlr4 import InputStream, Token
+from build.TyCLexer import TyCLexer
+from src.grammar.stringpool import StringPool, decode
+
+MESSAGES = [
+    "ok",
+    "value:\\t",
+    "done\\n",
+    "error: \\\"{}\\\" not found\\n",
+    "row {}\\tcol {}\\n",
+    "path C:\\\\tmp\\\\{}",
+]
+
+# Phases that read every literal value (e.g. checker, interpreter, codegen).
+PHASES = 3
+
+
+def literal_program(literals: int, distinct: int, seed: int = 0) -> str:
+    """A program with `literals` printString calls over `distinct` values."""
+    rng = random.Random(seed)
+    values = [rng.choice(MESSAGES).replace("{}", str(i)) for i in range(distinct)]
+    lines = ["void main() {"]
+    for _ in range(literals):
+        lines.append(f'    printString("{rng.choice(values)}");')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def string_tokens(source: str):
+    lexer = TyCLexer(InputStream(source))
+    tokens = []
+    while True:
+        t = lexer.nextToken()
+        if t.type == Token.EOF:
+            return tokens, lexer.stringPool
+        if t.type == TyCLexer.STRING_LITERAL:
+            tokens.append(t)
+
+
+def intern_all(texts):
+    """The pool and one array entry per literal, as the lexer leaves them."""
+    pool = StringPool()
+    return pool, array("i", [pool.intern(text) for text in texts])
+
+
+def retained(build) -> int:
+    """Bytes still allocated by the result of `build()`."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or [10000, 100000]
+    rows = []
+    for literals in sizes:
+        for distinct in (50, literals // 10):
+            source = literal_program(literals, distinct)
+            tokens, pool = string_tokens(source)
+            texts = [t.text for t in tokens]
+            indexes = [t.poolIndex for t in tokens]
+
+            per_literal = retained(lambda: [decode(text) for text in texts])
+            pooled = retained(lambda: intern_all(texts))
+
+            def decode_each():
+                for _ in range(PHASES):
+                    for text in texts:
+                        decode(text)
+
+            def lookup_each():
+                values = pool.values
+                for _ in range(PHASES):
+                    for index in indexes:
+                        values[index]
+
+            decode_time, _ = best_of(decode_each)
+            lookup_time, _ = best_of(lookup_each)
+            rows.append(
+                (
+                    len(tokens),
+                    len(pool),
+                    f"{per_literal / 1024:.0f}",
+                    f"{pooled / 1024:.0f}",
+                    f"{per_literal / pooled:.1f}x",
+                    f"{decode_time * 1000:.1f}",
+                    f"{lookup_time * 1000:.1f}",
+                )
+            )
+    report(
+        f"Decoded string literals (values read by {PHASES} phases)",
+        rows,
+        ("literals", "distinct", "KB per literal", "KB pooled", "saved", "ms decode", "ms pool"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
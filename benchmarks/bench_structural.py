@@ -0,0 +1,93 @@
+"""
+Structural comparison benchmark: comparing ASTs by their str() vs with
+structural_equal and structural_hash (src/utils/structural.py).
+
+- equal programs: two parses of one generated program, compared,
+- deep: two 100k-deep expressions, compared,
+- dedup: the function bodies of many submissions (generated programs with
+  the same bodies and different struct parameters) grouped by str() vs by
+  position-free structural hash, then grouped again with the hashes cached.
+
+Usage:
+    python -m benchmarks.bench_structural [size_in_kb] [submissions]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program, generate_program_of_size, report
+
+from src.utils.nodes import FuncDecl, Identifier, PrefixOp
+from src.utils.structural import clear_hash, structural_equal, structural_hash
+from src.utils.visitor import walk
+from tests.utils import ASTGenerator
+
+
+def parse(source):
+    return ASTGenerator(source, backend="descent").generate()
+
+
+def deep(depth):
+    node = Identifier("x")
+    for _ in range(depth):
+        node = PrefixOp("-", node)
+    return node
+
+
+def forget(ast):
+    for node in walk(ast):
+        clear_hash(node)
+
+
+def group_by_str(bodies):
+    groups = {}
+    for body in bodies:
+        groups.setdefault(str(body), []).append(body)
+    return len(groups)
+
+
+def group_by_hash(bodies):
+    groups = {}
+    for body in bodies:
+        group = groups.setdefault(structural_hash(body, positions=False), [])
+        if group:
+            assert structural_equal(group[0], body, positions=False)
+        group.append(body)
+    return len(groups)
+
+
+def main(argv):
+    size_kb = int(argv[0]) if argv else 512
+    count = int(argv[1]) if len(argv) > 1 else 50
+    rows = []
+
+    source = generate_program_of_size(size_kb * 1024)
+    a, b = parse(source), parse(source)
+    rows.append(("equal programs", f"{size_kb} KB", "str() ==", *timed(lambda: str(a) == str(b))))
+    rows.append(("", "", "structural_equal", *timed(lambda: structural_equal(a, b))))
+    rows.append(("", "", "hash, first", *timed(lambda: structural_hash(a), 1)))
+    rows.append(("", "", "hash, cached", *timed(lambda: structural_hash(a))))
+
+    depth = 100_000
+    x, y = deep(depth), deep(depth)
+    rows.append(("deep", f"depth {depth}", "str() ==", *timed(lambda: str(x) == str(y))))
+    rows.append(("", "", "structural_equal", *timed(lambda: structural_equal(x, y))))
+
+    submissions = [parse(generate_program(20, seed)) for seed in range(count)]
+    bodies = [d.body for ast in submissions for d in ast.decls if isinstance(d, FuncDecl)]
+    rows.append(("dedup bodies", f"{len(bodies)} bodies", "by str()", *timed(lambda: group_by_str(bodies))))
+    for ast in submissions:
+        forget(ast)
+    rows.append(("", "", "by hash, first", *timed(lambda: group_by_hash(bodies), 1)))
+    rows.append(("", "", "by hash, cached", *timed(lambda: group_by_hash(bodies))))
+    report("AST comparison", rows, ("workload", "input", "method", "seconds", "result"))
+
+
+def timed(fn, repeat=3):
+    seconds, result = best_of(fn, repeat)
+    if type(result) is int and result > 1 << 20:
+        result = "-"
+    return f"{seconds:.4f}", result
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,87 @@
+"""
+Token storage benchmark: bytes per token for CommonTokenStream,
+Tokenizer.tokenize (SimpleNamespace list) and the array-backed TokenBuffer,
+plus parse time with CommonTokenStream vs TokenBuffer.
+
+Usage:
+    python -m benchmarks.bench_token_buffer [size_in_kb ...]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCDFALexer import TyCDFALexer
+from build.TyCParser import TyCParser
+from src.lexer.token_buffer import TokenBuffer
+from tests.utils import Tokenizer
+
+
+def retained_bytes(build):
+    """Bytes still allocated after `build()` returns, while its result lives."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def filled(stream_class, chars):
+    def build():
+        chars.reset()
+        stream = stream_class(TyCDFALexer(chars))
+        stream.fill()
+        return stream
+
+    return build
+
+
+def parse(stream_class, source):
+    def run():
+        parser = TyCParser(stream_class(TyCDFALexer(InputStream(source))))
+        parser.program()
+
+    return run
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [256, 1024]
+    memory_rows = []
+    time_rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        # The character stream is shared, so it stays out of the measurement.
+        chars = InputStream(source)
+        _, stream = retained_bytes(filled(CommonTokenStream, chars))
+        count = len(stream.tokens)
+        del stream
+        candidates = (
+            ("CommonTokenStream", filled(CommonTokenStream, chars)),
+            ("Tokenizer.tokenize", lambda: Tokenizer(source, TyCDFALexer).tokenize()),
+            ("TokenBuffer", filled(TokenBuffer, chars)),
+        )
+        for name, build in candidates:
+            nbytes, result = retained_bytes(build)
+            del result
+            memory_rows.append(
+                (f"{size_kb} KB", name, count, nbytes, f"{nbytes / count:.1f}")
+            )
+        for stream_class in (CommonTokenStream, TokenBuffer):
+            seconds, _ = best_of(parse(stream_class, source), repeat=2)
+            time_rows.append((f"{size_kb} KB", stream_class.__name__, f"{seconds:.3f}"))
+    report(
+        "Retained token storage",
+        memory_rows,
+        ("input", "storage", "tokens", "bytes", "bytes/token"),
+    )
+    report("Parse time (TyCDFALexer + TyCParser)", time_rows, ("input", "stream", "seconds"))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
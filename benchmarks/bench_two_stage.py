@@ -0,0 +1,114 @@
+"""
+Two-stage parsing benchmark: per corpus, time of plain LL parsing vs the
+two-stage mode (SLL with bail-out, LL on failure), the time spent in each
+stage and how many programs needed the LL fallback.
+
+Corpora: the programs of tests/test_parser.py, generated valid programs,
+and the same programs with a few random token edits (mostly invalid, so
+they always take the fallback).
+
+Usage:
+    python -m benchmarks.bench_two_stage [programs_per_corpus]
+"""
+
+import sys
+import time
+
+from benchmarks.common import generate_program, mutate_program, parser_test_sources, report
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+
+
+def new_parser(source: str) -> TyCParser:
+    parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def ll_only(source: str):
+    try:
+        new_parser(source).program()
+    except Exception:
+        pass
+
+
+def two_stage(source: str) -> bool:
+    try:
+        return parse_two_stage(new_parser(source))[1]
+    except Exception:
+        return True
+
+
+def sll_stage(source: str) -> bool:
+    """The first stage alone; True if it bailed out."""
+    parser = new_parser(source)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        parser.program()
+        return False
+    except Exception:
+        return True
+
+
+def total_time(fn, sources, repeat: int = 3):
+    """Best total seconds of `fn` over `sources`, and the last results."""
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [fn(source) for source in sources]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 40
+    generated = [generate_program(5, seed) for seed in range(count)]
+    corpora = [
+        ("parser tests", parser_test_sources()),
+        ("generated", generated),
+        ("mutated", [mutate_program(src, 2, seed) for seed, src in enumerate(generated)]),
+    ]
+    # Warm the shared prediction DFA in both modes before timing.
+    for _, sources in corpora:
+        total_time(ll_only, sources, repeat=1)
+        total_time(two_stage, sources, repeat=1)
+
+    rows = []
+    for name, sources in corpora:
+        ll, _ = total_time(ll_only, sources)
+        both, fallbacks = total_time(two_stage, sources)
+        sll, bailed = total_time(sll_stage, sources)
+        failed = [src for src, bail in zip(sources, bailed) if bail]
+        ll_stage, _ = total_time(ll_only, failed) if failed else (0.0, None)
+        rows.append(
+            (
+                name,
+                len(sources),
+                f"{ll * 1000:.1f}",
+                f"{sll * 1000:.1f}",
+                f"{ll_stage * 1000:.1f}",
+                f"{both * 1000:.1f}",
+                f"{sum(fallbacks)} ({100 * sum(fallbacks) / len(sources):.0f}%)",
+                f"{ll / both:.2f}x",
+            )
+        )
+    report(
+        "Plain LL vs two-stage parsing (ms per corpus)",
+        rows,
+        ("corpus", "programs", "LL only", "SLL stage", "LL stage", "two-stage", "LL fallbacks", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
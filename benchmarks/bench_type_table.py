@@ -0,0 +1,95 @@
+"""
+Type-checking microbenchmark: comparisons of the type nodes of a generated
+program done structurally (classes, then struct names) vs through a
+TypeTable (src/utils/type_table.py), looking the IDs up at each check or
+once per occurrence as an inference pass would keep them.
+
+Checks, over all type occurrences:
+
+- equality of every occurrence with each of the next 16,
+- membership in the numeric types,
+- grouping functions by signature (return and parameter types).
+
+Times are relative to the structural checks (below 1 is faster): an id_of()
+call per check is slower than comparing classes, IDs resolved once are
+faster.
+
+Usage:
+    python -m benchmarks.bench_type_table [size_in_kb ...]
+"""
+
+import sys
+
+from benchmarks.common import best_of, generate_program_of_size, report
+
+from src.utils.nodes import FloatType, FuncDecl, IntType, StructType, Type
+from src.utils.type_table import NUMERIC, TypeTable
+from src.utils.visitor import walk
+from tests.utils import ASTGenerator
+
+WINDOW = 16
+
+
+def same_type(a, b) -> bool:
+    return type(a) is type(b) and (type(a) is not StructType or a.struct_name == b.struct_name)
+
+
+def structural_key(node):
+    return (type(node), getattr(node, "struct_name", None))
+
+
+def structural(types, funcs):
+    n = len(types)
+    equal = sum(same_type(types[i], types[j]) for i in range(n) for j in range(i + 1, min(i + WINDOW, n)))
+    numeric = sum(isinstance(t, (IntType, FloatType)) for t in types)
+    groups = {}
+    for f in funcs:
+        key = (structural_key(f.return_type), *(structural_key(p.param_type) for p in f.params))
+        groups.setdefault(key, []).append(f.name)
+    return equal, numeric, len(groups)
+
+
+def by_table(types, funcs):
+    table = TypeTable()
+    id_of = table.id_of
+    n = len(types)
+    equal = sum(id_of(types[i]) == id_of(types[j]) for i in range(n) for j in range(i + 1, min(i + WINDOW, n)))
+    numeric = sum(NUMERIC >> id_of(t) & 1 for t in types)
+    groups = {}
+    for f in funcs:
+        key = (id_of(f.return_type), *(id_of(p.param_type) for p in f.params))
+        groups.setdefault(key, []).append(f.name)
+    return equal, numeric, len(groups)
+
+
+def by_ids(types, funcs):
+    table = TypeTable()
+    ids = [table.id_of(t) for t in types]
+    signatures = [(table.id_of(f.return_type), *(table.id_of(p.param_type) for p in f.params)) for f in funcs]
+    n = len(ids)
+    equal = sum(ids[i] == ids[j] for i in range(n) for j in range(i + 1, min(i + WINDOW, n)))
+    numeric = sum(NUMERIC >> i & 1 for i in ids)
+    groups = {}
+    for f, key in zip(funcs, signatures):
+        groups.setdefault(key, []).append(f.name)
+    return equal, numeric, len(groups)
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [256, 1024]
+    rows = []
+    for size_kb in sizes_kb:
+        ast = ASTGenerator(generate_program_of_size(size_kb * 1024), backend="descent").generate()
+        types = [n for n in walk(ast) if isinstance(n, Type)]
+        funcs = [d for d in ast.decls if isinstance(d, FuncDecl) and d.return_type is not None]
+        baseline, expected = best_of(lambda: structural(types, funcs))
+        rows.append((f"{size_kb} KB", "structural", len(types), f"{baseline:.3f}", "1.00"))
+        for name, check in (("TypeTable.id_of per check", by_table), ("IDs resolved once", by_ids)):
+            seconds, result = best_of(lambda: check(types, funcs))
+            assert result == expected
+            rows.append((f"{size_kb} KB", name, len(types), f"{seconds:.3f}", f"{seconds / baseline:.2f}"))
+    report("Type checks", rows, ("input", "comparison", "type nodes", "seconds", "relative time"))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
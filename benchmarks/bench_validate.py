@@ -0,0 +1,60 @@
+"""
+Validate-only benchmark: `Parser.parse`, which builds the parse tree and
+drops it, vs `Parser.validate`, which builds none, on generated programs;
+and parse_many vs validate_many on many small ones (the parser test
+sources, repeated).
+
+Both read the source from a string with the pooled recognizers and warm
+prediction DFAs. Peak memory is the tracemalloc peak during one call, so it
+includes the tokens and, for the full path, the whole tree.
+
+Usage:
+    python -m benchmarks.bench_validate [size_in_kb ...]
+"""
+
+import sys
+import tracemalloc
+
+from benchmarks.common import best_of, generate_program_of_size, parser_test_sources, report
+
+from src.parser.pool import parse_many, validate_many
+from tests.utils import Parser
+
+
+def peak_mb(fn) -> float:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def compare(name, full, validate, rows):
+    assert full() == validate()
+    full_time, _ = best_of(full)
+    validate_time, _ = best_of(validate)
+    full_mb = peak_mb(full)
+    validate_mb = peak_mb(validate)
+    for path, seconds, mb in (("full", full_time, full_mb), ("validate", validate_time, validate_mb)):
+        rows.append(
+            (name, path, f"{seconds:.3f}", f"{full_time / seconds:.2f}x", f"{mb:.1f}", f"{full_mb / mb:.2f}x")
+        )
+
+
+def main(argv):
+    sizes_kb = [int(a) for a in argv] or [64, 512]
+    rows = []
+    for size_kb in sizes_kb:
+        source = generate_program_of_size(size_kb * 1024)
+        compare(f"{size_kb} KB", lambda: Parser(source).parse(), lambda: Parser(source).validate(), rows)
+    sources = parser_test_sources() * 10
+    compare(f"{len(sources)} small", lambda: parse_many(sources), lambda: validate_many(sources), rows)
+    report(
+        "Syntax check, full parse vs validate-only",
+        rows,
+        ("input", "path", "seconds", "speedup", "peak MB", "memory saving"),
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
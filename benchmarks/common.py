@@ -0,0 +1,138 @@
+"""
+Shared helpers for TyC benchmarks: path setup, synthetic program
+generation and timing.
+
+Run a benchmark from the project root, e.g.:
+    python -m benchmarks.bench_lexer
+"""
+
+import ast
+import os
+import random
+import sys
+import time
+
+# Add project root and build directory to Python path (as tests/utils.py does)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+build_dir = os.path.join(project_root, "build")
+sys.path.insert(0, project_root)
+sys.path.insert(0, build_dir)
+
+
+_STRUCT_TEMPLATE = """\
+struct S{i} {{
+    int x;
+    float y;
+    string tag;
+}};
+"""
+
+_FUNC_TEMPLATE = """\
+// helper {i}
+int f{i}(int a, float b, S{s} p) {{
+    /* local state */
+    auto total = 0;
+    string msg = "value\\t{i}\\n";
+    for (int k = 0; k < a; k++) {{
+        if (k % 2 == 0 && b >= 1.5e2) {{
+            total = total + k * {i};
+        }} else {{
+            total = total - (k + 1) / 3;
+        }}
+    }}
+    while (total > 100) {{
+        total--;
+        p.x = total;
+    }}
+    switch (a) {{
+        case 1: total = f{prev}(a - 1, b, p); break;
+        case 2 + 1: p.y = 0.5; break;
+        default: msg = "done";
+    }}
+    return total + p.x;
+}}
+"""
+
+_MAIN = """\
+void main() {
+    S0 p = {1, 2.0, "origin"};
+    auto r = f0(10, 3.25, p);
+}
+"""
+
+
+def generate_program(num_funcs: int, seed: int = 0) -> str:
+    """Return a valid TyC program with `num_funcs` structs and functions."""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(num_funcs):
+        parts.append(_STRUCT_TEMPLATE.format(i=i))
+        parts.append(
+            _FUNC_TEMPLATE.format(i=i, s=rng.randrange(i + 1), prev=max(i - 1, 0))
+        )
+    parts.append(_MAIN)
+    return "\n".join(parts)
+
+
+def generate_program_of_size(num_bytes: int, seed: int = 0) -> str:
+    """Return a valid TyC program of at least `num_bytes` characters."""
+    unit = len(generate_program(1, seed))
+    return generate_program(max(1, num_bytes // unit + 1), seed)
+
+
+def parser_test_sources():
+    """The `source = "..."` programs of tests/test_parser.py, in order."""
+    path = os.path.join(project_root, "tests", "test_parser.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    sources = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "source"
+            and isinstance(node.value, ast.Constant)
+        ):
+            sources.append((node.lineno, node.value.value))
+    return [source for _, source in sorted(sources)]
+
+
+def mutate_program(source: str, edits: int, seed: int = 0) -> str:
+    """`source` with `edits` random token deletions/insertions (usually invalid)."""
+    from antlr4 import InputStream
+    from build.TyCLexer import TyCLexer
+
+    rng = random.Random(seed)
+    tokens = TyCLexer(InputStream(source)).getAllTokens()
+    words = [source[t.start : t.stop + 1] for t in tokens]
+    for _ in range(edits):
+        i = rng.randrange(len(words))
+        if rng.random() < 0.5:
+            del words[i]
+        else:
+            words.insert(i, rng.choice([";", "(", ")", "{", "}", "=", "++", ".", "x", ","]))
+    return " ".join(words)
+
+
+def best_of(fn, repeat: int = 3):
+    """Run `fn` `repeat` times and return (best seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def report(title: str, rows, headers):
+    """Print `rows` as an aligned text table."""
+    table = [list(map(str, headers))] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(r[i]) for r in table) for i in range(len(headers))]
+    print(title)
+    for n, row in enumerate(table):
+        print("  " + "  ".join(c.ljust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print("  " + "  ".join("-" * w for w in widths))
+    print()
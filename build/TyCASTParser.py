@@ -0,0 +1,3934 @@
+# Generated from TyCASTParser.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+
+from antlr4.error.Errors import InputMismatchException
+from src.parser.snapshot import warm_state
+from src.utils.nodes import *
+
+
+def at(node, token):
+    node.line = token.line
+    node.column = token.column
+    return node
+
+if "." in __name__:
+    from .TyCParserBase import TyCParserBase
+else:
+    from TyCParserBase import TyCParserBase
+
+def serializedATN():
+    return [
+        4,1,51,686,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
+        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,46,
+        7,46,2,47,7,47,2,48,7,48,2,49,7,49,1,0,1,0,1,0,1,0,5,0,105,8,0,10,
+        0,12,0,108,9,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,3,1,119,8,1,1,
+        2,1,2,1,2,1,2,1,2,1,2,1,2,5,2,128,8,2,10,2,12,2,131,9,2,1,2,1,2,
+        1,2,1,3,1,3,1,3,1,3,1,3,1,4,3,4,142,8,4,1,4,1,4,1,4,3,4,147,8,4,
+        1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,5,5,159,8,5,10,5,12,5,162,
+        9,5,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,3,7,176,8,7,
+        1,8,1,8,1,8,1,8,1,8,3,8,183,8,8,1,9,1,9,1,9,1,9,1,9,5,9,190,8,9,
+        10,9,12,9,193,9,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
+        1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
+        1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,3,10,227,8,10,1,11,
+        1,11,1,11,1,11,3,11,233,8,11,1,11,1,11,1,11,1,11,1,11,1,11,3,11,
+        241,8,11,1,11,1,11,1,11,3,11,246,8,11,1,12,1,12,1,12,1,12,1,13,1,
+        13,1,13,1,13,1,14,1,14,1,14,1,14,1,15,1,15,3,15,262,8,15,1,15,1,
+        15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,3,16,274,8,16,1,16,1,
+        16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,3,18,288,8,
+        18,1,18,1,18,3,18,292,8,18,1,18,1,18,3,18,296,8,18,1,18,1,18,1,18,
+        1,18,1,19,1,19,1,19,1,19,1,19,1,19,3,19,308,8,19,1,20,1,20,1,20,
+        1,20,3,20,314,8,20,1,20,1,20,1,20,1,20,1,20,3,20,321,8,20,1,20,1,
+        20,3,20,325,8,20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,
+        21,1,21,1,21,3,21,339,8,21,3,21,341,8,21,1,22,1,22,1,22,1,22,1,22,
+        1,22,1,22,1,22,1,22,5,22,352,8,22,10,22,12,22,355,9,22,1,22,1,22,
+        1,22,1,22,1,22,5,22,362,8,22,10,22,12,22,365,9,22,3,22,367,8,22,
+        1,22,1,22,1,23,1,23,1,23,1,23,4,23,375,8,23,11,23,12,23,376,1,23,
+        1,23,1,23,5,23,382,8,23,10,23,12,23,385,9,23,1,24,1,24,1,24,1,24,
+        1,24,1,24,5,24,393,8,24,10,24,12,24,396,9,24,1,25,1,25,1,25,1,25,
+        1,25,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,5,27,412,8,27,
+        10,27,12,27,415,9,27,1,28,1,28,1,28,1,28,1,28,1,28,5,28,423,8,28,
+        10,28,12,28,426,9,28,1,29,1,29,1,29,1,29,1,29,1,29,1,29,3,29,435,
+        8,29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,3,30,444,8,30,1,31,1,31,
+        1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,459,
+        8,32,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,
+        1,34,5,34,474,8,34,10,34,12,34,477,9,34,1,35,1,35,1,35,1,35,1,35,
+        1,35,1,35,1,35,5,35,487,8,35,10,35,12,35,490,9,35,1,36,1,36,1,36,
+        1,36,1,36,1,36,1,36,1,36,5,36,500,8,36,10,36,12,36,503,9,36,1,37,
+        1,37,1,37,1,37,1,37,1,37,1,37,1,37,5,37,513,8,37,10,37,12,37,516,
+        9,37,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,5,38,526,8,38,10,38,
+        12,38,529,9,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,5,39,539,
+        8,39,10,39,12,39,542,9,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,
+        1,40,1,40,1,40,1,40,1,40,3,40,557,8,40,1,41,1,41,1,41,1,41,1,42,
+        1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,5,42,572,8,42,10,42,12,42,
+        575,9,42,1,43,1,43,1,43,1,43,1,43,1,43,1,43,3,43,584,8,43,1,44,1,
+        44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,3,44,596,8,44,1,45,1,
+        45,1,45,3,45,601,8,45,1,45,1,45,1,45,1,46,1,46,1,46,1,46,3,46,610,
+        8,46,1,46,1,46,1,46,1,46,3,46,616,8,46,1,46,1,46,1,46,5,46,621,8,
+        46,10,46,12,46,624,9,46,1,46,1,46,1,46,1,46,1,46,3,46,631,8,46,1,
+        47,1,47,1,47,1,47,1,47,1,47,5,47,639,8,47,10,47,12,47,642,9,47,1,
+        48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,
+        48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,3,48,667,8,48,1,
+        49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,5,49,677,8,49,10,49,12,49,
+        680,9,49,3,49,682,8,49,1,49,1,49,1,49,0,0,50,0,2,4,6,8,10,12,14,
+        16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,
+        60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,90,92,94,96,98,0,6,
+        1,0,30,31,1,0,32,34,1,0,23,24,2,0,25,26,36,37,2,0,27,27,30,31,1,
+        0,28,29,706,0,100,1,0,0,0,2,118,1,0,0,0,4,120,1,0,0,0,6,135,1,0,
+        0,0,8,141,1,0,0,0,10,152,1,0,0,0,12,163,1,0,0,0,14,175,1,0,0,0,16,
+        182,1,0,0,0,18,184,1,0,0,0,20,226,1,0,0,0,22,245,1,0,0,0,24,247,
+        1,0,0,0,26,251,1,0,0,0,28,255,1,0,0,0,30,259,1,0,0,0,32,266,1,0,
+        0,0,34,277,1,0,0,0,36,284,1,0,0,0,38,307,1,0,0,0,40,324,1,0,0,0,
+        42,340,1,0,0,0,44,342,1,0,0,0,46,370,1,0,0,0,48,386,1,0,0,0,50,397,
+        1,0,0,0,52,402,1,0,0,0,54,405,1,0,0,0,56,416,1,0,0,0,58,434,1,0,
+        0,0,60,443,1,0,0,0,62,445,1,0,0,0,64,449,1,0,0,0,66,460,1,0,0,0,
+        68,465,1,0,0,0,70,478,1,0,0,0,72,491,1,0,0,0,74,504,1,0,0,0,76,517,
+        1,0,0,0,78,530,1,0,0,0,80,556,1,0,0,0,82,558,1,0,0,0,84,562,1,0,
+        0,0,86,583,1,0,0,0,88,595,1,0,0,0,90,597,1,0,0,0,92,630,1,0,0,0,
+        94,632,1,0,0,0,96,666,1,0,0,0,98,668,1,0,0,0,100,106,6,0,-1,0,101,
+        102,3,2,1,0,102,103,6,0,-1,0,103,105,1,0,0,0,104,101,1,0,0,0,105,
+        108,1,0,0,0,106,104,1,0,0,0,106,107,1,0,0,0,107,109,1,0,0,0,108,
+        106,1,0,0,0,109,110,5,0,0,1,110,111,6,0,-1,0,111,1,1,0,0,0,112,113,
+        3,4,2,0,113,114,6,1,-1,0,114,119,1,0,0,0,115,116,3,8,4,0,116,117,
+        6,1,-1,0,117,119,1,0,0,0,118,112,1,0,0,0,118,115,1,0,0,0,119,3,1,
+        0,0,0,120,121,5,16,0,0,121,122,5,20,0,0,122,123,5,41,0,0,123,129,
+        6,2,-1,0,124,125,3,6,3,0,125,126,6,2,-1,0,126,128,1,0,0,0,127,124,
+        1,0,0,0,128,131,1,0,0,0,129,127,1,0,0,0,129,130,1,0,0,0,130,132,
+        1,0,0,0,131,129,1,0,0,0,132,133,5,42,0,0,133,134,5,43,0,0,134,5,
+        1,0,0,0,135,136,3,14,7,0,136,137,5,20,0,0,137,138,5,43,0,0,138,139,
+        6,3,-1,0,139,7,1,0,0,0,140,142,3,16,8,0,141,140,1,0,0,0,141,142,
+        1,0,0,0,142,143,1,0,0,0,143,144,5,20,0,0,144,146,5,39,0,0,145,147,
+        3,10,5,0,146,145,1,0,0,0,146,147,1,0,0,0,147,148,1,0,0,0,148,149,
+        5,40,0,0,149,150,3,18,9,0,150,151,6,4,-1,0,151,9,1,0,0,0,152,153,
+        3,12,6,0,153,160,6,5,-1,0,154,155,5,44,0,0,155,156,3,12,6,0,156,
+        157,6,5,-1,0,157,159,1,0,0,0,158,154,1,0,0,0,159,162,1,0,0,0,160,
+        158,1,0,0,0,160,161,1,0,0,0,161,11,1,0,0,0,162,160,1,0,0,0,163,164,
+        3,14,7,0,164,165,5,20,0,0,165,166,6,6,-1,0,166,13,1,0,0,0,167,168,
+        5,13,0,0,168,176,6,7,-1,0,169,170,5,10,0,0,170,176,6,7,-1,0,171,
+        172,5,15,0,0,172,176,6,7,-1,0,173,174,5,20,0,0,174,176,6,7,-1,0,
+        175,167,1,0,0,0,175,169,1,0,0,0,175,171,1,0,0,0,175,173,1,0,0,0,
+        176,15,1,0,0,0,177,178,3,14,7,0,178,179,6,8,-1,0,179,183,1,0,0,0,
+        180,181,5,18,0,0,181,183,6,8,-1,0,182,177,1,0,0,0,182,180,1,0,0,
+        0,183,17,1,0,0,0,184,185,5,41,0,0,185,191,6,9,-1,0,186,187,3,20,
+        10,0,187,188,6,9,-1,0,188,190,1,0,0,0,189,186,1,0,0,0,190,193,1,
+        0,0,0,191,189,1,0,0,0,191,192,1,0,0,0,192,194,1,0,0,0,193,191,1,
+        0,0,0,194,195,5,42,0,0,195,19,1,0,0,0,196,197,3,22,11,0,197,198,
+        6,10,-1,0,198,227,1,0,0,0,199,200,3,32,16,0,200,201,6,10,-1,0,201,
+        227,1,0,0,0,202,203,3,34,17,0,203,204,6,10,-1,0,204,227,1,0,0,0,
+        205,206,3,36,18,0,206,207,6,10,-1,0,207,227,1,0,0,0,208,209,3,44,
+        22,0,209,210,6,10,-1,0,210,227,1,0,0,0,211,212,3,26,13,0,212,213,
+        6,10,-1,0,213,227,1,0,0,0,214,215,3,28,14,0,215,216,6,10,-1,0,216,
+        227,1,0,0,0,217,218,3,30,15,0,218,219,6,10,-1,0,219,227,1,0,0,0,
+        220,221,3,18,9,0,221,222,6,10,-1,0,222,227,1,0,0,0,223,224,3,24,
+        12,0,224,225,6,10,-1,0,225,227,1,0,0,0,226,196,1,0,0,0,226,199,1,
+        0,0,0,226,202,1,0,0,0,226,205,1,0,0,0,226,208,1,0,0,0,226,211,1,
+        0,0,0,226,214,1,0,0,0,226,217,1,0,0,0,226,220,1,0,0,0,226,223,1,
+        0,0,0,227,21,1,0,0,0,228,229,5,4,0,0,229,232,5,20,0,0,230,231,5,
+        35,0,0,231,233,3,62,31,0,232,230,1,0,0,0,232,233,1,0,0,0,233,234,
+        1,0,0,0,234,235,5,43,0,0,235,246,6,11,-1,0,236,237,3,14,7,0,237,
+        240,5,20,0,0,238,239,5,35,0,0,239,241,3,62,31,0,240,238,1,0,0,0,
+        240,241,1,0,0,0,241,242,1,0,0,0,242,243,5,43,0,0,243,244,6,11,-1,
+        0,244,246,1,0,0,0,245,228,1,0,0,0,245,236,1,0,0,0,246,23,1,0,0,0,
+        247,248,3,62,31,0,248,249,5,43,0,0,249,250,6,12,-1,0,250,25,1,0,
+        0,0,251,252,5,5,0,0,252,253,5,43,0,0,253,254,6,13,-1,0,254,27,1,
+        0,0,0,255,256,5,7,0,0,256,257,5,43,0,0,257,258,6,14,-1,0,258,29,
+        1,0,0,0,259,261,5,14,0,0,260,262,3,62,31,0,261,260,1,0,0,0,261,262,
+        1,0,0,0,262,263,1,0,0,0,263,264,5,43,0,0,264,265,6,15,-1,0,265,31,
+        1,0,0,0,266,267,5,12,0,0,267,268,5,39,0,0,268,269,3,62,31,0,269,
+        270,5,40,0,0,270,273,3,20,10,0,271,272,5,9,0,0,272,274,3,20,10,0,
+        273,271,1,0,0,0,273,274,1,0,0,0,274,275,1,0,0,0,275,276,6,16,-1,
+        0,276,33,1,0,0,0,277,278,5,19,0,0,278,279,5,39,0,0,279,280,3,62,
+        31,0,280,281,5,40,0,0,281,282,3,20,10,0,282,283,6,17,-1,0,283,35,
+        1,0,0,0,284,285,5,11,0,0,285,287,5,39,0,0,286,288,3,38,19,0,287,
+        286,1,0,0,0,287,288,1,0,0,0,288,289,1,0,0,0,289,291,5,43,0,0,290,
+        292,3,62,31,0,291,290,1,0,0,0,291,292,1,0,0,0,292,293,1,0,0,0,293,
+        295,5,43,0,0,294,296,3,42,21,0,295,294,1,0,0,0,295,296,1,0,0,0,296,
+        297,1,0,0,0,297,298,5,40,0,0,298,299,3,20,10,0,299,300,6,18,-1,0,
+        300,37,1,0,0,0,301,302,3,40,20,0,302,303,6,19,-1,0,303,308,1,0,0,
+        0,304,305,3,66,33,0,305,306,6,19,-1,0,306,308,1,0,0,0,307,301,1,
+        0,0,0,307,304,1,0,0,0,308,39,1,0,0,0,309,310,5,4,0,0,310,313,5,20,
+        0,0,311,312,5,35,0,0,312,314,3,62,31,0,313,311,1,0,0,0,313,314,1,
+        0,0,0,314,315,1,0,0,0,315,325,6,20,-1,0,316,317,3,14,7,0,317,320,
+        5,20,0,0,318,319,5,35,0,0,319,321,3,62,31,0,320,318,1,0,0,0,320,
+        321,1,0,0,0,321,322,1,0,0,0,322,323,6,20,-1,0,323,325,1,0,0,0,324,
+        309,1,0,0,0,324,316,1,0,0,0,325,41,1,0,0,0,326,327,3,82,41,0,327,
+        328,6,21,-1,0,328,341,1,0,0,0,329,338,3,92,46,0,330,331,5,35,0,0,
+        331,332,3,64,32,0,332,333,6,21,-1,0,333,339,1,0,0,0,334,335,5,28,
+        0,0,335,339,6,21,-1,0,336,337,5,29,0,0,337,339,6,21,-1,0,338,330,
+        1,0,0,0,338,334,1,0,0,0,338,336,1,0,0,0,339,341,1,0,0,0,340,326,
+        1,0,0,0,340,329,1,0,0,0,341,43,1,0,0,0,342,343,5,17,0,0,343,344,
+        5,39,0,0,344,345,3,62,31,0,345,346,5,40,0,0,346,347,5,41,0,0,347,
+        353,6,22,-1,0,348,349,3,46,23,0,349,350,6,22,-1,0,350,352,1,0,0,
+        0,351,348,1,0,0,0,352,355,1,0,0,0,353,351,1,0,0,0,353,354,1,0,0,
+        0,354,366,1,0,0,0,355,353,1,0,0,0,356,357,3,48,24,0,357,363,6,22,
+        -1,0,358,359,3,46,23,0,359,360,6,22,-1,0,360,362,1,0,0,0,361,358,
+        1,0,0,0,362,365,1,0,0,0,363,361,1,0,0,0,363,364,1,0,0,0,364,367,
+        1,0,0,0,365,363,1,0,0,0,366,356,1,0,0,0,366,367,1,0,0,0,367,368,
+        1,0,0,0,368,369,5,42,0,0,369,45,1,0,0,0,370,374,6,23,-1,0,371,372,
+        3,50,25,0,372,373,6,23,-1,0,373,375,1,0,0,0,374,371,1,0,0,0,375,
+        376,1,0,0,0,376,374,1,0,0,0,376,377,1,0,0,0,377,383,1,0,0,0,378,
+        379,3,20,10,0,379,380,6,23,-1,0,380,382,1,0,0,0,381,378,1,0,0,0,
+        382,385,1,0,0,0,383,381,1,0,0,0,383,384,1,0,0,0,384,47,1,0,0,0,385,
+        383,1,0,0,0,386,387,5,8,0,0,387,388,5,45,0,0,388,394,6,24,-1,0,389,
+        390,3,20,10,0,390,391,6,24,-1,0,391,393,1,0,0,0,392,389,1,0,0,0,
+        393,396,1,0,0,0,394,392,1,0,0,0,394,395,1,0,0,0,395,49,1,0,0,0,396,
+        394,1,0,0,0,397,398,5,6,0,0,398,399,3,52,26,0,399,400,5,45,0,0,400,
+        401,6,25,-1,0,401,51,1,0,0,0,402,403,3,54,27,0,403,404,6,26,-1,0,
+        404,53,1,0,0,0,405,406,3,56,28,0,406,413,6,27,-1,0,407,408,7,0,0,
+        0,408,409,3,56,28,0,409,410,6,27,-1,0,410,412,1,0,0,0,411,407,1,
+        0,0,0,412,415,1,0,0,0,413,411,1,0,0,0,413,414,1,0,0,0,414,55,1,0,
+        0,0,415,413,1,0,0,0,416,417,3,58,29,0,417,424,6,28,-1,0,418,419,
+        7,1,0,0,419,420,3,58,29,0,420,421,6,28,-1,0,421,423,1,0,0,0,422,
+        418,1,0,0,0,423,426,1,0,0,0,424,422,1,0,0,0,424,425,1,0,0,0,425,
+        57,1,0,0,0,426,424,1,0,0,0,427,428,7,0,0,0,428,429,3,58,29,0,429,
+        430,6,29,-1,0,430,435,1,0,0,0,431,432,3,60,30,0,432,433,6,29,-1,
+        0,433,435,1,0,0,0,434,427,1,0,0,0,434,431,1,0,0,0,435,59,1,0,0,0,
+        436,437,5,47,0,0,437,444,6,30,-1,0,438,439,5,39,0,0,439,440,3,52,
+        26,0,440,441,5,40,0,0,441,442,6,30,-1,0,442,444,1,0,0,0,443,436,
+        1,0,0,0,443,438,1,0,0,0,444,61,1,0,0,0,445,446,3,64,32,0,446,447,
+        6,31,-1,0,447,448,6,31,-1,0,448,63,1,0,0,0,449,450,3,68,34,0,450,
+        451,6,32,-1,0,451,458,6,32,-1,0,452,453,6,32,-1,0,453,454,5,35,0,
+        0,454,455,3,64,32,0,455,456,6,32,-1,0,456,457,6,32,-1,0,457,459,
+        1,0,0,0,458,452,1,0,0,0,458,459,1,0,0,0,459,65,1,0,0,0,460,461,3,
+        92,46,0,461,462,5,35,0,0,462,463,3,64,32,0,463,464,6,33,-1,0,464,
+        67,1,0,0,0,465,466,3,70,35,0,466,467,6,34,-1,0,467,475,6,34,-1,0,
+        468,469,5,21,0,0,469,470,3,70,35,0,470,471,6,34,-1,0,471,472,6,34,
+        -1,0,472,474,1,0,0,0,473,468,1,0,0,0,474,477,1,0,0,0,475,473,1,0,
+        0,0,475,476,1,0,0,0,476,69,1,0,0,0,477,475,1,0,0,0,478,479,3,72,
+        36,0,479,480,6,35,-1,0,480,488,6,35,-1,0,481,482,5,22,0,0,482,483,
+        3,72,36,0,483,484,6,35,-1,0,484,485,6,35,-1,0,485,487,1,0,0,0,486,
+        481,1,0,0,0,487,490,1,0,0,0,488,486,1,0,0,0,488,489,1,0,0,0,489,
+        71,1,0,0,0,490,488,1,0,0,0,491,492,3,74,37,0,492,493,6,36,-1,0,493,
+        501,6,36,-1,0,494,495,7,2,0,0,495,496,3,74,37,0,496,497,6,36,-1,
+        0,497,498,6,36,-1,0,498,500,1,0,0,0,499,494,1,0,0,0,500,503,1,0,
+        0,0,501,499,1,0,0,0,501,502,1,0,0,0,502,73,1,0,0,0,503,501,1,0,0,
+        0,504,505,3,76,38,0,505,506,6,37,-1,0,506,514,6,37,-1,0,507,508,
+        7,3,0,0,508,509,3,76,38,0,509,510,6,37,-1,0,510,511,6,37,-1,0,511,
+        513,1,0,0,0,512,507,1,0,0,0,513,516,1,0,0,0,514,512,1,0,0,0,514,
+        515,1,0,0,0,515,75,1,0,0,0,516,514,1,0,0,0,517,518,3,78,39,0,518,
+        519,6,38,-1,0,519,527,6,38,-1,0,520,521,7,0,0,0,521,522,3,78,39,
+        0,522,523,6,38,-1,0,523,524,6,38,-1,0,524,526,1,0,0,0,525,520,1,
+        0,0,0,526,529,1,0,0,0,527,525,1,0,0,0,527,528,1,0,0,0,528,77,1,0,
+        0,0,529,527,1,0,0,0,530,531,3,80,40,0,531,532,6,39,-1,0,532,540,
+        6,39,-1,0,533,534,7,1,0,0,534,535,3,80,40,0,535,536,6,39,-1,0,536,
+        537,6,39,-1,0,537,539,1,0,0,0,538,533,1,0,0,0,539,542,1,0,0,0,540,
+        538,1,0,0,0,540,541,1,0,0,0,541,79,1,0,0,0,542,540,1,0,0,0,543,544,
+        3,82,41,0,544,545,6,40,-1,0,545,546,6,40,-1,0,546,557,1,0,0,0,547,
+        548,7,4,0,0,548,549,3,80,40,0,549,550,6,40,-1,0,550,551,6,40,-1,
+        0,551,557,1,0,0,0,552,553,3,84,42,0,553,554,6,40,-1,0,554,555,6,
+        40,-1,0,555,557,1,0,0,0,556,543,1,0,0,0,556,547,1,0,0,0,556,552,
+        1,0,0,0,557,81,1,0,0,0,558,559,7,5,0,0,559,560,3,92,46,0,560,561,
+        6,41,-1,0,561,83,1,0,0,0,562,563,3,88,44,0,563,564,6,42,-1,0,564,
+        565,6,42,-1,0,565,573,6,42,-1,0,566,567,3,86,43,0,567,568,6,42,-1,
+        0,568,569,6,42,-1,0,569,570,6,42,-1,0,570,572,1,0,0,0,571,566,1,
+        0,0,0,572,575,1,0,0,0,573,571,1,0,0,0,573,574,1,0,0,0,574,85,1,0,
+        0,0,575,573,1,0,0,0,576,577,5,38,0,0,577,578,5,20,0,0,578,584,6,
+        43,-1,0,579,580,5,28,0,0,580,584,6,43,-1,0,581,582,5,29,0,0,582,
+        584,6,43,-1,0,583,576,1,0,0,0,583,579,1,0,0,0,583,581,1,0,0,0,584,
+        87,1,0,0,0,585,586,3,90,45,0,586,587,6,44,-1,0,587,588,6,44,-1,0,
+        588,589,6,44,-1,0,589,596,1,0,0,0,590,591,3,96,48,0,591,592,6,44,
+        -1,0,592,593,6,44,-1,0,593,594,6,44,-1,0,594,596,1,0,0,0,595,585,
+        1,0,0,0,595,590,1,0,0,0,596,89,1,0,0,0,597,598,5,20,0,0,598,600,
+        5,39,0,0,599,601,3,94,47,0,600,599,1,0,0,0,600,601,1,0,0,0,601,602,
+        1,0,0,0,602,603,5,40,0,0,603,604,6,45,-1,0,604,91,1,0,0,0,605,606,
+        5,20,0,0,606,615,6,46,-1,0,607,609,5,39,0,0,608,610,3,94,47,0,609,
+        608,1,0,0,0,609,610,1,0,0,0,610,611,1,0,0,0,611,612,5,40,0,0,612,
+        613,5,38,0,0,613,614,5,20,0,0,614,616,6,46,-1,0,615,607,1,0,0,0,
+        615,616,1,0,0,0,616,622,1,0,0,0,617,618,5,38,0,0,618,619,5,20,0,
+        0,619,621,6,46,-1,0,620,617,1,0,0,0,621,624,1,0,0,0,622,620,1,0,
+        0,0,622,623,1,0,0,0,623,631,1,0,0,0,624,622,1,0,0,0,625,626,5,39,
+        0,0,626,627,3,92,46,0,627,628,5,40,0,0,628,629,6,46,-1,0,629,631,
+        1,0,0,0,630,605,1,0,0,0,630,625,1,0,0,0,631,93,1,0,0,0,632,633,3,
+        62,31,0,633,640,6,47,-1,0,634,635,5,44,0,0,635,636,3,62,31,0,636,
+        637,6,47,-1,0,637,639,1,0,0,0,638,634,1,0,0,0,639,642,1,0,0,0,640,
+        638,1,0,0,0,640,641,1,0,0,0,641,95,1,0,0,0,642,640,1,0,0,0,643,644,
+        5,47,0,0,644,645,6,48,-1,0,645,667,6,48,-1,0,646,647,5,46,0,0,647,
+        648,6,48,-1,0,648,667,6,48,-1,0,649,650,5,50,0,0,650,651,6,48,-1,
+        0,651,667,6,48,-1,0,652,653,3,98,49,0,653,654,6,48,-1,0,654,655,
+        6,48,-1,0,655,667,1,0,0,0,656,657,5,20,0,0,657,658,6,48,-1,0,658,
+        667,6,48,-1,0,659,660,5,39,0,0,660,661,3,62,31,0,661,662,5,40,0,
+        0,662,663,6,48,-1,0,663,664,6,48,-1,0,664,665,6,48,-1,0,665,667,
+        1,0,0,0,666,643,1,0,0,0,666,646,1,0,0,0,666,649,1,0,0,0,666,652,
+        1,0,0,0,666,656,1,0,0,0,666,659,1,0,0,0,667,97,1,0,0,0,668,669,5,
+        41,0,0,669,681,6,49,-1,0,670,671,3,62,31,0,671,678,6,49,-1,0,672,
+        673,5,44,0,0,673,674,3,62,31,0,674,675,6,49,-1,0,675,677,1,0,0,0,
+        676,672,1,0,0,0,677,680,1,0,0,0,678,676,1,0,0,0,678,679,1,0,0,0,
+        679,682,1,0,0,0,680,678,1,0,0,0,681,670,1,0,0,0,681,682,1,0,0,0,
+        682,683,1,0,0,0,683,684,5,42,0,0,684,99,1,0,0,0,54,106,118,129,141,
+        146,160,175,182,191,226,232,240,245,261,273,287,291,295,307,313,
+        320,324,338,340,353,363,366,376,383,394,413,424,434,443,458,475,
+        488,501,514,527,540,556,573,583,595,600,609,615,622,630,640,666,
+        678,681
+    ]
+
+class TyCASTParser ( TyCParserBase ):
+
+    grammarFileName = "TyCASTParser.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "'auto'", "'break'", "'case'", "'continue'", "'default'", 
+                     "'else'", "'float'", "'for'", "'if'", "'int'", "'return'", 
+                     "'string'", "'struct'", "'switch'", "'void'", "'while'", 
+                     "<INVALID>", "'||'", "'&&'", "'=='", "'!='", "'<='", 
+                     "'>='", "'!'", "'++'", "'--'", "'+'", "'-'", "'*'", 
+                     "'/'", "'%'", "'='", "'<'", "'>'", "'.'", "'('", "')'", 
+                     "'{'", "'}'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>", "WS", "LINE_COMMENT", "BLOCK_COMMENT", 
+                      "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", 
+                      "FLOAT", "FOR", "IF", "INT", "RETURN", "STRING", "STRUCT", 
+                      "SWITCH", "VOID", "WHILE", "ID", "OR", "AND", "EQ", 
+                      "NEQ", "LE", "GE", "NOT", "INC", "DEC", "PLUS", "MINUS", 
+                      "MUL", "DIV", "MOD", "ASSIGN", "LT", "GT", "DOT", 
+                      "LPAREN", "RPAREN", "LBRACE", "RBRACE", "SEMI", "COMMA", 
+                      "COLON", "FLOAT_LITERAL", "INT_LITERAL", "ILLEGAL_ESCAPE", 
+                      "UNCLOSE_STRING", "STRING_LITERAL", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_decl = 1
+    RULE_structDecl = 2
+    RULE_structMember = 3
+    RULE_funcDecl = 4
+    RULE_paramList = 5
+    RULE_param = 6
+    RULE_typeSpec = 7
+    RULE_returnType = 8
+    RULE_block = 9
+    RULE_stmt = 10
+    RULE_varDecl = 11
+    RULE_exprStmt = 12
+    RULE_breakStmt = 13
+    RULE_continueStmt = 14
+    RULE_returnStmt = 15
+    RULE_ifStmt = 16
+    RULE_whileStmt = 17
+    RULE_forStmt = 18
+    RULE_forInit = 19
+    RULE_varDeclFor = 20
+    RULE_forUpdate = 21
+    RULE_switchStmt = 22
+    RULE_switchSection = 23
+    RULE_defaultSection = 24
+    RULE_caseLabel = 25
+    RULE_constExpr = 26
+    RULE_constAddExpr = 27
+    RULE_constMulExpr = 28
+    RULE_constUnaryExpr = 29
+    RULE_constPrimary = 30
+    RULE_expr = 31
+    RULE_assignExpr = 32
+    RULE_assignOnly = 33
+    RULE_orExpr = 34
+    RULE_andExpr = 35
+    RULE_eqExpr = 36
+    RULE_relExpr = 37
+    RULE_addExpr = 38
+    RULE_mulExpr = 39
+    RULE_unaryExpr = 40
+    RULE_prefixIncDec = 41
+    RULE_postfixExpr = 42
+    RULE_postfixOp = 43
+    RULE_postfixPrimary = 44
+    RULE_postfixCall = 45
+    RULE_lvalue = 46
+    RULE_argList = 47
+    RULE_primaryExpr = 48
+    RULE_structLiteral = 49
+
+    ruleNames =  [ "program", "decl", "structDecl", "structMember", "funcDecl", 
+                   "paramList", "param", "typeSpec", "returnType", "block", 
+                   "stmt", "varDecl", "exprStmt", "breakStmt", "continueStmt", 
+                   "returnStmt", "ifStmt", "whileStmt", "forStmt", "forInit", 
+                   "varDeclFor", "forUpdate", "switchStmt", "switchSection", 
+                   "defaultSection", "caseLabel", "constExpr", "constAddExpr", 
+                   "constMulExpr", "constUnaryExpr", "constPrimary", "expr", 
+                   "assignExpr", "assignOnly", "orExpr", "andExpr", "eqExpr", 
+                   "relExpr", "addExpr", "mulExpr", "unaryExpr", "prefixIncDec", 
+                   "postfixExpr", "postfixOp", "postfixPrimary", "postfixCall", 
+                   "lvalue", "argList", "primaryExpr", "structLiteral" ]
+
+    EOF = Token.EOF
+    WS=1
+    LINE_COMMENT=2
+    BLOCK_COMMENT=3
+    AUTO=4
+    BREAK=5
+    CASE=6
+    CONTINUE=7
+    DEFAULT=8
+    ELSE=9
+    FLOAT=10
+    FOR=11
+    IF=12
+    INT=13
+    RETURN=14
+    STRING=15
+    STRUCT=16
+    SWITCH=17
+    VOID=18
+    WHILE=19
+    ID=20
+    OR=21
+    AND=22
+    EQ=23
+    NEQ=24
+    LE=25
+    GE=26
+    NOT=27
+    INC=28
+    DEC=29
+    PLUS=30
+    MINUS=31
+    MUL=32
+    DIV=33
+    MOD=34
+    ASSIGN=35
+    LT=36
+    GT=37
+    DOT=38
+    LPAREN=39
+    RPAREN=40
+    LBRACE=41
+    RBRACE=42
+    SEMI=43
+    COMMA=44
+    COLON=45
+    FLOAT_LITERAL=46
+    INT_LITERAL=47
+    ILLEGAL_ESCAPE=48
+    UNCLOSE_STRING=49
+    STRING_LITERAL=50
+    ERROR_CHAR=51
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+    # Start with the warm DFAs and context cache of build/TyC.snapshot, as
+    # TyCParser does.
+    decisionsToDFA, sharedContextCache = warm_state("TyCASTParser", serializedATN(), atn, decisionsToDFA, sharedContextCache)
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._decl = None # DeclContext
+
+        def EOF(self):
+            return self.getToken(TyCASTParser.EOF, 0)
+
+        def decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.DeclContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.DeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_program
+
+
+
+
+    def program(self):
+
+        localctx = TyCASTParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self.buildParseTrees = False
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx.node = Program([])
+            self.state = 106
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1418240) != 0):
+                self.state = 101
+                localctx._decl = self.decl()
+                localctx.node.decls.append(localctx._decl.node)
+                self.state = 108
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 109
+            self.match(TyCASTParser.EOF)
+            at(localctx.node, localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._structDecl = None # StructDeclContext
+            self._funcDecl = None # FuncDeclContext
+
+        def structDecl(self):
+            return self.getTypedRuleContext(TyCASTParser.StructDeclContext,0)
+
+
+        def funcDecl(self):
+            return self.getTypedRuleContext(TyCASTParser.FuncDeclContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_decl
+
+
+
+
+    def decl(self):
+
+        localctx = TyCASTParser.DeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_decl)
+        try:
+            self.state = 118
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [16]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 112
+                localctx._structDecl = self.structDecl()
+                localctx.node = localctx._structDecl.node
+                pass
+            elif token in [10, 13, 15, 18, 20]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 115
+                localctx._funcDecl = self.funcDecl()
+                localctx.node = localctx._funcDecl.node
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._ID = None # Token
+            self._structMember = None # StructMemberContext
+
+        def STRUCT(self):
+            return self.getToken(TyCASTParser.STRUCT, 0)
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCASTParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCASTParser.RBRACE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def structMember(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.StructMemberContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.StructMemberContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_structDecl
+
+
+
+
+    def structDecl(self):
+
+        localctx = TyCASTParser.StructDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_structDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 120
+            self.match(TyCASTParser.STRUCT)
+            self.state = 121
+            localctx._ID = self.match(TyCASTParser.ID)
+            self.state = 122
+            self.match(TyCASTParser.LBRACE)
+            localctx.node = at(StructDecl((None if localctx._ID is None else localctx._ID.text), []), localctx.start)
+            self.state = 129
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1090560) != 0):
+                self.state = 124
+                localctx._structMember = self.structMember()
+                localctx.node.members.append(localctx._structMember.node)
+                self.state = 131
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 132
+            self.match(TyCASTParser.RBRACE)
+            self.state = 133
+            self.match(TyCASTParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructMemberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._typeSpec = None # TypeSpecContext
+            self._ID = None # Token
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCASTParser.TypeSpecContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_structMember
+
+
+
+
+    def structMember(self):
+
+        localctx = TyCASTParser.StructMemberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_structMember)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 135
+            localctx._typeSpec = self.typeSpec()
+            self.state = 136
+            localctx._ID = self.match(TyCASTParser.ID)
+            self.state = 137
+            self.match(TyCASTParser.SEMI)
+            localctx.node = at(MemberDecl(localctx._typeSpec.node, (None if localctx._ID is None else localctx._ID.text)), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FuncDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._returnType = None # ReturnTypeContext
+            self._ID = None # Token
+            self._paramList = None # ParamListContext
+            self._block = None # BlockContext
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCASTParser.BlockContext,0)
+
+
+        def returnType(self):
+            return self.getTypedRuleContext(TyCASTParser.ReturnTypeContext,0)
+
+
+        def paramList(self):
+            return self.getTypedRuleContext(TyCASTParser.ParamListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_funcDecl
+
+
+
+
+    def funcDecl(self):
+
+        localctx = TyCASTParser.FuncDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_funcDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 141
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.state = 140
+                localctx._returnType = self.returnType()
+
+
+            self.state = 143
+            localctx._ID = self.match(TyCASTParser.ID)
+            self.state = 144
+            self.match(TyCASTParser.LPAREN)
+            self.state = 146
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1090560) != 0):
+                self.state = 145
+                localctx._paramList = self.paramList()
+
+
+            self.state = 148
+            self.match(TyCASTParser.RPAREN)
+            self.state = 149
+            localctx._block = self.block()
+            localctx.node = at(FuncDecl(localctx._returnType.node if localctx._returnType else None, (None if localctx._ID is None else localctx._ID.text), localctx._paramList.nodes if localctx._paramList else [], localctx._block.node), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.nodes = None
+            self.p = None # ParamContext
+            self.q = None # ParamContext
+
+        def param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.ParamContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.ParamContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.COMMA)
+            else:
+                return self.getToken(TyCASTParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_paramList
+
+
+
+
+    def paramList(self):
+
+        localctx = TyCASTParser.ParamListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_paramList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 152
+            localctx.p = self.param()
+            localctx.nodes = [localctx.p.node]
+            self.state = 160
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==44:
+                self.state = 154
+                self.match(TyCASTParser.COMMA)
+                self.state = 155
+                localctx.q = self.param()
+                localctx.nodes.append(localctx.q.node)
+                self.state = 162
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._typeSpec = None # TypeSpecContext
+            self._ID = None # Token
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCASTParser.TypeSpecContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_param
+
+
+
+
+    def param(self):
+
+        localctx = TyCASTParser.ParamContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_param)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 163
+            localctx._typeSpec = self.typeSpec()
+            self.state = 164
+            localctx._ID = self.match(TyCASTParser.ID)
+            localctx.node = at(Param(localctx._typeSpec.node, (None if localctx._ID is None else localctx._ID.text)), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeSpecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._ID = None # Token
+
+        def INT(self):
+            return self.getToken(TyCASTParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(TyCASTParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(TyCASTParser.STRING, 0)
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_typeSpec
+
+
+
+
+    def typeSpec(self):
+
+        localctx = TyCASTParser.TypeSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_typeSpec)
+        try:
+            self.state = 175
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [13]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 167
+                self.match(TyCASTParser.INT)
+                localctx.node = at(IntType(), localctx.start)
+                pass
+            elif token in [10]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 169
+                self.match(TyCASTParser.FLOAT)
+                localctx.node = at(FloatType(), localctx.start)
+                pass
+            elif token in [15]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 171
+                self.match(TyCASTParser.STRING)
+                localctx.node = at(StringType(), localctx.start)
+                pass
+            elif token in [20]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 173
+                localctx._ID = self.match(TyCASTParser.ID)
+                localctx.node = at(StructType((None if localctx._ID is None else localctx._ID.text)), localctx.start)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._typeSpec = None # TypeSpecContext
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCASTParser.TypeSpecContext,0)
+
+
+        def VOID(self):
+            return self.getToken(TyCASTParser.VOID, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_returnType
+
+
+
+
+    def returnType(self):
+
+        localctx = TyCASTParser.ReturnTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_returnType)
+        try:
+            self.state = 182
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [10, 13, 15, 20]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 177
+                localctx._typeSpec = self.typeSpec()
+                localctx.node = localctx._typeSpec.node
+                pass
+            elif token in [18]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 180
+                self.match(TyCASTParser.VOID)
+                localctx.node = at(VoidType(), localctx.start)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._stmt = None # StmtContext
+
+        def LBRACE(self):
+            return self.getToken(TyCASTParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCASTParser.RBRACE, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_block
+
+
+
+
+    def block(self):
+
+        localctx = TyCASTParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 184
+            self.match(TyCASTParser.LBRACE)
+            localctx.node = at(BlockStmt([]), localctx.start)
+            self.state = 191
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080963248) != 0):
+                self.state = 186
+                localctx._stmt = self.stmt()
+                localctx.node.statements.append(localctx._stmt.node)
+                self.state = 193
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 194
+            self.match(TyCASTParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._varDecl = None # VarDeclContext
+            self._ifStmt = None # IfStmtContext
+            self._whileStmt = None # WhileStmtContext
+            self._forStmt = None # ForStmtContext
+            self._switchStmt = None # SwitchStmtContext
+            self._breakStmt = None # BreakStmtContext
+            self._continueStmt = None # ContinueStmtContext
+            self._returnStmt = None # ReturnStmtContext
+            self._block = None # BlockContext
+            self._exprStmt = None # ExprStmtContext
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCASTParser.VarDeclContext,0)
+
+
+        def ifStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.IfStmtContext,0)
+
+
+        def whileStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.WhileStmtContext,0)
+
+
+        def forStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.ForStmtContext,0)
+
+
+        def switchStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.SwitchStmtContext,0)
+
+
+        def breakStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.BreakStmtContext,0)
+
+
+        def continueStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.ContinueStmtContext,0)
+
+
+        def returnStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.ReturnStmtContext,0)
+
+
+        def block(self):
+            return self.getTypedRuleContext(TyCASTParser.BlockContext,0)
+
+
+        def exprStmt(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprStmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_stmt
+
+
+
+
+    def stmt(self):
+
+        localctx = TyCASTParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_stmt)
+        try:
+            self.state = 226
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 196
+                localctx._varDecl = self.varDecl()
+                localctx.node = localctx._varDecl.node
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 199
+                localctx._ifStmt = self.ifStmt()
+                localctx.node = localctx._ifStmt.node
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 202
+                localctx._whileStmt = self.whileStmt()
+                localctx.node = localctx._whileStmt.node
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 205
+                localctx._forStmt = self.forStmt()
+                localctx.node = localctx._forStmt.node
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 208
+                localctx._switchStmt = self.switchStmt()
+                localctx.node = localctx._switchStmt.node
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 211
+                localctx._breakStmt = self.breakStmt()
+                localctx.node = localctx._breakStmt.node
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 214
+                localctx._continueStmt = self.continueStmt()
+                localctx.node = localctx._continueStmt.node
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 217
+                localctx._returnStmt = self.returnStmt()
+                localctx.node = localctx._returnStmt.node
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 220
+                localctx._block = self.block()
+                localctx.node = localctx._block.node
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 223
+                localctx._exprStmt = self.exprStmt()
+                localctx.node = localctx._exprStmt.node
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._ID = None # Token
+            self._expr = None # ExprContext
+            self._typeSpec = None # TypeSpecContext
+
+        def AUTO(self):
+            return self.getToken(TyCASTParser.AUTO, 0)
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCASTParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCASTParser.TypeSpecContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_varDecl
+
+
+
+
+    def varDecl(self):
+
+        localctx = TyCASTParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 245
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [4]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 228
+                self.match(TyCASTParser.AUTO)
+                self.state = 229
+                localctx._ID = self.match(TyCASTParser.ID)
+                self.state = 232
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 230
+                    self.match(TyCASTParser.ASSIGN)
+                    self.state = 231
+                    localctx._expr = self.expr()
+
+
+                self.state = 234
+                self.match(TyCASTParser.SEMI)
+                localctx.node = at(VarDecl(None, (None if localctx._ID is None else localctx._ID.text), localctx._expr.node if localctx._expr else None), localctx.start)
+                pass
+            elif token in [10, 13, 15, 20]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 236
+                localctx._typeSpec = self.typeSpec()
+                self.state = 237
+                localctx._ID = self.match(TyCASTParser.ID)
+                self.state = 240
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 238
+                    self.match(TyCASTParser.ASSIGN)
+                    self.state = 239
+                    localctx._expr = self.expr()
+
+
+                self.state = 242
+                self.match(TyCASTParser.SEMI)
+                localctx.node = at(VarDecl(localctx._typeSpec.node, (None if localctx._ID is None else localctx._ID.text), localctx._expr.node if localctx._expr else None), localctx.start)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._expr = None # ExprContext
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_exprStmt
+
+
+
+
+    def exprStmt(self):
+
+        localctx = TyCASTParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_exprStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 247
+            localctx._expr = self.expr()
+            self.state = 248
+            self.match(TyCASTParser.SEMI)
+            localctx.node = at(ExprStmt(localctx._expr.node), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+
+        def BREAK(self):
+            return self.getToken(TyCASTParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_breakStmt
+
+
+
+
+    def breakStmt(self):
+
+        localctx = TyCASTParser.BreakStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_breakStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 251
+            self.match(TyCASTParser.BREAK)
+            self.state = 252
+            self.match(TyCASTParser.SEMI)
+            localctx.node = at(BreakStmt(), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinueStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+
+        def CONTINUE(self):
+            return self.getToken(TyCASTParser.CONTINUE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_continueStmt
+
+
+
+
+    def continueStmt(self):
+
+        localctx = TyCASTParser.ContinueStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_continueStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 255
+            self.match(TyCASTParser.CONTINUE)
+            self.state = 256
+            self.match(TyCASTParser.SEMI)
+            localctx.node = at(ContinueStmt(), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._expr = None # ExprContext
+
+        def RETURN(self):
+            return self.getToken(TyCASTParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCASTParser.SEMI, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_returnStmt
+
+
+
+
+    def returnStmt(self):
+
+        localctx = TyCASTParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_returnStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 259
+            self.match(TyCASTParser.RETURN)
+            self.state = 261
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 260
+                localctx._expr = self.expr()
+
+
+            self.state = 263
+            self.match(TyCASTParser.SEMI)
+            localctx.node = at(ReturnStmt(localctx._expr.node if localctx._expr else None), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._expr = None # ExprContext
+            self.t = None # StmtContext
+            self.e = None # StmtContext
+
+        def IF(self):
+            return self.getToken(TyCASTParser.IF, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.StmtContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(TyCASTParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_ifStmt
+
+
+
+
+    def ifStmt(self):
+
+        localctx = TyCASTParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_ifStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 266
+            self.match(TyCASTParser.IF)
+            self.state = 267
+            self.match(TyCASTParser.LPAREN)
+            self.state = 268
+            localctx._expr = self.expr()
+            self.state = 269
+            self.match(TyCASTParser.RPAREN)
+            self.state = 270
+            localctx.t = self.stmt()
+            self.state = 273
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                self.state = 271
+                self.match(TyCASTParser.ELSE)
+                self.state = 272
+                localctx.e = self.stmt()
+
+
+            localctx.node = at(IfStmt(localctx._expr.node, localctx.t.node, localctx.e.node if localctx.e else None), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class WhileStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._expr = None # ExprContext
+            self._stmt = None # StmtContext
+
+        def WHILE(self):
+            return self.getToken(TyCASTParser.WHILE, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCASTParser.StmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_whileStmt
+
+
+
+
+    def whileStmt(self):
+
+        localctx = TyCASTParser.WhileStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_whileStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 277
+            self.match(TyCASTParser.WHILE)
+            self.state = 278
+            self.match(TyCASTParser.LPAREN)
+            self.state = 279
+            localctx._expr = self.expr()
+            self.state = 280
+            self.match(TyCASTParser.RPAREN)
+            self.state = 281
+            localctx._stmt = self.stmt()
+            localctx.node = at(WhileStmt(localctx._expr.node, localctx._stmt.node), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._forInit = None # ForInitContext
+            self._expr = None # ExprContext
+            self._forUpdate = None # ForUpdateContext
+            self._stmt = None # StmtContext
+
+        def FOR(self):
+            return self.getToken(TyCASTParser.FOR, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.SEMI)
+            else:
+                return self.getToken(TyCASTParser.SEMI, i)
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCASTParser.StmtContext,0)
+
+
+        def forInit(self):
+            return self.getTypedRuleContext(TyCASTParser.ForInitContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def forUpdate(self):
+            return self.getTypedRuleContext(TyCASTParser.ForUpdateContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_forStmt
+
+
+
+
+    def forStmt(self):
+
+        localctx = TyCASTParser.ForStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_forStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 284
+            self.match(TyCASTParser.FOR)
+            self.state = 285
+            self.match(TyCASTParser.LPAREN)
+            self.state = 287
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 549756904464) != 0):
+                self.state = 286
+                localctx._forInit = self.forInit()
+
+
+            self.state = 289
+            self.match(TyCASTParser.SEMI)
+            self.state = 291
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 290
+                localctx._expr = self.expr()
+
+
+            self.state = 293
+            self.match(TyCASTParser.SEMI)
+            self.state = 295
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 550562168832) != 0):
+                self.state = 294
+                localctx._forUpdate = self.forUpdate()
+
+
+            self.state = 297
+            self.match(TyCASTParser.RPAREN)
+            self.state = 298
+            localctx._stmt = self.stmt()
+            localctx.node = at(ForStmt(localctx._forInit.node if localctx._forInit else None, localctx._expr.node if localctx._expr else None, localctx._forUpdate.node if localctx._forUpdate else None, localctx._stmt.node), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForInitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._varDeclFor = None # VarDeclForContext
+            self._assignOnly = None # AssignOnlyContext
+
+        def varDeclFor(self):
+            return self.getTypedRuleContext(TyCASTParser.VarDeclForContext,0)
+
+
+        def assignOnly(self):
+            return self.getTypedRuleContext(TyCASTParser.AssignOnlyContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_forInit
+
+
+
+
+    def forInit(self):
+
+        localctx = TyCASTParser.ForInitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_forInit)
+        try:
+            self.state = 307
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,18,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 301
+                localctx._varDeclFor = self.varDeclFor()
+                localctx.node = localctx._varDeclFor.node
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 304
+                localctx._assignOnly = self.assignOnly()
+                localctx.node = at(ExprStmt(localctx._assignOnly.node), localctx.start)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclForContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._ID = None # Token
+            self._expr = None # ExprContext
+            self._typeSpec = None # TypeSpecContext
+
+        def AUTO(self):
+            return self.getToken(TyCASTParser.AUTO, 0)
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCASTParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCASTParser.TypeSpecContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_varDeclFor
+
+
+
+
+    def varDeclFor(self):
+
+        localctx = TyCASTParser.VarDeclForContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_varDeclFor)
+        self._la = 0 # Token type
+        try:
+            self.state = 324
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [4]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 309
+                self.match(TyCASTParser.AUTO)
+                self.state = 310
+                localctx._ID = self.match(TyCASTParser.ID)
+                self.state = 313
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 311
+                    self.match(TyCASTParser.ASSIGN)
+                    self.state = 312
+                    localctx._expr = self.expr()
+
+
+                localctx.node = at(VarDecl(None, (None if localctx._ID is None else localctx._ID.text), localctx._expr.node if localctx._expr else None), localctx.start)
+                pass
+            elif token in [10, 13, 15, 20]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 316
+                localctx._typeSpec = self.typeSpec()
+                self.state = 317
+                localctx._ID = self.match(TyCASTParser.ID)
+                self.state = 320
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 318
+                    self.match(TyCASTParser.ASSIGN)
+                    self.state = 319
+                    localctx._expr = self.expr()
+
+
+                localctx.node = at(VarDecl(localctx._typeSpec.node, (None if localctx._ID is None else localctx._ID.text), localctx._expr.node if localctx._expr else None), localctx.start)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForUpdateContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._prefixIncDec = None # PrefixIncDecContext
+            self._lvalue = None # LvalueContext
+            self._assignExpr = None # AssignExprContext
+
+        def prefixIncDec(self):
+            return self.getTypedRuleContext(TyCASTParser.PrefixIncDecContext,0)
+
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCASTParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCASTParser.ASSIGN, 0)
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.AssignExprContext,0)
+
+
+        def INC(self):
+            return self.getToken(TyCASTParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCASTParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_forUpdate
+
+
+
+
+    def forUpdate(self):
+
+        localctx = TyCASTParser.ForUpdateContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_forUpdate)
+        try:
+            self.state = 340
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [28, 29]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 326
+                localctx._prefixIncDec = self.prefixIncDec()
+                localctx.node = localctx._prefixIncDec.node
+                pass
+            elif token in [20, 39]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 329
+                localctx._lvalue = self.lvalue()
+                self.state = 338
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [35]:
+                    self.state = 330
+                    self.match(TyCASTParser.ASSIGN)
+                    self.state = 331
+                    localctx._assignExpr = self.assignExpr()
+                    localctx.node = at(AssignExpr(localctx._lvalue.node, localctx._assignExpr.node), localctx.start)
+                    pass
+                elif token in [28]:
+                    self.state = 334
+                    self.match(TyCASTParser.INC)
+                    localctx.node = at(PostfixOp("++", localctx._lvalue.node), localctx.start)
+                    pass
+                elif token in [29]:
+                    self.state = 336
+                    self.match(TyCASTParser.DEC)
+                    localctx.node = at(PostfixOp("--", localctx._lvalue.node), localctx.start)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._expr = None # ExprContext
+            self.s = None # SwitchSectionContext
+            self._defaultSection = None # DefaultSectionContext
+            self.t = None # SwitchSectionContext
+
+        def SWITCH(self):
+            return self.getToken(TyCASTParser.SWITCH, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCASTParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCASTParser.RBRACE, 0)
+
+        def defaultSection(self):
+            return self.getTypedRuleContext(TyCASTParser.DefaultSectionContext,0)
+
+
+        def switchSection(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.SwitchSectionContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.SwitchSectionContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_switchStmt
+
+
+
+
+    def switchStmt(self):
+
+        localctx = TyCASTParser.SwitchStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_switchStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 342
+            self.match(TyCASTParser.SWITCH)
+            self.state = 343
+            self.match(TyCASTParser.LPAREN)
+            self.state = 344
+            localctx._expr = self.expr()
+            self.state = 345
+            self.match(TyCASTParser.RPAREN)
+            self.state = 346
+            self.match(TyCASTParser.LBRACE)
+            localctx.node = at(SwitchStmt(localctx._expr.node, []), localctx.start)
+            self.state = 353
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==6:
+                self.state = 348
+                localctx.s = self.switchSection()
+                localctx.node.cases.extend(localctx.s.nodes)
+                self.state = 355
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 366
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==8:
+                self.state = 356
+                localctx._defaultSection = self.defaultSection()
+                localctx.node.default_case = localctx._defaultSection.node
+                self.state = 363
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==6:
+                    self.state = 358
+                    localctx.t = self.switchSection()
+                    localctx.node.cases.extend(localctx.t.nodes)
+                    self.state = 365
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 368
+            self.match(TyCASTParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchSectionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.nodes = None
+            self._caseLabel = None # CaseLabelContext
+            self._stmt = None # StmtContext
+
+        def caseLabel(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.CaseLabelContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.CaseLabelContext,i)
+
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_switchSection
+
+
+
+
+    def switchSection(self):
+
+        localctx = TyCASTParser.SwitchSectionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_switchSection)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            localctx.nodes = []
+            self.state = 374 
+            self._errHandler.sync(self)
+            _alt = 1
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt == 1:
+                    self.state = 371
+                    localctx._caseLabel = self.caseLabel()
+                    localctx.nodes.append(localctx._caseLabel.node)
+
+                else:
+                    raise NoViableAltException(self)
+                self.state = 376 
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+
+            self.state = 383
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080963248) != 0):
+                self.state = 378
+                localctx._stmt = self.stmt()
+                localctx.nodes[-1].statements.append(localctx._stmt.node)
+                self.state = 385
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefaultSectionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._stmt = None # StmtContext
+
+        def DEFAULT(self):
+            return self.getToken(TyCASTParser.DEFAULT, 0)
+
+        def COLON(self):
+            return self.getToken(TyCASTParser.COLON, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_defaultSection
+
+
+
+
+    def defaultSection(self):
+
+        localctx = TyCASTParser.DefaultSectionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_defaultSection)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 386
+            self.match(TyCASTParser.DEFAULT)
+            self.state = 387
+            self.match(TyCASTParser.COLON)
+            localctx.node = at(DefaultStmt([]), localctx.start)
+            self.state = 394
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080963248) != 0):
+                self.state = 389
+                localctx._stmt = self.stmt()
+                localctx.node.statements.append(localctx._stmt.node)
+                self.state = 396
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CaseLabelContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._constExpr = None # ConstExprContext
+
+        def CASE(self):
+            return self.getToken(TyCASTParser.CASE, 0)
+
+        def constExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.ConstExprContext,0)
+
+
+        def COLON(self):
+            return self.getToken(TyCASTParser.COLON, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_caseLabel
+
+
+
+
+    def caseLabel(self):
+
+        localctx = TyCASTParser.CaseLabelContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_caseLabel)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 397
+            self.match(TyCASTParser.CASE)
+            self.state = 398
+            localctx._constExpr = self.constExpr()
+            self.state = 399
+            self.match(TyCASTParser.COLON)
+            localctx.node = at(CaseStmt(localctx._constExpr.node, []), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._constAddExpr = None # ConstAddExprContext
+
+        def constAddExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.ConstAddExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_constExpr
+
+
+
+
+    def constExpr(self):
+
+        localctx = TyCASTParser.ConstExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_constExpr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 402
+            localctx._constAddExpr = self.constAddExpr()
+            localctx.node = localctx._constAddExpr.node
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstAddExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.l = None # ConstMulExprContext
+            self.op = None # Token
+            self.r = None # ConstMulExprContext
+
+        def constMulExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.ConstMulExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.ConstMulExprContext,i)
+
+
+        def PLUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.PLUS)
+            else:
+                return self.getToken(TyCASTParser.PLUS, i)
+
+        def MINUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.MINUS)
+            else:
+                return self.getToken(TyCASTParser.MINUS, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_constAddExpr
+
+
+
+
+    def constAddExpr(self):
+
+        localctx = TyCASTParser.ConstAddExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_constAddExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 405
+            localctx.l = self.constMulExpr()
+            localctx.node = localctx.l.node
+            self.state = 413
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==30 or _la==31:
+                self.state = 407
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not(_la==30 or _la==31):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 408
+                localctx.r = self.constMulExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                self.state = 415
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstMulExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.l = None # ConstUnaryExprContext
+            self.op = None # Token
+            self.r = None # ConstUnaryExprContext
+
+        def constUnaryExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.ConstUnaryExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.ConstUnaryExprContext,i)
+
+
+        def MUL(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.MUL)
+            else:
+                return self.getToken(TyCASTParser.MUL, i)
+
+        def DIV(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.DIV)
+            else:
+                return self.getToken(TyCASTParser.DIV, i)
+
+        def MOD(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.MOD)
+            else:
+                return self.getToken(TyCASTParser.MOD, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_constMulExpr
+
+
+
+
+    def constMulExpr(self):
+
+        localctx = TyCASTParser.ConstMulExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_constMulExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 416
+            localctx.l = self.constUnaryExpr()
+            localctx.node = localctx.l.node
+            self.state = 424
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0):
+                self.state = 418
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0)):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 419
+                localctx.r = self.constUnaryExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                self.state = 426
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstUnaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.op = None # Token
+            self.u = None # ConstUnaryExprContext
+            self._constPrimary = None # ConstPrimaryContext
+
+        def constUnaryExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.ConstUnaryExprContext,0)
+
+
+        def PLUS(self):
+            return self.getToken(TyCASTParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(TyCASTParser.MINUS, 0)
+
+        def constPrimary(self):
+            return self.getTypedRuleContext(TyCASTParser.ConstPrimaryContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_constUnaryExpr
+
+
+
+
+    def constUnaryExpr(self):
+
+        localctx = TyCASTParser.ConstUnaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_constUnaryExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 434
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [30, 31]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 427
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not(_la==30 or _la==31):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 428
+                localctx.u = self.constUnaryExpr()
+                localctx.node = at(PrefixOp((None if localctx.op is None else localctx.op.text), localctx.u.node), localctx.start)
+                pass
+            elif token in [39, 47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 431
+                localctx._constPrimary = self.constPrimary()
+                localctx.node = localctx._constPrimary.node
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstPrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._INT_LITERAL = None # Token
+            self._constExpr = None # ConstExprContext
+
+        def INT_LITERAL(self):
+            return self.getToken(TyCASTParser.INT_LITERAL, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def constExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.ConstExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_constPrimary
+
+
+
+
+    def constPrimary(self):
+
+        localctx = TyCASTParser.ConstPrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_constPrimary)
+        try:
+            self.state = 443
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 436
+                localctx._INT_LITERAL = self.match(TyCASTParser.INT_LITERAL)
+                localctx.node = at(IntLiteral(int((None if localctx._INT_LITERAL is None else localctx._INT_LITERAL.text))), localctx.start)
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 438
+                self.match(TyCASTParser.LPAREN)
+                self.state = 439
+                localctx._constExpr = self.constExpr()
+                self.state = 440
+                self.match(TyCASTParser.RPAREN)
+                localctx.node = localctx._constExpr.node
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self._assignExpr = None # AssignExprContext
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.AssignExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_expr
+
+
+
+
+    def expr(self):
+
+        localctx = TyCASTParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_expr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 445
+            localctx._assignExpr = self.assignExpr()
+            localctx.node = localctx._assignExpr.node
+            localctx.lv = localctx._assignExpr.lv
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.lhs = None # OrExprContext
+            self.rhs = None # AssignExprContext
+
+        def orExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.OrExprContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCASTParser.ASSIGN, 0)
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.AssignExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_assignExpr
+
+
+
+
+    def assignExpr(self):
+
+        localctx = TyCASTParser.AssignExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_assignExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 449
+            localctx.lhs = self.orExpr()
+            localctx.node = localctx.lhs.node
+            localctx.lv = localctx.lhs.lv
+            self.state = 458
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==35:
+                if not localctx.lhs.lv: raise InputMismatchException(self)
+                self.state = 453
+                self.match(TyCASTParser.ASSIGN)
+                self.state = 454
+                localctx.rhs = self.assignExpr()
+                localctx.node = at(AssignExpr(localctx.lhs.node, localctx.rhs.node), localctx.start)
+                localctx.lv = False
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignOnlyContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._lvalue = None # LvalueContext
+            self._assignExpr = None # AssignExprContext
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCASTParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCASTParser.ASSIGN, 0)
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.AssignExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_assignOnly
+
+
+
+
+    def assignOnly(self):
+
+        localctx = TyCASTParser.AssignOnlyContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_assignOnly)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 460
+            localctx._lvalue = self.lvalue()
+            self.state = 461
+            self.match(TyCASTParser.ASSIGN)
+            self.state = 462
+            localctx._assignExpr = self.assignExpr()
+            localctx.node = at(AssignExpr(localctx._lvalue.node, localctx._assignExpr.node), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OrExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.l = None # AndExprContext
+            self.op = None # Token
+            self.r = None # AndExprContext
+
+        def andExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.AndExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.AndExprContext,i)
+
+
+        def OR(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.OR)
+            else:
+                return self.getToken(TyCASTParser.OR, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_orExpr
+
+
+
+
+    def orExpr(self):
+
+        localctx = TyCASTParser.OrExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_orExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 465
+            localctx.l = self.andExpr()
+            localctx.node = localctx.l.node
+            localctx.lv = localctx.l.lv
+            self.state = 475
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==21:
+                self.state = 468
+                localctx.op = self.match(TyCASTParser.OR)
+                self.state = 469
+                localctx.r = self.andExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                localctx.lv = False
+                self.state = 477
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AndExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.l = None # EqExprContext
+            self.op = None # Token
+            self.r = None # EqExprContext
+
+        def eqExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.EqExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.EqExprContext,i)
+
+
+        def AND(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.AND)
+            else:
+                return self.getToken(TyCASTParser.AND, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_andExpr
+
+
+
+
+    def andExpr(self):
+
+        localctx = TyCASTParser.AndExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_andExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 478
+            localctx.l = self.eqExpr()
+            localctx.node = localctx.l.node
+            localctx.lv = localctx.l.lv
+            self.state = 488
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==22:
+                self.state = 481
+                localctx.op = self.match(TyCASTParser.AND)
+                self.state = 482
+                localctx.r = self.eqExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                localctx.lv = False
+                self.state = 490
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class EqExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.l = None # RelExprContext
+            self.op = None # Token
+            self.r = None # RelExprContext
+
+        def relExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.RelExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.RelExprContext,i)
+
+
+        def EQ(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.EQ)
+            else:
+                return self.getToken(TyCASTParser.EQ, i)
+
+        def NEQ(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.NEQ)
+            else:
+                return self.getToken(TyCASTParser.NEQ, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_eqExpr
+
+
+
+
+    def eqExpr(self):
+
+        localctx = TyCASTParser.EqExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_eqExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 491
+            localctx.l = self.relExpr()
+            localctx.node = localctx.l.node
+            localctx.lv = localctx.l.lv
+            self.state = 501
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==23 or _la==24:
+                self.state = 494
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not(_la==23 or _la==24):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 495
+                localctx.r = self.relExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                localctx.lv = False
+                self.state = 503
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.l = None # AddExprContext
+            self.op = None # Token
+            self.r = None # AddExprContext
+
+        def addExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.AddExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.AddExprContext,i)
+
+
+        def LT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.LT)
+            else:
+                return self.getToken(TyCASTParser.LT, i)
+
+        def LE(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.LE)
+            else:
+                return self.getToken(TyCASTParser.LE, i)
+
+        def GT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.GT)
+            else:
+                return self.getToken(TyCASTParser.GT, i)
+
+        def GE(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.GE)
+            else:
+                return self.getToken(TyCASTParser.GE, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_relExpr
+
+
+
+
+    def relExpr(self):
+
+        localctx = TyCASTParser.RelExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_relExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 504
+            localctx.l = self.addExpr()
+            localctx.node = localctx.l.node
+            localctx.lv = localctx.l.lv
+            self.state = 514
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 206259093504) != 0):
+                self.state = 507
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 206259093504) != 0)):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 508
+                localctx.r = self.addExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                localctx.lv = False
+                self.state = 516
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AddExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.l = None # MulExprContext
+            self.op = None # Token
+            self.r = None # MulExprContext
+
+        def mulExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.MulExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.MulExprContext,i)
+
+
+        def PLUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.PLUS)
+            else:
+                return self.getToken(TyCASTParser.PLUS, i)
+
+        def MINUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.MINUS)
+            else:
+                return self.getToken(TyCASTParser.MINUS, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_addExpr
+
+
+
+
+    def addExpr(self):
+
+        localctx = TyCASTParser.AddExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_addExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 517
+            localctx.l = self.mulExpr()
+            localctx.node = localctx.l.node
+            localctx.lv = localctx.l.lv
+            self.state = 527
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==30 or _la==31:
+                self.state = 520
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not(_la==30 or _la==31):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 521
+                localctx.r = self.mulExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                localctx.lv = False
+                self.state = 529
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MulExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.l = None # UnaryExprContext
+            self.op = None # Token
+            self.r = None # UnaryExprContext
+
+        def unaryExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.UnaryExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.UnaryExprContext,i)
+
+
+        def MUL(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.MUL)
+            else:
+                return self.getToken(TyCASTParser.MUL, i)
+
+        def DIV(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.DIV)
+            else:
+                return self.getToken(TyCASTParser.DIV, i)
+
+        def MOD(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.MOD)
+            else:
+                return self.getToken(TyCASTParser.MOD, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_mulExpr
+
+
+
+
+    def mulExpr(self):
+
+        localctx = TyCASTParser.MulExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 78, self.RULE_mulExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 530
+            localctx.l = self.unaryExpr()
+            localctx.node = localctx.l.node
+            localctx.lv = localctx.l.lv
+            self.state = 540
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0):
+                self.state = 533
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0)):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 534
+                localctx.r = self.unaryExpr()
+                localctx.node = at(BinaryOp(localctx.node, (None if localctx.op is None else localctx.op.text), localctx.r.node), localctx.start)
+                localctx.lv = False
+                self.state = 542
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UnaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self._prefixIncDec = None # PrefixIncDecContext
+            self.op = None # Token
+            self.u = None # UnaryExprContext
+            self._postfixExpr = None # PostfixExprContext
+
+        def prefixIncDec(self):
+            return self.getTypedRuleContext(TyCASTParser.PrefixIncDecContext,0)
+
+
+        def unaryExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.UnaryExprContext,0)
+
+
+        def NOT(self):
+            return self.getToken(TyCASTParser.NOT, 0)
+
+        def PLUS(self):
+            return self.getToken(TyCASTParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(TyCASTParser.MINUS, 0)
+
+        def postfixExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.PostfixExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_unaryExpr
+
+
+
+
+    def unaryExpr(self):
+
+        localctx = TyCASTParser.UnaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 80, self.RULE_unaryExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 556
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [28, 29]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 543
+                localctx._prefixIncDec = self.prefixIncDec()
+                localctx.node = localctx._prefixIncDec.node
+                localctx.lv = False
+                pass
+            elif token in [27, 30, 31]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 547
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3355443200) != 0)):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 548
+                localctx.u = self.unaryExpr()
+                localctx.node = at(PrefixOp((None if localctx.op is None else localctx.op.text), localctx.u.node), localctx.start)
+                localctx.lv = False
+                pass
+            elif token in [20, 39, 41, 46, 47, 50]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 552
+                localctx._postfixExpr = self.postfixExpr()
+                localctx.node = localctx._postfixExpr.node
+                localctx.lv = localctx._postfixExpr.lv
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrefixIncDecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.op = None # Token
+            self._lvalue = None # LvalueContext
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCASTParser.LvalueContext,0)
+
+
+        def INC(self):
+            return self.getToken(TyCASTParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCASTParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_prefixIncDec
+
+
+
+
+    def prefixIncDec(self):
+
+        localctx = TyCASTParser.PrefixIncDecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 82, self.RULE_prefixIncDec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 558
+            localctx.op = self._input.LT(1)
+            _la = self._input.LA(1)
+            if not(_la==28 or _la==29):
+                localctx.op = self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 559
+            localctx._lvalue = self.lvalue()
+            localctx.node = at(PrefixOp((None if localctx.op is None else localctx.op.text), localctx._lvalue.node), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.dotted = None
+            self._postfixPrimary = None # PostfixPrimaryContext
+            self._postfixOp = None # PostfixOpContext
+
+        def postfixPrimary(self):
+            return self.getTypedRuleContext(TyCASTParser.PostfixPrimaryContext,0)
+
+
+        def postfixOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.PostfixOpContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.PostfixOpContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_postfixExpr
+
+
+
+
+    def postfixExpr(self):
+
+        localctx = TyCASTParser.PostfixExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 84, self.RULE_postfixExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 562
+            localctx._postfixPrimary = self.postfixPrimary()
+            localctx.node = localctx._postfixPrimary.node
+            localctx.lv = localctx._postfixPrimary.bare
+            localctx.dotted = localctx._postfixPrimary.dotted
+            self.state = 573
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 275683213312) != 0):
+                self.state = 566
+                localctx._postfixOp = self.postfixOp()
+                localctx.node = at(PostfixOp(localctx._postfixOp.op, localctx.node) if localctx._postfixOp.member is None else MemberAccess(localctx.node, localctx._postfixOp.member), localctx.start)
+                localctx.dotted = localctx.dotted and localctx._postfixOp.member is not None
+                localctx.lv = localctx.dotted
+                self.state = 575
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.member = None
+            self.op = None
+            self._ID = None # Token
+
+        def DOT(self):
+            return self.getToken(TyCASTParser.DOT, 0)
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def INC(self):
+            return self.getToken(TyCASTParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCASTParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_postfixOp
+
+
+
+
+    def postfixOp(self):
+
+        localctx = TyCASTParser.PostfixOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_postfixOp)
+        try:
+            self.state = 583
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [38]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 576
+                self.match(TyCASTParser.DOT)
+                self.state = 577
+                localctx._ID = self.match(TyCASTParser.ID)
+                localctx.member = (None if localctx._ID is None else localctx._ID.text)
+                pass
+            elif token in [28]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 579
+                self.match(TyCASTParser.INC)
+                localctx.op = "++"
+                pass
+            elif token in [29]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 581
+                self.match(TyCASTParser.DEC)
+                localctx.op = "--"
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixPrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.bare = None
+            self.dotted = None
+            self._postfixCall = None # PostfixCallContext
+            self._primaryExpr = None # PrimaryExprContext
+
+        def postfixCall(self):
+            return self.getTypedRuleContext(TyCASTParser.PostfixCallContext,0)
+
+
+        def primaryExpr(self):
+            return self.getTypedRuleContext(TyCASTParser.PrimaryExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_postfixPrimary
+
+
+
+
+    def postfixPrimary(self):
+
+        localctx = TyCASTParser.PostfixPrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_postfixPrimary)
+        try:
+            self.state = 595
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,44,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 585
+                localctx._postfixCall = self.postfixCall()
+                localctx.node = localctx._postfixCall.node
+                localctx.bare = False
+                localctx.dotted = True
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 590
+                localctx._primaryExpr = self.primaryExpr()
+                localctx.node = localctx._primaryExpr.node
+                localctx.bare = localctx._primaryExpr.lv
+                localctx.dotted = localctx._primaryExpr.dotted
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixCallContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self._ID = None # Token
+            self._argList = None # ArgListContext
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCASTParser.ArgListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_postfixCall
+
+
+
+
+    def postfixCall(self):
+
+        localctx = TyCASTParser.PostfixCallContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_postfixCall)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 597
+            localctx._ID = self.match(TyCASTParser.ID)
+            self.state = 598
+            self.match(TyCASTParser.LPAREN)
+            self.state = 600
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 599
+                localctx._argList = self.argList()
+
+
+            self.state = 602
+            self.match(TyCASTParser.RPAREN)
+            localctx.node = at(FuncCall((None if localctx._ID is None else localctx._ID.text), localctx._argList.nodes if localctx._argList else []), localctx.start)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LvalueContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.name = None # Token
+            self._argList = None # ArgListContext
+            self.m = None # Token
+            self.n = None # Token
+            self.inner = None # LvalueContext
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.ID)
+            else:
+                return self.getToken(TyCASTParser.ID, i)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def DOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.DOT)
+            else:
+                return self.getToken(TyCASTParser.DOT, i)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCASTParser.ArgListContext,0)
+
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCASTParser.LvalueContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_lvalue
+
+
+
+
+    def lvalue(self):
+
+        localctx = TyCASTParser.LvalueContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 92, self.RULE_lvalue)
+        self._la = 0 # Token type
+        try:
+            self.state = 630
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [20]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 605
+                localctx.name = self.match(TyCASTParser.ID)
+                localctx.node = at(Identifier((None if localctx.name is None else localctx.name.text)), localctx.start)
+                self.state = 615
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==39:
+                    self.state = 607
+                    self.match(TyCASTParser.LPAREN)
+                    self.state = 609
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                        self.state = 608
+                        localctx._argList = self.argList()
+
+
+                    self.state = 611
+                    self.match(TyCASTParser.RPAREN)
+                    self.state = 612
+                    self.match(TyCASTParser.DOT)
+                    self.state = 613
+                    localctx.m = self.match(TyCASTParser.ID)
+                    localctx.node = at(MemberAccess(at(FuncCall((None if localctx.name is None else localctx.name.text), localctx._argList.nodes if localctx._argList else []), localctx.start), (None if localctx.m is None else localctx.m.text)), localctx.start)
+
+
+                self.state = 622
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==38:
+                    self.state = 617
+                    self.match(TyCASTParser.DOT)
+                    self.state = 618
+                    localctx.n = self.match(TyCASTParser.ID)
+                    localctx.node = at(MemberAccess(localctx.node, (None if localctx.n is None else localctx.n.text)), localctx.start)
+                    self.state = 624
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 625
+                self.match(TyCASTParser.LPAREN)
+                self.state = 626
+                localctx.inner = self.lvalue()
+                self.state = 627
+                self.match(TyCASTParser.RPAREN)
+                localctx.node = localctx.inner.node
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArgListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.nodes = None
+            self.a = None # ExprContext
+            self.b = None # ExprContext
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.COMMA)
+            else:
+                return self.getToken(TyCASTParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_argList
+
+
+
+
+    def argList(self):
+
+        localctx = TyCASTParser.ArgListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 94, self.RULE_argList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 632
+            localctx.a = self.expr()
+            localctx.nodes = [localctx.a.node]
+            self.state = 640
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==44:
+                self.state = 634
+                self.match(TyCASTParser.COMMA)
+                self.state = 635
+                localctx.b = self.expr()
+                localctx.nodes.append(localctx.b.node)
+                self.state = 642
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.lv = None
+            self.dotted = None
+            self._INT_LITERAL = None # Token
+            self._FLOAT_LITERAL = None # Token
+            self._STRING_LITERAL = None # Token
+            self._structLiteral = None # StructLiteralContext
+            self._ID = None # Token
+            self._expr = None # ExprContext
+
+        def INT_LITERAL(self):
+            return self.getToken(TyCASTParser.INT_LITERAL, 0)
+
+        def FLOAT_LITERAL(self):
+            return self.getToken(TyCASTParser.FLOAT_LITERAL, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(TyCASTParser.STRING_LITERAL, 0)
+
+        def structLiteral(self):
+            return self.getTypedRuleContext(TyCASTParser.StructLiteralContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCASTParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCASTParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCASTParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCASTParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_primaryExpr
+
+
+
+
+    def primaryExpr(self):
+
+        localctx = TyCASTParser.PrimaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 96, self.RULE_primaryExpr)
+        try:
+            self.state = 666
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 643
+                localctx._INT_LITERAL = self.match(TyCASTParser.INT_LITERAL)
+                localctx.node = at(IntLiteral(int((None if localctx._INT_LITERAL is None else localctx._INT_LITERAL.text))), localctx.start)
+                localctx.lv = localctx.dotted = False
+                pass
+            elif token in [46]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 646
+                localctx._FLOAT_LITERAL = self.match(TyCASTParser.FLOAT_LITERAL)
+                localctx.node = at(FloatLiteral(float((None if localctx._FLOAT_LITERAL is None else localctx._FLOAT_LITERAL.text))), localctx.start)
+                localctx.lv = localctx.dotted = False
+                pass
+            elif token in [50]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 649
+                localctx._STRING_LITERAL = self.match(TyCASTParser.STRING_LITERAL)
+                localctx.node = at(StringLiteral((None if localctx._STRING_LITERAL is None else localctx._STRING_LITERAL.text), getattr(localctx._STRING_LITERAL, "poolIndex", None)), localctx.start)
+                localctx.lv = localctx.dotted = False
+                pass
+            elif token in [41]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 652
+                localctx._structLiteral = self.structLiteral()
+                localctx.node = localctx._structLiteral.node
+                localctx.lv = localctx.dotted = False
+                pass
+            elif token in [20]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 656
+                localctx._ID = self.match(TyCASTParser.ID)
+                localctx.node = at(Identifier((None if localctx._ID is None else localctx._ID.text)), localctx.start)
+                localctx.lv = localctx.dotted = True
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 659
+                self.match(TyCASTParser.LPAREN)
+                self.state = 660
+                localctx._expr = self.expr()
+                self.state = 661
+                self.match(TyCASTParser.RPAREN)
+                localctx.node = localctx._expr.node
+                localctx.lv = localctx._expr.lv
+                localctx.dotted = False
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructLiteralContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.node = None
+            self.a = None # ExprContext
+            self.b = None # ExprContext
+
+        def LBRACE(self):
+            return self.getToken(TyCASTParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCASTParser.RBRACE, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCASTParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCASTParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCASTParser.COMMA)
+            else:
+                return self.getToken(TyCASTParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCASTParser.RULE_structLiteral
+
+
+
+
+    def structLiteral(self):
+
+        localctx = TyCASTParser.StructLiteralContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 98, self.RULE_structLiteral)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 668
+            self.match(TyCASTParser.LBRACE)
+            localctx.node = at(StructLiteral([]), localctx.start)
+            self.state = 681
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 670
+                localctx.a = self.expr()
+                localctx.node.values.append(localctx.a.node)
+                self.state = 678
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==44:
+                    self.state = 672
+                    self.match(TyCASTParser.COMMA)
+                    self.state = 673
+                    localctx.b = self.expr()
+                    localctx.node.values.append(localctx.b.node)
+                    self.state = 680
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 683
+            self.match(TyCASTParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+
+
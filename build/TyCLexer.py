@@ -0,0 +1,388 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+from stringpool import StringPool
+from src.parser.snapshot import warm_state
+
+
+def serializedATN():
+    return [
+        4,0,51,392,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,1,0,4,0,109,8,0,11,0,12,0,110,1,0,1,0,1,1,1,1,1,1,1,1,5,
+        1,119,8,1,10,1,12,1,122,9,1,1,1,1,1,1,2,1,2,1,2,1,2,5,2,130,8,2,
+        10,2,12,2,133,9,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,4,1,
+        4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,
+        6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,
+        9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,12,1,
+        12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,
+        14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,
+        16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,
+        18,1,18,1,18,1,19,1,19,5,19,236,8,19,10,19,12,19,239,9,19,1,20,1,
+        20,1,20,1,21,1,21,1,21,1,22,1,22,1,22,1,23,1,23,1,23,1,24,1,24,1,
+        24,1,25,1,25,1,25,1,26,1,26,1,27,1,27,1,27,1,28,1,28,1,28,1,29,1,
+        29,1,30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,
+        36,1,36,1,37,1,37,1,38,1,38,1,39,1,39,1,40,1,40,1,41,1,41,1,42,1,
+        42,1,43,1,43,1,44,1,44,1,45,1,45,1,46,1,46,3,46,303,8,46,1,46,4,
+        46,306,8,46,11,46,12,46,307,1,47,4,47,311,8,47,11,47,12,47,312,1,
+        47,1,47,5,47,317,8,47,10,47,12,47,320,9,47,1,47,3,47,323,8,47,1,
+        47,1,47,4,47,327,8,47,11,47,12,47,328,1,47,3,47,332,8,47,1,47,4,
+        47,335,8,47,11,47,12,47,336,1,47,1,47,3,47,341,8,47,1,48,4,48,344,
+        8,48,11,48,12,48,345,1,49,1,49,1,49,1,49,5,49,352,8,49,10,49,12,
+        49,355,9,49,1,49,1,49,1,49,1,49,1,50,1,50,1,50,1,50,5,50,365,8,50,
+        10,50,12,50,368,9,50,1,50,3,50,371,8,50,1,50,1,50,3,50,375,8,50,
+        1,50,1,50,1,51,1,51,1,51,1,51,5,51,383,8,51,10,51,12,51,386,9,51,
+        1,51,1,51,1,51,1,52,1,52,1,131,0,53,1,1,3,2,5,3,7,4,9,5,11,6,13,
+        7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,
+        37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,
+        59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,
+        81,41,83,42,85,43,87,44,89,45,91,0,93,0,95,46,97,47,99,48,101,49,
+        103,50,105,51,1,0,10,3,0,9,10,12,13,32,32,1,0,10,10,3,0,65,90,95,
+        95,97,122,4,0,48,57,65,90,95,95,97,122,1,0,48,57,2,0,69,69,101,101,
+        2,0,43,43,45,45,7,0,34,34,92,92,98,98,102,102,110,110,114,114,116,
+        116,4,0,10,10,13,13,34,34,92,92,9,0,10,10,13,13,34,34,92,92,98,98,
+        102,102,110,110,114,114,116,116,412,0,1,1,0,0,0,0,3,1,0,0,0,0,5,
+        1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,
+        0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,
+        0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,
+        0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,
+        0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,
+        0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,
+        0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,
+        0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,
+        0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,
+        0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,1,108,1,0,0,0,3,
+        114,1,0,0,0,5,125,1,0,0,0,7,139,1,0,0,0,9,144,1,0,0,0,11,150,1,0,
+        0,0,13,155,1,0,0,0,15,164,1,0,0,0,17,172,1,0,0,0,19,177,1,0,0,0,
+        21,183,1,0,0,0,23,187,1,0,0,0,25,190,1,0,0,0,27,194,1,0,0,0,29,201,
+        1,0,0,0,31,208,1,0,0,0,33,215,1,0,0,0,35,222,1,0,0,0,37,227,1,0,
+        0,0,39,233,1,0,0,0,41,240,1,0,0,0,43,243,1,0,0,0,45,246,1,0,0,0,
+        47,249,1,0,0,0,49,252,1,0,0,0,51,255,1,0,0,0,53,258,1,0,0,0,55,260,
+        1,0,0,0,57,263,1,0,0,0,59,266,1,0,0,0,61,268,1,0,0,0,63,270,1,0,
+        0,0,65,272,1,0,0,0,67,274,1,0,0,0,69,276,1,0,0,0,71,278,1,0,0,0,
+        73,280,1,0,0,0,75,282,1,0,0,0,77,284,1,0,0,0,79,286,1,0,0,0,81,288,
+        1,0,0,0,83,290,1,0,0,0,85,292,1,0,0,0,87,294,1,0,0,0,89,296,1,0,
+        0,0,91,298,1,0,0,0,93,300,1,0,0,0,95,340,1,0,0,0,97,343,1,0,0,0,
+        99,347,1,0,0,0,101,360,1,0,0,0,103,378,1,0,0,0,105,390,1,0,0,0,107,
+        109,7,0,0,0,108,107,1,0,0,0,109,110,1,0,0,0,110,108,1,0,0,0,110,
+        111,1,0,0,0,111,112,1,0,0,0,112,113,6,0,0,0,113,2,1,0,0,0,114,115,
+        5,47,0,0,115,116,5,47,0,0,116,120,1,0,0,0,117,119,8,1,0,0,118,117,
+        1,0,0,0,119,122,1,0,0,0,120,118,1,0,0,0,120,121,1,0,0,0,121,123,
+        1,0,0,0,122,120,1,0,0,0,123,124,6,1,0,0,124,4,1,0,0,0,125,126,5,
+        47,0,0,126,127,5,42,0,0,127,131,1,0,0,0,128,130,9,0,0,0,129,128,
+        1,0,0,0,130,133,1,0,0,0,131,132,1,0,0,0,131,129,1,0,0,0,132,134,
+        1,0,0,0,133,131,1,0,0,0,134,135,5,42,0,0,135,136,5,47,0,0,136,137,
+        1,0,0,0,137,138,6,2,0,0,138,6,1,0,0,0,139,140,5,97,0,0,140,141,5,
+        117,0,0,141,142,5,116,0,0,142,143,5,111,0,0,143,8,1,0,0,0,144,145,
+        5,98,0,0,145,146,5,114,0,0,146,147,5,101,0,0,147,148,5,97,0,0,148,
+        149,5,107,0,0,149,10,1,0,0,0,150,151,5,99,0,0,151,152,5,97,0,0,152,
+        153,5,115,0,0,153,154,5,101,0,0,154,12,1,0,0,0,155,156,5,99,0,0,
+        156,157,5,111,0,0,157,158,5,110,0,0,158,159,5,116,0,0,159,160,5,
+        105,0,0,160,161,5,110,0,0,161,162,5,117,0,0,162,163,5,101,0,0,163,
+        14,1,0,0,0,164,165,5,100,0,0,165,166,5,101,0,0,166,167,5,102,0,0,
+        167,168,5,97,0,0,168,169,5,117,0,0,169,170,5,108,0,0,170,171,5,116,
+        0,0,171,16,1,0,0,0,172,173,5,101,0,0,173,174,5,108,0,0,174,175,5,
+        115,0,0,175,176,5,101,0,0,176,18,1,0,0,0,177,178,5,102,0,0,178,179,
+        5,108,0,0,179,180,5,111,0,0,180,181,5,97,0,0,181,182,5,116,0,0,182,
+        20,1,0,0,0,183,184,5,102,0,0,184,185,5,111,0,0,185,186,5,114,0,0,
+        186,22,1,0,0,0,187,188,5,105,0,0,188,189,5,102,0,0,189,24,1,0,0,
+        0,190,191,5,105,0,0,191,192,5,110,0,0,192,193,5,116,0,0,193,26,1,
+        0,0,0,194,195,5,114,0,0,195,196,5,101,0,0,196,197,5,116,0,0,197,
+        198,5,117,0,0,198,199,5,114,0,0,199,200,5,110,0,0,200,28,1,0,0,0,
+        201,202,5,115,0,0,202,203,5,116,0,0,203,204,5,114,0,0,204,205,5,
+        105,0,0,205,206,5,110,0,0,206,207,5,103,0,0,207,30,1,0,0,0,208,209,
+        5,115,0,0,209,210,5,116,0,0,210,211,5,114,0,0,211,212,5,117,0,0,
+        212,213,5,99,0,0,213,214,5,116,0,0,214,32,1,0,0,0,215,216,5,115,
+        0,0,216,217,5,119,0,0,217,218,5,105,0,0,218,219,5,116,0,0,219,220,
+        5,99,0,0,220,221,5,104,0,0,221,34,1,0,0,0,222,223,5,118,0,0,223,
+        224,5,111,0,0,224,225,5,105,0,0,225,226,5,100,0,0,226,36,1,0,0,0,
+        227,228,5,119,0,0,228,229,5,104,0,0,229,230,5,105,0,0,230,231,5,
+        108,0,0,231,232,5,101,0,0,232,38,1,0,0,0,233,237,7,2,0,0,234,236,
+        7,3,0,0,235,234,1,0,0,0,236,239,1,0,0,0,237,235,1,0,0,0,237,238,
+        1,0,0,0,238,40,1,0,0,0,239,237,1,0,0,0,240,241,5,124,0,0,241,242,
+        5,124,0,0,242,42,1,0,0,0,243,244,5,38,0,0,244,245,5,38,0,0,245,44,
+        1,0,0,0,246,247,5,61,0,0,247,248,5,61,0,0,248,46,1,0,0,0,249,250,
+        5,33,0,0,250,251,5,61,0,0,251,48,1,0,0,0,252,253,5,60,0,0,253,254,
+        5,61,0,0,254,50,1,0,0,0,255,256,5,62,0,0,256,257,5,61,0,0,257,52,
+        1,0,0,0,258,259,5,33,0,0,259,54,1,0,0,0,260,261,5,43,0,0,261,262,
+        5,43,0,0,262,56,1,0,0,0,263,264,5,45,0,0,264,265,5,45,0,0,265,58,
+        1,0,0,0,266,267,5,43,0,0,267,60,1,0,0,0,268,269,5,45,0,0,269,62,
+        1,0,0,0,270,271,5,42,0,0,271,64,1,0,0,0,272,273,5,47,0,0,273,66,
+        1,0,0,0,274,275,5,37,0,0,275,68,1,0,0,0,276,277,5,61,0,0,277,70,
+        1,0,0,0,278,279,5,60,0,0,279,72,1,0,0,0,280,281,5,62,0,0,281,74,
+        1,0,0,0,282,283,5,46,0,0,283,76,1,0,0,0,284,285,5,40,0,0,285,78,
+        1,0,0,0,286,287,5,41,0,0,287,80,1,0,0,0,288,289,5,123,0,0,289,82,
+        1,0,0,0,290,291,5,125,0,0,291,84,1,0,0,0,292,293,5,59,0,0,293,86,
+        1,0,0,0,294,295,5,44,0,0,295,88,1,0,0,0,296,297,5,58,0,0,297,90,
+        1,0,0,0,298,299,7,4,0,0,299,92,1,0,0,0,300,302,7,5,0,0,301,303,7,
+        6,0,0,302,301,1,0,0,0,302,303,1,0,0,0,303,305,1,0,0,0,304,306,3,
+        91,45,0,305,304,1,0,0,0,306,307,1,0,0,0,307,305,1,0,0,0,307,308,
+        1,0,0,0,308,94,1,0,0,0,309,311,3,91,45,0,310,309,1,0,0,0,311,312,
+        1,0,0,0,312,310,1,0,0,0,312,313,1,0,0,0,313,314,1,0,0,0,314,318,
+        5,46,0,0,315,317,3,91,45,0,316,315,1,0,0,0,317,320,1,0,0,0,318,316,
+        1,0,0,0,318,319,1,0,0,0,319,322,1,0,0,0,320,318,1,0,0,0,321,323,
+        3,93,46,0,322,321,1,0,0,0,322,323,1,0,0,0,323,341,1,0,0,0,324,326,
+        5,46,0,0,325,327,3,91,45,0,326,325,1,0,0,0,327,328,1,0,0,0,328,326,
+        1,0,0,0,328,329,1,0,0,0,329,331,1,0,0,0,330,332,3,93,46,0,331,330,
+        1,0,0,0,331,332,1,0,0,0,332,341,1,0,0,0,333,335,3,91,45,0,334,333,
+        1,0,0,0,335,336,1,0,0,0,336,334,1,0,0,0,336,337,1,0,0,0,337,338,
+        1,0,0,0,338,339,3,93,46,0,339,341,1,0,0,0,340,310,1,0,0,0,340,324,
+        1,0,0,0,340,334,1,0,0,0,341,96,1,0,0,0,342,344,3,91,45,0,343,342,
+        1,0,0,0,344,345,1,0,0,0,345,343,1,0,0,0,345,346,1,0,0,0,346,98,1,
+        0,0,0,347,353,5,34,0,0,348,349,5,92,0,0,349,352,7,7,0,0,350,352,
+        8,8,0,0,351,348,1,0,0,0,351,350,1,0,0,0,352,355,1,0,0,0,353,351,
+        1,0,0,0,353,354,1,0,0,0,354,356,1,0,0,0,355,353,1,0,0,0,356,357,
+        5,92,0,0,357,358,8,9,0,0,358,359,6,49,1,0,359,100,1,0,0,0,360,366,
+        5,34,0,0,361,362,5,92,0,0,362,365,7,7,0,0,363,365,8,8,0,0,364,361,
+        1,0,0,0,364,363,1,0,0,0,365,368,1,0,0,0,366,364,1,0,0,0,366,367,
+        1,0,0,0,367,374,1,0,0,0,368,366,1,0,0,0,369,371,5,13,0,0,370,369,
+        1,0,0,0,370,371,1,0,0,0,371,372,1,0,0,0,372,375,5,10,0,0,373,375,
+        5,0,0,1,374,370,1,0,0,0,374,373,1,0,0,0,375,376,1,0,0,0,376,377,
+        6,50,2,0,377,102,1,0,0,0,378,384,5,34,0,0,379,380,5,92,0,0,380,383,
+        7,7,0,0,381,383,8,8,0,0,382,379,1,0,0,0,382,381,1,0,0,0,383,386,
+        1,0,0,0,384,382,1,0,0,0,384,385,1,0,0,0,385,387,1,0,0,0,386,384,
+        1,0,0,0,387,388,5,34,0,0,388,389,6,51,3,0,389,104,1,0,0,0,390,391,
+        9,0,0,0,391,106,1,0,0,0,23,0,110,120,131,237,302,307,312,318,322,
+        328,331,336,340,345,351,353,364,366,370,374,382,384,4,6,0,0,1,49,
+        0,1,50,1,1,51,2
+    ]
+
+class TyCLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    WS = 1
+    LINE_COMMENT = 2
+    BLOCK_COMMENT = 3
+    AUTO = 4
+    BREAK = 5
+    CASE = 6
+    CONTINUE = 7
+    DEFAULT = 8
+    ELSE = 9
+    FLOAT = 10
+    FOR = 11
+    IF = 12
+    INT = 13
+    RETURN = 14
+    STRING = 15
+    STRUCT = 16
+    SWITCH = 17
+    VOID = 18
+    WHILE = 19
+    ID = 20
+    OR = 21
+    AND = 22
+    EQ = 23
+    NEQ = 24
+    LE = 25
+    GE = 26
+    NOT = 27
+    INC = 28
+    DEC = 29
+    PLUS = 30
+    MINUS = 31
+    MUL = 32
+    DIV = 33
+    MOD = 34
+    ASSIGN = 35
+    LT = 36
+    GT = 37
+    DOT = 38
+    LPAREN = 39
+    RPAREN = 40
+    LBRACE = 41
+    RBRACE = 42
+    SEMI = 43
+    COMMA = 44
+    COLON = 45
+    FLOAT_LITERAL = 46
+    INT_LITERAL = 47
+    ILLEGAL_ESCAPE = 48
+    UNCLOSE_STRING = 49
+    STRING_LITERAL = 50
+    ERROR_CHAR = 51
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'auto'", "'break'", "'case'", "'continue'", "'default'", "'else'", 
+            "'float'", "'for'", "'if'", "'int'", "'return'", "'string'", 
+            "'struct'", "'switch'", "'void'", "'while'", "'||'", "'&&'", 
+            "'=='", "'!='", "'<='", "'>='", "'!'", "'++'", "'--'", "'+'", 
+            "'-'", "'*'", "'/'", "'%'", "'='", "'<'", "'>'", "'.'", "'('", 
+            "')'", "'{'", "'}'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "WS", "LINE_COMMENT", "BLOCK_COMMENT", "AUTO", "BREAK", "CASE", 
+            "CONTINUE", "DEFAULT", "ELSE", "FLOAT", "FOR", "IF", "INT", 
+            "RETURN", "STRING", "STRUCT", "SWITCH", "VOID", "WHILE", "ID", 
+            "OR", "AND", "EQ", "NEQ", "LE", "GE", "NOT", "INC", "DEC", "PLUS", 
+            "MINUS", "MUL", "DIV", "MOD", "ASSIGN", "LT", "GT", "DOT", "LPAREN", 
+            "RPAREN", "LBRACE", "RBRACE", "SEMI", "COMMA", "COLON", "FLOAT_LITERAL", 
+            "INT_LITERAL", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "STRING_LITERAL", 
+            "ERROR_CHAR" ]
+
+    ruleNames = [ "WS", "LINE_COMMENT", "BLOCK_COMMENT", "AUTO", "BREAK", 
+                  "CASE", "CONTINUE", "DEFAULT", "ELSE", "FLOAT", "FOR", 
+                  "IF", "INT", "RETURN", "STRING", "STRUCT", "SWITCH", "VOID", 
+                  "WHILE", "ID", "OR", "AND", "EQ", "NEQ", "LE", "GE", "NOT", 
+                  "INC", "DEC", "PLUS", "MINUS", "MUL", "DIV", "MOD", "ASSIGN", 
+                  "LT", "GT", "DOT", "LPAREN", "RPAREN", "LBRACE", "RBRACE", 
+                  "SEMI", "COMMA", "COLON", "DIGIT", "EXP", "FLOAT_LITERAL", 
+                  "INT_LITERAL", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "STRING_LITERAL", 
+                  "ERROR_CHAR" ]
+
+    grammarFileName = "TyC.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    # Start with the warm DFAs of build/TyC.snapshot, if it is valid (see
+    # src/parser/snapshot.py).
+    (decisionsToDFA,) = warm_state("TyCLexer", serializedATN(), atn, decisionsToDFA)
+
+    # When True, lexical errors are collected in lexerErrors and the offending
+    # tokens are still emitted, instead of raising on the first one.
+    recoverErrors = False
+    lexerErrors = None
+
+    # With recoverErrors, report a double quote that starts no string token (a
+    # backslash before the line end) as UncloseString of the rest of its line,
+    # which is skipped, instead of as ErrorToken, as Tokenizer.tokenize does.
+    strayQuoteUnclosed = False
+
+    # Decoded STRING_LITERAL values; each string token gets a poolIndex into it.
+    # Created on the first literal unless a pool is assigned to share it, and
+    # kept across reset() so earlier indices stay valid.
+    stringPool = None
+
+    def emit(self):
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            return self.lexerError(UncloseString(result.text), result);
+        elif tk == self.ILLEGAL_ESCAPE:
+            if self.recoverErrors:
+                self.skipStringRest()
+            result = super().emit();
+            return self.lexerError(IllegalEscape(result.text), result);
+        elif tk == self.ERROR_CHAR:
+            if self.recoverErrors and self.strayQuoteUnclosed and self.text == '"':
+                self.type = self.UNCLOSE_STRING
+                self.text = self.skipLineRest()
+                result = super().emit();
+                return self.lexerError(UncloseString(result.text), result);
+            result = super().emit();
+            return self.lexerError(ErrorToken(result.text), result);
+        elif tk == self.STRING_LITERAL:
+            result = super().emit();
+            result.poolIndex = self.internString(result.text)
+            return result;
+        else:
+            return super().emit();
+
+    def lexerError(self, err, token):
+        err.at(token.start, token.line, token.column, token.text)
+        if not self.recoverErrors:
+            raise err
+        if self.lexerErrors is None:
+            self.lexerErrors = []
+        self.lexerErrors.append(err)
+        return token
+
+    def internString(self, raw):
+        if self.stringPool is None:
+            self.stringPool = StringPool()
+        return self.stringPool.intern(raw)
+
+    def skipStringRest(self):
+        # Consume the rest of a string after an illegal escape, up to and including
+        # its closing quote, so the literal is reported once and its tail is not
+        # lexed as code. Strings never span lines, so only the column moves.
+        consumed = 0
+        while True:
+            c = self._input.LA(1)
+            if c in (-1, 10, 13):
+                break
+            self._input.consume()
+            consumed += 1
+            if c == 34:
+                break
+            if c == 92 and self._input.LA(1) not in (-1, 10, 13):
+                self._input.consume()
+                consumed += 1
+        self.column += consumed
+
+    def skipLineRest(self):
+        # Consume the rest of the line, up to its line break; return it.
+        start = self._input.index
+        while self._input.LA(1) not in (-1, 10, 13):
+            self._input.consume()
+        self.column += self._input.index - start
+        return self._input.getText(start, self._input.index - 1)
+
+    def reset(self):
+        super().reset()
+        self.lexerErrors = None
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[49] = self.ILLEGAL_ESCAPE_action 
+            actions[50] = self.UNCLOSE_STRING_action 
+            actions[51] = self.STRING_LITERAL_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def ILLEGAL_ESCAPE_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+             self.text = self.text[1:] 
+     
+
+    def UNCLOSE_STRING_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 1:
+
+                    self.text = self.text[1:]
+                    if self.text.endswith('\n'):
+                        self.text = self.text[:-1]
+                        if self.text.endswith('\r'):
+                            self.text = self.text[:-1]
+                  
+     
+
+    def STRING_LITERAL_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 2:
+             self.text = self.text[1:-1] 
+     
+
+
@@ -0,0 +1,3837 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+
+from antlr4.error.Errors import InputMismatchException
+from src.parser.snapshot import warm_state
+
+if "." in __name__:
+    from .TyCParserBase import TyCParserBase
+else:
+    from TyCParserBase import TyCParserBase
+
+def serializedATN():
+    return [
+        4,1,51,492,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
+        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,46,
+        7,46,2,47,7,47,2,48,7,48,2,49,7,49,1,0,5,0,102,8,0,10,0,12,0,105,
+        9,0,1,0,1,0,1,1,1,1,3,1,111,8,1,1,2,1,2,1,2,1,2,5,2,117,8,2,10,2,
+        12,2,120,9,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,4,3,4,130,8,4,1,4,1,4,
+        1,4,3,4,135,8,4,1,4,1,4,1,4,1,5,1,5,1,5,5,5,143,8,5,10,5,12,5,146,
+        9,5,1,6,1,6,1,6,1,7,1,7,1,8,1,8,3,8,155,8,8,1,9,1,9,5,9,159,8,9,
+        10,9,12,9,162,9,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
+        1,10,1,10,3,10,176,8,10,1,11,1,11,1,11,1,11,3,11,182,8,11,1,11,1,
+        11,1,11,1,11,1,11,3,11,189,8,11,1,11,1,11,3,11,193,8,11,1,12,1,12,
+        1,12,1,13,1,13,1,13,1,14,1,14,1,14,1,15,1,15,3,15,206,8,15,1,15,
+        1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,3,16,217,8,16,1,17,1,17,
+        1,17,1,17,1,17,1,17,1,18,1,18,1,18,3,18,228,8,18,1,18,1,18,3,18,
+        232,8,18,1,18,1,18,3,18,236,8,18,1,18,1,18,1,18,1,19,1,19,3,19,243,
+        8,19,1,20,1,20,1,20,1,20,3,20,249,8,20,1,20,1,20,1,20,1,20,3,20,
+        255,8,20,3,20,257,8,20,1,21,1,21,1,21,1,21,1,21,1,21,3,21,265,8,
+        21,3,21,267,8,21,1,22,1,22,1,22,1,22,1,22,1,22,5,22,275,8,22,10,
+        22,12,22,278,9,22,1,22,1,22,5,22,282,8,22,10,22,12,22,285,9,22,3,
+        22,287,8,22,1,22,1,22,1,23,4,23,292,8,23,11,23,12,23,293,1,23,5,
+        23,297,8,23,10,23,12,23,300,9,23,1,24,1,24,1,24,5,24,305,8,24,10,
+        24,12,24,308,9,24,1,25,1,25,1,25,1,25,1,26,1,26,1,27,1,27,1,27,5,
+        27,319,8,27,10,27,12,27,322,9,27,1,28,1,28,1,28,5,28,327,8,28,10,
+        28,12,28,330,9,28,1,29,1,29,1,29,3,29,335,8,29,1,30,1,30,1,30,1,
+        30,1,30,3,30,342,8,30,1,31,1,31,1,32,1,32,1,32,1,32,3,32,350,8,32,
+        1,33,1,33,1,33,1,33,1,34,1,34,1,34,5,34,359,8,34,10,34,12,34,362,
+        9,34,1,35,1,35,1,35,5,35,367,8,35,10,35,12,35,370,9,35,1,36,1,36,
+        1,36,5,36,375,8,36,10,36,12,36,378,9,36,1,37,1,37,1,37,5,37,383,
+        8,37,10,37,12,37,386,9,37,1,38,1,38,1,38,5,38,391,8,38,10,38,12,
+        38,394,9,38,1,39,1,39,1,39,5,39,399,8,39,10,39,12,39,402,9,39,1,
+        40,1,40,1,40,1,40,3,40,408,8,40,1,41,1,41,1,41,1,42,1,42,5,42,415,
+        8,42,10,42,12,42,418,9,42,1,43,1,43,1,43,1,43,3,43,424,8,43,1,44,
+        1,44,3,44,428,8,44,1,45,1,45,1,45,3,45,433,8,45,1,45,1,45,1,46,1,
+        46,1,46,3,46,440,8,46,1,46,1,46,1,46,3,46,445,8,46,1,46,1,46,5,46,
+        449,8,46,10,46,12,46,452,9,46,1,46,1,46,1,46,1,46,3,46,458,8,46,
+        1,47,1,47,1,47,5,47,463,8,47,10,47,12,47,466,9,47,1,48,1,48,1,48,
+        1,48,1,48,1,48,1,48,1,48,1,48,3,48,477,8,48,1,49,1,49,1,49,1,49,
+        5,49,483,8,49,10,49,12,49,486,9,49,3,49,488,8,49,1,49,1,49,1,49,
+        0,0,50,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
+        42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,
+        86,88,90,92,94,96,98,0,7,4,0,10,10,13,13,15,15,20,20,1,0,30,31,1,
+        0,32,34,1,0,23,24,2,0,25,26,36,37,2,0,27,27,30,31,1,0,28,29,509,
+        0,103,1,0,0,0,2,110,1,0,0,0,4,112,1,0,0,0,6,124,1,0,0,0,8,129,1,
+        0,0,0,10,139,1,0,0,0,12,147,1,0,0,0,14,150,1,0,0,0,16,154,1,0,0,
+        0,18,156,1,0,0,0,20,175,1,0,0,0,22,192,1,0,0,0,24,194,1,0,0,0,26,
+        197,1,0,0,0,28,200,1,0,0,0,30,203,1,0,0,0,32,209,1,0,0,0,34,218,
+        1,0,0,0,36,224,1,0,0,0,38,242,1,0,0,0,40,256,1,0,0,0,42,266,1,0,
+        0,0,44,268,1,0,0,0,46,291,1,0,0,0,48,301,1,0,0,0,50,309,1,0,0,0,
+        52,313,1,0,0,0,54,315,1,0,0,0,56,323,1,0,0,0,58,334,1,0,0,0,60,341,
+        1,0,0,0,62,343,1,0,0,0,64,345,1,0,0,0,66,351,1,0,0,0,68,355,1,0,
+        0,0,70,363,1,0,0,0,72,371,1,0,0,0,74,379,1,0,0,0,76,387,1,0,0,0,
+        78,395,1,0,0,0,80,407,1,0,0,0,82,409,1,0,0,0,84,412,1,0,0,0,86,423,
+        1,0,0,0,88,427,1,0,0,0,90,429,1,0,0,0,92,457,1,0,0,0,94,459,1,0,
+        0,0,96,476,1,0,0,0,98,478,1,0,0,0,100,102,3,2,1,0,101,100,1,0,0,
+        0,102,105,1,0,0,0,103,101,1,0,0,0,103,104,1,0,0,0,104,106,1,0,0,
+        0,105,103,1,0,0,0,106,107,5,0,0,1,107,1,1,0,0,0,108,111,3,4,2,0,
+        109,111,3,8,4,0,110,108,1,0,0,0,110,109,1,0,0,0,111,3,1,0,0,0,112,
+        113,5,16,0,0,113,114,5,20,0,0,114,118,5,41,0,0,115,117,3,6,3,0,116,
+        115,1,0,0,0,117,120,1,0,0,0,118,116,1,0,0,0,118,119,1,0,0,0,119,
+        121,1,0,0,0,120,118,1,0,0,0,121,122,5,42,0,0,122,123,5,43,0,0,123,
+        5,1,0,0,0,124,125,3,14,7,0,125,126,5,20,0,0,126,127,5,43,0,0,127,
+        7,1,0,0,0,128,130,3,16,8,0,129,128,1,0,0,0,129,130,1,0,0,0,130,131,
+        1,0,0,0,131,132,5,20,0,0,132,134,5,39,0,0,133,135,3,10,5,0,134,133,
+        1,0,0,0,134,135,1,0,0,0,135,136,1,0,0,0,136,137,5,40,0,0,137,138,
+        3,18,9,0,138,9,1,0,0,0,139,144,3,12,6,0,140,141,5,44,0,0,141,143,
+        3,12,6,0,142,140,1,0,0,0,143,146,1,0,0,0,144,142,1,0,0,0,144,145,
+        1,0,0,0,145,11,1,0,0,0,146,144,1,0,0,0,147,148,3,14,7,0,148,149,
+        5,20,0,0,149,13,1,0,0,0,150,151,7,0,0,0,151,15,1,0,0,0,152,155,3,
+        14,7,0,153,155,5,18,0,0,154,152,1,0,0,0,154,153,1,0,0,0,155,17,1,
+        0,0,0,156,160,5,41,0,0,157,159,3,20,10,0,158,157,1,0,0,0,159,162,
+        1,0,0,0,160,158,1,0,0,0,160,161,1,0,0,0,161,163,1,0,0,0,162,160,
+        1,0,0,0,163,164,5,42,0,0,164,19,1,0,0,0,165,176,3,22,11,0,166,176,
+        3,32,16,0,167,176,3,34,17,0,168,176,3,36,18,0,169,176,3,44,22,0,
+        170,176,3,26,13,0,171,176,3,28,14,0,172,176,3,30,15,0,173,176,3,
+        18,9,0,174,176,3,24,12,0,175,165,1,0,0,0,175,166,1,0,0,0,175,167,
+        1,0,0,0,175,168,1,0,0,0,175,169,1,0,0,0,175,170,1,0,0,0,175,171,
+        1,0,0,0,175,172,1,0,0,0,175,173,1,0,0,0,175,174,1,0,0,0,176,21,1,
+        0,0,0,177,178,5,4,0,0,178,181,5,20,0,0,179,180,5,35,0,0,180,182,
+        3,62,31,0,181,179,1,0,0,0,181,182,1,0,0,0,182,183,1,0,0,0,183,193,
+        5,43,0,0,184,185,3,14,7,0,185,188,5,20,0,0,186,187,5,35,0,0,187,
+        189,3,62,31,0,188,186,1,0,0,0,188,189,1,0,0,0,189,190,1,0,0,0,190,
+        191,5,43,0,0,191,193,1,0,0,0,192,177,1,0,0,0,192,184,1,0,0,0,193,
+        23,1,0,0,0,194,195,3,62,31,0,195,196,5,43,0,0,196,25,1,0,0,0,197,
+        198,5,5,0,0,198,199,5,43,0,0,199,27,1,0,0,0,200,201,5,7,0,0,201,
+        202,5,43,0,0,202,29,1,0,0,0,203,205,5,14,0,0,204,206,3,62,31,0,205,
+        204,1,0,0,0,205,206,1,0,0,0,206,207,1,0,0,0,207,208,5,43,0,0,208,
+        31,1,0,0,0,209,210,5,12,0,0,210,211,5,39,0,0,211,212,3,62,31,0,212,
+        213,5,40,0,0,213,216,3,20,10,0,214,215,5,9,0,0,215,217,3,20,10,0,
+        216,214,1,0,0,0,216,217,1,0,0,0,217,33,1,0,0,0,218,219,5,19,0,0,
+        219,220,5,39,0,0,220,221,3,62,31,0,221,222,5,40,0,0,222,223,3,20,
+        10,0,223,35,1,0,0,0,224,225,5,11,0,0,225,227,5,39,0,0,226,228,3,
+        38,19,0,227,226,1,0,0,0,227,228,1,0,0,0,228,229,1,0,0,0,229,231,
+        5,43,0,0,230,232,3,62,31,0,231,230,1,0,0,0,231,232,1,0,0,0,232,233,
+        1,0,0,0,233,235,5,43,0,0,234,236,3,42,21,0,235,234,1,0,0,0,235,236,
+        1,0,0,0,236,237,1,0,0,0,237,238,5,40,0,0,238,239,3,20,10,0,239,37,
+        1,0,0,0,240,243,3,40,20,0,241,243,3,66,33,0,242,240,1,0,0,0,242,
+        241,1,0,0,0,243,39,1,0,0,0,244,245,5,4,0,0,245,248,5,20,0,0,246,
+        247,5,35,0,0,247,249,3,62,31,0,248,246,1,0,0,0,248,249,1,0,0,0,249,
+        257,1,0,0,0,250,251,3,14,7,0,251,254,5,20,0,0,252,253,5,35,0,0,253,
+        255,3,62,31,0,254,252,1,0,0,0,254,255,1,0,0,0,255,257,1,0,0,0,256,
+        244,1,0,0,0,256,250,1,0,0,0,257,41,1,0,0,0,258,267,3,82,41,0,259,
+        264,3,92,46,0,260,261,5,35,0,0,261,265,3,64,32,0,262,265,5,28,0,
+        0,263,265,5,29,0,0,264,260,1,0,0,0,264,262,1,0,0,0,264,263,1,0,0,
+        0,265,267,1,0,0,0,266,258,1,0,0,0,266,259,1,0,0,0,267,43,1,0,0,0,
+        268,269,5,17,0,0,269,270,5,39,0,0,270,271,3,62,31,0,271,272,5,40,
+        0,0,272,276,5,41,0,0,273,275,3,46,23,0,274,273,1,0,0,0,275,278,1,
+        0,0,0,276,274,1,0,0,0,276,277,1,0,0,0,277,286,1,0,0,0,278,276,1,
+        0,0,0,279,283,3,48,24,0,280,282,3,46,23,0,281,280,1,0,0,0,282,285,
+        1,0,0,0,283,281,1,0,0,0,283,284,1,0,0,0,284,287,1,0,0,0,285,283,
+        1,0,0,0,286,279,1,0,0,0,286,287,1,0,0,0,287,288,1,0,0,0,288,289,
+        5,42,0,0,289,45,1,0,0,0,290,292,3,50,25,0,291,290,1,0,0,0,292,293,
+        1,0,0,0,293,291,1,0,0,0,293,294,1,0,0,0,294,298,1,0,0,0,295,297,
+        3,20,10,0,296,295,1,0,0,0,297,300,1,0,0,0,298,296,1,0,0,0,298,299,
+        1,0,0,0,299,47,1,0,0,0,300,298,1,0,0,0,301,302,5,8,0,0,302,306,5,
+        45,0,0,303,305,3,20,10,0,304,303,1,0,0,0,305,308,1,0,0,0,306,304,
+        1,0,0,0,306,307,1,0,0,0,307,49,1,0,0,0,308,306,1,0,0,0,309,310,5,
+        6,0,0,310,311,3,52,26,0,311,312,5,45,0,0,312,51,1,0,0,0,313,314,
+        3,54,27,0,314,53,1,0,0,0,315,320,3,56,28,0,316,317,7,1,0,0,317,319,
+        3,56,28,0,318,316,1,0,0,0,319,322,1,0,0,0,320,318,1,0,0,0,320,321,
+        1,0,0,0,321,55,1,0,0,0,322,320,1,0,0,0,323,328,3,58,29,0,324,325,
+        7,2,0,0,325,327,3,58,29,0,326,324,1,0,0,0,327,330,1,0,0,0,328,326,
+        1,0,0,0,328,329,1,0,0,0,329,57,1,0,0,0,330,328,1,0,0,0,331,332,7,
+        1,0,0,332,335,3,58,29,0,333,335,3,60,30,0,334,331,1,0,0,0,334,333,
+        1,0,0,0,335,59,1,0,0,0,336,342,5,47,0,0,337,338,5,39,0,0,338,339,
+        3,52,26,0,339,340,5,40,0,0,340,342,1,0,0,0,341,336,1,0,0,0,341,337,
+        1,0,0,0,342,61,1,0,0,0,343,344,3,64,32,0,344,63,1,0,0,0,345,349,
+        3,68,34,0,346,347,6,32,-1,0,347,348,5,35,0,0,348,350,3,64,32,0,349,
+        346,1,0,0,0,349,350,1,0,0,0,350,65,1,0,0,0,351,352,3,92,46,0,352,
+        353,5,35,0,0,353,354,3,64,32,0,354,67,1,0,0,0,355,360,3,70,35,0,
+        356,357,5,21,0,0,357,359,3,70,35,0,358,356,1,0,0,0,359,362,1,0,0,
+        0,360,358,1,0,0,0,360,361,1,0,0,0,361,69,1,0,0,0,362,360,1,0,0,0,
+        363,368,3,72,36,0,364,365,5,22,0,0,365,367,3,72,36,0,366,364,1,0,
+        0,0,367,370,1,0,0,0,368,366,1,0,0,0,368,369,1,0,0,0,369,71,1,0,0,
+        0,370,368,1,0,0,0,371,376,3,74,37,0,372,373,7,3,0,0,373,375,3,74,
+        37,0,374,372,1,0,0,0,375,378,1,0,0,0,376,374,1,0,0,0,376,377,1,0,
+        0,0,377,73,1,0,0,0,378,376,1,0,0,0,379,384,3,76,38,0,380,381,7,4,
+        0,0,381,383,3,76,38,0,382,380,1,0,0,0,383,386,1,0,0,0,384,382,1,
+        0,0,0,384,385,1,0,0,0,385,75,1,0,0,0,386,384,1,0,0,0,387,392,3,78,
+        39,0,388,389,7,1,0,0,389,391,3,78,39,0,390,388,1,0,0,0,391,394,1,
+        0,0,0,392,390,1,0,0,0,392,393,1,0,0,0,393,77,1,0,0,0,394,392,1,0,
+        0,0,395,400,3,80,40,0,396,397,7,2,0,0,397,399,3,80,40,0,398,396,
+        1,0,0,0,399,402,1,0,0,0,400,398,1,0,0,0,400,401,1,0,0,0,401,79,1,
+        0,0,0,402,400,1,0,0,0,403,408,3,82,41,0,404,405,7,5,0,0,405,408,
+        3,80,40,0,406,408,3,84,42,0,407,403,1,0,0,0,407,404,1,0,0,0,407,
+        406,1,0,0,0,408,81,1,0,0,0,409,410,7,6,0,0,410,411,3,92,46,0,411,
+        83,1,0,0,0,412,416,3,88,44,0,413,415,3,86,43,0,414,413,1,0,0,0,415,
+        418,1,0,0,0,416,414,1,0,0,0,416,417,1,0,0,0,417,85,1,0,0,0,418,416,
+        1,0,0,0,419,420,5,38,0,0,420,424,5,20,0,0,421,424,5,28,0,0,422,424,
+        5,29,0,0,423,419,1,0,0,0,423,421,1,0,0,0,423,422,1,0,0,0,424,87,
+        1,0,0,0,425,428,3,90,45,0,426,428,3,96,48,0,427,425,1,0,0,0,427,
+        426,1,0,0,0,428,89,1,0,0,0,429,430,5,20,0,0,430,432,5,39,0,0,431,
+        433,3,94,47,0,432,431,1,0,0,0,432,433,1,0,0,0,433,434,1,0,0,0,434,
+        435,5,40,0,0,435,91,1,0,0,0,436,444,5,20,0,0,437,439,5,39,0,0,438,
+        440,3,94,47,0,439,438,1,0,0,0,439,440,1,0,0,0,440,441,1,0,0,0,441,
+        442,5,40,0,0,442,443,5,38,0,0,443,445,5,20,0,0,444,437,1,0,0,0,444,
+        445,1,0,0,0,445,450,1,0,0,0,446,447,5,38,0,0,447,449,5,20,0,0,448,
+        446,1,0,0,0,449,452,1,0,0,0,450,448,1,0,0,0,450,451,1,0,0,0,451,
+        458,1,0,0,0,452,450,1,0,0,0,453,454,5,39,0,0,454,455,3,92,46,0,455,
+        456,5,40,0,0,456,458,1,0,0,0,457,436,1,0,0,0,457,453,1,0,0,0,458,
+        93,1,0,0,0,459,464,3,62,31,0,460,461,5,44,0,0,461,463,3,62,31,0,
+        462,460,1,0,0,0,463,466,1,0,0,0,464,462,1,0,0,0,464,465,1,0,0,0,
+        465,95,1,0,0,0,466,464,1,0,0,0,467,477,5,47,0,0,468,477,5,46,0,0,
+        469,477,5,50,0,0,470,477,3,98,49,0,471,477,5,20,0,0,472,473,5,39,
+        0,0,473,474,3,62,31,0,474,475,5,40,0,0,475,477,1,0,0,0,476,467,1,
+        0,0,0,476,468,1,0,0,0,476,469,1,0,0,0,476,470,1,0,0,0,476,471,1,
+        0,0,0,476,472,1,0,0,0,477,97,1,0,0,0,478,487,5,41,0,0,479,484,3,
+        62,31,0,480,481,5,44,0,0,481,483,3,62,31,0,482,480,1,0,0,0,483,486,
+        1,0,0,0,484,482,1,0,0,0,484,485,1,0,0,0,485,488,1,0,0,0,486,484,
+        1,0,0,0,487,479,1,0,0,0,487,488,1,0,0,0,488,489,1,0,0,0,489,490,
+        5,42,0,0,490,99,1,0,0,0,53,103,110,118,129,134,144,154,160,175,181,
+        188,192,205,216,227,231,235,242,248,254,256,264,266,276,283,286,
+        293,298,306,320,328,334,341,349,360,368,376,384,392,400,407,416,
+        423,427,432,439,444,450,457,464,476,484,487
+    ]
+
+class TyCParser ( TyCParserBase ):
+
+    grammarFileName = "TyC.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "'auto'", "'break'", "'case'", "'continue'", "'default'", 
+                     "'else'", "'float'", "'for'", "'if'", "'int'", "'return'", 
+                     "'string'", "'struct'", "'switch'", "'void'", "'while'", 
+                     "<INVALID>", "'||'", "'&&'", "'=='", "'!='", "'<='", 
+                     "'>='", "'!'", "'++'", "'--'", "'+'", "'-'", "'*'", 
+                     "'/'", "'%'", "'='", "'<'", "'>'", "'.'", "'('", "')'", 
+                     "'{'", "'}'", "';'", "','", "':'" ]
+
+    symbolicNames = [ "<INVALID>", "WS", "LINE_COMMENT", "BLOCK_COMMENT", 
+                      "AUTO", "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", 
+                      "FLOAT", "FOR", "IF", "INT", "RETURN", "STRING", "STRUCT", 
+                      "SWITCH", "VOID", "WHILE", "ID", "OR", "AND", "EQ", 
+                      "NEQ", "LE", "GE", "NOT", "INC", "DEC", "PLUS", "MINUS", 
+                      "MUL", "DIV", "MOD", "ASSIGN", "LT", "GT", "DOT", 
+                      "LPAREN", "RPAREN", "LBRACE", "RBRACE", "SEMI", "COMMA", 
+                      "COLON", "FLOAT_LITERAL", "INT_LITERAL", "ILLEGAL_ESCAPE", 
+                      "UNCLOSE_STRING", "STRING_LITERAL", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_decl = 1
+    RULE_structDecl = 2
+    RULE_structMember = 3
+    RULE_funcDecl = 4
+    RULE_paramList = 5
+    RULE_param = 6
+    RULE_typeSpec = 7
+    RULE_returnType = 8
+    RULE_block = 9
+    RULE_stmt = 10
+    RULE_varDecl = 11
+    RULE_exprStmt = 12
+    RULE_breakStmt = 13
+    RULE_continueStmt = 14
+    RULE_returnStmt = 15
+    RULE_ifStmt = 16
+    RULE_whileStmt = 17
+    RULE_forStmt = 18
+    RULE_forInit = 19
+    RULE_varDeclFor = 20
+    RULE_forUpdate = 21
+    RULE_switchStmt = 22
+    RULE_switchSection = 23
+    RULE_defaultSection = 24
+    RULE_caseLabel = 25
+    RULE_constExpr = 26
+    RULE_constAddExpr = 27
+    RULE_constMulExpr = 28
+    RULE_constUnaryExpr = 29
+    RULE_constPrimary = 30
+    RULE_expr = 31
+    RULE_assignExpr = 32
+    RULE_assignOnly = 33
+    RULE_orExpr = 34
+    RULE_andExpr = 35
+    RULE_eqExpr = 36
+    RULE_relExpr = 37
+    RULE_addExpr = 38
+    RULE_mulExpr = 39
+    RULE_unaryExpr = 40
+    RULE_prefixIncDec = 41
+    RULE_postfixExpr = 42
+    RULE_postfixOp = 43
+    RULE_postfixPrimary = 44
+    RULE_postfixCall = 45
+    RULE_lvalue = 46
+    RULE_argList = 47
+    RULE_primaryExpr = 48
+    RULE_structLiteral = 49
+
+    ruleNames =  [ "program", "decl", "structDecl", "structMember", "funcDecl", 
+                   "paramList", "param", "typeSpec", "returnType", "block", 
+                   "stmt", "varDecl", "exprStmt", "breakStmt", "continueStmt", 
+                   "returnStmt", "ifStmt", "whileStmt", "forStmt", "forInit", 
+                   "varDeclFor", "forUpdate", "switchStmt", "switchSection", 
+                   "defaultSection", "caseLabel", "constExpr", "constAddExpr", 
+                   "constMulExpr", "constUnaryExpr", "constPrimary", "expr", 
+                   "assignExpr", "assignOnly", "orExpr", "andExpr", "eqExpr", 
+                   "relExpr", "addExpr", "mulExpr", "unaryExpr", "prefixIncDec", 
+                   "postfixExpr", "postfixOp", "postfixPrimary", "postfixCall", 
+                   "lvalue", "argList", "primaryExpr", "structLiteral" ]
+
+    EOF = Token.EOF
+    WS=1
+    LINE_COMMENT=2
+    BLOCK_COMMENT=3
+    AUTO=4
+    BREAK=5
+    CASE=6
+    CONTINUE=7
+    DEFAULT=8
+    ELSE=9
+    FLOAT=10
+    FOR=11
+    IF=12
+    INT=13
+    RETURN=14
+    STRING=15
+    STRUCT=16
+    SWITCH=17
+    VOID=18
+    WHILE=19
+    ID=20
+    OR=21
+    AND=22
+    EQ=23
+    NEQ=24
+    LE=25
+    GE=26
+    NOT=27
+    INC=28
+    DEC=29
+    PLUS=30
+    MINUS=31
+    MUL=32
+    DIV=33
+    MOD=34
+    ASSIGN=35
+    LT=36
+    GT=37
+    DOT=38
+    LPAREN=39
+    RPAREN=40
+    LBRACE=41
+    RBRACE=42
+    SEMI=43
+    COMMA=44
+    COLON=45
+    FLOAT_LITERAL=46
+    INT_LITERAL=47
+    ILLEGAL_ESCAPE=48
+    UNCLOSE_STRING=49
+    STRING_LITERAL=50
+    ERROR_CHAR=51
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+    # Start with the warm DFAs and context cache of build/TyC.snapshot, if it
+    # is valid (see src/parser/snapshot.py).
+    decisionsToDFA, sharedContextCache = warm_state("TyCParser", serializedATN(), atn, decisionsToDFA, sharedContextCache)
+
+    def checkLvalue(self, ctx):
+        # Reports `=` after an operand that is not an lvalue as a syntax error
+        # at the `=`. An action rather than a predicate, so that the decisions
+        # of the expression rules stay LL(1).
+        if not self.isLvalue(ctx):
+            raise InputMismatchException(self)
+
+    def isLvalue(self, ctx):
+        # True if the orExpr `ctx` is exactly an lvalue: ID (DOT ID)*, a call
+        # followed by (DOT ID)+, or a parenthesized lvalue, with no operator.
+        if not self.buildParseTrees:
+            return self.isLvalueTokens(ctx.start.tokenIndex, ctx.stop.tokenIndex)
+        while not isinstance(ctx, TyCParser.UnaryExprContext):
+            if ctx.getChildCount() != 1:
+                return False
+            ctx = ctx.getChild(0)
+        postfix = ctx.getChild(0)
+        if not isinstance(postfix, TyCParser.PostfixExprContext):
+            return False
+        ops = postfix.postfixOp()
+        for op in ops:
+            if op.DOT() is None:
+                return False
+        primary = postfix.postfixPrimary().getChild(0)
+        if isinstance(primary, TyCParser.PostfixCallContext):
+            return len(ops) > 0
+        if primary.ID() is not None:
+            return True
+        if primary.LPAREN() is None or ops or primary.expr() is None:
+            return False
+        inner = primary.expr().assignExpr()
+        return inner is not None and inner.getChildCount() == 1 and self.isLvalue(inner.orExpr())
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EOF(self):
+            return self.getToken(TyCParser.EOF, 0)
+
+        def decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.DeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.DeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = TyCParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 103
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1418240) != 0):
+                self.state = 100
+                self.decl()
+                self.state = 105
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 106
+            self.match(TyCParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def structDecl(self):
+            return self.getTypedRuleContext(TyCParser.StructDeclContext,0)
+
+
+        def funcDecl(self):
+            return self.getTypedRuleContext(TyCParser.FuncDeclContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDecl" ):
+                return visitor.visitDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def decl(self):
+
+        localctx = TyCParser.DeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_decl)
+        try:
+            self.state = 110
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [16]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 108
+                self.structDecl()
+                pass
+            elif token in [10, 13, 15, 18, 20]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 109
+                self.funcDecl()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRUCT(self):
+            return self.getToken(TyCParser.STRUCT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def structMember(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StructMemberContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StructMemberContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructDecl" ):
+                return visitor.visitStructDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structDecl(self):
+
+        localctx = TyCParser.StructDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_structDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 112
+            self.match(TyCParser.STRUCT)
+            self.state = 113
+            self.match(TyCParser.ID)
+            self.state = 114
+            self.match(TyCParser.LBRACE)
+            self.state = 118
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1090560) != 0):
+                self.state = 115
+                self.structMember()
+                self.state = 120
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 121
+            self.match(TyCParser.RBRACE)
+            self.state = 122
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructMemberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCParser.TypeSpecContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structMember
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructMember" ):
+                return visitor.visitStructMember(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structMember(self):
+
+        localctx = TyCParser.StructMemberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_structMember)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 124
+            self.typeSpec()
+            self.state = 125
+            self.match(TyCParser.ID)
+            self.state = 126
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FuncDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def returnType(self):
+            return self.getTypedRuleContext(TyCParser.ReturnTypeContext,0)
+
+
+        def paramList(self):
+            return self.getTypedRuleContext(TyCParser.ParamListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_funcDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFuncDecl" ):
+                return visitor.visitFuncDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def funcDecl(self):
+
+        localctx = TyCParser.FuncDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_funcDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 129
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.state = 128
+                self.returnType()
+
+
+            self.state = 131
+            self.match(TyCParser.ID)
+            self.state = 132
+            self.match(TyCParser.LPAREN)
+            self.state = 134
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1090560) != 0):
+                self.state = 133
+                self.paramList()
+
+
+            self.state = 136
+            self.match(TyCParser.RPAREN)
+            self.state = 137
+            self.block()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ParamContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ParamContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_paramList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamList" ):
+                return visitor.visitParamList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramList(self):
+
+        localctx = TyCParser.ParamListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_paramList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 139
+            self.param()
+            self.state = 144
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==44:
+                self.state = 140
+                self.match(TyCParser.COMMA)
+                self.state = 141
+                self.param()
+                self.state = 146
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCParser.TypeSpecContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParam" ):
+                return visitor.visitParam(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def param(self):
+
+        localctx = TyCParser.ParamContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_param)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 147
+            self.typeSpec()
+            self.state = 148
+            self.match(TyCParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeSpecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(TyCParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(TyCParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(TyCParser.STRING, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_typeSpec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTypeSpec" ):
+                return visitor.visitTypeSpec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def typeSpec(self):
+
+        localctx = TyCParser.TypeSpecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_typeSpec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 150
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1090560) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCParser.TypeSpecContext,0)
+
+
+        def VOID(self):
+            return self.getToken(TyCParser.VOID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnType
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnType" ):
+                return visitor.visitReturnType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnType(self):
+
+        localctx = TyCParser.ReturnTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_returnType)
+        try:
+            self.state = 154
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [10, 13, 15, 20]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 152
+                self.typeSpec()
+                pass
+            elif token in [18]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 153
+                self.match(TyCParser.VOID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_block
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = TyCParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 156
+            self.match(TyCParser.LBRACE)
+            self.state = 160
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080963248) != 0):
+                self.state = 157
+                self.stmt()
+                self.state = 162
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 163
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def ifStmt(self):
+            return self.getTypedRuleContext(TyCParser.IfStmtContext,0)
+
+
+        def whileStmt(self):
+            return self.getTypedRuleContext(TyCParser.WhileStmtContext,0)
+
+
+        def forStmt(self):
+            return self.getTypedRuleContext(TyCParser.ForStmtContext,0)
+
+
+        def switchStmt(self):
+            return self.getTypedRuleContext(TyCParser.SwitchStmtContext,0)
+
+
+        def breakStmt(self):
+            return self.getTypedRuleContext(TyCParser.BreakStmtContext,0)
+
+
+        def continueStmt(self):
+            return self.getTypedRuleContext(TyCParser.ContinueStmtContext,0)
+
+
+        def returnStmt(self):
+            return self.getTypedRuleContext(TyCParser.ReturnStmtContext,0)
+
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def exprStmt(self):
+            return self.getTypedRuleContext(TyCParser.ExprStmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_stmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmt" ):
+                return visitor.visitStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmt(self):
+
+        localctx = TyCParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_stmt)
+        try:
+            self.state = 175
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 165
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 166
+                self.ifStmt()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 167
+                self.whileStmt()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 168
+                self.forStmt()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 169
+                self.switchStmt()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 170
+                self.breakStmt()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 171
+                self.continueStmt()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 172
+                self.returnStmt()
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 173
+                self.block()
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 174
+                self.exprStmt()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCParser.TypeSpecContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDecl" ):
+                return visitor.visitVarDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDecl(self):
+
+        localctx = TyCParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 192
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [4]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 177
+                self.match(TyCParser.AUTO)
+                self.state = 178
+                self.match(TyCParser.ID)
+                self.state = 181
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 179
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 180
+                    self.expr()
+
+
+                self.state = 183
+                self.match(TyCParser.SEMI)
+                pass
+            elif token in [10, 13, 15, 20]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 184
+                self.typeSpec()
+                self.state = 185
+                self.match(TyCParser.ID)
+                self.state = 188
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 186
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 187
+                    self.expr()
+
+
+                self.state = 190
+                self.match(TyCParser.SEMI)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_exprStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprStmt" ):
+                return visitor.visitExprStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprStmt(self):
+
+        localctx = TyCParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_exprStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 194
+            self.expr()
+            self.state = 195
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(TyCParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_breakStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakStmt" ):
+                return visitor.visitBreakStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakStmt(self):
+
+        localctx = TyCParser.BreakStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_breakStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 197
+            self.match(TyCParser.BREAK)
+            self.state = 198
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinueStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CONTINUE(self):
+            return self.getToken(TyCParser.CONTINUE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_continueStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinueStmt" ):
+                return visitor.visitContinueStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continueStmt(self):
+
+        localctx = TyCParser.ContinueStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_continueStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 200
+            self.match(TyCParser.CONTINUE)
+            self.state = 201
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(TyCParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnStmt" ):
+                return visitor.visitReturnStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnStmt(self):
+
+        localctx = TyCParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_returnStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 203
+            self.match(TyCParser.RETURN)
+            self.state = 205
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 204
+                self.expr()
+
+
+            self.state = 207
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(TyCParser.IF, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(TyCParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_ifStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfStmt" ):
+                return visitor.visitIfStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifStmt(self):
+
+        localctx = TyCParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_ifStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 209
+            self.match(TyCParser.IF)
+            self.state = 210
+            self.match(TyCParser.LPAREN)
+            self.state = 211
+            self.expr()
+            self.state = 212
+            self.match(TyCParser.RPAREN)
+            self.state = 213
+            self.stmt()
+            self.state = 216
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
+            if la_ == 1:
+                self.state = 214
+                self.match(TyCParser.ELSE)
+                self.state = 215
+                self.stmt()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class WhileStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def WHILE(self):
+            return self.getToken(TyCParser.WHILE, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_whileStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhileStmt" ):
+                return visitor.visitWhileStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def whileStmt(self):
+
+        localctx = TyCParser.WhileStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_whileStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 218
+            self.match(TyCParser.WHILE)
+            self.state = 219
+            self.match(TyCParser.LPAREN)
+            self.state = 220
+            self.expr()
+            self.state = 221
+            self.match(TyCParser.RPAREN)
+            self.state = 222
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(TyCParser.FOR, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.SEMI)
+            else:
+                return self.getToken(TyCParser.SEMI, i)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def forInit(self):
+            return self.getTypedRuleContext(TyCParser.ForInitContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def forUpdate(self):
+            return self.getTypedRuleContext(TyCParser.ForUpdateContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForStmt" ):
+                return visitor.visitForStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forStmt(self):
+
+        localctx = TyCParser.ForStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_forStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 224
+            self.match(TyCParser.FOR)
+            self.state = 225
+            self.match(TyCParser.LPAREN)
+            self.state = 227
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 549756904464) != 0):
+                self.state = 226
+                self.forInit()
+
+
+            self.state = 229
+            self.match(TyCParser.SEMI)
+            self.state = 231
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 230
+                self.expr()
+
+
+            self.state = 233
+            self.match(TyCParser.SEMI)
+            self.state = 235
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 550562168832) != 0):
+                self.state = 234
+                self.forUpdate()
+
+
+            self.state = 237
+            self.match(TyCParser.RPAREN)
+            self.state = 238
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForInitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDeclFor(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclForContext,0)
+
+
+        def assignOnly(self):
+            return self.getTypedRuleContext(TyCParser.AssignOnlyContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forInit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForInit" ):
+                return visitor.visitForInit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forInit(self):
+
+        localctx = TyCParser.ForInitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_forInit)
+        try:
+            self.state = 242
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 240
+                self.varDeclFor()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 241
+                self.assignOnly()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclForContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def typeSpec(self):
+            return self.getTypedRuleContext(TyCParser.TypeSpecContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDeclFor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDeclFor" ):
+                return visitor.visitVarDeclFor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDeclFor(self):
+
+        localctx = TyCParser.VarDeclForContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_varDeclFor)
+        self._la = 0 # Token type
+        try:
+            self.state = 256
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [4]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 244
+                self.match(TyCParser.AUTO)
+                self.state = 245
+                self.match(TyCParser.ID)
+                self.state = 248
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 246
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 247
+                    self.expr()
+
+
+                pass
+            elif token in [10, 13, 15, 20]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 250
+                self.typeSpec()
+                self.state = 251
+                self.match(TyCParser.ID)
+                self.state = 254
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 252
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 253
+                    self.expr()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForUpdateContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def prefixIncDec(self):
+            return self.getTypedRuleContext(TyCParser.PrefixIncDecContext,0)
+
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCParser.AssignExprContext,0)
+
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forUpdate
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForUpdate" ):
+                return visitor.visitForUpdate(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forUpdate(self):
+
+        localctx = TyCParser.ForUpdateContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_forUpdate)
+        try:
+            self.state = 266
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [28, 29]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 258
+                self.prefixIncDec()
+                pass
+            elif token in [20, 39]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 259
+                self.lvalue()
+                self.state = 264
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [35]:
+                    self.state = 260
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 261
+                    self.assignExpr()
+                    pass
+                elif token in [28]:
+                    self.state = 262
+                    self.match(TyCParser.INC)
+                    pass
+                elif token in [29]:
+                    self.state = 263
+                    self.match(TyCParser.DEC)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SWITCH(self):
+            return self.getToken(TyCParser.SWITCH, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def switchSection(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.SwitchSectionContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.SwitchSectionContext,i)
+
+
+        def defaultSection(self):
+            return self.getTypedRuleContext(TyCParser.DefaultSectionContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchStmt" ):
+                return visitor.visitSwitchStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchStmt(self):
+
+        localctx = TyCParser.SwitchStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_switchStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 268
+            self.match(TyCParser.SWITCH)
+            self.state = 269
+            self.match(TyCParser.LPAREN)
+            self.state = 270
+            self.expr()
+            self.state = 271
+            self.match(TyCParser.RPAREN)
+            self.state = 272
+            self.match(TyCParser.LBRACE)
+            self.state = 276
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==6:
+                self.state = 273
+                self.switchSection()
+                self.state = 278
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 286
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==8:
+                self.state = 279
+                self.defaultSection()
+                self.state = 283
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==6:
+                    self.state = 280
+                    self.switchSection()
+                    self.state = 285
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 288
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchSectionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def caseLabel(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.CaseLabelContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.CaseLabelContext,i)
+
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchSection
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchSection" ):
+                return visitor.visitSwitchSection(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchSection(self):
+
+        localctx = TyCParser.SwitchSectionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_switchSection)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 291 
+            self._errHandler.sync(self)
+            _alt = 1
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt == 1:
+                    self.state = 290
+                    self.caseLabel()
+
+                else:
+                    raise NoViableAltException(self)
+                self.state = 293 
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,26,self._ctx)
+
+            self.state = 298
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080963248) != 0):
+                self.state = 295
+                self.stmt()
+                self.state = 300
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefaultSectionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DEFAULT(self):
+            return self.getToken(TyCParser.DEFAULT, 0)
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_defaultSection
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefaultSection" ):
+                return visitor.visitDefaultSection(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def defaultSection(self):
+
+        localctx = TyCParser.DefaultSectionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_defaultSection)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 301
+            self.match(TyCParser.DEFAULT)
+            self.state = 302
+            self.match(TyCParser.COLON)
+            self.state = 306
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080963248) != 0):
+                self.state = 303
+                self.stmt()
+                self.state = 308
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CaseLabelContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CASE(self):
+            return self.getToken(TyCParser.CASE, 0)
+
+        def constExpr(self):
+            return self.getTypedRuleContext(TyCParser.ConstExprContext,0)
+
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_caseLabel
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCaseLabel" ):
+                return visitor.visitCaseLabel(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def caseLabel(self):
+
+        localctx = TyCParser.CaseLabelContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_caseLabel)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 309
+            self.match(TyCParser.CASE)
+            self.state = 310
+            self.constExpr()
+            self.state = 311
+            self.match(TyCParser.COLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def constAddExpr(self):
+            return self.getTypedRuleContext(TyCParser.ConstAddExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_constExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstExpr" ):
+                return visitor.visitConstExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constExpr(self):
+
+        localctx = TyCParser.ConstExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_constExpr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 313
+            self.constAddExpr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstAddExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def constMulExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ConstMulExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ConstMulExprContext,i)
+
+
+        def PLUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.PLUS)
+            else:
+                return self.getToken(TyCParser.PLUS, i)
+
+        def MINUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MINUS)
+            else:
+                return self.getToken(TyCParser.MINUS, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_constAddExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstAddExpr" ):
+                return visitor.visitConstAddExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constAddExpr(self):
+
+        localctx = TyCParser.ConstAddExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_constAddExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 315
+            self.constMulExpr()
+            self.state = 320
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==30 or _la==31:
+                self.state = 316
+                _la = self._input.LA(1)
+                if not(_la==30 or _la==31):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 317
+                self.constMulExpr()
+                self.state = 322
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstMulExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def constUnaryExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ConstUnaryExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ConstUnaryExprContext,i)
+
+
+        def MUL(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MUL)
+            else:
+                return self.getToken(TyCParser.MUL, i)
+
+        def DIV(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DIV)
+            else:
+                return self.getToken(TyCParser.DIV, i)
+
+        def MOD(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MOD)
+            else:
+                return self.getToken(TyCParser.MOD, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_constMulExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstMulExpr" ):
+                return visitor.visitConstMulExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constMulExpr(self):
+
+        localctx = TyCParser.ConstMulExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_constMulExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 323
+            self.constUnaryExpr()
+            self.state = 328
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0):
+                self.state = 324
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 325
+                self.constUnaryExpr()
+                self.state = 330
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstUnaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def constUnaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.ConstUnaryExprContext,0)
+
+
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def constPrimary(self):
+            return self.getTypedRuleContext(TyCParser.ConstPrimaryContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_constUnaryExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstUnaryExpr" ):
+                return visitor.visitConstUnaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constUnaryExpr(self):
+
+        localctx = TyCParser.ConstUnaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_constUnaryExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 334
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [30, 31]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 331
+                _la = self._input.LA(1)
+                if not(_la==30 or _la==31):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 332
+                self.constUnaryExpr()
+                pass
+            elif token in [39, 47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 333
+                self.constPrimary()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstPrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT_LITERAL(self):
+            return self.getToken(TyCParser.INT_LITERAL, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def constExpr(self):
+            return self.getTypedRuleContext(TyCParser.ConstExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_constPrimary
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstPrimary" ):
+                return visitor.visitConstPrimary(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constPrimary(self):
+
+        localctx = TyCParser.ConstPrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_constPrimary)
+        try:
+            self.state = 341
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 336
+                self.match(TyCParser.INT_LITERAL)
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 337
+                self.match(TyCParser.LPAREN)
+                self.state = 338
+                self.constExpr()
+                self.state = 339
+                self.match(TyCParser.RPAREN)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCParser.AssignExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_expr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr(self):
+
+        localctx = TyCParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_expr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 343
+            self.assignExpr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.lhs = None # OrExprContext
+
+        def orExpr(self):
+            return self.getTypedRuleContext(TyCParser.OrExprContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCParser.AssignExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_assignExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignExpr" ):
+                return visitor.visitAssignExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assignExpr(self):
+
+        localctx = TyCParser.AssignExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_assignExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 345
+            localctx.lhs = self.orExpr()
+            self.state = 349
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==35:
+                self.checkLvalue(localctx.lhs)
+                self.state = 347
+                self.match(TyCParser.ASSIGN)
+                self.state = 348
+                self.assignExpr()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignOnlyContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def assignExpr(self):
+            return self.getTypedRuleContext(TyCParser.AssignExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_assignOnly
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignOnly" ):
+                return visitor.visitAssignOnly(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assignOnly(self):
+
+        localctx = TyCParser.AssignOnlyContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_assignOnly)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 351
+            self.lvalue()
+            self.state = 352
+            self.match(TyCParser.ASSIGN)
+            self.state = 353
+            self.assignExpr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OrExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def andExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.AndExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.AndExprContext,i)
+
+
+        def OR(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.OR)
+            else:
+                return self.getToken(TyCParser.OR, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_orExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrExpr" ):
+                return visitor.visitOrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def orExpr(self):
+
+        localctx = TyCParser.OrExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_orExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 355
+            self.andExpr()
+            self.state = 360
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==21:
+                self.state = 356
+                self.match(TyCParser.OR)
+                self.state = 357
+                self.andExpr()
+                self.state = 362
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AndExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def eqExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.EqExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.EqExprContext,i)
+
+
+        def AND(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.AND)
+            else:
+                return self.getToken(TyCParser.AND, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_andExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAndExpr" ):
+                return visitor.visitAndExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def andExpr(self):
+
+        localctx = TyCParser.AndExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_andExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 363
+            self.eqExpr()
+            self.state = 368
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==22:
+                self.state = 364
+                self.match(TyCParser.AND)
+                self.state = 365
+                self.eqExpr()
+                self.state = 370
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class EqExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def relExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.RelExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.RelExprContext,i)
+
+
+        def EQ(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.EQ)
+            else:
+                return self.getToken(TyCParser.EQ, i)
+
+        def NEQ(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.NEQ)
+            else:
+                return self.getToken(TyCParser.NEQ, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_eqExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEqExpr" ):
+                return visitor.visitEqExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def eqExpr(self):
+
+        localctx = TyCParser.EqExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_eqExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 371
+            self.relExpr()
+            self.state = 376
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==23 or _la==24:
+                self.state = 372
+                _la = self._input.LA(1)
+                if not(_la==23 or _la==24):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 373
+                self.relExpr()
+                self.state = 378
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def addExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.AddExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.AddExprContext,i)
+
+
+        def LT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.LT)
+            else:
+                return self.getToken(TyCParser.LT, i)
+
+        def LE(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.LE)
+            else:
+                return self.getToken(TyCParser.LE, i)
+
+        def GT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.GT)
+            else:
+                return self.getToken(TyCParser.GT, i)
+
+        def GE(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.GE)
+            else:
+                return self.getToken(TyCParser.GE, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_relExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelExpr" ):
+                return visitor.visitRelExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def relExpr(self):
+
+        localctx = TyCParser.RelExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_relExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 379
+            self.addExpr()
+            self.state = 384
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 206259093504) != 0):
+                self.state = 380
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 206259093504) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 381
+                self.addExpr()
+                self.state = 386
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AddExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def mulExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.MulExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.MulExprContext,i)
+
+
+        def PLUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.PLUS)
+            else:
+                return self.getToken(TyCParser.PLUS, i)
+
+        def MINUS(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MINUS)
+            else:
+                return self.getToken(TyCParser.MINUS, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_addExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAddExpr" ):
+                return visitor.visitAddExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def addExpr(self):
+
+        localctx = TyCParser.AddExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_addExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 387
+            self.mulExpr()
+            self.state = 392
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==30 or _la==31:
+                self.state = 388
+                _la = self._input.LA(1)
+                if not(_la==30 or _la==31):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 389
+                self.mulExpr()
+                self.state = 394
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MulExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def unaryExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.UnaryExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.UnaryExprContext,i)
+
+
+        def MUL(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MUL)
+            else:
+                return self.getToken(TyCParser.MUL, i)
+
+        def DIV(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DIV)
+            else:
+                return self.getToken(TyCParser.DIV, i)
+
+        def MOD(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.MOD)
+            else:
+                return self.getToken(TyCParser.MOD, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_mulExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMulExpr" ):
+                return visitor.visitMulExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def mulExpr(self):
+
+        localctx = TyCParser.MulExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 78, self.RULE_mulExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 395
+            self.unaryExpr()
+            self.state = 400
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0):
+                self.state = 396
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 397
+                self.unaryExpr()
+                self.state = 402
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UnaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def prefixIncDec(self):
+            return self.getTypedRuleContext(TyCParser.PrefixIncDecContext,0)
+
+
+        def unaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.UnaryExprContext,0)
+
+
+        def NOT(self):
+            return self.getToken(TyCParser.NOT, 0)
+
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def postfixExpr(self):
+            return self.getTypedRuleContext(TyCParser.PostfixExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_unaryExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaryExpr" ):
+                return visitor.visitUnaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unaryExpr(self):
+
+        localctx = TyCParser.UnaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 80, self.RULE_unaryExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 407
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [28, 29]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 403
+                self.prefixIncDec()
+                pass
+            elif token in [27, 30, 31]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 404
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3355443200) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 405
+                self.unaryExpr()
+                pass
+            elif token in [20, 39, 41, 46, 47, 50]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 406
+                self.postfixExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrefixIncDecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_prefixIncDec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrefixIncDec" ):
+                return visitor.visitPrefixIncDec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def prefixIncDec(self):
+
+        localctx = TyCParser.PrefixIncDecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 82, self.RULE_prefixIncDec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 409
+            _la = self._input.LA(1)
+            if not(_la==28 or _la==29):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 410
+            self.lvalue()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def postfixPrimary(self):
+            return self.getTypedRuleContext(TyCParser.PostfixPrimaryContext,0)
+
+
+        def postfixOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.PostfixOpContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.PostfixOpContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixExpr" ):
+                return visitor.visitPostfixExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixExpr(self):
+
+        localctx = TyCParser.PostfixExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 84, self.RULE_postfixExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 412
+            self.postfixPrimary()
+            self.state = 416
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 275683213312) != 0):
+                self.state = 413
+                self.postfixOp()
+                self.state = 418
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(TyCParser.DOT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixOp
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixOp" ):
+                return visitor.visitPostfixOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixOp(self):
+
+        localctx = TyCParser.PostfixOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_postfixOp)
+        try:
+            self.state = 423
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [38]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 419
+                self.match(TyCParser.DOT)
+                self.state = 420
+                self.match(TyCParser.ID)
+                pass
+            elif token in [28]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 421
+                self.match(TyCParser.INC)
+                pass
+            elif token in [29]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 422
+                self.match(TyCParser.DEC)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixPrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def postfixCall(self):
+            return self.getTypedRuleContext(TyCParser.PostfixCallContext,0)
+
+
+        def primaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.PrimaryExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixPrimary
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixPrimary" ):
+                return visitor.visitPostfixPrimary(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixPrimary(self):
+
+        localctx = TyCParser.PostfixPrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_postfixPrimary)
+        try:
+            self.state = 427
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,43,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 425
+                self.postfixCall()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 426
+                self.primaryExpr()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixCallContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixCall
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixCall" ):
+                return visitor.visitPostfixCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixCall(self):
+
+        localctx = TyCParser.PostfixCallContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_postfixCall)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 429
+            self.match(TyCParser.ID)
+            self.state = 430
+            self.match(TyCParser.LPAREN)
+            self.state = 432
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 431
+                self.argList()
+
+
+            self.state = 434
+            self.match(TyCParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LvalueContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.ID)
+            else:
+                return self.getToken(TyCParser.ID, i)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def DOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DOT)
+            else:
+                return self.getToken(TyCParser.DOT, i)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def lvalue(self):
+            return self.getTypedRuleContext(TyCParser.LvalueContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_lvalue
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLvalue" ):
+                return visitor.visitLvalue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lvalue(self):
+
+        localctx = TyCParser.LvalueContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 92, self.RULE_lvalue)
+        self._la = 0 # Token type
+        try:
+            self.state = 457
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [20]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 436
+                self.match(TyCParser.ID)
+                self.state = 444
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==39:
+                    self.state = 437
+                    self.match(TyCParser.LPAREN)
+                    self.state = 439
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                        self.state = 438
+                        self.argList()
+
+
+                    self.state = 441
+                    self.match(TyCParser.RPAREN)
+                    self.state = 442
+                    self.match(TyCParser.DOT)
+                    self.state = 443
+                    self.match(TyCParser.ID)
+
+
+                self.state = 450
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==38:
+                    self.state = 446
+                    self.match(TyCParser.DOT)
+                    self.state = 447
+                    self.match(TyCParser.ID)
+                    self.state = 452
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 453
+                self.match(TyCParser.LPAREN)
+                self.state = 454
+                self.lvalue()
+                self.state = 455
+                self.match(TyCParser.RPAREN)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArgListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_argList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArgList" ):
+                return visitor.visitArgList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def argList(self):
+
+        localctx = TyCParser.ArgListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 94, self.RULE_argList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 459
+            self.expr()
+            self.state = 464
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==44:
+                self.state = 460
+                self.match(TyCParser.COMMA)
+                self.state = 461
+                self.expr()
+                self.state = 466
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT_LITERAL(self):
+            return self.getToken(TyCParser.INT_LITERAL, 0)
+
+        def FLOAT_LITERAL(self):
+            return self.getToken(TyCParser.FLOAT_LITERAL, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(TyCParser.STRING_LITERAL, 0)
+
+        def structLiteral(self):
+            return self.getTypedRuleContext(TyCParser.StructLiteralContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_primaryExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimaryExpr" ):
+                return visitor.visitPrimaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primaryExpr(self):
+
+        localctx = TyCParser.PrimaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 96, self.RULE_primaryExpr)
+        try:
+            self.state = 476
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 467
+                self.match(TyCParser.INT_LITERAL)
+                pass
+            elif token in [46]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 468
+                self.match(TyCParser.FLOAT_LITERAL)
+                pass
+            elif token in [50]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 469
+                self.match(TyCParser.STRING_LITERAL)
+                pass
+            elif token in [41]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 470
+                self.structLiteral()
+                pass
+            elif token in [20]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 471
+                self.match(TyCParser.ID)
+                pass
+            elif token in [39]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 472
+                self.match(TyCParser.LPAREN)
+                self.state = 473
+                self.expr()
+                self.state = 474
+                self.match(TyCParser.RPAREN)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructLiteralContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structLiteral
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructLiteral" ):
+                return visitor.visitStructLiteral(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structLiteral(self):
+
+        localctx = TyCParser.StructLiteralContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 98, self.RULE_structLiteral)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 478
+            self.match(TyCParser.LBRACE)
+            self.state = 487
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 1339759080243200) != 0):
+                self.state = 479
+                self.expr()
+                self.state = 484
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==44:
+                    self.state = 480
+                    self.match(TyCParser.COMMA)
+                    self.state = 481
+                    self.expr()
+                    self.state = 486
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 489
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+
+
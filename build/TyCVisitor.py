@@ -0,0 +1,263 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .TyCParser import TyCParser
+else:
+    from TyCParser import TyCParser
+
+# This class defines a complete generic visitor for a parse tree produced by TyCParser.
+
+class TyCVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by TyCParser#program.
+    def visitProgram(self, ctx:TyCParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#decl.
+    def visitDecl(self, ctx:TyCParser.DeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structDecl.
+    def visitStructDecl(self, ctx:TyCParser.StructDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structMember.
+    def visitStructMember(self, ctx:TyCParser.StructMemberContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#funcDecl.
+    def visitFuncDecl(self, ctx:TyCParser.FuncDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#paramList.
+    def visitParamList(self, ctx:TyCParser.ParamListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#param.
+    def visitParam(self, ctx:TyCParser.ParamContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#typeSpec.
+    def visitTypeSpec(self, ctx:TyCParser.TypeSpecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnType.
+    def visitReturnType(self, ctx:TyCParser.ReturnTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#block.
+    def visitBlock(self, ctx:TyCParser.BlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#stmt.
+    def visitStmt(self, ctx:TyCParser.StmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDecl.
+    def visitVarDecl(self, ctx:TyCParser.VarDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#exprStmt.
+    def visitExprStmt(self, ctx:TyCParser.ExprStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#breakStmt.
+    def visitBreakStmt(self, ctx:TyCParser.BreakStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#continueStmt.
+    def visitContinueStmt(self, ctx:TyCParser.ContinueStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnStmt.
+    def visitReturnStmt(self, ctx:TyCParser.ReturnStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ifStmt.
+    def visitIfStmt(self, ctx:TyCParser.IfStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#whileStmt.
+    def visitWhileStmt(self, ctx:TyCParser.WhileStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forStmt.
+    def visitForStmt(self, ctx:TyCParser.ForStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forInit.
+    def visitForInit(self, ctx:TyCParser.ForInitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDeclFor.
+    def visitVarDeclFor(self, ctx:TyCParser.VarDeclForContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forUpdate.
+    def visitForUpdate(self, ctx:TyCParser.ForUpdateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchStmt.
+    def visitSwitchStmt(self, ctx:TyCParser.SwitchStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchSection.
+    def visitSwitchSection(self, ctx:TyCParser.SwitchSectionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#defaultSection.
+    def visitDefaultSection(self, ctx:TyCParser.DefaultSectionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#caseLabel.
+    def visitCaseLabel(self, ctx:TyCParser.CaseLabelContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#constExpr.
+    def visitConstExpr(self, ctx:TyCParser.ConstExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#constAddExpr.
+    def visitConstAddExpr(self, ctx:TyCParser.ConstAddExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#constMulExpr.
+    def visitConstMulExpr(self, ctx:TyCParser.ConstMulExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#constUnaryExpr.
+    def visitConstUnaryExpr(self, ctx:TyCParser.ConstUnaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#constPrimary.
+    def visitConstPrimary(self, ctx:TyCParser.ConstPrimaryContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#expr.
+    def visitExpr(self, ctx:TyCParser.ExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#assignExpr.
+    def visitAssignExpr(self, ctx:TyCParser.AssignExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#assignOnly.
+    def visitAssignOnly(self, ctx:TyCParser.AssignOnlyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#orExpr.
+    def visitOrExpr(self, ctx:TyCParser.OrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#andExpr.
+    def visitAndExpr(self, ctx:TyCParser.AndExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#eqExpr.
+    def visitEqExpr(self, ctx:TyCParser.EqExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#relExpr.
+    def visitRelExpr(self, ctx:TyCParser.RelExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#addExpr.
+    def visitAddExpr(self, ctx:TyCParser.AddExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#mulExpr.
+    def visitMulExpr(self, ctx:TyCParser.MulExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#unaryExpr.
+    def visitUnaryExpr(self, ctx:TyCParser.UnaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#prefixIncDec.
+    def visitPrefixIncDec(self, ctx:TyCParser.PrefixIncDecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixExpr.
+    def visitPostfixExpr(self, ctx:TyCParser.PostfixExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixOp.
+    def visitPostfixOp(self, ctx:TyCParser.PostfixOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixPrimary.
+    def visitPostfixPrimary(self, ctx:TyCParser.PostfixPrimaryContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixCall.
+    def visitPostfixCall(self, ctx:TyCParser.PostfixCallContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#lvalue.
+    def visitLvalue(self, ctx:TyCParser.LvalueContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#argList.
+    def visitArgList(self, ctx:TyCParser.ArgListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#primaryExpr.
+    def visitPrimaryExpr(self, ctx:TyCParser.PrimaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structLiteral.
+    def visitStructLiteral(self, ctx:TyCParser.StructLiteralContext):
+        return self.visitChildren(ctx)
+
+
+
+del TyCParser
\ No newline at end of file
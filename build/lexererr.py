@@ -0,0 +1,38 @@
+class LexerError(Exception):
+    # Position and text of the offending token: character offset, line
+    # (1-based), column (0-based) and the lexeme the message was built from.
+    # Set by the lexer when the error is reported.
+    offset = None
+    line = None
+    column = None
+    token = None
+
+    def at(self, offset, line, column, token=None):
+        self.offset = offset
+        self.line = line
+        self.column = column
+        self.token = token
+        return self
+
+    def __str__(self):
+        return self.message
+
+    def __reduce__(self):
+        # Pickle the message and position as they are (e.g. to send the
+        # error back from a worker process); __init__ only takes the lexeme.
+        return (self.__class__.__new__, (self.__class__,), self.__dict__)
+
+
+class ErrorToken(LexerError):
+    def __init__(self, s):
+        self.message = "Error Token " + s
+
+
+class UncloseString(LexerError):
+    def __init__(self, s):
+        self.message = "Unclosed String: " + s
+
+
+class IllegalEscape(LexerError):
+    def __init__(self, s):
+        self.message = "Illegal Escape In String: " + s
@@ -0,0 +1,48 @@
+import re
+
+# Value of each escape sequence allowed in a TyC string literal.
+ESCAPES = {"b": "\b", "f": "\f", "r": "\r", "n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+
+_ESCAPE = re.compile(r"\\(.)")
+
+
+def _replace(match):
+    return ESCAPES[match.group(1)]
+
+
+def decode(raw):
+    """Value of a STRING_LITERAL token text (quotes already stripped)."""
+    if "\\" not in raw:
+        return raw
+    return _ESCAPE.sub(_replace, raw)
+
+
+class StringPool:
+    # Constant pool of decoded string literals. Each distinct value is stored
+    # once in `values`; intern() returns its index. Literals are decoded once
+    # per distinct spelling, so a repeated literal costs one dict lookup.
+
+    __slots__ = ("values", "_by_raw", "_by_value")
+
+    def __init__(self):
+        self.values = []
+        self._by_raw = {}
+        self._by_value = {}
+
+    def intern(self, raw):
+        index = self._by_raw.get(raw)
+        if index is None:
+            value = decode(raw)
+            index = self._by_value.get(value)
+            if index is None:
+                index = len(self.values)
+                self.values.append(value)
+                self._by_value[value] = index
+            self._by_raw[raw] = index
+        return index
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
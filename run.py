@@ -122,6 +122,12 @@ class TyCBuilder:
                 sys.exit(1)
             return e
 
+    def build_python(self):
+        """Python executable used by build steps (venv if present)."""
+        if self.venv_python3.exists():
+            return str(self.venv_python3)
+        return sys.executable
+
     def command_exists(self, command):
         """Check if a command exists in PATH."""
         try:
@@ -318,8 +324,9 @@ class TyCBuilder:
 
         self.build_dir.mkdir(exist_ok=True)
 
-        grammar_files = list((self.root_dir / "src" / "grammar").glob("*.g4"))
-        if not grammar_files:
+        grammar_dir = self.root_dir / "src" / "grammar"
+        grammar_file = grammar_dir / "TyC.g4"
+        if not grammar_file.exists():
             print(self.colors.red("No grammar files found in src/grammar/"))
             sys.exit(1)
 
@@ -333,18 +340,47 @@ class TyCBuilder:
             "-no-listener",
             "-o",
             str(self.build_dir),
-        ] + [str(f) for f in grammar_files]
+            str(grammar_file),
+        ]
 
         self.run_command(cmd)
 
+        # The AST-building parser grammar imports TyC.tokens from build/
+        print(self.colors.yellow("Compiling AST-building parser (TyCASTParser.g4)..."))
+        self.run_command(
+            [
+                "java",
+                "-jar",
+                str(antlr_path),
+                "-Dlanguage=Python3",
+                "-no-visitor",
+                "-no-listener",
+                "-lib",
+                str(self.build_dir),
+                "-o",
+                str(self.build_dir),
+                str(grammar_dir / "TyCASTParser.g4"),
+            ]
+        )
+
         # Create __init__.py
         (self.build_dir / "__init__.py").touch()
 
         # Copy Python files
-        lexererr_src = self.root_dir / "src" / "grammar" / "lexererr.py"
-        lexererr_dst = self.build_dir / "lexererr.py"
-        if lexererr_src.exists():
-            shutil.copy2(lexererr_src, lexererr_dst)
+        for name in ("lexererr.py", "stringpool.py", "TyCParserBase.py"):
+            src = self.root_dir / "src" / "grammar" / name
+            if src.exists():
+                shutil.copy2(src, self.build_dir / name)
+
+        print(self.colors.yellow("Generating table-driven DFA lexer..."))
+        self.run_command(
+            [self.build_python(), "-m", "src.grammar.lexgen", str(self.build_dir)]
+        )
+
+        print(self.colors.yellow("Writing warm DFA snapshot..."))
+        self.run_command(
+            [self.build_python(), "-m", "src.parser.snapshot", str(self.build_dir)]
+        )
 
         print(self.colors.green("ANTLR grammar files compiled to build/"))
 
@@ -2,6 +2,10 @@
 AST Generation module for TyC programming language.
 This module contains the ASTGeneration class that converts parse trees
 into Abstract Syntax Trees using the visitor pattern.
+
+Every node gets the `line` and `column` of the first token of the source
+it was built from; parentheses around an operand belong to the operand's
+parent (`(a).b` starts at `(`), not to the operand itself.
 """
 
 from functools import reduce
@@ -10,7 +14,265 @@ from build.TyCParser import TyCParser
 from src.utils.nodes import *
 
 
+def at(node, token):
+    """Set the position of `node` to that of `token` and return it."""
+    node.line = token.line
+    node.column = token.column
+    return node
+
+
 class ASTGeneration(TyCVisitor):
     """AST Generation visitor for TyC language."""
 
-    pass
+    # ------------------------------------------------------------------
+    # Program and declarations
+    # ------------------------------------------------------------------
+
+    def visitProgram(self, ctx: TyCParser.ProgramContext):
+        return at(Program([self.visit(d) for d in ctx.decl()]), ctx.start)
+
+    def visitDecl(self, ctx: TyCParser.DeclContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitStructDecl(self, ctx: TyCParser.StructDeclContext):
+        members = [self.visit(m) for m in ctx.structMember()]
+        return at(StructDecl(ctx.ID().getText(), members), ctx.start)
+
+    def visitStructMember(self, ctx: TyCParser.StructMemberContext):
+        return at(MemberDecl(self.visit(ctx.typeSpec()), ctx.ID().getText()), ctx.start)
+
+    def visitFuncDecl(self, ctx: TyCParser.FuncDeclContext):
+        return_type = self.visit(ctx.returnType()) if ctx.returnType() else None
+        params = self.visit(ctx.paramList()) if ctx.paramList() else []
+        func = FuncDecl(return_type, ctx.ID().getText(), params, self.visit(ctx.block()))
+        return at(func, ctx.start)
+
+    def visitParamList(self, ctx: TyCParser.ParamListContext):
+        return [self.visit(p) for p in ctx.param()]
+
+    def visitParam(self, ctx: TyCParser.ParamContext):
+        return at(Param(self.visit(ctx.typeSpec()), ctx.ID().getText()), ctx.start)
+
+    # ------------------------------------------------------------------
+    # Types
+    # ------------------------------------------------------------------
+
+    def visitTypeSpec(self, ctx: TyCParser.TypeSpecContext):
+        if ctx.INT():
+            node = IntType()
+        elif ctx.FLOAT():
+            node = FloatType()
+        elif ctx.STRING():
+            node = StringType()
+        else:
+            node = StructType(ctx.ID().getText())
+        return at(node, ctx.start)
+
+    def visitReturnType(self, ctx: TyCParser.ReturnTypeContext):
+        if ctx.VOID():
+            return at(VoidType(), ctx.start)
+        return self.visit(ctx.typeSpec())
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def visitBlock(self, ctx: TyCParser.BlockContext):
+        return at(BlockStmt([self.visit(s) for s in ctx.stmt()]), ctx.start)
+
+    def visitStmt(self, ctx: TyCParser.StmtContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitVarDecl(self, ctx: TyCParser.VarDeclContext):
+        var_type = self.visit(ctx.typeSpec()) if ctx.typeSpec() else None
+        init = self.visit(ctx.expr()) if ctx.expr() else None
+        return at(VarDecl(var_type, ctx.ID().getText(), init), ctx.start)
+
+    def visitExprStmt(self, ctx: TyCParser.ExprStmtContext):
+        return at(ExprStmt(self.visit(ctx.expr())), ctx.start)
+
+    def visitBreakStmt(self, ctx: TyCParser.BreakStmtContext):
+        return at(BreakStmt(), ctx.start)
+
+    def visitContinueStmt(self, ctx: TyCParser.ContinueStmtContext):
+        return at(ContinueStmt(), ctx.start)
+
+    def visitReturnStmt(self, ctx: TyCParser.ReturnStmtContext):
+        return at(ReturnStmt(self.visit(ctx.expr()) if ctx.expr() else None), ctx.start)
+
+    def visitIfStmt(self, ctx: TyCParser.IfStmtContext):
+        stmts = ctx.stmt()
+        else_stmt = self.visit(stmts[1]) if len(stmts) > 1 else None
+        return at(IfStmt(self.visit(ctx.expr()), self.visit(stmts[0]), else_stmt), ctx.start)
+
+    def visitWhileStmt(self, ctx: TyCParser.WhileStmtContext):
+        return at(WhileStmt(self.visit(ctx.expr()), self.visit(ctx.stmt())), ctx.start)
+
+    def visitForStmt(self, ctx: TyCParser.ForStmtContext):
+        init = self.visit(ctx.forInit()) if ctx.forInit() else None
+        cond = self.visit(ctx.expr()) if ctx.expr() else None
+        update = self.visit(ctx.forUpdate()) if ctx.forUpdate() else None
+        return at(ForStmt(init, cond, update, self.visit(ctx.stmt())), ctx.start)
+
+    def visitForInit(self, ctx: TyCParser.ForInitContext):
+        if ctx.varDeclFor():
+            return self.visit(ctx.varDeclFor())
+        return at(ExprStmt(self.visit(ctx.assignOnly())), ctx.start)
+
+    def visitVarDeclFor(self, ctx: TyCParser.VarDeclForContext):
+        var_type = self.visit(ctx.typeSpec()) if ctx.typeSpec() else None
+        init = self.visit(ctx.expr()) if ctx.expr() else None
+        return at(VarDecl(var_type, ctx.ID().getText(), init), ctx.start)
+
+    def visitForUpdate(self, ctx: TyCParser.ForUpdateContext):
+        if ctx.prefixIncDec():
+            return self.visit(ctx.prefixIncDec())
+        lhs = self.visit(ctx.lvalue())
+        if ctx.ASSIGN():
+            return at(AssignExpr(lhs, self.visit(ctx.assignExpr())), ctx.start)
+        return at(PostfixOp(ctx.getChild(1).getText(), lhs), ctx.start)
+
+    def visitSwitchStmt(self, ctx: TyCParser.SwitchStmtContext):
+        cases = [case for section in ctx.switchSection() for case in self.visit(section)]
+        default = self.visit(ctx.defaultSection()) if ctx.defaultSection() else None
+        return at(SwitchStmt(self.visit(ctx.expr()), cases, default), ctx.start)
+
+    def visitSwitchSection(self, ctx: TyCParser.SwitchSectionContext):
+        # `case 1: case 2: stmts` falls through: only the last label of a
+        # section holds its statements.
+        labels = ctx.caseLabel()
+        stmts = [self.visit(s) for s in ctx.stmt()]
+        return [
+            at(CaseStmt(self.visit(label), stmts if i == len(labels) - 1 else []), label.start)
+            for i, label in enumerate(labels)
+        ]
+
+    def visitDefaultSection(self, ctx: TyCParser.DefaultSectionContext):
+        return at(DefaultStmt([self.visit(s) for s in ctx.stmt()]), ctx.start)
+
+    def visitCaseLabel(self, ctx: TyCParser.CaseLabelContext):
+        return self.visit(ctx.constExpr())
+
+    # ------------------------------------------------------------------
+    # Constant expressions (case labels)
+    # ------------------------------------------------------------------
+
+    def _binary_chain(self, ctx, operands):
+        """Fold `operand (op operand)*` into left-associative BinaryOps."""
+        nodes = [self.visit(o) for o in operands]
+        ops = [ctx.getChild(i).getText() for i in range(1, ctx.getChildCount(), 2)]
+        return reduce(
+            lambda left, pair: at(BinaryOp(left, pair[0], pair[1]), ctx.start),
+            zip(ops, nodes[1:]),
+            nodes[0],
+        )
+
+    def visitConstExpr(self, ctx: TyCParser.ConstExprContext):
+        return self.visit(ctx.constAddExpr())
+
+    def visitConstAddExpr(self, ctx: TyCParser.ConstAddExprContext):
+        return self._binary_chain(ctx, ctx.constMulExpr())
+
+    def visitConstMulExpr(self, ctx: TyCParser.ConstMulExprContext):
+        return self._binary_chain(ctx, ctx.constUnaryExpr())
+
+    def visitConstUnaryExpr(self, ctx: TyCParser.ConstUnaryExprContext):
+        if ctx.constPrimary():
+            return self.visit(ctx.constPrimary())
+        return at(PrefixOp(ctx.getChild(0).getText(), self.visit(ctx.constUnaryExpr())), ctx.start)
+
+    def visitConstPrimary(self, ctx: TyCParser.ConstPrimaryContext):
+        if ctx.INT_LITERAL():
+            return at(IntLiteral(int(ctx.INT_LITERAL().getText())), ctx.start)
+        return self.visit(ctx.constExpr())
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def visitExpr(self, ctx: TyCParser.ExprContext):
+        return self.visit(ctx.assignExpr())
+
+    def visitAssignExpr(self, ctx: TyCParser.AssignExprContext):
+        lhs = self.visit(ctx.orExpr())
+        if ctx.assignExpr() is None:
+            return lhs
+        return at(AssignExpr(lhs, self.visit(ctx.assignExpr())), ctx.start)
+
+    def visitAssignOnly(self, ctx: TyCParser.AssignOnlyContext):
+        return at(AssignExpr(self.visit(ctx.lvalue()), self.visit(ctx.assignExpr())), ctx.start)
+
+    def visitOrExpr(self, ctx: TyCParser.OrExprContext):
+        return self._binary_chain(ctx, ctx.andExpr())
+
+    def visitAndExpr(self, ctx: TyCParser.AndExprContext):
+        return self._binary_chain(ctx, ctx.eqExpr())
+
+    def visitEqExpr(self, ctx: TyCParser.EqExprContext):
+        return self._binary_chain(ctx, ctx.relExpr())
+
+    def visitRelExpr(self, ctx: TyCParser.RelExprContext):
+        return self._binary_chain(ctx, ctx.addExpr())
+
+    def visitAddExpr(self, ctx: TyCParser.AddExprContext):
+        return self._binary_chain(ctx, ctx.mulExpr())
+
+    def visitMulExpr(self, ctx: TyCParser.MulExprContext):
+        return self._binary_chain(ctx, ctx.unaryExpr())
+
+    def visitUnaryExpr(self, ctx: TyCParser.UnaryExprContext):
+        if ctx.unaryExpr():
+            return at(PrefixOp(ctx.getChild(0).getText(), self.visit(ctx.unaryExpr())), ctx.start)
+        return self.visit(ctx.getChild(0))
+
+    def visitPrefixIncDec(self, ctx: TyCParser.PrefixIncDecContext):
+        return at(PrefixOp(ctx.getChild(0).getText(), self.visit(ctx.lvalue())), ctx.start)
+
+    def visitPostfixExpr(self, ctx: TyCParser.PostfixExprContext):
+        node = self.visit(ctx.postfixPrimary())
+        for op in ctx.postfixOp():
+            if op.ID():
+                node = at(MemberAccess(node, op.ID().getText()), ctx.start)
+            else:
+                node = at(PostfixOp(op.getText(), node), ctx.start)
+        return node
+
+    def visitPostfixPrimary(self, ctx: TyCParser.PostfixPrimaryContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitPostfixCall(self, ctx: TyCParser.PostfixCallContext):
+        args = self.visit(ctx.argList()) if ctx.argList() else []
+        return at(FuncCall(ctx.ID().getText(), args), ctx.start)
+
+    def visitLvalue(self, ctx: TyCParser.LvalueContext):
+        if ctx.lvalue():
+            return self.visit(ctx.lvalue())
+        ids = ctx.ID()
+        if ctx.LPAREN():
+            args = self.visit(ctx.argList()) if ctx.argList() else []
+            node = at(FuncCall(ids[0].getText(), args), ctx.start)
+        else:
+            node = at(Identifier(ids[0].getText()), ctx.start)
+        for member in ids[1:]:
+            node = at(MemberAccess(node, member.getText()), ctx.start)
+        return node
+
+    def visitArgList(self, ctx: TyCParser.ArgListContext):
+        return [self.visit(e) for e in ctx.expr()]
+
+    def visitPrimaryExpr(self, ctx: TyCParser.PrimaryExprContext):
+        token = ctx.start
+        if ctx.INT_LITERAL():
+            return at(IntLiteral(int(token.text)), token)
+        if ctx.FLOAT_LITERAL():
+            return at(FloatLiteral(float(token.text)), token)
+        if ctx.STRING_LITERAL():
+            return at(StringLiteral(token.text, getattr(token, "poolIndex", None)), token)
+        if ctx.ID():
+            return at(Identifier(token.text), token)
+        if ctx.structLiteral():
+            return self.visit(ctx.structLiteral())
+        return self.visit(ctx.expr())
+
+    def visitStructLiteral(self, ctx: TyCParser.StructLiteralContext):
+        return at(StructLiteral([self.visit(e) for e in ctx.expr()]), ctx.start)
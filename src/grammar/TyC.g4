@@ -2,26 +2,147 @@ grammar TyC;
 
 @lexer::header {
 from lexererr import *
+from stringpool import StringPool
+from src.parser.snapshot import warm_state
 }
 
 @lexer::members {
+# Start with the warm DFAs of build/TyC.snapshot, if it is valid (see
+# src/parser/snapshot.py).
+(decisionsToDFA,) = warm_state("TyCLexer", serializedATN(), atn, decisionsToDFA)
+
+# When True, lexical errors are collected in lexerErrors and the offending
+# tokens are still emitted, instead of raising on the first one.
+recoverErrors = False
+lexerErrors = None
+
+# With recoverErrors, report a double quote that starts no string token (a
+# backslash before the line end) as UncloseString of the rest of its line,
+# which is skipped, instead of as ErrorToken, as Tokenizer.tokenize does.
+strayQuoteUnclosed = False
+
+# Decoded STRING_LITERAL values; each string token gets a poolIndex into it.
+# Created on the first literal unless a pool is assigned to share it, and
+# kept across reset() so earlier indices stay valid.
+stringPool = None
+
 def emit(self):
     tk = self.type
     if tk == self.UNCLOSE_STRING:       
         result = super().emit();
-        raise UncloseString(result.text);
+        return self.lexerError(UncloseString(result.text), result);
     elif tk == self.ILLEGAL_ESCAPE:
+        if self.recoverErrors:
+            self.skipStringRest()
         result = super().emit();
-        raise IllegalEscape(result.text);
+        return self.lexerError(IllegalEscape(result.text), result);
     elif tk == self.ERROR_CHAR:
+        if self.recoverErrors and self.strayQuoteUnclosed and self.text == '"':
+            self.type = self.UNCLOSE_STRING
+            self.text = self.skipLineRest()
+            result = super().emit();
+            return self.lexerError(UncloseString(result.text), result);
         result = super().emit();
-        raise ErrorToken(result.text); 
+        return self.lexerError(ErrorToken(result.text), result);
+    elif tk == self.STRING_LITERAL:
+        result = super().emit();
+        result.poolIndex = self.internString(result.text)
+        return result;
     else:
         return super().emit();
+
+def lexerError(self, err, token):
+    err.at(token.start, token.line, token.column, token.text)
+    if not self.recoverErrors:
+        raise err
+    if self.lexerErrors is None:
+        self.lexerErrors = []
+    self.lexerErrors.append(err)
+    return token
+
+def internString(self, raw):
+    if self.stringPool is None:
+        self.stringPool = StringPool()
+    return self.stringPool.intern(raw)
+
+def skipStringRest(self):
+    # Consume the rest of a string after an illegal escape, up to and including
+    # its closing quote, so the literal is reported once and its tail is not
+    # lexed as code. Strings never span lines, so only the column moves.
+    consumed = 0
+    while True:
+        c = self._input.LA(1)
+        if c in (-1, 10, 13):
+            break
+        self._input.consume()
+        consumed += 1
+        if c == 34:
+            break
+        if c == 92 and self._input.LA(1) not in (-1, 10, 13):
+            self._input.consume()
+            consumed += 1
+    self.column += consumed
+
+def skipLineRest(self):
+    # Consume the rest of the line, up to its line break; return it.
+    start = self._input.index
+    while self._input.LA(1) not in (-1, 10, 13):
+        self._input.consume()
+    self.column += self._input.index - start
+    return self._input.getText(start, self._input.index - 1)
+
+def reset(self):
+    super().reset()
+    self.lexerErrors = None
+}
+
+@parser::header {
+from antlr4.error.Errors import InputMismatchException
+from src.parser.snapshot import warm_state
+}
+
+@parser::members {
+# Start with the warm DFAs and context cache of build/TyC.snapshot, if it
+# is valid (see src/parser/snapshot.py).
+decisionsToDFA, sharedContextCache = warm_state("TyCParser", serializedATN(), atn, decisionsToDFA, sharedContextCache)
+
+def checkLvalue(self, ctx):
+    # Reports `=` after an operand that is not an lvalue as a syntax error
+    # at the `=`. An action rather than a predicate, so that the decisions
+    # of the expression rules stay LL(1).
+    if not self.isLvalue(ctx):
+        raise InputMismatchException(self)
+
+def isLvalue(self, ctx):
+    # True if the orExpr `ctx` is exactly an lvalue: ID (DOT ID)*, a call
+    # followed by (DOT ID)+, or a parenthesized lvalue, with no operator.
+    if not self.buildParseTrees:
+        return self.isLvalueTokens(ctx.start.tokenIndex, ctx.stop.tokenIndex)
+    while not isinstance(ctx, TyCParser.UnaryExprContext):
+        if ctx.getChildCount() != 1:
+            return False
+        ctx = ctx.getChild(0)
+    postfix = ctx.getChild(0)
+    if not isinstance(postfix, TyCParser.PostfixExprContext):
+        return False
+    ops = postfix.postfixOp()
+    for op in ops:
+        if op.DOT() is None:
+            return False
+    primary = postfix.postfixPrimary().getChild(0)
+    if isinstance(primary, TyCParser.PostfixCallContext):
+        return len(ops) > 0
+    if primary.ID() is not None:
+        return True
+    if primary.LPAREN() is None or ops or primary.expr() is None:
+        return False
+    inner = primary.expr().assignExpr()
+    return inner is not None and inner.getChildCount() == 1 and self.isLvalue(inner.orExpr())
 }
 
 options{
 	language=Python3;
+	superClass=TyCParserBase;
 }
 
 // Program Structure
@@ -134,13 +255,13 @@ varDeclFor
     ;
 
 forUpdate
-    : assignOnly
-    | incDecExpr
+    : prefixIncDec
+    | lvalue (ASSIGN assignExpr | INC | DEC)
     ;
 
 // switch (expr) { case ... default ... }
 switchStmt
-    : SWITCH LPAREN expr RPAREN LBRACE switchSection* defaultSection? switchSection* RBRACE
+    : SWITCH LPAREN expr RPAREN LBRACE switchSection* (defaultSection switchSection*)? RBRACE
     ;
 
 switchSection
@@ -180,9 +301,11 @@ expr
     : assignExpr
     ;
 
+// An assignment and an ordinary expression share their left operand, so
+// it is parsed once and checked for being an lvalue when `=` follows,
+// instead of predicting the alternative by scanning the whole lvalue.
 assignExpr
-    : assignOnly
-    | orExpr
+    : lhs=orExpr ({self.checkLvalue($lhs.ctx)} ASSIGN assignExpr)?   // right-associative
     ;
 
 assignOnly
@@ -224,11 +347,6 @@ prefixIncDec
     : (INC | DEC) lvalue
     ;
 
-incDecExpr
-    : prefixIncDec
-    | lvalue (INC | DEC)
-    ;
-
 // postfix: member access has highest precedence, then call, ++ --
 // All postfix operators are left-associative at the same level
 postfixExpr
@@ -250,9 +368,10 @@ postfixCall
     : ID LPAREN argList? RPAREN
     ;
 
+// ID (DOT ID)*, postfixCall (DOT ID)+ or a parenthesized lvalue,
+// left-factored so that each decision needs one token of lookahead
 lvalue
-    : ID (DOT ID)*
-    | postfixCall (DOT ID)+
+    : ID (LPAREN argList? RPAREN DOT ID)? (DOT ID)*
     | LPAREN lvalue RPAREN
     ;
 
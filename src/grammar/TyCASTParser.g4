@@ -0,0 +1,306 @@
+// The parser rules of TyC.g4, with the same alternatives in the same order,
+// building the AST of src/utils/nodes.py in `returns` actions instead of a
+// parse tree. The program rule turns buildParseTrees off: rule contexts are
+// still created for each invocation (they carry the return values), but
+// none is attached to its parent, so each is garbage as soon as its rule
+// returns. The result is the AST ASTGeneration builds, positions included.
+//
+// Keep this grammar in step with TyC.g4: same rules, same subrules. Actions
+// are invisible to prediction, so both parsers accept the same language
+// and report the same errors. `lv` tracks what TyC.g4's isLvalue decides
+// on the parse tree: the operand is exactly an lvalue.
+//
+// Each action holds a single `$attr = value`: the Python target drops the
+// `;` after such an assignment, so two of them cannot share an action.
+parser grammar TyCASTParser;
+
+options {
+	tokenVocab=TyC;
+	language=Python3;
+	superClass=TyCParserBase;
+}
+
+@header {
+from antlr4.error.Errors import InputMismatchException
+from src.parser.snapshot import warm_state
+from src.utils.nodes import *
+
+
+def at(node, token):
+    node.line = token.line
+    node.column = token.column
+    return node
+}
+
+@members {
+# Start with the warm DFAs and context cache of build/TyC.snapshot, as
+# TyCParser does.
+decisionsToDFA, sharedContextCache = warm_state("TyCASTParser", serializedATN(), atn, decisionsToDFA, sharedContextCache)
+}
+
+program returns [node]
+@init {self.buildParseTrees = False}
+    : {$node = Program([])} (decl {$node.decls.append($decl.node)})* EOF {at($node, $start)}
+    ;
+
+decl returns [node]
+    : structDecl {$node = $structDecl.node}
+    | funcDecl {$node = $funcDecl.node}
+    ;
+
+structDecl returns [node]
+    : STRUCT ID LBRACE {$node = at(StructDecl($ID.text, []), $start)}
+      (structMember {$node.members.append($structMember.node)})* RBRACE SEMI
+    ;
+
+structMember returns [node]
+    : typeSpec ID SEMI {$node = at(MemberDecl($typeSpec.node, $ID.text), $start)}
+    ;
+
+funcDecl returns [node]
+    : returnType? ID LPAREN paramList? RPAREN block
+      {$node = at(FuncDecl($returnType.node if $returnType.ctx else None, $ID.text, $paramList.nodes if $paramList.ctx else [], $block.node), $start)}
+    ;
+
+paramList returns [nodes]
+    : p=param {$nodes = [$p.node]} (COMMA q=param {$nodes.append($q.node)})*
+    ;
+
+param returns [node]
+    : typeSpec ID {$node = at(Param($typeSpec.node, $ID.text), $start)}
+    ;
+
+// Types
+typeSpec returns [node]
+    : INT {$node = at(IntType(), $start)}
+    | FLOAT {$node = at(FloatType(), $start)}
+    | STRING {$node = at(StringType(), $start)}
+    | ID {$node = at(StructType($ID.text), $start)}
+    ;
+
+returnType returns [node]
+    : typeSpec {$node = $typeSpec.node}
+    | VOID {$node = at(VoidType(), $start)}
+    ;
+
+// Block + statements
+block returns [node]
+    : LBRACE {$node = at(BlockStmt([]), $start)} (stmt {$node.statements.append($stmt.node)})* RBRACE
+    ;
+
+stmt returns [node]
+    : varDecl {$node = $varDecl.node}
+    | ifStmt {$node = $ifStmt.node}
+    | whileStmt {$node = $whileStmt.node}
+    | forStmt {$node = $forStmt.node}
+    | switchStmt {$node = $switchStmt.node}
+    | breakStmt {$node = $breakStmt.node}
+    | continueStmt {$node = $continueStmt.node}
+    | returnStmt {$node = $returnStmt.node}
+    | block {$node = $block.node}
+    | exprStmt {$node = $exprStmt.node}
+    ;
+
+varDecl returns [node]
+    : AUTO ID (ASSIGN expr)? SEMI {$node = at(VarDecl(None, $ID.text, $expr.node if $expr.ctx else None), $start)}
+    | typeSpec ID (ASSIGN expr)? SEMI {$node = at(VarDecl($typeSpec.node, $ID.text, $expr.node if $expr.ctx else None), $start)}
+    ;
+
+exprStmt returns [node]
+    : expr SEMI {$node = at(ExprStmt($expr.node), $start)}
+    ;
+
+breakStmt returns [node]
+    : BREAK SEMI {$node = at(BreakStmt(), $start)}
+    ;
+
+continueStmt returns [node]
+    : CONTINUE SEMI {$node = at(ContinueStmt(), $start)}
+    ;
+
+returnStmt returns [node]
+    : RETURN expr? SEMI {$node = at(ReturnStmt($expr.node if $expr.ctx else None), $start)}
+    ;
+
+// Control flow
+ifStmt returns [node]
+    : IF LPAREN expr RPAREN t=stmt (ELSE e=stmt)? {$node = at(IfStmt($expr.node, $t.node, $e.node if $e.ctx else None), $start)}
+    ;
+
+whileStmt returns [node]
+    : WHILE LPAREN expr RPAREN stmt {$node = at(WhileStmt($expr.node, $stmt.node), $start)}
+    ;
+
+forStmt returns [node]
+    : FOR LPAREN forInit? SEMI expr? SEMI forUpdate? RPAREN stmt
+      {$node = at(ForStmt($forInit.node if $forInit.ctx else None, $expr.node if $expr.ctx else None, $forUpdate.node if $forUpdate.ctx else None, $stmt.node), $start)}
+    ;
+
+forInit returns [node]
+    : varDeclFor {$node = $varDeclFor.node}
+    | assignOnly {$node = at(ExprStmt($assignOnly.node), $start)}
+    ;
+
+varDeclFor returns [node]
+    : AUTO ID (ASSIGN expr)? {$node = at(VarDecl(None, $ID.text, $expr.node if $expr.ctx else None), $start)}
+    | typeSpec ID (ASSIGN expr)? {$node = at(VarDecl($typeSpec.node, $ID.text, $expr.node if $expr.ctx else None), $start)}
+    ;
+
+forUpdate returns [node]
+    : prefixIncDec {$node = $prefixIncDec.node}
+    | lvalue
+      ( ASSIGN assignExpr {$node = at(AssignExpr($lvalue.node, $assignExpr.node), $start)}
+      | INC {$node = at(PostfixOp("++", $lvalue.node), $start)}
+      | DEC {$node = at(PostfixOp("--", $lvalue.node), $start)}
+      )
+    ;
+
+// `case 1: case 2: stmts` falls through: only the last label of a section
+// holds its statements.
+switchStmt returns [node]
+    : SWITCH LPAREN expr RPAREN LBRACE {$node = at(SwitchStmt($expr.node, []), $start)}
+      (s=switchSection {$node.cases.extend($s.nodes)})*
+      (defaultSection {$node.default_case = $defaultSection.node} (t=switchSection {$node.cases.extend($t.nodes)})*)?
+      RBRACE
+    ;
+
+switchSection returns [nodes]
+    : {$nodes = []} (caseLabel {$nodes.append($caseLabel.node)})+ (stmt {$nodes[-1].statements.append($stmt.node)})*
+    ;
+
+defaultSection returns [node]
+    : DEFAULT COLON {$node = at(DefaultStmt([]), $start)} (stmt {$node.statements.append($stmt.node)})*
+    ;
+
+caseLabel returns [node]
+    : CASE constExpr COLON {$node = at(CaseStmt($constExpr.node, []), $start)}
+    ;
+
+constExpr returns [node]
+    : constAddExpr {$node = $constAddExpr.node}
+    ;
+
+constAddExpr returns [node]
+    : l=constMulExpr {$node = $l.node}
+      (op=(PLUS | MINUS) r=constMulExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)})*
+    ;
+
+constMulExpr returns [node]
+    : l=constUnaryExpr {$node = $l.node}
+      (op=(MUL | DIV | MOD) r=constUnaryExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)})*
+    ;
+
+constUnaryExpr returns [node]
+    : op=(PLUS | MINUS) u=constUnaryExpr {$node = at(PrefixOp($op.text, $u.node), $start)}
+    | constPrimary {$node = $constPrimary.node}
+    ;
+
+constPrimary returns [node]
+    : INT_LITERAL {$node = at(IntLiteral(int($INT_LITERAL.text)), $start)}
+    | LPAREN constExpr RPAREN {$node = $constExpr.node}
+    ;
+
+expr returns [node, lv]
+    : assignExpr {$node = $assignExpr.node} {$lv = $assignExpr.lv}
+    ;
+
+assignExpr returns [node, lv]
+    : lhs=orExpr {$node = $lhs.node} {$lv = $lhs.lv}
+      ({if not $lhs.lv: raise InputMismatchException(self)} ASSIGN rhs=assignExpr {$node = at(AssignExpr($lhs.node, $rhs.node), $start)} {$lv = False})?   // right-associative
+    ;
+
+assignOnly returns [node]
+    : lvalue ASSIGN assignExpr {$node = at(AssignExpr($lvalue.node, $assignExpr.node), $start)}   // right-associative
+    ;
+
+orExpr returns [node, lv]
+    : l=andExpr {$node = $l.node} {$lv = $l.lv}
+      (op=OR r=andExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)} {$lv = False})*
+    ;
+
+andExpr returns [node, lv]
+    : l=eqExpr {$node = $l.node} {$lv = $l.lv}
+      (op=AND r=eqExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)} {$lv = False})*
+    ;
+
+eqExpr returns [node, lv]
+    : l=relExpr {$node = $l.node} {$lv = $l.lv}
+      (op=(EQ | NEQ) r=relExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)} {$lv = False})*
+    ;
+
+relExpr returns [node, lv]
+    : l=addExpr {$node = $l.node} {$lv = $l.lv}
+      (op=(LT | LE | GT | GE) r=addExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)} {$lv = False})*
+    ;
+
+addExpr returns [node, lv]
+    : l=mulExpr {$node = $l.node} {$lv = $l.lv}
+      (op=(PLUS | MINUS) r=mulExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)} {$lv = False})*
+    ;
+
+mulExpr returns [node, lv]
+    : l=unaryExpr {$node = $l.node} {$lv = $l.lv}
+      (op=(MUL | DIV | MOD) r=unaryExpr {$node = at(BinaryOp($node, $op.text, $r.node), $start)} {$lv = False})*
+    ;
+
+// prefix: ! + - ++ --
+unaryExpr returns [node, lv]
+    : prefixIncDec {$node = $prefixIncDec.node} {$lv = False}
+    | op=(NOT | PLUS | MINUS) u=unaryExpr {$node = at(PrefixOp($op.text, $u.node), $start)} {$lv = False}
+    | postfixExpr {$node = $postfixExpr.node} {$lv = $postfixExpr.lv}
+    ;
+
+prefixIncDec returns [node]
+    : op=(INC | DEC) lvalue {$node = at(PrefixOp($op.text, $lvalue.node), $start)}
+    ;
+
+// An operand followed by member accesses only is an lvalue if the primary
+// is a name or a call; `dotted` turns false at the first ++ or --.
+postfixExpr returns [node, lv]
+locals [dotted]
+    : postfixPrimary {$node = $postfixPrimary.node} {$lv = $postfixPrimary.bare} {$dotted = $postfixPrimary.dotted}
+      ( postfixOp
+        {$node = at(PostfixOp($postfixOp.op, $node) if $postfixOp.member is None else MemberAccess($node, $postfixOp.member), $start)} {$dotted = $dotted and $postfixOp.member is not None} {$lv = $dotted}
+      )*
+    ;
+
+postfixOp returns [member, op]
+    : DOT ID {$member = $ID.text}
+    | INC {$op = "++"}
+    | DEC {$op = "--"}
+    ;
+
+// `bare`: an lvalue on its own; `dotted`: an lvalue when followed by (DOT ID)+
+postfixPrimary returns [node, bare, dotted]
+    : postfixCall {$node = $postfixCall.node} {$bare = False} {$dotted = True}
+    | primaryExpr {$node = $primaryExpr.node} {$bare = $primaryExpr.lv} {$dotted = $primaryExpr.dotted}
+    ;
+
+postfixCall returns [node]
+    : ID LPAREN argList? RPAREN {$node = at(FuncCall($ID.text, $argList.nodes if $argList.ctx else []), $start)}
+    ;
+
+lvalue returns [node]
+    : name=ID {$node = at(Identifier($name.text), $start)}
+      (LPAREN argList? RPAREN DOT m=ID {$node = at(MemberAccess(at(FuncCall($name.text, $argList.nodes if $argList.ctx else []), $start), $m.text), $start)})?
+      (DOT n=ID {$node = at(MemberAccess($node, $n.text), $start)})*
+    | LPAREN inner=lvalue RPAREN {$node = $inner.node}
+    ;
+
+argList returns [nodes]
+    : a=expr {$nodes = [$a.node]} (COMMA b=expr {$nodes.append($b.node)})*
+    ;
+
+primaryExpr returns [node, lv, dotted]
+    : INT_LITERAL {$node = at(IntLiteral(int($INT_LITERAL.text)), $start)} {$lv = $dotted = False}
+    | FLOAT_LITERAL {$node = at(FloatLiteral(float($FLOAT_LITERAL.text)), $start)} {$lv = $dotted = False}
+    | STRING_LITERAL {$node = at(StringLiteral($STRING_LITERAL.text, getattr($STRING_LITERAL, "poolIndex", None)), $start)} {$lv = $dotted = False}
+    | structLiteral {$node = $structLiteral.node} {$lv = $dotted = False}
+    | ID {$node = at(Identifier($ID.text), $start)} {$lv = $dotted = True}
+    | LPAREN expr RPAREN {$node = $expr.node} {$lv = $expr.lv} {$dotted = False}
+    ;
+
+structLiteral returns [node]
+    : LBRACE {$node = at(StructLiteral([]), $start)}
+      (a=expr {$node.values.append($a.node)} (COMMA b=expr {$node.values.append($b.node)})*)? RBRACE
+    ;
@@ -0,0 +1,106 @@
+"""
+Base class of the generated parsers (the superClass of TyC.g4 and
+TyCASTParser.g4): the lvalue checks on tokens that both need. Copied to
+build/ with the generated modules.
+"""
+
+from antlr4.Parser import Parser
+from antlr4.error.Errors import NoViableAltException
+
+
+class TyCParserBase(Parser):
+    def __init_subclass__(cls, **kwargs):
+        # Token types for invalidAssign, from the token constants of the
+        # generated class: operands that are a single token, and operators
+        # that continue an operand (or, as `!`, `+`, `-`, start one).
+        super().__init_subclass__(**kwargs)
+        cls._PRIMARIES = (cls.ID, cls.INT_LITERAL, cls.FLOAT_LITERAL, cls.STRING_LITERAL)
+        cls._OPERATORS = (
+            cls.OR, cls.AND, cls.EQ, cls.NEQ, cls.LT, cls.LE, cls.GT, cls.GE,
+            cls.PLUS, cls.MINUS, cls.MUL, cls.DIV, cls.MOD, cls.NOT, cls.DOT,
+        )
+
+    def notifyErrorListeners(self, msg, offendingToken=None, e=None):
+        # checkLvalue runs after prediction, which sees `=` after any operand
+        # as valid: a decision that looks past such an `=` (block or struct
+        # literal at an opening brace) fails at a later token. Report it at
+        # the `=`, where prediction stopped before assignments were
+        # left-factored.
+        if isinstance(e, NoViableAltException) and e.startToken is not None and offendingToken is not None:
+            assign = self.invalidAssign(e.startToken.tokenIndex, offendingToken.tokenIndex)
+            if assign is not None:
+                offendingToken = assign
+        super().notifyErrorListeners(msg, offendingToken, e)
+
+    def invalidAssign(self, lo, hi):
+        # The first `=` among the tokens lo..hi-1 whose left operand is not an
+        # lvalue, or None. The operand starts after the last token that ends
+        # an expression at its nesting level (`;`, `,`, `:`, `=`, a keyword,
+        # an opening bracket), or at an operand token that follows a complete
+        # operand and so starts a new statement.
+        get = self._input.get
+        starts = []
+        start = None
+        complete = False
+        prev = None
+        for i in range(lo, hi):
+            t = get(i).type
+            if t in self._PRIMARIES:
+                if start is None or complete:
+                    start = i
+                complete = True
+            elif t == self.INC or t == self.DEC:
+                if not complete and start is None:
+                    start = i
+            elif t in self._OPERATORS:
+                if start is None:
+                    start = i
+                complete = False
+            elif t == self.LPAREN or t == self.LBRACE:
+                if start is None or (complete and not (t == self.LPAREN and prev == self.ID)):
+                    start = i
+                starts.append(start)
+                start = None
+                complete = False
+            elif t == self.RPAREN or t == self.RBRACE:
+                start = starts.pop() if starts else None
+                complete = True
+            elif t == self.ASSIGN:
+                if start is not None and not self.isLvalueTokens(start, i - 1):
+                    return get(i)
+                start = None
+                complete = False
+            else:
+                start = None
+                complete = False
+            prev = t
+        return None
+
+    def isLvalueTokens(self, lo, hi):
+        # Whether the tokens lo..hi of an orExpr are exactly an lvalue: ID
+        # (DOT ID)*, a call followed by (DOT ID)+, or a parenthesized lvalue.
+        # TyCParser.isLvalue on parses that build no tree (see
+        # src/parser/validate.py).
+        get = self._input.get
+        # Index of the RPAREN matching each LPAREN up to hi, in one pass.
+        closing = {}
+        opened = []
+        for j in range(lo, hi + 1):
+            t = get(j).type
+            if t == self.LPAREN:
+                opened.append(j)
+            elif t == self.RPAREN and opened:
+                closing[opened.pop()] = j
+        while get(lo).type == self.LPAREN and closing.get(lo) == hi:
+            lo, hi = lo + 1, hi - 1
+        if get(lo).type != self.ID:
+            return False
+        i = lo + 1
+        if i <= hi and get(i).type == self.LPAREN:
+            end = closing.get(i)
+            if end is None or end == hi:
+                return False
+            i = end + 1
+        while i < hi and get(i).type == self.DOT and get(i + 1).type == self.ID:
+            i += 2
+        return i > hi
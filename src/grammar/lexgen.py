@@ -0,0 +1,551 @@
+"""
+DFA lexer generator for TyC.
+
+Compiles the lexer rules of TyC.g4 (as serialized by ANTLR into the ATN of
+build/TyCLexer.py) into a table-driven Python lexer, build/TyCDFALexer.py.
+
+The generated TyCDFALexer subclasses TyCLexer, so it keeps the token type
+constants, the @lexer::members `emit` override that raises the lexererr
+exceptions and the rule actions. Only the matching engine is replaced: the
+generic ATN simulator is swapped for precomputed transition tables over
+character classes, with the same longest-match, rule-priority and
+non-greedy semantics as ANTLR's LexerATNSimulator.
+
+Usage (run after ANTLR has generated build/):
+    python -m src.grammar.lexgen [build_dir]
+"""
+
+import bisect
+import hashlib
+import os
+import sys
+
+MAX_CHAR = 0x10FFFF
+EOF = -1
+
+
+class LexerGenError(Exception):
+    def __init__(self, msg):
+        self.message = msg
+        super().__init__(msg)
+
+
+def load_lexer(build_dir: str):
+    """Import the ANTLR-generated TyCLexer class from `build_dir`."""
+    if build_dir not in sys.path:
+        sys.path.insert(0, build_dir)
+    from TyCLexer import TyCLexer
+
+    return TyCLexer
+
+
+# ============================================================================
+# Subset construction over the lexer ATN
+# ============================================================================
+
+
+class _DFABuilder:
+    """Precomputes every DFA state the LexerATNSimulator could reach.
+
+    A configuration is a tuple (state, alt, stack, non_greedy, actions) that
+    mirrors LexerATNConfig: `stack` holds follow states of fragment rule
+    calls, `non_greedy` is passedThroughNonGreedyDecision and `actions` the
+    lexer action indices collected on the way (the LexerActionExecutor).
+    """
+
+    def __init__(self, atn, mode: int = 0):
+        from antlr4.atn.ATNState import DecisionState, RuleStopState
+
+        self.atn = atn
+        self.mode = mode
+        self._decision_state = DecisionState
+        self._rule_stop_state = RuleStopState
+
+    # -- alphabet --------------------------------------------------------
+
+    def _char_transitions(self):
+        for state in self.atn.states:
+            if state is None:
+                continue
+            for t in state.transitions:
+                if not t.isEpsilon:
+                    yield t
+
+    def char_classes(self):
+        """Partition [0, MAX_CHAR] into classes no transition can tell apart.
+
+        Returns (bounds, interval_class, representatives): code point `c`
+        belongs to class interval_class[bisect_right(bounds, c) - 1].
+        """
+        cuts = {0, MAX_CHAR + 1}
+        for t in self._char_transitions():
+            if t.label is None:
+                continue
+            for r in t.label.intervals:
+                lo = max(r.start, 0)
+                hi = min(r.stop, MAX_CHAR + 1)
+                if lo < hi:
+                    cuts.add(lo)
+                    cuts.add(hi)
+        bounds = sorted(cuts)[:-1]
+        transitions = list(self._char_transitions())
+        signatures = {}
+        interval_class = []
+        representatives = []
+        for lo in bounds:
+            sig = tuple(i for i, t in enumerate(transitions) if t.matches(lo, 0, MAX_CHAR))
+            if sig not in signatures:
+                signatures[sig] = len(representatives)
+                representatives.append(lo)
+            interval_class.append(signatures[sig])
+        return bounds, interval_class, representatives
+
+    # -- closure (LexerATNSimulator.closure) -----------------------------
+
+    def _config(self, target, source, stack=None, actions=None):
+        non_greedy = source[3] or (
+            isinstance(target, self._decision_state) and target.nonGreedy
+        )
+        return (
+            target.stateNumber,
+            source[1],
+            source[2] if stack is None else stack,
+            non_greedy,
+            source[4] if actions is None else actions,
+        )
+
+    def _closure(self, cfg, out, seen, reached_accept, eof_as_epsilon):
+        state = self.atn.states[cfg[0]]
+        if isinstance(state, self._rule_stop_state):
+            stack = cfg[2]
+            if not stack:
+                if cfg not in seen:
+                    seen.add(cfg)
+                    out.append(cfg)
+                return True
+            follow = self.atn.states[stack[-1]]
+            return self._closure(
+                (follow.stateNumber, cfg[1], stack[:-1], cfg[3], cfg[4]),
+                out,
+                seen,
+                reached_accept,
+                eof_as_epsilon,
+            )
+
+        if not state.epsilonOnlyTransitions:
+            if not reached_accept or not cfg[3]:
+                if cfg not in seen:
+                    seen.add(cfg)
+                    out.append(cfg)
+
+        for t in state.transitions:
+            nxt = self._epsilon_target(cfg, t, eof_as_epsilon)
+            if nxt is not None:
+                reached_accept = self._closure(nxt, out, seen, reached_accept, eof_as_epsilon)
+        return reached_accept
+
+    def _epsilon_target(self, cfg, t, eof_as_epsilon):
+        from antlr4.atn.Transition import Transition
+
+        kind = t.serializationType
+        if kind == Transition.RULE:
+            return self._config(t.target, cfg, stack=cfg[2] + (t.followState.stateNumber,))
+        if kind == Transition.EPSILON:
+            return self._config(t.target, cfg)
+        if kind == Transition.ACTION:
+            if cfg[2]:
+                # Actions inside fragment rules are ignored, as in ANTLR.
+                return self._config(t.target, cfg)
+            return self._config(t.target, cfg, actions=cfg[4] + (t.actionIndex,))
+        if kind in (Transition.PREDICATE, Transition.PRECEDENCE):
+            raise LexerGenError("semantic predicates are not supported in lexer rules")
+        if eof_as_epsilon and kind in (Transition.ATOM, Transition.RANGE, Transition.SET):
+            if t.matches(EOF, 0, MAX_CHAR):
+                return self._config(t.target, cfg)
+        return None
+
+    # -- DFA states --------------------------------------------------------
+
+    def start_state(self):
+        start = self.atn.modeToStartState[self.mode]
+        out, seen = [], set()
+        for i, t in enumerate(start.transitions):
+            self._closure((t.target.stateNumber, i + 1, (), False, ()), out, seen, False, False)
+        return tuple(out)
+
+    def reach(self, configs, symbol):
+        """LexerATNSimulator.getReachableConfigSet for one input symbol."""
+        out, seen = [], set()
+        skip_alt = None
+        for cfg in configs:
+            reached_accept = cfg[1] == skip_alt
+            if reached_accept and cfg[3]:
+                continue
+            state = self.atn.states[cfg[0]]
+            for t in state.transitions:
+                if t.isEpsilon or not t.matches(symbol, 0, MAX_CHAR):
+                    continue
+                nxt = self._config(t.target, cfg)
+                if self._closure(nxt, out, seen, reached_accept, symbol == EOF):
+                    skip_alt = cfg[1]
+                    break
+        return tuple(out)
+
+    def accept_info(self, configs):
+        """Token type and actions of the first configuration at a rule stop."""
+        for cfg in configs:
+            state = self.atn.states[cfg[0]]
+            if isinstance(state, self._rule_stop_state):
+                return self.atn.ruleToTokenType[state.ruleIndex], cfg[4]
+        return 0, ()
+
+    def build(self):
+        bounds, interval_class, reps = self.char_classes()
+        start = self.start_state()
+        index = {start: 0}
+        states = [start]
+        edges = []
+        eof_edges = []
+        i = 0
+        while i < len(states):
+            configs = states[i]
+            row = []
+            for rep in reps + [EOF]:
+                target = self.reach(configs, rep)
+                if not target:
+                    row.append(-1)
+                    continue
+                if target not in index:
+                    index[target] = len(states)
+                    states.append(target)
+                row.append(index[target])
+            eof_edges.append(row.pop())
+            edges.append(row)
+            i += 1
+        accepts = [self.accept_info(s) for s in states]
+        return {
+            "bounds": bounds,
+            "interval_class": interval_class,
+            "num_classes": len(reps),
+            "edges": edges,
+            "eof_edges": eof_edges,
+            "accepts": accepts,
+        }
+
+
+# ============================================================================
+# Code generation
+# ============================================================================
+
+
+def _encode_actions(atn, action_indices):
+    from antlr4.atn.LexerAction import LexerActionType
+
+    encoded = []
+    for idx in action_indices:
+        action = atn.lexerActions[idx]
+        if action.actionType == LexerActionType.SKIP:
+            encoded.append((-1, -1))
+        elif action.actionType == LexerActionType.CUSTOM:
+            encoded.append((action.ruleIndex, action.actionIndex))
+        else:
+            raise LexerGenError(f"unsupported lexer action: {action.actionType.name}")
+    return tuple(encoded)
+
+
+def _wrap(values, indent="    ", width=96):
+    lines, line = [], indent
+    for v in values:
+        item = f"{v},"
+        if len(line) + len(item) + 1 > width:
+            lines.append(line.rstrip())
+            line = indent
+        line += item + " "
+    if line.strip():
+        lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def grammar_digest(grammar_path: str) -> str:
+    with open(grammar_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def render(tables, atn, digest: str) -> str:
+    if len(tables["edges"]) >= 2**15:
+        raise LexerGenError("lexer DFA too large")
+    if tables["num_classes"] > 255:
+        raise LexerGenError("too many character classes")
+    ascii_classes = [
+        tables["interval_class"][bisect.bisect_right(tables["bounds"], c) - 1]
+        for c in range(128)
+    ]
+    flat_edges = [s for row in tables["edges"] for s in row]
+    accept_types = [t for t, _ in tables["accepts"]]
+    accept_actions = [_encode_actions(atn, a) if t else () for t, a in tables["accepts"]]
+    self_loops = [
+        (state, bytes(c for c, target in enumerate(row) if target == state))
+        for state, row in enumerate(tables["edges"])
+    ]
+    return _TEMPLATE.format(
+        digest=digest,
+        num_classes=tables["num_classes"],
+        num_states=len(tables["edges"]),
+        ascii_classes=_wrap(ascii_classes),
+        bounds=_wrap(tables["bounds"]),
+        interval_class=_wrap(tables["interval_class"]),
+        edges=_wrap(flat_edges),
+        eof_edges=_wrap(tables["eof_edges"]),
+        accept_types=_wrap(accept_types),
+        accept_actions=_wrap(accept_actions),
+        self_loops=_wrap((state, loop) for state, loop in self_loops if loop),
+    )
+
+
+_TEMPLATE = '''\
+# Generated from TyC.g4 by src/grammar/lexgen.py. Do not edit.
+# grammar-sha256: {digest}
+import re
+import sys
+from bisect import bisect_right
+
+from antlr4.Token import Token
+from antlr4.error.Errors import IllegalStateException, LexerNoViableAltException
+
+if "." in __name__:
+    from .TyCLexer import TyCLexer
+else:
+    from TyCLexer import TyCLexer
+
+GRAMMAR_SHA256 = "{digest}"
+
+NUM_CLASSES = {num_classes}
+NUM_STATES = {num_states}
+
+# Character class of every ASCII code point.
+_ASCII_CLASSES = (
+{ascii_classes}
+)
+
+# Code point intervals [BOUNDS[i], BOUNDS[i+1]) and their character class.
+_BOUNDS = (
+{bounds}
+)
+
+_INTERVAL_CLASSES = (
+{interval_class}
+)
+
+# EDGES[state * NUM_CLASSES + class] -> next state, -1 when no rule matches.
+EDGES = (
+{edges}
+)
+
+# Next state when the input ends in a state, -1 when EOF is not matched.
+EOF_EDGES = (
+{eof_edges}
+)
+
+# Token type predicted by each state, 0 for non-accepting states.
+ACCEPT = (
+{accept_types}
+)
+
+# Lexer actions run on accept: (ruleIndex, actionIndex), ruleIndex -1 = skip.
+ACTIONS = (
+{accept_actions}
+)
+
+# Classes on which a state transitions to itself. The scanner skips such
+# runs (identifier tails, whitespace, comment and string bodies) with one
+# regex match over the class bytes instead of one table lookup per char.
+_SELF_LOOPS = (
+{self_loops}
+)
+
+LOOPS = [None] * NUM_STATES
+for _state, _classes in _SELF_LOOPS:
+    LOOPS[_state] = re.compile(b"[" + re.escape(_classes) + b"]+").match
+
+
+class _ClassMap(dict):
+    """str.translate table mapping code points to character classes."""
+
+    def __missing__(self, cp):
+        cls = _INTERVAL_CLASSES[bisect_right(_BOUNDS, cp) - 1]
+        self[cp] = cls
+        return cls
+
+
+CLASS_MAP = _ClassMap(enumerate(_ASCII_CLASSES))
+
+
+def classify(text: str) -> bytes:
+    """Map `text` to one character-class byte per code point."""
+    return text.translate(CLASS_MAP).encode("latin-1")
+
+
+class TyCDFALexer(TyCLexer):
+    """Table-driven drop-in replacement for TyCLexer."""
+
+    def __init__(self, input=None, output=sys.stdout):
+        super().__init__(input, output)
+        self._line = 1
+        self._column = 0
+        self._source = None
+        self._data = ""
+        self._classes = b""
+
+    def reset(self):
+        super().reset()
+        self._line = 1
+        self._column = 0
+        self._source = None
+
+    @property
+    def line(self):
+        return self._line
+
+    @line.setter
+    def line(self, line: int):
+        self._line = line
+
+    @property
+    def column(self):
+        return self._column
+
+    @column.setter
+    def column(self, column: int):
+        self._column = column
+
+    @property
+    def text(self):
+        if self._text is not None:
+            return self._text
+        return self._input.getText(self._tokenStartCharIndex, self._input.index - 1)
+
+    @text.setter
+    def text(self, txt: str):
+        self._text = txt
+
+    def _load(self):
+        input = self._input
+        data = getattr(input, "strdata", None)
+        if data is None:
+            data = input.getText(0, input.size - 1)
+        self._data = data
+        self._classes = classify(data)
+        self._source = input
+
+    def nextToken(self):
+        input = self._input
+        if input is None:
+            raise IllegalStateException("nextToken requires a non-null input stream.")
+        if self._source is not input:
+            self._load()
+        data = self._data
+        classes = self._classes
+        n = len(classes)
+        edges = EDGES
+        accept = ACCEPT
+        loops = LOOPS
+        while True:
+            if self._hitEOF:
+                self.emitEOF()
+                return self._token
+            self._token = None
+            self._channel = Token.DEFAULT_CHANNEL
+            start = input.index
+            self._tokenStartCharIndex = start
+            self._tokenStartLine = self._line
+            self._tokenStartColumn = self._column
+            self._text = None
+            self._type = Token.INVALID_TYPE
+
+            state = 0
+            pos = start
+            last = 0 if accept[0] else -1
+            stop = start
+            while pos < n:
+                state = edges[state * NUM_CLASSES + classes[pos]]
+                if state < 0:
+                    break
+                pos += 1
+                run = loops[state]
+                if run is not None:
+                    m = run(classes, pos)
+                    if m is not None:
+                        pos = m.end()
+                if accept[state]:
+                    last = state
+                    stop = pos
+            else:
+                state = EOF_EDGES[state]
+                if state >= 0 and accept[state]:
+                    last = state
+                    stop = pos
+
+            if last >= 0:
+                ttype = accept[last]
+                input.seek(stop)
+                self._advance(data, start, stop)
+                for rule_index, action_index in ACTIONS[last]:
+                    if rule_index < 0:
+                        self.skip()
+                    else:
+                        self.action(None, rule_index, action_index)
+            elif start >= n:
+                ttype = Token.EOF
+            else:
+                ttype = self.SKIP
+                input.seek(pos)
+                self._advance(data, start, pos)
+                self.notifyListeners(LexerNoViableAltException(self, input, start, None))
+                if pos < n:
+                    input.seek(pos + 1)
+                    self._advance(data, pos, pos + 1)
+
+            if input.index >= n:
+                self._hitEOF = True
+            if self._type == Token.INVALID_TYPE:
+                self._type = ttype
+            if self._type == self.SKIP:
+                continue
+            if self._token is None:
+                self.emit()
+            return self._token
+
+    def _advance(self, data: str, start: int, stop: int):
+        """Move line/column over data[start:stop], as LexerATNSimulator.consume does."""
+        newlines = data.count("\\n", start, stop)
+        if newlines:
+            self._line += newlines
+            self._column = stop - data.rindex("\\n", start, stop) - 1
+        else:
+            self._column += stop - start
+'''
+
+
+def generate(build_dir: str, grammar_path: str) -> str:
+    """Generate build_dir/TyCDFALexer.py and return its path."""
+    lexer = load_lexer(build_dir)
+    builder = _DFABuilder(lexer.atn)
+    tables = builder.build()
+    source = render(tables, lexer.atn, grammar_digest(grammar_path))
+    out_path = os.path.join(build_dir, "TyCDFALexer.py")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return out_path
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    build_dir = os.path.abspath(argv[0]) if argv else os.path.join(root, "build")
+    grammar_path = os.path.join(root, "src", "grammar", "TyC.g4")
+    out_path = generate(build_dir, grammar_path)
+    print(f"DFA lexer written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
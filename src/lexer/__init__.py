@@ -0,0 +1,3 @@
+"""
+Lexing infrastructure for TyC language
+"""
@@ -0,0 +1,87 @@
+"""
+Memory-mapped character stream for TyC source files.
+
+antlr4's InputStream/FileStream decode the whole source into a str and then
+build a Python list with one int per code point (8 bytes per character for
+the list alone, before any lexing). MappedCharStream maps the file instead:
+for pure-ASCII sources every byte is one code point, so LA() indexes the
+mmap directly and token text is decoded slice by slice. Sources containing
+non-ASCII bytes fall back to the usual UTF-8 decoding.
+"""
+
+import mmap
+
+from antlr4.InputStream import InputStream
+
+# Bytes checked per isascii() call while scanning the mapped file.
+_ASCII_CHUNK = 1 << 20
+
+
+class MappedCharStream(InputStream):
+    """CharStream over a memory-mapped file, usable wherever InputStream is.
+
+    `ascii` tells which path was taken. On the ASCII path `data` is the mmap
+    itself (indexing it yields byte values) and `strdata` is None; otherwise
+    both are filled exactly as InputStream does. Call `close()` (or use the
+    stream as a context manager) to release the mapping.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        self.name = path
+        self.path = path
+        self._index = 0
+        self._file = open(path, "rb")
+        size = self._file.seek(0, 2)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.ascii = self._map is None or _is_ascii(self._map)
+        if self.ascii:
+            self.strdata = None
+            self.data = self._map if self._map is not None else b""
+            self._size = size
+        else:
+            self.strdata = self._map[:].decode(encoding)
+            self._loadString()
+            self._release()
+
+    @property
+    def bytesdata(self):
+        """The mapped bytes on the ASCII path, else None."""
+        return self.data if self.ascii else None
+
+    def getText(self, start: int, stop: int):
+        if not self.ascii:
+            return super().getText(start, stop)
+        if start >= self._size:
+            return ""
+        return self.data[start : stop + 1].decode("ascii")
+
+    def close(self):
+        if self.ascii:
+            self.data = b""
+            self._size = 0
+            self._index = 0
+        self._release()
+
+    def _release(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+
+def _is_ascii(buf) -> bool:
+    for start in range(0, len(buf), _ASCII_CHUNK):
+        if not buf[start : start + _ASCII_CHUNK].isascii():
+            return False
+    return True
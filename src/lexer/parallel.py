@@ -0,0 +1,198 @@
+"""
+Parallel lexing of large TyC sources.
+
+The source is cut into chunks at "safe" newlines: newlines that are not
+inside a block comment. Strings and line comments never span a newline in
+TyC (an unclosed string ends at it), so at such a newline the lexer is always
+between tokens and a fresh lexer started there produces exactly the tokens
+the sequential lexer would. A cheap regex prepass finds the multi-line block
+comments; it mirrors the STRING_LITERAL / ILLEGAL_ESCAPE / UNCLOSE_STRING
+rules so that a quote or comment opener inside a string is not mistaken
+for code.
+
+Chunks are lexed in a process pool into compact array columns, then stitched
+back together: offsets are shifted by the chunk start and lines by the number
+of newlines before it (chunks start at column 0, so columns are unchanged).
+ParallelLexer replays the stitched tokens through the TokenSource interface,
+and raises the first lexical error at its global position, after the same
+tokens TyCLexer would have produced before it.
+"""
+
+import os
+import re
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from antlr4.InputStream import InputStream
+from antlr4.Lexer import TokenSource
+from antlr4.Token import CommonToken, Token
+
+from src.grammar.stringpool import StringPool
+
+# Tokens that can hide a "/*": block and line comments and the string rules.
+# A quote that none of the string rules accepts is an ERROR_CHAR on its own.
+_SCANNER = re.compile(
+    r"""
+      /\*.*?\*/
+    | //[^\n]*
+    | "(?:\\[bfrnt"\\]|[^"\\\r\n])*(?:"|\\[^bfrnt"\\\r\n]|\r?\n|\Z)
+    | "
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Smallest chunk worth shipping to another process.
+MIN_CHUNK = 256 * 1024
+
+
+def multiline_comments(text: str):
+    """(starts, ends) of the block comments in `text` that contain a newline."""
+    starts = array("q")
+    ends = array("q")
+    for m in _SCANNER.finditer(text):
+        start, end = m.span()
+        if text.startswith("/*", start) and text.find("\n", start, end) >= 0:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def split_points(text: str, parts: int, min_chunk: int = MIN_CHUNK):
+    """Offsets just after safe newlines that cut `text` into about `parts` chunks.
+
+    Always starts with 0; chunks are at least `min_chunk` characters long
+    except possibly the last.
+    """
+    size = len(text)
+    step = max(min_chunk, size // max(parts, 1) + 1)
+    if step >= size:
+        return [0]
+    starts, ends = multiline_comments(text)
+    points = [0]
+    target = step
+    while target < size:
+        pos = text.find("\n", target)
+        while pos >= 0:
+            i = bisect_right(starts, pos) - 1
+            if i < 0 or ends[i] <= pos:
+                break
+            pos = text.find("\n", ends[i])
+        if pos < 0 or pos + 1 >= size:
+            break
+        points.append(pos + 1)
+        target = pos + 1 + step
+    return points
+
+
+def lex_chunk(lexer_class, text: str):
+    """Lex `text` into array columns; runs in a worker process.
+
+    Returns (columns, texts, error): columns are type, channel, start, stop,
+    line and column arrays (ending with EOF unless lexing failed), texts maps
+    token index to text set by a lexer action, and error is the LexerError
+    raised, if any.
+    """
+    lexer = lexer_class(InputStream(text))
+    columns = tuple(array("i") for _ in range(6))
+    types, channels, starts, stops, lines, cols = columns
+    texts = {}
+    error = None
+    try:
+        while True:
+            t = lexer.nextToken()
+            if t._text is not None:
+                texts[len(types)] = t._text
+            types.append(t.type)
+            channels.append(t.channel)
+            starts.append(t.start)
+            stops.append(t.stop)
+            lines.append(t.line)
+            cols.append(t.column)
+            if t.type == Token.EOF:
+                break
+    except Exception as err:
+        error = err
+    return columns, texts, error
+
+
+class ParallelLexer(TokenSource):
+    """TokenSource that lexes `input` in chunks on a process pool.
+
+    `lexer_class` is the chunk lexer (TyCLexer or TyCDFALexer). With
+    `workers=1`, or when the input is smaller than two chunks, everything is
+    lexed in-process. Tokens are CommonTokens identical (type, text,
+    channel, start, stop, line, column) to those of `lexer_class` over the
+    whole input; STRING_LITERAL tokens get a poolIndex into `stringPool`,
+    as the chunk lexer would give them.
+    """
+
+    def __init__(self, input: InputStream, lexer_class, workers: int = None, min_chunk: int = MIN_CHUNK):
+        self.inputStream = input
+        self.lexer_class = lexer_class
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self._chunks = None
+        self._chunk = 0
+        self._pos = 0
+        self._source = (self, input)
+        self.stringPool = StringPool()
+        # Read by CommonToken's constructor; every token then gets its own.
+        self.line = 1
+        self.column = 0
+
+    def getInputStream(self):
+        return self.inputStream
+
+    def lex(self):
+        """Lex every chunk; returns [(base offset, base line, columns, texts, error)]."""
+        input = self.inputStream
+        text = input.getText(0, input.size - 1)
+        points = split_points(text, self.workers, self.min_chunk)
+        pieces = [text[a:b] for a, b in zip(points, points[1:] + [len(text)])]
+        if len(pieces) == 1 or self.workers == 1:
+            results = [lex_chunk(self.lexer_class, piece) for piece in pieces]
+        else:
+            with ProcessPoolExecutor(min(self.workers, len(pieces))) as pool:
+                results = list(pool.map(lex_chunk, repeat(self.lexer_class), pieces))
+        chunks = []
+        line = 0
+        prev = 0
+        for base, (columns, texts, error) in zip(points, results):
+            line += text.count("\n", prev, base)
+            prev = base
+            if error is not None and getattr(error, "offset", None) is not None:
+                error.at(error.offset + base, error.line + line, error.column, error.token)
+            chunks.append((base, line, columns, texts, error))
+            if error is not None:
+                break
+        return chunks
+
+    def nextToken(self):
+        if self._chunks is None:
+            self._chunks = self.lex()
+        while True:
+            base, line, columns, texts, error = self._chunks[self._chunk]
+            types, channels, starts, stops, lines, cols = columns
+            i = self._pos
+            last = self._chunk == len(self._chunks) - 1
+            if i < len(types) and (last or types[i] != Token.EOF):
+                self._pos = i + 1
+                t = CommonToken(self._source, types[i], channels[i], starts[i] + base, stops[i] + base)
+                t.line = lines[i] + line
+                t.column = cols[i]
+                text = texts.get(i)
+                if text is not None:
+                    t.text = text
+                    if t.type == self.lexer_class.STRING_LITERAL:
+                        t.poolIndex = self.stringPool.intern(text)
+                return t
+            if error is not None:
+                raise error
+            if last:
+                # EOF already returned; keep returning it like a Lexer does.
+                self._pos = len(types) - 1
+                continue
+            self._chunk += 1
+            self._pos = 0
@@ -0,0 +1,247 @@
+"""
+Character-class prepass over a TyC source.
+
+One pass over the whole buffer finds, ahead of lexing:
+  * skipped regions: maximal runs of WS, LINE_COMMENT and BLOCK_COMMENT
+    tokens (adjacent ones merged),
+  * closed, well-formed string literals,
+  * the line-start offset table.
+
+PrepassMixin lets a lexer use the result: whenever it stands at the start of
+a skipped region it jumps to the region's end in one seek, and at the start
+of a string literal it emits the STRING_LITERAL token directly, instead of
+running the lexer ATN over every character.
+
+Each region is a property of its start offset only (a WS run, a comment or a
+string starting there), so a lexer that reaches that offset between tokens
+always produces exactly the region the prepass found. Anything else — an
+unterminated block comment, an unclosed string, an illegal escape, a stray
+quote — is left to the lexer rules, so they produce the usual tokens and
+errors.
+
+With NumPy installed the character classes, WS runs and line starts are
+computed with vectorized array operations; without it the same result comes
+from a regex pass. NumPy is optional.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # optional: the regex pass gives the same result
+    np = None
+
+from antlr4.Token import Token
+
+# The STRING_LITERAL / ILLEGAL_ESCAPE / UNCLOSE_STRING rules from one quote.
+# Group 1 is the closing quote, set only for a well-formed literal. A quote
+# that none of the rules accepts is an ERROR_CHAR on its own.
+_STRING = r'"(?:\\[bfrnt"\\]|[^"\\\r\n])*(?:(")|\\[^bfrnt"\\\r\n]|\r?\n|\Z)|"'
+_STRING_MATCH = re.compile(_STRING).match
+
+_SCANNER = re.compile(
+    r"(?P<skip>[ \t\f\r\n]+|//[^\n]*|/\*.*?\*/)|" + _STRING,
+    re.DOTALL,
+)
+
+# Character classes for the vectorized pass (code points >= 128 are OTHER).
+_OTHER, _WS, _SLASH, _STAR, _QUOTE = range(5)
+
+
+def _class_table():
+    table = bytearray(129)
+    for ch in " \t\f\r\n":
+        table[ord(ch)] = _WS
+    table[ord("/")] = _SLASH
+    table[ord("*")] = _STAR
+    table[ord('"')] = _QUOTE
+    return table
+
+
+class Prepass:
+    """Skipped regions, string literals and line starts of `text`.
+
+    Spans are half-open [start, end) character offsets in parallel
+    array('q') columns sorted by start. `use_numpy` forces one
+    implementation; by default NumPy is used when it is installed.
+    """
+
+    def __init__(self, text: str, use_numpy: bool = None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        self.size = len(text)
+        if use_numpy:
+            self._scan_numpy(text)
+        else:
+            self._scan_regex(text)
+
+    def line_column(self, offset: int):
+        """1-based line and 0-based column of character offset `offset`."""
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1]
+
+    # -- regex pass -------------------------------------------------------
+
+    def _scan_regex(self, text):
+        skip_starts, skip_ends = array("q"), array("q")
+        string_starts, string_ends = array("q"), array("q")
+        for m in _SCANNER.finditer(text):
+            start, end = m.span()
+            if m.lastgroup == "skip":
+                if skip_ends and skip_ends[-1] == start:
+                    skip_ends[-1] = end
+                else:
+                    skip_starts.append(start)
+                    skip_ends.append(end)
+            elif m.group(2) is not None:
+                string_starts.append(start)
+                string_ends.append(end)
+        line_starts = array("q", [0])
+        pos = text.find("\n")
+        while pos >= 0:
+            line_starts.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+        self.skip_starts, self.skip_ends = skip_starts, skip_ends
+        self.string_starts, self.string_ends = string_starts, string_ends
+        self.line_starts = line_starts
+
+    # -- vectorized pass --------------------------------------------------
+
+    def _scan_numpy(self, text):
+        n = len(text)
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        classes = np.frombuffer(_class_table(), dtype=np.uint8)[np.minimum(codes, 128)]
+        self.line_starts = _to_array(
+            np.concatenate(([0], np.flatnonzero(codes == ord("\n")) + 1))
+        )
+
+        # Quotes and comment openers are the only places where the lexer's
+        # state can change; walk just those in order.
+        opener = np.zeros(n, dtype=bool)
+        if n > 1:
+            opener[:-1] = (classes[:-1] == _SLASH) & (
+                (classes[1:] == _SLASH) | (classes[1:] == _STAR)
+            )
+        events = np.flatnonzero(opener | (classes == _QUOTE)).tolist()
+        comment_starts, comment_ends = [], []
+        opaque_starts, opaque_ends = [], []
+        string_starts, string_ends = array("q"), array("q")
+        pos = 0
+        for e in events:
+            if e < pos:
+                continue
+            if text[e] == '"':
+                m = _STRING_MATCH(text, e)
+                pos = m.end()
+                opaque_starts.append(e)
+                opaque_ends.append(pos)
+                if m.group(1) is not None:
+                    string_starts.append(e)
+                    string_ends.append(pos)
+            elif text[e + 1] == "/":
+                end = text.find("\n", e)
+                pos = n if end < 0 else end
+                comment_starts.append(e)
+                comment_ends.append(pos)
+            else:
+                end = text.find("*/", e + 2)
+                if end < 0:
+                    # Unterminated: DIV and MUL tokens, as the lexer sees it.
+                    pos = e + 1
+                    continue
+                pos = end + 2
+                comment_starts.append(e)
+                comment_ends.append(pos)
+        self.string_starts, self.string_ends = string_starts, string_ends
+
+        # WS runs outside strings and comments.
+        depth = np.zeros(n + 1, dtype=np.int32)
+        depth[opaque_starts + comment_starts] += 1
+        depth[opaque_ends + comment_ends] -= 1
+        ws = (classes == _WS) & (np.cumsum(depth[:-1]) == 0)
+        edges = np.diff(ws.astype(np.int8), prepend=0, append=0)
+        ws_starts = np.flatnonzero(edges == 1)
+        ws_ends = np.flatnonzero(edges == -1)
+
+        # Merge WS runs and comments that touch into single regions.
+        starts = np.concatenate((ws_starts, np.array(comment_starts, dtype=np.int64)))
+        ends = np.concatenate((ws_ends, np.array(comment_ends, dtype=np.int64)))
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+        if len(starts):
+            first = np.concatenate(([True], starts[1:] != ends[:-1]))
+            last = np.concatenate((first[1:], [True]))
+            starts, ends = starts[first], ends[last]
+        self.skip_starts, self.skip_ends = _to_array(starts), _to_array(ends)
+
+
+def _to_array(values):
+    result = array("q")
+    result.frombytes(np.asarray(values, dtype=np.int64).tobytes())
+    return result
+
+
+class PrepassMixin:
+    """Lexer mixin that jumps over prepass regions in bulk.
+
+    Mix in before a TyC lexer class, e.g.
+    `class TyCPrepassLexer(PrepassMixin, TyCLexer)`. The prepass runs on the
+    first nextToken() for each input stream; `prepass_numpy` is passed to
+    Prepass as `use_numpy`.
+    """
+
+    prepass_numpy = None
+    _prepass = None
+    _prepass_input = None
+
+    def reset(self):
+        super().reset()
+        self._prepass_input = None
+
+    def nextToken(self):
+        input = self._input
+        if self._prepass_input is not input:
+            prepass = Prepass(input.getText(0, input.size - 1), self.prepass_numpy)
+            self._prepass = prepass
+            self._prepass_input = input
+            self._skips = dict(zip(prepass.skip_starts, prepass.skip_ends))
+            self._strings = dict(zip(prepass.string_starts, prepass.string_ends))
+        if self._hitEOF:
+            return super().nextToken()
+        p = input.index
+        end = self._skips.get(p)
+        if end is not None:
+            p = end
+            input.seek(p)
+            self.line, self.column = self._prepass.line_column(p)
+            if p >= self._prepass.size:
+                self._hitEOF = True
+                return super().nextToken()
+        end = self._strings.get(p)
+        if end is not None:
+            return self._emit_string(p, end)
+        return super().nextToken()
+
+    def _emit_string(self, start: int, end: int):
+        """Emit the STRING_LITERAL token for the literal at [start, end)."""
+        input = self._input
+        line, column = self.line, self.column
+        token = self._factory.create(
+            self._tokenFactorySourcePair,
+            self.STRING_LITERAL,
+            input.getText(start + 1, end - 2),
+            Token.DEFAULT_CHANNEL,
+            start,
+            end - 1,
+            line,
+            column,
+        )
+        token.poolIndex = self.internString(token.text)
+        input.seek(end)
+        self.column = column + end - start
+        if end >= self._prepass.size:
+            self._hitEOF = True
+        self.emitToken(token)
+        return token
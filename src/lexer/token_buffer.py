@@ -0,0 +1,324 @@
+"""
+Compact, array-backed token buffer for TyC.
+
+TokenBuffer is a drop-in TokenStream for TyCParser that stores each token as
+three machine integers (type, start offset, stop offset) in parallel
+array('i') columns instead of one CommonToken object per token. Token text
+is sliced from the character stream on demand, and line/column are computed
+from a line-start offset index that is only built when first asked for.
+
+Token objects are materialized lazily as BufferToken views (buffer + index)
+when the parser asks for them through LT()/get().
+"""
+
+import sys
+from array import array
+from bisect import bisect_right
+
+from antlr4.BufferedTokenStream import TokenStream
+from antlr4.Token import Token
+from antlr4.error.Errors import IllegalStateException
+
+
+class BufferToken:
+    """Lightweight view of one token in a TokenBuffer.
+
+    Exposes the attributes of antlr4's CommonToken (type, text, start, stop,
+    line, column, tokenIndex, channel, source) computed from the buffer, and
+    the poolIndex of STRING_LITERAL tokens.
+    """
+
+    __slots__ = ("_buffer", "tokenIndex")
+
+    def __init__(self, buffer: "TokenBuffer", index: int):
+        self._buffer = buffer
+        self.tokenIndex = index
+
+    @property
+    def type(self):
+        return self._buffer.types[self.tokenIndex]
+
+    @property
+    def start(self):
+        return self._buffer.starts[self.tokenIndex]
+
+    @property
+    def stop(self):
+        return self._buffer.stops[self.tokenIndex]
+
+    @property
+    def channel(self):
+        return Token.DEFAULT_CHANNEL
+
+    @property
+    def text(self):
+        return self._buffer.token_text(self.tokenIndex)
+
+    @text.setter
+    def text(self, text: str):
+        self._buffer.overrides[self.tokenIndex] = text
+
+    @property
+    def poolIndex(self):
+        """String pool index of a STRING_LITERAL token."""
+        try:
+            return self._buffer.pool_indexes[self.tokenIndex]
+        except KeyError:
+            raise AttributeError("poolIndex") from None
+
+    @property
+    def line(self):
+        return self._buffer.line_column(self.start)[0]
+
+    @property
+    def column(self):
+        return self._buffer.line_column(self.start)[1]
+
+    @property
+    def source(self):
+        return (self._buffer.tokenSource, self._buffer.chars)
+
+    def getTokenSource(self):
+        return self._buffer.tokenSource
+
+    def getInputStream(self):
+        return self._buffer.chars
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, BufferToken)
+            and other._buffer is self._buffer
+            and other.tokenIndex == self.tokenIndex
+        )
+
+    def __hash__(self):
+        return hash((id(self._buffer), self.tokenIndex))
+
+    def __str__(self):
+        txt = self.text
+        if txt is not None:
+            txt = txt.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        else:
+            txt = "<no text>"
+        return (
+            f"[@{self.tokenIndex},{self.start}:{self.stop}='{txt}',"
+            f"<{self.type}>,{self.line}:{self.column}]"
+        )
+
+
+class TokenBuffer(TokenStream):
+    """TokenStream over parallel array('i') columns, filled lazily from a lexer.
+
+    Only default-channel tokens are buffered (TyC sends everything else to
+    `skip`), so token indices match CommonTokenStream's for TyC sources.
+    Tokens are fetched on demand, exactly as BufferedTokenStream does, so
+    lexer errors surface at the same point of the parse.
+    """
+
+    def __init__(self, tokenSource):
+        self.tokenSource = None
+        self.setTokenSource(tokenSource)
+
+    def setTokenSource(self, tokenSource):
+        self.tokenSource = tokenSource
+        self.chars = tokenSource.inputStream if tokenSource is not None else None
+        self.types = array("i")
+        self.starts = array("i")
+        self.stops = array("i")
+        # Token text that differs from the source slice (e.g. STRING_LITERAL
+        # without its quotes), by token index.
+        self.overrides = {}
+        # String pool index of each STRING_LITERAL token, by token index.
+        self.pool_indexes = {}
+        self.fetchedEOF = False
+        self._p = 0
+        self._line_starts = None
+        self._current = None
+
+    # -- filling -----------------------------------------------------------
+
+    def fetch(self, n: int) -> int:
+        """Pull up to `n` more on-channel tokens from the lexer."""
+        if self.fetchedEOF:
+            return 0
+        source = self.tokenSource
+        types, starts, stops, overrides = self.types, self.starts, self.stops, self.overrides
+        fetched = 0
+        while fetched < n:
+            t = source.nextToken()
+            if t.channel != Token.DEFAULT_CHANNEL:
+                continue
+            text = getattr(t, "_text", None)
+            if text is not None:
+                overrides[len(types)] = text
+                pool_index = getattr(t, "poolIndex", None)
+                if pool_index is not None:
+                    self.pool_indexes[len(types)] = pool_index
+            types.append(t.type)
+            starts.append(t.start)
+            stops.append(t.stop)
+            fetched += 1
+            if t.type == Token.EOF:
+                self.fetchedEOF = True
+                break
+        return fetched
+
+    def sync(self, i: int) -> bool:
+        n = i - len(self.types) + 1
+        if n > 0:
+            return self.fetch(n) >= n
+        return True
+
+    def fill(self):
+        while not self.fetchedEOF:
+            self.fetch(1000)
+
+    # -- TokenStream interface --------------------------------------------
+
+    @property
+    def index(self):
+        return self._p
+
+    @property
+    def size(self):
+        return len(self.types)
+
+    def mark(self):
+        return 0
+
+    def release(self, marker: int):
+        pass
+
+    def reset(self):
+        self.seek(0)
+
+    def seek(self, index: int):
+        self.sync(index)
+        self._p = index
+
+    def consume(self):
+        p = self._p
+        n = len(self.types)
+        skip_eof_check = p < n - 1 if self.fetchedEOF else p < n
+        if not skip_eof_check and self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        if self.sync(p + 1):
+            self._p = p + 1
+
+    def LA(self, i: int) -> int:
+        if i == 0:
+            return 0
+        if i < 0:
+            j = self._p + i
+            return self.types[j] if j >= 0 else Token.INVALID_TYPE
+        j = self._p + i - 1
+        types = self.types
+        if j >= len(types):
+            self.sync(j)
+            if j >= len(types):
+                return types[-1]
+        return types[j]
+
+    def LT(self, k: int):
+        if k == 0:
+            return None
+        if k < 0:
+            j = self._p + k
+            return self.get(j) if j >= 0 else None
+        j = self._p + k - 1
+        if j >= len(self.types):
+            self.sync(j)
+            if j >= len(self.types):
+                j = len(self.types) - 1
+        current = self._current
+        if current is not None and current.tokenIndex == j:
+            return current
+        token = BufferToken(self, j)
+        self._current = token
+        return token
+
+    def get(self, index: int):
+        if index >= len(self.types):
+            raise IndexError("token index out of range")
+        return BufferToken(self, index)
+
+    def getTokens(self, start: int, stop: int, types: set = None):
+        if start < 0 or stop < 0:
+            return None
+        stop = min(stop, len(self.types) - 1)
+        subset = []
+        for i in range(start, stop):
+            ttype = self.types[i]
+            if ttype == Token.EOF:
+                break
+            if types is None or ttype in types:
+                subset.append(BufferToken(self, i))
+        return subset
+
+    def getText(self, start=None, stop=None):
+        self.fill()
+        n = len(self.types)
+        if start is None:
+            start = 0
+        elif not isinstance(start, int):
+            start = start.tokenIndex
+        if stop is None:
+            stop = n - 1
+        elif not isinstance(stop, int):
+            stop = stop.tokenIndex
+        stop = min(stop, n - 1)
+        if start < 0 or stop < 0 or stop < start:
+            return ""
+        parts = []
+        for i in range(start, stop + 1):
+            if self.types[i] == Token.EOF:
+                break
+            parts.append(self.token_text(i))
+        return "".join(parts)
+
+    def getSourceName(self):
+        return self.tokenSource.sourceName
+
+    # -- lazily computed token attributes ---------------------------------
+
+    def token_text(self, i: int) -> str:
+        text = self.overrides.get(i)
+        if text is not None:
+            return text
+        start = self.starts[i]
+        stop = self.stops[i]
+        if start < self.chars.size and stop < self.chars.size:
+            return self.chars.getText(start, stop)
+        return "<EOF>"
+
+    def line_column(self, offset: int):
+        """1-based line and 0-based column of character offset `offset`."""
+        line_starts = self._line_starts
+        if line_starts is None:
+            line_starts = self._line_starts = self._build_line_index()
+        line = bisect_right(line_starts, offset)
+        return line, offset - line_starts[line - 1]
+
+    def _build_line_index(self):
+        # A memory-mapped ASCII stream is searched in place, without decoding.
+        text = getattr(self.chars, "bytesdata", None)
+        newline = b"\n"
+        if text is None:
+            text = self.chars.getText(0, self.chars.size - 1)
+            newline = "\n"
+        line_starts = array("i", [0])
+        pos = text.find(newline)
+        while pos >= 0:
+            line_starts.append(pos + 1)
+            pos = text.find(newline, pos + 1)
+        return line_starts
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the buffer (columns, overrides, line index)."""
+        size = sum(len(c) * c.itemsize for c in (self.types, self.starts, self.stops))
+        size += sys.getsizeof(self.overrides)
+        size += sum(sys.getsizeof(t) for t in self.overrides.values())
+        size += sys.getsizeof(self.pool_indexes)
+        if self._line_starts is not None:
+            size += len(self._line_starts) * self._line_starts.itemsize
+        return size
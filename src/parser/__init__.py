@@ -0,0 +1,3 @@
+"""
+Parsing infrastructure for TyC language
+"""
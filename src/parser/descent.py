@@ -0,0 +1,649 @@
+"""
+Hand-written recursive-descent parser that builds the AST directly.
+
+The ANTLR route builds a parse tree, with a context object per rule level
+(about ten per operand for the expression chain alone), and the
+ASTGeneration visitor then turns it into nodes and throws it away.
+DescentParser reads the tokens of the same lexer and builds the nodes of
+src/utils/nodes.py as it goes: statements by recursive descent, binary
+operators by precedence climbing on explicit stacks. The result is the AST
+ASTGeneration builds from TyCParser's tree, with the same node positions.
+
+Expressions are parsed without recursion, and else-if chains in a loop, so
+deeply nested expressions and long else-if chains do not run into Python's
+recursion limit (see `expr`).
+
+It recognizes exactly the language of TyC.g4, but does not try to mirror
+where ANTLR's adaptive prediction reports an error. On the first lexical
+or syntax error it resets the lexer and parses again with TyCParser and
+NewErrorListener, which raises exactly the error a plain TyCParser parse
+raises (the same fallback IncrementalParser uses). Should TyCParser accept
+the input after all, its tree is converted by ASTGeneration and
+`fallback` tells that this happened.
+
+Decisions TyCParser makes with unbounded lookahead are made by bounded
+lookahead or by parsing ahead speculatively:
+
+- `stmt` at `{`: a block, or an expression statement starting with a
+  struct literal. The literal is tried first; it almost always fails
+  within a few tokens. If it parses, the block wins only if the block and
+  the statements after it end on the same `;` and no `else` follows that
+  only the literal's enclosing if could take (ANTLR then reports an
+  ambiguity and takes the first alternative, the block).
+- `lhs = rhs`: the left operand is parsed as an expression and must be an
+  lvalue, as checked by the grammar's checkLvalue action.
+"""
+
+from antlr4 import CommonTokenStream, Token
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration, at
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import *
+
+EOF = Token.EOF
+ID = TyCLexer.ID
+LPAREN = TyCLexer.LPAREN
+RPAREN = TyCLexer.RPAREN
+LBRACE = TyCLexer.LBRACE
+RBRACE = TyCLexer.RBRACE
+SEMI = TyCLexer.SEMI
+COMMA = TyCLexer.COMMA
+COLON = TyCLexer.COLON
+DOT = TyCLexer.DOT
+ASSIGN = TyCLexer.ASSIGN
+INC = TyCLexer.INC
+DEC = TyCLexer.DEC
+AUTO = TyCLexer.AUTO
+VOID = TyCLexer.VOID
+INT = TyCLexer.INT
+FLOAT = TyCLexer.FLOAT
+STRING = TyCLexer.STRING
+INT_LITERAL = TyCLexer.INT_LITERAL
+FLOAT_LITERAL = TyCLexer.FLOAT_LITERAL
+STRING_LITERAL = TyCLexer.STRING_LITERAL
+
+# Binary operators by precedence; all are left-associative.
+PRECEDENCE = {
+    TyCLexer.OR: 1,
+    TyCLexer.AND: 2,
+    TyCLexer.EQ: 3,
+    TyCLexer.NEQ: 3,
+    TyCLexer.LT: 4,
+    TyCLexer.LE: 4,
+    TyCLexer.GT: 4,
+    TyCLexer.GE: 4,
+    TyCLexer.PLUS: 5,
+    TyCLexer.MINUS: 5,
+    TyCLexer.MUL: 6,
+    TyCLexer.DIV: 6,
+    TyCLexer.MOD: 6,
+}
+CONST_PRECEDENCE = {
+    TyCLexer.PLUS: 1,
+    TyCLexer.MINUS: 1,
+    TyCLexer.MUL: 2,
+    TyCLexer.DIV: 2,
+    TyCLexer.MOD: 2,
+}
+PREFIX = (TyCLexer.NOT, TyCLexer.PLUS, TyCLexer.MINUS)
+TYPES = (INT, FLOAT, STRING)
+TYPE_NODES = {INT: IntType, FLOAT: FloatType, STRING: StringType}
+
+
+# States and frame kinds of the expression parser (see DescentParser.expr).
+_OPERAND = "operand"
+_OPERAND_DONE = "operand done"
+_EXPR_DONE = "expression done"
+_PAREN = "paren"
+_CALL = "call"
+_LITERAL = "literal"
+_ASSIGN = "assign"
+
+
+class _Mismatch(Exception):
+    """The input is not in the language; TyCParser reports the error."""
+
+
+class DescentParser:
+    """Parse a TyC program from `lexer` straight into a Program node.
+
+    `parse()` returns the Program or raises the error TyCParser with
+    NewErrorListener would raise. `fallback` is True when the result or
+    error came from TyCParser.
+    """
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.fallback = None
+        self.tokens = None
+        self.types = None
+        self.pos = 0
+        # Whether the operand just parsed is an lvalue (see checkLvalue).
+        self.is_lvalue = False
+        self.speculating = False
+
+    def parse(self) -> Program:
+        try:
+            self._lex()
+            program = self.program()
+        except Exception:
+            self.fallback = True
+            return self._parse_with_antlr()
+        self.fallback = False
+        return program
+
+    def _lex(self):
+        tokens = []
+        next_token = self.lexer.nextToken
+        while True:
+            token = next_token()
+            tokens.append(token)
+            if token.type == EOF:
+                break
+        self.tokens = tokens
+        self.types = [t.type for t in tokens]
+        self.pos = 0
+
+    def _parse_with_antlr(self):
+        self.lexer.reset()
+        parser = TyCParser(CommonTokenStream(self.lexer))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        return ASTGeneration().visit(parser.program())
+
+    # ------------------------------------------------------------------
+    # Token helpers
+    # ------------------------------------------------------------------
+
+    def expect(self, ttype):
+        if self.types[self.pos] != ttype:
+            raise _Mismatch()
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def accept(self, ttype):
+        if self.types[self.pos] == ttype:
+            self.pos += 1
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Program and declarations
+    # ------------------------------------------------------------------
+
+    def program(self):
+        start = self.tokens[0]
+        decls = []
+        types = self.types
+        while types[self.pos] != EOF:
+            if types[self.pos] == TyCLexer.STRUCT:
+                decls.append(self.struct_decl())
+            else:
+                decls.append(self.func_decl())
+        return at(Program(decls), start)
+
+    def struct_decl(self):
+        start = self.expect(TyCLexer.STRUCT)
+        name = self.expect(ID).text
+        self.expect(LBRACE)
+        members = []
+        while self.types[self.pos] != RBRACE:
+            member_start = self.tokens[self.pos]
+            member_type = self.type_spec()
+            members.append(at(MemberDecl(member_type, self.expect(ID).text), member_start))
+            self.expect(SEMI)
+        self.pos += 1
+        self.expect(SEMI)
+        return at(StructDecl(name, members), start)
+
+    def func_decl(self):
+        start = self.tokens[self.pos]
+        t = self.types[self.pos]
+        if t == VOID:
+            self.pos += 1
+            return_type = at(VoidType(), start)
+        elif t in TYPES or (t == ID and self.types[self.pos + 1] == ID):
+            return_type = self.type_spec()
+        else:
+            return_type = None
+        name = self.expect(ID).text
+        self.expect(LPAREN)
+        params = []
+        if self.types[self.pos] != RPAREN:
+            while True:
+                param_start = self.tokens[self.pos]
+                param_type = self.type_spec()
+                params.append(at(Param(param_type, self.expect(ID).text), param_start))
+                if not self.accept(COMMA):
+                    break
+        self.expect(RPAREN)
+        return at(FuncDecl(return_type, name, params, self.block()), start)
+
+    def type_spec(self):
+        token = self.tokens[self.pos]
+        t = token.type
+        if t in TYPES:
+            node = TYPE_NODES[t]()
+        elif t == ID:
+            node = StructType(token.text)
+        else:
+            raise _Mismatch()
+        self.pos += 1
+        return at(node, token)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def block(self):
+        start = self.expect(LBRACE)
+        stmts = []
+        types = self.types
+        while types[self.pos] != RBRACE:
+            stmts.append(self.stmt())
+        self.pos += 1
+        return at(BlockStmt(stmts), start)
+
+    def stmt(self, in_then=False):
+        """One statement; `in_then` if an `else` after it would belong to an
+        enclosing if (it ends the then-branch of an if)."""
+        start = self.tokens[self.pos]
+        t = start.type
+        if t == ID:
+            if self.types[self.pos + 1] == ID:
+                return self.var_decl(SEMI)
+        elif t == TyCLexer.IF:
+            # An else-if chain is parsed in a loop and nested from the end.
+            branches = []
+            other = None
+            while True:
+                self.pos += 1
+                self.expect(LPAREN)
+                cond = self.expr()
+                self.expect(RPAREN)
+                branches.append((start, cond, self.stmt(True)))
+                if not self.accept(TyCLexer.ELSE):
+                    break
+                start = self.tokens[self.pos]
+                if start.type != TyCLexer.IF:
+                    other = self.stmt(in_then)
+                    break
+            for start, cond, then in reversed(branches):
+                other = at(IfStmt(cond, then, other), start)
+            return other
+        elif t == TyCLexer.WHILE:
+            self.pos += 1
+            self.expect(LPAREN)
+            cond = self.expr()
+            self.expect(RPAREN)
+            return at(WhileStmt(cond, self.stmt(in_then)), start)
+        elif t == TyCLexer.FOR:
+            return self.for_stmt(in_then)
+        elif t == TyCLexer.SWITCH:
+            return self.switch_stmt()
+        elif t == TyCLexer.BREAK:
+            self.pos += 1
+            self.expect(SEMI)
+            return at(BreakStmt(), start)
+        elif t == TyCLexer.CONTINUE:
+            self.pos += 1
+            self.expect(SEMI)
+            return at(ContinueStmt(), start)
+        elif t == TyCLexer.RETURN:
+            self.pos += 1
+            value = None if self.types[self.pos] == SEMI else self.expr()
+            self.expect(SEMI)
+            return at(ReturnStmt(value), start)
+        elif t == AUTO or t in TYPES:
+            return self.var_decl(SEMI)
+        elif t == LBRACE and self._brace_starts_block(in_then):
+            return self.block()
+        node = at(ExprStmt(self.expr()), start)
+        self.expect(SEMI)
+        return node
+
+    def _brace_starts_block(self, in_then):
+        """Decide a `{` at statement start; see the module docstring."""
+        save = self.pos
+        speculating = self.speculating
+        self.speculating = True
+        try:
+            try:
+                self.expr()
+                self.expect(SEMI)
+            except _Mismatch:
+                return True
+            end = self.pos
+            self.pos = save
+            try:
+                self.block()
+                while self.pos < end:
+                    self.stmt()
+            except _Mismatch:
+                return False
+            # An `else` after the `;` continues only the literal's if.
+            return self.pos == end and not (in_then and self.types[end] == TyCLexer.ELSE)
+        finally:
+            self.pos = save
+            self.speculating = speculating
+
+    def var_decl(self, terminator):
+        """`(AUTO | typeSpec) ID (= expr)?`, followed by `terminator` if given."""
+        start = self.tokens[self.pos]
+        if start.type == AUTO:
+            self.pos += 1
+            var_type = None
+        else:
+            var_type = self.type_spec()
+        name = self.expect(ID).text
+        init = self.expr() if self.accept(ASSIGN) else None
+        if terminator is not None:
+            self.expect(terminator)
+        return at(VarDecl(var_type, name, init), start)
+
+    def for_stmt(self, in_then):
+        start = self.tokens[self.pos]
+        self.pos += 1
+        self.expect(LPAREN)
+        types = self.types
+        t = types[self.pos]
+        if t == SEMI:
+            init = None
+        elif t == AUTO or t in TYPES or (t == ID and types[self.pos + 1] == ID):
+            init = self.var_decl(None)
+        else:
+            init_start = self.tokens[self.pos]
+            lhs = self.lvalue()
+            self.expect(ASSIGN)
+            assign = at(AssignExpr(lhs, self.expr()), init_start)
+            init = at(ExprStmt(assign), init_start)
+        self.expect(SEMI)
+        cond = None if types[self.pos] == SEMI else self.expr()
+        self.expect(SEMI)
+        if types[self.pos] == RPAREN:
+            update = None
+        else:
+            update_start = self.tokens[self.pos]
+            t = update_start.type
+            if t == INC or t == DEC:
+                update = self.prefix_inc_dec()
+            else:
+                lhs = self.lvalue()
+                t = types[self.pos]
+                if t == ASSIGN:
+                    self.pos += 1
+                    update = at(AssignExpr(lhs, self.expr()), update_start)
+                elif t == INC or t == DEC:
+                    self.pos += 1
+                    update = at(PostfixOp(self.tokens[self.pos - 1].text, lhs), update_start)
+                else:
+                    raise _Mismatch()
+        self.expect(RPAREN)
+        return at(ForStmt(init, cond, update, self.stmt(in_then)), start)
+
+    def switch_stmt(self):
+        start = self.tokens[self.pos]
+        self.pos += 1
+        self.expect(LPAREN)
+        subject = self.expr()
+        self.expect(RPAREN)
+        self.expect(LBRACE)
+        types = self.types
+        cases = []
+        default = None
+        while True:
+            t = types[self.pos]
+            if t == TyCLexer.CASE:
+                labels = []
+                while types[self.pos] == TyCLexer.CASE:
+                    label = self.tokens[self.pos]
+                    self.pos += 1
+                    labels.append((label, self.const_expr(1)))
+                    self.expect(COLON)
+                stmts = self.section_stmts()
+                for i, (label, value) in enumerate(labels):
+                    cases.append(at(CaseStmt(value, stmts if i == len(labels) - 1 else []), label))
+            elif t == TyCLexer.DEFAULT and default is None:
+                label = self.tokens[self.pos]
+                self.pos += 1
+                self.expect(COLON)
+                default = at(DefaultStmt(self.section_stmts()), label)
+            else:
+                break
+        self.expect(RBRACE)
+        return at(SwitchStmt(subject, cases, default), start)
+
+    def section_stmts(self):
+        stmts = []
+        types = self.types
+        while types[self.pos] not in (TyCLexer.CASE, TyCLexer.DEFAULT, RBRACE):
+            stmts.append(self.stmt())
+        return stmts
+
+    def const_expr(self, min_prec):
+        start = self.tokens[self.pos]
+        left = self.const_unary()
+        types = self.types
+        while True:
+            prec = CONST_PRECEDENCE.get(types[self.pos])
+            if prec is None or prec < min_prec:
+                return left
+            op = self.tokens[self.pos].text
+            self.pos += 1
+            left = at(BinaryOp(left, op, self.const_expr(prec + 1)), start)
+
+    def const_unary(self):
+        token = self.tokens[self.pos]
+        t = token.type
+        if t == TyCLexer.PLUS or t == TyCLexer.MINUS:
+            self.pos += 1
+            return at(PrefixOp(token.text, self.const_unary()), token)
+        if t == INT_LITERAL:
+            self.pos += 1
+            return at(IntLiteral(int(token.text)), token)
+        self.expect(LPAREN)
+        node = self.const_expr(1)
+        self.expect(RPAREN)
+        return node
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def expr(self):
+        """assignExpr, without recursion.
+
+        The operands and pending operators of an expression are kept on two
+        stacks (precedence climbing unrolled), and an expression nested in
+        parentheses, call arguments, a struct literal or the right side of
+        an assignment is parsed after pushing a frame with the state of the
+        enclosing one, which is resumed when it ends.
+        """
+        tokens = self.tokens
+        types = self.types
+        frames = []
+        start = tokens[self.pos]
+        operands = []
+        operators = []
+        state = _OPERAND
+        while True:
+            if state is _OPERAND:
+                # Prefix operators, then a primary (or a prefix ++/--).
+                first = tokens[self.pos]
+                prefixes = []
+                t = first.type
+                while t in PREFIX:
+                    prefixes.append(tokens[self.pos])
+                    self.pos += 1
+                    t = types[self.pos]
+                primary = tokens[self.pos]
+                if t == INC or t == DEC:
+                    node = self.prefix_inc_dec()
+                    state = _OPERAND_DONE
+                elif t == ID and types[self.pos + 1] == LPAREN:
+                    self.pos += 2
+                    if types[self.pos] == RPAREN:
+                        self.pos += 1
+                        node = self._postfix(at(FuncCall(primary.text, []), primary), primary, False, True)
+                        state = _OPERAND_DONE
+                    else:
+                        frames.append((_CALL, start, operands, operators, first, prefixes, primary, []))
+                elif t == LBRACE:
+                    self.pos += 1
+                    if types[self.pos] == RBRACE:
+                        self.pos += 1
+                        node = self._postfix(at(StructLiteral([]), primary), primary, False, False)
+                        state = _OPERAND_DONE
+                    else:
+                        frames.append((_LITERAL, start, operands, operators, first, prefixes, primary, []))
+                elif t == LPAREN:
+                    self.pos += 1
+                    frames.append((_PAREN, start, operands, operators, first, prefixes, primary, None))
+                else:
+                    node = self._primary(primary)
+                    state = _OPERAND_DONE
+                if state is _OPERAND:
+                    # A frame was pushed: parse the nested expression.
+                    start = tokens[self.pos]
+                    operands = []
+                    operators = []
+                    continue
+
+            if state is _OPERAND_DONE:
+                for token in reversed(prefixes):
+                    node = at(PrefixOp(token.text, node), token)
+                    self.is_lvalue = False
+                operands.append((node, first))
+                t = types[self.pos]
+                prec = PRECEDENCE.get(t)
+                while operators and (prec is None or operators[-1][0] >= prec):
+                    right = operands.pop()[0]
+                    left, left_first = operands[-1]
+                    operands[-1] = (at(BinaryOp(left, operators.pop()[1], right), left_first), left_first)
+                    self.is_lvalue = False
+                if prec is not None:
+                    operators.append((prec, tokens[self.pos].text))
+                    self.pos += 1
+                    state = _OPERAND
+                    continue
+                node = operands[0][0]
+                if t == ASSIGN:
+                    if not self.is_lvalue and not self.speculating:
+                        raise _Mismatch()
+                    self.pos += 1
+                    frames.append((_ASSIGN, start, None, None, None, None, node, None))
+                    start = tokens[self.pos]
+                    operands = []
+                    operators = []
+                    state = _OPERAND
+                    continue
+                state = _EXPR_DONE
+
+            # The expression `node` ended: resume the enclosing one.
+            if not frames:
+                return node
+            kind, start, operands, operators, first, prefixes, primary, values = frames.pop()
+            if kind is _ASSIGN:
+                node = at(AssignExpr(primary, node), start)
+                self.is_lvalue = False
+                continue
+            if kind is _PAREN:
+                self.expect(RPAREN)
+                node = self._postfix(node, primary, self.is_lvalue, False)
+                state = _OPERAND_DONE
+                continue
+            values.append(node)
+            if self.accept(COMMA):
+                frames.append((kind, start, operands, operators, first, prefixes, primary, values))
+                start = tokens[self.pos]
+                operands = []
+                operators = []
+                state = _OPERAND
+            elif kind is _CALL:
+                self.expect(RPAREN)
+                node = self._postfix(at(FuncCall(primary.text, values), primary), primary, False, True)
+                state = _OPERAND_DONE
+            else:
+                self.expect(RBRACE)
+                node = self._postfix(at(StructLiteral(values), primary), primary, False, False)
+                state = _OPERAND_DONE
+
+    def prefix_inc_dec(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        node = at(PrefixOp(token.text, self.lvalue()), token)
+        self.is_lvalue = False
+        return node
+
+    def _primary(self, start):
+        """An identifier or literal at `start`, with its postfix operators."""
+        t = start.type
+        self.pos += 1
+        if t == ID:
+            return self._postfix(at(Identifier(start.text), start), start, True, True)
+        if t == INT_LITERAL:
+            node = at(IntLiteral(int(start.text)), start)
+        elif t == FLOAT_LITERAL:
+            node = at(FloatLiteral(float(start.text)), start)
+        elif t == STRING_LITERAL:
+            node = at(StringLiteral(start.text, getattr(start, "poolIndex", None)), start)
+        else:
+            raise _Mismatch()
+        return self._postfix(node, start, False, False)
+
+    def _postfix(self, node, start, bare, dotted):
+        """Member accesses and postfix ++/-- after the primary `node`.
+
+        `bare` tells whether the primary is an lvalue with no operators
+        after it, `dotted` whether it is one with only member accesses
+        after it; `is_lvalue` is set accordingly.
+        """
+        tokens = self.tokens
+        types = self.types
+        t = types[self.pos]
+        if t != DOT and t != INC and t != DEC:
+            self.is_lvalue = bare
+            return node
+        while True:
+            if t == DOT:
+                node = at(MemberAccess(node, tokens[self.pos + 1].text), start)
+                self.pos += 1
+                self.expect(ID)
+            elif t == INC or t == DEC:
+                node = at(PostfixOp(tokens[self.pos].text, node), start)
+                self.pos += 1
+                dotted = False
+            else:
+                self.is_lvalue = dotted
+                return node
+            t = types[self.pos]
+
+    def args(self):
+        """`argList? )` after the `(` of a call."""
+        if self.accept(RPAREN):
+            return []
+        values = [self.expr()]
+        while self.accept(COMMA):
+            values.append(self.expr())
+        self.expect(RPAREN)
+        return values
+
+    def lvalue(self):
+        """lvalue: ID (LPAREN argList? RPAREN DOT ID)? (DOT ID)* | ( lvalue )"""
+        if self.accept(LPAREN):
+            node = self.lvalue()
+            self.expect(RPAREN)
+            return node
+        start = self.expect(ID)
+        if self.accept(LPAREN):
+            node = at(FuncCall(start.text, self.args()), start)
+            self.expect(DOT)
+            node = at(MemberAccess(node, self.expect(ID).text), start)
+        else:
+            node = at(Identifier(start.text), start)
+        while self.accept(DOT):
+            node = at(MemberAccess(node, self.expect(ID).text), start)
+        return node
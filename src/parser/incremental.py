@@ -0,0 +1,278 @@
+"""
+Incremental relexing and reparsing of a TyC buffer.
+
+IncrementalParser keeps the tokens and parse tree of one source text and
+updates them for an edit (offset, removed length, inserted text):
+
+1. Relex. The TyC lexer has no modes, so at any token boundary it starts
+   from the same state. Relexing starts at the first token of the top-level
+   declaration that holds the last token before the edit (the token right
+   before that is a `}` or `;` of the previous declaration, which never
+   looks ahead), and stops as soon as a new token starts where a shifted old
+   token started past the edit: from there on, the old tokens are reused
+   with their offsets, lines and columns shifted.
+2. Reparse. Only the declarations between the restart point and the next
+   old declaration start after the converged token are parsed again, as
+   `decl*`; the other DeclContext subtrees are reused and a new
+   ProgramContext is assembled.
+
+Anything unusual falls back to a full parse, which also gives the exact
+first error message: a failed previous parse, a lexical or syntax error in
+the reparsed region, or a `/` `*` token pair (an unterminated block comment,
+whose meaning depends on text arbitrarily far away).
+
+Reused tokens are mutated in place, so an IncrementalParser owns its
+tokens and tree; edits are applied to it and it always describes the
+current text.
+
+String literals are interned into `string_pool` as the lexer meets them.
+When an edit adds, removes or changes a string literal, the pool is rebuilt
+from the current tokens, so literals edited away do not pile up over a
+session and every poolIndex is the one a full parse assigns. The rebuilt
+pool is a new object and the reused tokens are re-indexed in place, like
+their positions: an earlier pool stays valid for the ASTs built before the
+edit (StringLiteral nodes copy the index), not for the tokens, which always
+index the current `string_pool`.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.Token import CommonToken, Token
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.grammar.stringpool import StringPool
+from src.utils.error_listener import NewErrorListener
+
+# What the last parse or edit did: whether it was a full parse, how many
+# tokens were (re)lexed and how many declarations were (re)parsed.
+EditStats = namedtuple("EditStats", "full relexed reparsed")
+
+STRING_LITERAL = TyCLexer.STRING_LITERAL
+
+# Characters relexed past the edit before looking for convergence again
+# with a larger window.
+WINDOW = 4096
+
+# A converged token must start this far before the end of the relex window,
+# so that no token before it was cut short by the window (TyC tokens other
+# than unterminated block comments look at most a few characters ahead).
+WINDOW_MARGIN = 16
+
+
+def _start(token):
+    return token.start
+
+
+def _stop(token):
+    return token.stop
+
+
+def _decl_start(decl):
+    return decl.start.tokenIndex
+
+
+class IncrementalParser:
+    """Parse result of `text` (`result` is "success" or the error message)
+    that can be updated with `edit()`."""
+
+    def __init__(self, text: str, lexer_class=TyCLexer):
+        self.lexer_class = lexer_class
+        self.text = text
+        self.tokens = None
+        self.tree = None
+        self.stats = None
+        # Shared by every lexer run, so reused and relexed string tokens
+        # index the same pool (rebuilt by _rebuild_string_pool).
+        self.string_pool = StringPool()
+        self.result = self._parse_all()
+
+    @property
+    def decls(self):
+        return self.tree.decl() if self.tree is not None else []
+
+    def _new_parser(self, stream):
+        parser = TyCParser(stream)
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        return parser
+
+    def _new_lexer(self, text):
+        lexer = self.lexer_class(InputStream(text))
+        lexer.stringPool = self.string_pool
+        return lexer
+
+    def _parse_all(self) -> str:
+        self.string_pool = StringPool()
+        stream = CommonTokenStream(self._new_lexer(self.text))
+        parser = self._new_parser(stream)
+        try:
+            tree = parser.program()
+        except Exception as e:
+            self.tokens = None
+            self.tree = None
+            self.stats = EditStats(True, len(stream.tokens), 0)
+            return str(e)
+        self.tokens = stream.tokens
+        self.tree = tree
+        self.stats = EditStats(True, len(self.tokens), len(tree.decl()))
+        if _has_open_comment(self.tokens):
+            self.tree = None
+        return "success"
+
+    def edit(self, offset: int, removed: int, inserted: str) -> str:
+        """Replace `removed` characters at `offset` with `inserted`.
+
+        Returns the new result, "success" or the first error message, exactly
+        as a full Parser run over the new text would.
+        """
+        old_text = self.text
+        new_text = old_text[:offset] + inserted + old_text[offset + removed :]
+        self.text = new_text
+        if self.tree is None:
+            self.result = self._parse_all()
+            return self.result
+        result = self._edit(old_text, new_text, offset, offset + removed, offset + len(inserted))
+        if result is None:
+            result = self._parse_all()
+        self.result = result
+        return result
+
+    def _edit(self, old_text, new_text, offset, old_end, new_end):
+        tokens = self.tokens
+        decls = self.decls
+        delta = new_end - old_end
+
+        # Restart at the first token of the declaration holding the last
+        # token that ends before the edit.
+        before = bisect_right(tokens, offset - 1, 0, len(tokens) - 1, key=_stop) - 1
+        if before < 0:
+            first_decl = 0
+            restart = 0
+        else:
+            first_decl = bisect_right(decls, before, key=_decl_start) - 1
+            restart = decls[first_decl].start.tokenIndex
+        if restart == 0:
+            restart_offset, line, column = 0, 1, 0
+        else:
+            token = tokens[restart]
+            restart_offset, line, column = token.start, token.line, token.column
+
+        relexed = self._relex(new_text, restart_offset, line, column, new_end, delta)
+        if relexed is None:
+            return None
+        relexed, converged = relexed
+        if _has_open_comment(relexed + tokens[converged : converged + 1]):
+            return None
+
+        # Reparse up to the first old declaration at or after the converged token.
+        next_decl = bisect_left(decls, converged, key=_decl_start)
+        region_end = decls[next_decl].start.tokenIndex if next_decl < len(decls) else len(tokens) - 1
+
+        line_delta = new_text.count("\n", offset, new_end) - old_text.count("\n", offset, old_end)
+        old_end_line = old_text.count("\n", 0, old_end) + 1
+        column_delta = (new_end - new_text.rfind("\n", 0, new_end)) - (old_end - old_text.rfind("\n", 0, old_end))
+        for token in tokens[converged:]:
+            if token._text is None:
+                token._text = token.text
+            if token.line == old_end_line:
+                token.column += column_delta
+            token.start += delta
+            token.stop += delta
+            token.line += line_delta
+
+        region = relexed + tokens[converged:region_end]
+        eof = CommonToken(type=Token.EOF)
+        eof.start = tokens[region_end].start
+        eof.stop = eof.start - 1
+        eof.line = tokens[region_end].line
+        eof.column = tokens[region_end].column
+        parser = self._new_parser(CommonTokenStream(ListTokenSource(region + [eof])))
+        try:
+            region_decls = parser.program().decl()
+        except Exception:
+            return None
+
+        new_tokens = tokens[:restart] + region + tokens[region_end:]
+        for index in range(restart, len(new_tokens)):
+            new_tokens[index].tokenIndex = index
+        new_decls = decls[:first_decl] + region_decls + decls[next_decl:]
+        self.tokens = new_tokens
+        if _string_texts(tokens[restart:converged]) != _string_texts(relexed):
+            self._rebuild_string_pool()
+        self.tree = _program(parser, new_decls, self.tree.children[-1], new_tokens)
+        self.stats = EditStats(False, len(relexed), len(region_decls))
+        return "success"
+
+    def _rebuild_string_pool(self):
+        """Intern the string literals of the current tokens, in order, into
+        a new pool, as a full parse would."""
+        pool = StringPool()
+        intern = pool.intern
+        for token in self.tokens:
+            if token.type == STRING_LITERAL:
+                token.poolIndex = intern(token.text)
+        self.string_pool = pool
+
+    def _relex(self, new_text, restart, line, column, new_end, delta):
+        """Lex from `restart` until a token lines up with an old one past the edit.
+
+        Returns (relexed tokens, index of the old token where lexing
+        converged), or None on a lexical error.
+        """
+        tokens = self.tokens
+        window = WINDOW
+        while True:
+            stop = min(len(new_text), new_end + window)
+            lexer = self._new_lexer(new_text[restart:stop])
+            lexer.line = line
+            lexer.column = column
+            relexed = []
+            try:
+                while True:
+                    token = lexer.nextToken()
+                    token.start += restart
+                    token.stop += restart
+                    if token.type == Token.EOF:
+                        if stop == len(new_text):
+                            return relexed, len(tokens) - 1
+                        break
+                    if token.start >= new_end and (stop == len(new_text) or token.start < stop - WINDOW_MARGIN):
+                        old = bisect_left(tokens, token.start - delta, key=_start)
+                        if old < len(tokens) and tokens[old].start == token.start - delta:
+                            return relexed, old
+                    if token._text is None:
+                        token._text = new_text[token.start : token.stop + 1]
+                    relexed.append(token)
+            except Exception:
+                return None
+            window *= 4
+
+
+def _string_texts(tokens) -> list:
+    return [t.text for t in tokens if t.type == STRING_LITERAL]
+
+
+def _has_open_comment(tokens) -> bool:
+    """True if a DIV is directly followed by a MUL: an unterminated `/*`."""
+    for a, b in zip(tokens, tokens[1:]):
+        if a.type == TyCParser.DIV and b.type == TyCParser.MUL and b.start == a.stop + 1:
+            return True
+    return False
+
+
+def _program(parser, decls, eof_node, tokens):
+    """Assemble a ProgramContext over `decls` as TyCParser.program() would."""
+    tree = TyCParser.ProgramContext(parser)
+    for decl in decls:
+        decl.parentCtx = tree
+        tree.addChild(decl)
+    eof_node.parentCtx = tree
+    tree.addChild(eof_node)
+    tree.start = tokens[0]
+    # The rule stops at the token before EOF (None for an empty program).
+    tree.stop = tokens[-2] if len(tokens) > 1 else None
+    return tree
@@ -0,0 +1,217 @@
+"""
+Lazy parsing of function bodies.
+
+Tooling queries such as signature lookup, struct layout or an outline view
+only need the struct members and function headers of a program. The lazy
+parse lexes the whole source, finds each function body by brace matching
+on the tokens (a `{` right after a `)` at brace depth 0 opens one), and
+parses a skeleton of the program in which every body is just its `{` and
+`}`. Each FuncDecl of the result holds a LazyBlockStmt with the tokens of
+its body instead of the parsed body; the first access to `FuncDecl.body`
+parses those tokens with TyCParser's `block` rule and ASTGeneration and
+keeps the BlockStmt.
+
+Braces pair up in every valid TyC program, so a forced body is the body
+a full parse builds, with the same positions and string pool indices (the
+lexer interned every literal in source order). Errors are split between
+the two steps:
+
+- Parsing raises the first syntax or lexical error outside function
+  bodies, as a full parse would find it among those tokens. Bodies whose
+  braces do not match stay in the skeleton and are parsed at once.
+- Forcing a body raises the first error inside it; a lexical error is
+  raised when the parser reaches its token, as the lexer raises it then.
+  The error is raised again on every access until the body parses.
+"""
+
+from antlr4 import CommonTokenStream
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.Token import CommonToken, Token
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import BlockStmt, FuncDecl
+
+# Error tokens the lexer emits in recovering mode.
+LEXER_ERROR_TOKENS = frozenset((TyCParser.ERROR_CHAR, TyCParser.UNCLOSE_STRING, TyCParser.ILLEGAL_ESCAPE))
+
+
+class _Replay(ListTokenSource):
+    """Token source over already lexed `tokens` (ending with EOF) that raises
+    the lexical error of an error token when it is read, as the lexer does."""
+
+    def __init__(self, tokens, errors):
+        super().__init__(tokens)
+        self.errors = errors
+
+    def nextToken(self):
+        token = super().nextToken()
+        if token.type in LEXER_ERROR_TOKENS:
+            raise self.errors[token.start]
+        return token
+
+
+def _parser(tokens, errors):
+    parser = TyCParser(CommonTokenStream(_Replay(tokens, errors)))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def _eof(follow):
+    """An EOF token at the position of the token `follow`."""
+    eof = CommonToken(type=Token.EOF)
+    eof.start = follow.start
+    eof.stop = follow.start - 1
+    eof.line = follow.line
+    eof.column = follow.column
+    return eof
+
+
+class LazyBlockStmt(BlockStmt):
+    """Function body not parsed yet: its tokens from `{` to `}` and the
+    lexical errors of the source by offset. `parse()` builds the BlockStmt."""
+
+    __slots__ = ("tokens", "follow", "errors")
+
+    def __init__(self, tokens, follow, errors):
+        # `statements` is left unset: the body is only read once parsed.
+        self.line = tokens[0].line
+        self.column = tokens[0].column
+        self.tokens = tokens
+        self.follow = follow
+        self.errors = errors
+
+    def parse(self) -> BlockStmt:
+        """The parsed body; raises the first error in it."""
+        parser = _parser(self.tokens + [_eof(self.follow)], self.errors)
+        tree = parser.block()
+        token = parser.getCurrentToken()
+        if token.type != Token.EOF:
+            raise NewErrorListener.error(token, token.line, token.column)
+        return ASTGeneration().visit(tree)
+
+    def accept(self, visitor, o=None):
+        return self.parse().accept(visitor, o)
+
+    def __str__(self):
+        return str(self.parse())
+
+
+class LazyFuncDecl(FuncDecl):
+    """FuncDecl whose body is parsed on the first access to `body`."""
+
+    __slots__ = ("_body",)
+
+    @property
+    def body(self):
+        body = self._body
+        if type(body) is LazyBlockStmt:
+            body = self._body = body.parse()
+        return body
+
+    @body.setter
+    def body(self, body):
+        self._body = body
+
+    @property
+    def body_parsed(self) -> bool:
+        """Whether the body was parsed (accessing `body` parses it)."""
+        return type(self._body) is not LazyBlockStmt
+
+
+class _SkeletonGeneration(ASTGeneration):
+    """ASTGeneration of a skeleton tree: function bodies from `bodies` (in
+    source order, one per function) instead of the empty blocks."""
+
+    def __init__(self, bodies):
+        super().__init__()
+        self.bodies = iter(bodies)
+
+    def visitFuncDecl(self, ctx: TyCParser.FuncDeclContext):
+        func = super().visitFuncDecl(ctx)
+        lazy = LazyFuncDecl(func.return_type, func.name, func.params, next(self.bodies))
+        lazy.line, lazy.column = func.line, func.column
+        return lazy
+
+
+def _lex(lexer):
+    """All tokens of `lexer` up to EOF, and its lexical errors by offset."""
+    recover_errors = lexer.recoverErrors
+    lexer.recoverErrors = True
+    try:
+        tokens = []
+        next_token = lexer.nextToken
+        while True:
+            token = next_token()
+            tokens.append(token)
+            if token.type == Token.EOF:
+                break
+        errors = {e.offset: e for e in lexer.lexerErrors or ()}
+    finally:
+        lexer.recoverErrors = recover_errors
+        lexer.lexerErrors = None
+    return tokens, errors
+
+
+def split_bodies(tokens):
+    """Cut function bodies out of `tokens`.
+
+    Returns (skeleton, bodies): the tokens with each body reduced to its
+    `{` and `}`, and the tokens of each body from `{` to `}` with the token
+    after it. A `{` at depth 0 without a matching `}` stays in the skeleton
+    with everything after it.
+    """
+    skeleton = []
+    bodies = []
+    depth = 0
+    i = 0
+    n = len(tokens)
+    while i < n:
+        token = tokens[i]
+        t = token.type
+        if t == TyCParser.LBRACE:
+            if depth == 0 and skeleton and skeleton[-1].type == TyCParser.RPAREN:
+                end = _matching(tokens, i)
+                if end is None:
+                    return skeleton + tokens[i:], bodies
+                bodies.append((tokens[i : end + 1], tokens[end + 1]))
+                skeleton.append(token)
+                skeleton.append(tokens[end])
+                i = end + 1
+                continue
+            depth += 1
+        elif t == TyCParser.RBRACE and depth:
+            depth -= 1
+        skeleton.append(token)
+        i += 1
+    return skeleton, bodies
+
+
+def _matching(tokens, i):
+    """Index of the `}` that matches the `{` at `i`, or None."""
+    depth = 0
+    for j in range(i, len(tokens)):
+        t = tokens[j].type
+        if t == TyCParser.LBRACE:
+            depth += 1
+        elif t == TyCParser.RBRACE:
+            depth -= 1
+            if depth == 0:
+                return j
+    return None
+
+
+def parse_lazy(lexer):
+    """Parse the program of `lexer` with function bodies left unparsed.
+
+    Returns the Program ASTGeneration builds, except that its functions are
+    LazyFuncDecls whose body is parsed on first access. Raises the first
+    error outside function bodies; the lexer's `stringPool` holds every
+    string literal of the source.
+    """
+    tokens, errors = _lex(lexer)
+    skeleton, bodies = split_bodies(tokens)
+    tree = _parser(skeleton, errors).program()
+    return _SkeletonGeneration([LazyBlockStmt(body, follow, errors) for body, follow in bodies]).visit(tree)
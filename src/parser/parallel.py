@@ -0,0 +1,186 @@
+"""
+Parallel parsing of the top-level declarations of large TyC sources.
+
+Only `struct ... { ... };` and function declarations appear at the top level
+of a TyC program, and each ends where its braces close: after the `}` that
+brings the brace depth back to 0 (and the `;` after a struct). A regex pass
+over the source tracks that depth, skipping comments and string literals,
+and cuts the source at such boundaries into chunks of whole declarations.
+
+The chunks are lexed, parsed and turned into ASTs on a process pool. Each
+chunk lexer starts at the chunk's global line and column, so tokens, AST
+node positions and error messages carry global positions, and it shares a
+string pool filled with the source's string literals in order by the same
+pass, so StringLiteral pool indices are those of a sequential parse. The
+chunk Programs are merged into one in source order.
+
+A chunk parses exactly as the same declarations do in a sequential parse
+(the `decl*` loop of `program` starts over at each boundary). So if every
+chunk parses, the merged Program is the sequential one; if one fails, the
+source is parsed sequentially from the start of the first failing chunk,
+which raises the error a full sequential parse would raise first.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.grammar.stringpool import StringPool
+from src.utils.error_listener import NewErrorListener
+
+# Comments, string literals (the STRING_LITERAL / ILLEGAL_ESCAPE /
+# UNCLOSE_STRING shapes; `close` is set for a well-formed literal), a quote
+# none of them accepts, and the braces and semicolons that end declarations.
+_SCANNER = re.compile(
+    r"""
+      /\*.*?\*/
+    | //[^\n]*
+    | "(?P<raw>(?:\\[bfrnt"\\]|[^"\\\r\n])*)(?:(?P<close>")|\\[^bfrnt"\\\r\n]|\r?\n|\Z)
+    | "
+    | [{};]
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Whitespace and comments between two tokens.
+_GAP = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.DOTALL)
+
+# Smallest chunk worth shipping to another process.
+MIN_CHUNK = 64 * 1024
+
+
+def scan(text: str):
+    """Declaration boundaries and string pool of `text`.
+
+    Returns (boundaries, pool): the offsets just after each `}` or `;` at
+    brace depth 0, with whether it is a `}`, and the StringPool of the
+    well-formed string literals in order. Boundaries are None if the braces
+    do not balance.
+    """
+    boundaries = []
+    pool = StringPool()
+    depth = 0
+    for m in _SCANNER.finditer(text):
+        c = text[m.start()]
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth < 0:
+                return None, pool
+            if depth == 0:
+                boundaries.append((m.end(), True))
+        elif c == ";":
+            if depth == 0:
+                boundaries.append((m.end(), False))
+        elif m.group("close") is not None:
+            pool.intern(m.group("raw"))
+    return (boundaries if depth == 0 else None), pool
+
+
+def split_points(text: str, boundaries, parts: int, min_chunk: int = MIN_CHUNK):
+    """Boundaries that cut `text` into about `parts` chunks of whole
+    declarations, at least `min_chunk` characters long except possibly the
+    last. Always starts with 0."""
+    size = len(text)
+    step = max(min_chunk, size // max(parts, 1) + 1)
+    points = [0]
+    target = step
+    for i, (end, brace) in enumerate(boundaries):
+        if end < target or end >= size:
+            continue
+        if brace and i + 1 < len(boundaries):
+            # A `}` followed by `;` ends a struct: cut after the `;`.
+            following, following_brace = boundaries[i + 1]
+            if not following_brace and _GAP.fullmatch(text, end, following - 1):
+                continue
+        if _GAP.fullmatch(text, end):
+            break
+        points.append(end)
+        target = end + step
+    return points
+
+
+def _parser(lexer_class, text: str, line: int, column: int, pool):
+    lexer = lexer_class(InputStream(text))
+    lexer.line = line
+    lexer.column = column
+    lexer.stringPool = pool
+    parser = TyCParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def parse_chunk(lexer_class, text: str, line: int, column: int, pool):
+    """The Program of a chunk of whole declarations starting at `line` and
+    `column`, or None if it does not parse; runs in a worker process."""
+    from src.astgen.ast_generation import ASTGeneration
+
+    size = len(pool)
+    try:
+        program = ASTGeneration().visit(_parser(lexer_class, text, line, column, pool).program())
+    except Exception:
+        return None
+    # A literal the scan did not see would get an index of its own.
+    return program if len(pool) == size else None
+
+
+def parse_parallel(text: str, lexer_class=TyCLexer, workers: int = None, min_chunk: int = MIN_CHUNK):
+    """Parse `text` with its declarations in chunks on `workers` processes
+    (in-process with one worker, or when `text` is smaller than two chunks).
+
+    Returns (program, string pool): the AST TyCParser.program() and
+    ASTGeneration give, and the lexer's `stringPool` of that parse. Raises
+    the first syntax or lexical error a sequential parse raises.
+    """
+    workers = workers or os.cpu_count() or 1
+    boundaries, pool = scan(text)
+    if boundaries is None:
+        # Unbalanced braces: there is an error, which only a full parse
+        # places exactly.
+        return _sequential(lexer_class, text)
+    points = split_points(text, boundaries, workers, min_chunk)
+    pieces = [text[a:b] for a, b in zip(points, points[1:] + [len(text)])]
+    lines, columns = [], []
+    line, prev = 1, 0
+    for start in points:
+        line += text.count("\n", prev, start)
+        prev = start
+        lines.append(line)
+        columns.append(start - (text.rfind("\n", 0, start) + 1))
+    if len(pieces) == 1 or workers == 1:
+        results = [parse_chunk(lexer_class, *chunk, pool) for chunk in zip(pieces, lines, columns)]
+    else:
+        with ProcessPoolExecutor(min(workers, len(pieces))) as executor:
+            results = list(executor.map(parse_chunk, repeat(lexer_class), pieces, lines, columns, repeat(pool)))
+
+    for i, program in enumerate(results):
+        if program is None:
+            return _sequential(lexer_class, text, points[i], lines[i], columns[i])
+    merged = results[0]
+    for program in results[1:]:
+        merged.decls.extend(program.decls)
+    return merged, pool
+
+
+def _sequential(lexer_class, text: str, start: int = 0, line: int = 1, column: int = 0):
+    """Parse `text` in this process, from `start` on first if a chunk there
+    failed: its first error is the first error of the whole source."""
+    from src.astgen.ast_generation import ASTGeneration
+
+    if start:
+        try:
+            _parser(lexer_class, text[start:], line, column, None).program()
+        except Exception as e:
+            if getattr(e, "offset", None) is not None:
+                e.offset += start
+            raise
+    parser = _parser(lexer_class, text, 1, 0, None)
+    program = ASTGeneration().visit(parser.program())
+    return program, parser.getTokenStream().tokenSource.stringPool or StringPool()
@@ -0,0 +1,160 @@
+"""
+Reusable lexer/parser instances for parsing many small programs.
+
+Building a TyCLexer, token stream, TyCParser and ASTGeneration visitor for
+every source, and registering the error listener on each parser, is a
+visible share of the time for programs of a few lines. A RecognizerPool
+keeps one of each per thread and rebinds them to the next source instead:
+
+- the lexer gets the new input stream (which resets it) and a fresh
+  string pool,
+- the token stream gets the lexer again, which drops its old tokens,
+- the parser gets the token stream, which resets its context, error
+  strategy and syntax error count.
+
+The recognizers use the classes' shared DFAs in either case, so a pooled
+parse gives the same trees, ASTs and error messages as fresh instances.
+Rebinding also resets a pool left in the middle of a failed parse.
+
+pool_for() gives the shared pool of a lexer and token stream class;
+compile_many(), parse_many() and validate_many() use the default one, and
+so do Parser and ASTGenerator in tests/utils.py. Each thread has its own
+instances in every pool.
+"""
+
+import threading
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.lexer.mapped_stream import MappedCharStream
+from src.parser.two_stage import parse_two_stage
+from src.parser.validate import validate
+from src.utils.error_listener import NewErrorListener
+
+
+class RecognizerPool(threading.local):
+    """One lexer, token stream, parser and AST visitor per thread.
+
+    The instances are created on first use in each thread (the TyCASTParser
+    of `acquire(actions=True)` on its first use); `acquire` rebinds them to a
+    source and returns the parser.
+    """
+
+    def __init__(self, lexer_class=TyCLexer, token_stream_class=CommonTokenStream):
+        self.lexer = lexer_class(None)
+        self.token_stream = token_stream_class(self.lexer)
+        self.parser = _parser(TyCParser, self.token_stream)
+        self.ast_parser = None
+        self.ast_generator = None
+
+    def acquire(self, source: str = None, input_stream=None, actions: bool = False):
+        """Rebind the pool's recognizers to `source` (or `input_stream`) and
+        return the TyCParser, or with `actions` the TyCASTParser."""
+        if input_stream is None:
+            input_stream = InputStream(source)
+        else:
+            input_stream.reset()
+        self.lexer.inputStream = input_stream
+        self.lexer.stringPool = None
+        self.token_stream.setTokenSource(self.lexer)
+        if not actions:
+            parser = self.parser
+        elif self.ast_parser is None:
+            from build.TyCASTParser import TyCASTParser
+
+            parser = self.ast_parser = _parser(TyCASTParser, self.token_stream)
+        else:
+            parser = self.ast_parser
+        parser.setTokenStream(self.token_stream)
+        return parser
+
+    def visitor(self):
+        """This thread's ASTGeneration visitor."""
+        if self.ast_generator is None:
+            from src.astgen.ast_generation import ASTGeneration
+
+            self.ast_generator = ASTGeneration()
+        return self.ast_generator
+
+    def parse(self, source: str, two_stage: bool = False):
+        """Parse `source` into a parse tree; errors raise as from `program()`."""
+        parser = self.acquire(source)
+        if two_stage:
+            return parse_two_stage(parser)[0]
+        return parser.program()
+
+    def validate(self, source: str) -> str:
+        """"success" or the first error message of `source`, building no
+        parse tree (see src/parser/validate.py)."""
+        return validate(self.acquire(source))
+
+    def validate_file(self, path: str) -> str:
+        """validate() of a source file, read through a memory-mapped
+        CharStream that is closed before returning."""
+        with MappedCharStream(path) as stream:
+            return validate(self.acquire(input_stream=stream))
+
+    def compile(self, source: str, two_stage: bool = False):
+        """The AST of `source`, or an "AST Generation Error: ..." message.
+
+        Input nested too deeply for TyCParser and the visitor to recurse is
+        parsed by DescentParser instead, as in ASTGenerator.generate().
+        """
+        visitor = self.visitor()
+        try:
+            try:
+                return visitor.visit(self.parse(source, two_stage))
+            except RecursionError:
+                from src.parser.descent import DescentParser
+
+                self.acquire(source)
+                return DescentParser(self.lexer).parse()
+        except Exception as e:
+            return f"AST Generation Error: {str(e)}"
+
+
+def _parser(parser_class, token_stream):
+    parser = parser_class(token_stream)
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+_pools = {}
+
+
+def pool_for(lexer_class=TyCLexer, token_stream_class=CommonTokenStream) -> RecognizerPool:
+    """The shared pool for a lexer and token stream class."""
+    key = (lexer_class, token_stream_class)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools.setdefault(key, RecognizerPool(lexer_class, token_stream_class))
+    return pool
+
+
+def compile_many(sources, two_stage: bool = False) -> list:
+    """The AST (or error message) of every source, in order."""
+    pool = pool_for()
+    return [pool.compile(source, two_stage) for source in sources]
+
+
+def parse_many(sources, two_stage: bool = False) -> list:
+    """"success" or the syntax/lexical error message of every source."""
+    pool = pool_for()
+    results = []
+    for source in sources:
+        try:
+            pool.parse(source, two_stage)
+            results.append("success")
+        except Exception as e:
+            results.append(str(e))
+    return results
+
+
+def validate_many(sources) -> list:
+    """parse_many() without parse trees: the same results, in less time and
+    memory."""
+    pool = pool_for()
+    return [pool.validate(source) for source in sources]
@@ -0,0 +1,305 @@
+"""
+Decision-level profiling of TyCParser prediction.
+
+The Python ANTLR runtime has no ProfilingATNSimulator, so this module
+provides one, following the Java runtime's: a ParserATNSimulator subclass
+that records, per grammar decision,
+
+- invocations and time spent in adaptivePredict,
+- SLL lookahead depth (tokens examined, total/min/max) and the number of
+  DFA edges followed vs ATN reach sets computed,
+- full-context (LL) fallbacks with their lookahead depth and ATN reach sets,
+- context sensitivities (LL chose another alternative than SLL would have),
+  ambiguities (LL ended on a conflict) and prediction errors.
+
+Only decisions that are not LL(1) are predicted this way: for the others
+the generated parser switches on LA(1) and never calls the simulator, so
+they cost nothing and do not appear in a profile.
+
+A ParseProfile holds one DecisionInfo per decision of a parser class and
+maps each to its rule name and kind (e.g. `stmt`, "(...)* loop entry"). The
+Parser and ASTGenerator wrappers in tests/utils.py take `profile=` to
+accumulate into one. Profiles merge, so a corpus can be profiled per file
+and in total:
+
+    python -m src.parser.profiling corpus_dir_or_files... [--json out.json]
+        [--sort time|invocations|sll_max|ll_fallbacks|ll_max] [--top N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+from build.TyCParser import TyCParser
+from src.utils.files import corpus_files
+
+_KINDS = {
+    "BasicBlockStartState": "(...) block",
+    "StarBlockStartState": "(...)* block",
+    "PlusBlockStartState": "(...)+ block",
+    "StarLoopEntryState": "(...)* loop entry",
+    "PlusLoopbackState": "(...)+ loop back",
+    "TokensStartState": "tokens",
+}
+
+SORT_KEYS = {
+    "time": lambda d: d.time,
+    "invocations": lambda d: d.invocations,
+    "sll_max": lambda d: d.sll_max_look,
+    "ll_fallbacks": lambda d: d.ll_fallbacks,
+    "ll_max": lambda d: d.ll_max_look,
+}
+
+
+class DecisionInfo:
+    """Prediction statistics of one decision (cf. the Java runtime's DecisionInfo)."""
+
+    __slots__ = (
+        "decision", "invocations", "time",
+        "sll_total_look", "sll_min_look", "sll_max_look", "sll_atn_transitions", "sll_dfa_transitions",
+        "ll_fallbacks", "ll_total_look", "ll_min_look", "ll_max_look", "ll_atn_transitions",
+        "context_sensitivities", "ambiguities", "errors",
+    )
+
+    def __init__(self, decision: int):
+        self.decision = decision
+        for name in self.__slots__[1:]:
+            setattr(self, name, 0)
+
+    def merge(self, other: "DecisionInfo"):
+        for name in self.__slots__[1:]:
+            if name.endswith("_min_look"):
+                mine, theirs = getattr(self, name), getattr(other, name)
+                setattr(self, name, min(mine, theirs) if mine and theirs else mine or theirs)
+            elif name.endswith("_max_look"):
+                setattr(self, name, max(getattr(self, name), getattr(other, name)))
+            else:
+                setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _look(info: DecisionInfo, prefix: str, k: int):
+    setattr(info, f"{prefix}_total_look", getattr(info, f"{prefix}_total_look") + k)
+    low = getattr(info, f"{prefix}_min_look")
+    if low == 0 or k < low:
+        setattr(info, f"{prefix}_min_look", k)
+    if k > getattr(info, f"{prefix}_max_look"):
+        setattr(info, f"{prefix}_max_look", k)
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator recording a DecisionInfo per decision into `decisions`."""
+
+    def __init__(self, parser, decisions: list):
+        super().__init__(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+        self.predictionMode = parser._interp.predictionMode
+        self.decisions = decisions
+        self._current = None
+        self._sll_stop = -1
+        self._ll_stop = -1
+        self._conflicting_alt = None
+
+    def adaptivePredict(self, input, decision: int, outerContext):
+        info = self._current = self.decisions[decision]
+        self._sll_stop = self._ll_stop = -1
+        start_index = input.index
+        start = time.perf_counter()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        except Exception:
+            info.errors += 1
+            raise
+        finally:
+            info.time += time.perf_counter() - start
+            info.invocations += 1
+            if self._sll_stop >= 0:
+                _look(info, "sll", self._sll_stop - start_index + 1)
+            if self._ll_stop >= 0:
+                _look(info, "ll", self._ll_stop - start_index + 1)
+            self._current = None
+
+    def getExistingTargetState(self, previousD, t: int):
+        # Called each time SLL prediction advances the input
+        self._sll_stop = self._input.index
+        state = super().getExistingTargetState(previousD, t)
+        if state is not None:
+            self._current.sll_dfa_transitions += 1
+        return state
+
+    def computeReachSet(self, closure, t: int, fullCtx: bool):
+        if fullCtx:
+            # Called each time full-context prediction advances the input
+            self._ll_stop = self._input.index
+            self._current.ll_atn_transitions += 1
+        else:
+            self._current.sll_atn_transitions += 1
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex: int, stopIndex: int):
+        alts = conflictingAlts if conflictingAlts is not None else configs.getAlts()
+        self._conflicting_alt = min(alts) if alts else None
+        self._current.ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction: int, configs, startIndex: int, stopIndex: int):
+        if prediction != self._conflicting_alt:
+            self._current.context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex: int, stopIndex: int, exact: bool, ambigAlts, configs):
+        self._current.ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+class ParseProfile:
+    """Per-decision prediction statistics of `parser_class`, over any number
+    of parses."""
+
+    def __init__(self, parser_class=TyCParser):
+        self.parser_class = parser_class
+        self.decisions = [DecisionInfo(i) for i in range(len(parser_class.atn.decisionToState))]
+        self.parses = 0
+
+    def simulator(self, parser) -> ProfilingATNSimulator:
+        """A profiling simulator for `parser`, recording into this profile."""
+        if not isinstance(parser, self.parser_class):
+            raise ValueError(f"profile of {self.parser_class.__name__} used with {type(parser).__name__}")
+        self.parses += 1
+        return ProfilingATNSimulator(parser, self.decisions)
+
+    @contextmanager
+    def attached(self, parser):
+        """Profile `parser` (into this profile) within the block."""
+        interp = parser._interp
+        parser._interp = self.simulator(parser)
+        try:
+            yield parser
+        finally:
+            parser._interp = interp
+
+    def merge(self, other: "ParseProfile"):
+        for mine, theirs in zip(self.decisions, other.decisions):
+            mine.merge(theirs)
+        self.parses += other.parses
+
+    def describe(self, decision: int):
+        """(rule name, decision kind) of a decision number."""
+        state = self.parser_class.atn.decisionToState[decision]
+        kind = _KINDS.get(type(state).__name__, type(state).__name__)
+        return self.parser_class.ruleNames[state.ruleIndex], kind
+
+    def rows(self, sort: str = "time") -> list:
+        """Statistics of the decisions that were predicted, as dicts with
+        `rule` and `kind`, most expensive first by `sort`."""
+        used = [d for d in self.decisions if d.invocations]
+        used.sort(key=SORT_KEYS[sort], reverse=True)
+        rows = []
+        for info in used:
+            rule, kind = self.describe(info.decision)
+            rows.append(dict(rule=rule, kind=kind, **info.to_dict()))
+        return rows
+
+    def total_time(self) -> float:
+        return sum(d.time for d in self.decisions)
+
+    def to_json(self, sort: str = "time") -> dict:
+        return {
+            "parser": self.parser_class.__name__,
+            "parses": self.parses,
+            "prediction_seconds": self.total_time(),
+            "decisions": self.rows(sort),
+        }
+
+    def report(self, sort: str = "time", top: int = None) -> str:
+        """A text table of `rows(sort)`, the first `top` of them."""
+        headers = ("rule", "dec", "kind", "calls", "ms", "SLL avg", "SLL max", "LL fb", "LL avg",
+                   "LL max", "ctx", "ambig", "err", "ATN SLL/LL", "DFA")
+        table = [headers]
+        for row in self.rows(sort)[:top]:
+            calls, fallbacks = row["invocations"], row["ll_fallbacks"]
+            table.append((
+                row["rule"], row["decision"], row["kind"], calls, f"{row['time'] * 1000:.1f}",
+                f"{row['sll_total_look'] / calls:.2f}", row["sll_max_look"], fallbacks,
+                f"{row['ll_total_look'] / fallbacks:.2f}" if fallbacks else "-", row["ll_max_look"] or "-",
+                row["context_sensitivities"], row["ambiguities"], row["errors"],
+                f"{row['sll_atn_transitions']}/{row['ll_atn_transitions']}", row["sll_dfa_transitions"],
+            ))
+        table = [[str(c) for c in r] for r in table]
+        widths = [max(len(r[i]) for r in table) for i in range(len(headers))]
+        lines = [
+            f"{self.parser_class.__name__}: {self.parses} parses, "
+            f"{self.total_time() * 1000:.1f} ms in prediction"
+        ]
+        for n, r in enumerate(table):
+            lines.append("  ".join(c.ljust(w) for c, w in zip(r, widths)).rstrip())
+            if n == 0:
+                lines.append("  ".join("-" * w for w in widths))
+        return "\n".join(lines)
+
+
+def profile_corpus(paths, two_stage: bool = False):
+    """Parse every file under `paths` with profiling.
+
+    Returns (corpus profile, per-file list of (path, parse seconds, result,
+    file profile)), where result is "success" or the error message.
+    """
+    # tests/utils.py makes the generated lexer importable.
+    from tests.utils import Parser
+
+    total = ParseProfile()
+    files = []
+    for path in corpus_files(paths):
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        profile = ParseProfile()
+        start = time.perf_counter()
+        result = Parser(source, two_stage=two_stage, profile=profile).parse()
+        files.append((path, time.perf_counter() - start, result, profile))
+        total.merge(profile)
+    return total, files
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(description="Per-decision prediction profile of a TyC corpus")
+    args.add_argument("paths", nargs="+", help="source files or directories")
+    args.add_argument("--json", help="also write the profile to this JSON file")
+    args.add_argument("--sort", choices=sorted(SORT_KEYS), default="time")
+    args.add_argument("--top", type=int, default=None, help="decisions (and slowest files) to list")
+    args.add_argument("--two-stage", action="store_true", help="parse SLL first, LL on failure")
+    args = args.parse_args(argv)
+
+    total, files = profile_corpus(args.paths, args.two_stage)
+    slowest = sorted(files, key=lambda f: f[1], reverse=True)[: args.top or 10]
+    print(total.report(args.sort, args.top))
+    print()
+    print("Slowest files:")
+    for path, seconds, result, profile in slowest:
+        rows = profile.rows("time")
+        worst = f"{rows[0]['rule']} (decision {rows[0]['decision']})" if rows else "-"
+        status = "ok" if result == "success" else "error"
+        print(f"  {seconds * 1000:9.1f} ms  {status:5}  top decision {worst}  {path}")
+    if args.json:
+        data = total.to_json(args.sort)
+        data["files"] = [
+            {
+                "path": path,
+                "seconds": seconds,
+                "result": result,
+                "prediction_seconds": profile.total_time(),
+                "decisions": profile.rows("time")[:5],
+            }
+            for path, seconds, result, profile in files
+        ]
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"\nProfile written to {args.json}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Recovering parse: every syntax error of a program in one parse.
+
+A normal parse stops at the first error (NewErrorListener raises it). In
+recovering mode the parser instead records each error and resynchronizes:
+
+- Inside a declaration, the tokens up to the next `;`, `{`, `}`, or start
+  of a top-level declaration are skipped (the stop token is kept), and the
+  enclosing rules carry on from there. ANTLR's own error mode suppresses
+  the follow-on errors until a token matches again.
+- After a first error, a `struct`, `void` or `type name (` inside a block
+  or struct body means the body was never closed: the parser reports it
+  there and unwinds to the top level, so the next declaration parses as
+  one.
+- Between declarations, stray tokens are skipped up to the next start of
+  a declaration, and parsing continues after an error that ended the
+  `program` rule early.
+
+Lexical errors are collected too (the lexer runs with `recoverErrors`),
+and the syntax errors at their error tokens are not reported again.
+Errors are listed in the order they were found. Until the first one the
+recovering parser runs exactly like a normal one, so the first error (and
+its message) is the one a normal parse raises.
+
+Declarations the parser went through without any error are clean:
+`recovered_ast` builds the AST of those, a partial Program of the
+declarations that parsed.
+"""
+
+from contextlib import contextmanager
+
+from antlr4.IntervalSet import IntervalSet
+from antlr4.atn.Transition import RuleTransition
+from antlr4.Token import Token
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.error.Errors import InputMismatchException, NoViableAltException
+from antlr4.tree.Tree import ErrorNode
+
+from build.TyCParser import TyCParser
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import Program
+
+# Tokens that end or start a statement or body.
+SYNC_TOKENS = frozenset((TyCParser.SEMI, TyCParser.LBRACE, TyCParser.RBRACE, Token.EOF))
+
+# Tokens that only start a top-level declaration.
+DECL_KEYWORDS = frozenset((TyCParser.STRUCT, TyCParser.VOID))
+
+# Tokens that start a type (or a function name without return type).
+TYPE_TOKENS = frozenset((TyCParser.INT, TyCParser.FLOAT, TyCParser.STRING, TyCParser.ID))
+
+# Offending tokens already reported as lexical errors.
+LEXER_ERROR_TOKENS = frozenset((TyCParser.ERROR_CHAR, TyCParser.UNCLOSE_STRING, TyCParser.ILLEGAL_ESCAPE))
+
+# Rules whose loops hold whole declarations, statements or members.
+_BODY_CONTEXTS = (TyCParser.ProgramContext, TyCParser.BlockContext, TyCParser.StructDeclContext)
+
+
+def _at_decl_start(stream) -> bool:
+    """True if the next tokens can only start a top-level declaration:
+    `struct`, `void`, or `type name (` (never valid inside a body)."""
+    la = stream.LA(1)
+    if la in DECL_KEYWORDS:
+        return True
+    return la in TYPE_TOKENS and stream.LA(2) == TyCParser.ID and stream.LA(3) == TyCParser.LPAREN
+
+
+def _at_top_level_start(stream) -> bool:
+    """True if the next tokens can start a declaration between declarations."""
+    la = stream.LA(1)
+    if la in DECL_KEYWORDS:
+        return True
+    return la in TYPE_TOKENS and stream.LA(2) in (TyCParser.ID, TyCParser.LPAREN)
+
+
+def _block_in_stmt(atn) -> int:
+    """The state of `stmt` that calls `block` (the invoking state of a block
+    parsed as a statement)."""
+    for state in atn.states:
+        if state.ruleIndex != TyCParser.RULE_stmt:
+            continue
+        for t in state.transitions:
+            if isinstance(t, RuleTransition) and t.ruleIndex == TyCParser.RULE_block:
+                return state.stateNumber
+    raise LookupError("stmt does not call block")
+
+
+class RecoveringErrorStrategy(DefaultErrorStrategy):
+    """DefaultErrorStrategy that resynchronizes on statement and declaration
+    boundaries; `errors` is shared with the collecting listener."""
+
+    def __init__(self, errors: list):
+        super().__init__()
+        self.errors = errors
+
+    def sync(self, recognizer):
+        stream = recognizer.getTokenStream()
+        if not isinstance(recognizer._ctx, _BODY_CONTEXTS[1:]):
+            super().sync(recognizer)
+            return
+        if self.errors and _at_decl_start(stream):
+            raise InputMismatchException(recognizer)
+        # Skip stray tokens between statements or members, also on the
+        # first iteration and while already recovering: giving up here
+        # would end the whole body.
+        state = recognizer._interp.atn.states[recognizer.state]
+        if stream.LA(1) not in recognizer.atn.nextTokens(state):
+            if not self.inErrorRecoveryMode(recognizer):
+                # The default sync looks at the token after the stray one
+                # first; it may be a lexical error, which then comes first.
+                stream.LA(2)
+                self.reportUnwantedToken(recognizer)
+            expecting = recognizer.getExpectedTokens()
+            self.consumeUntil(recognizer, expecting.addSet(self.getErrorRecoverySet(recognizer)))
+
+    def singleTokenDeletion(self, recognizer):
+        # Within a statement or declaration header, never drop a token as
+        # extraneous to go on across a `;`, `{` or `}`: the error is reported
+        # at the same token either way, and recover() stops at the boundary.
+        stream = recognizer.getTokenStream()
+        following = stream.LA(2)
+        if not isinstance(recognizer._ctx, _BODY_CONTEXTS) and (
+            stream.LA(1) in SYNC_TOKENS or following in SYNC_TOKENS
+        ):
+            return None
+        return super().singleTokenDeletion(recognizer)
+
+    def recover(self, recognizer, e):
+        stream = recognizer.getTokenStream()
+        top_level = isinstance(recognizer._ctx, TyCParser.ProgramContext)
+        if not top_level and _at_decl_start(stream):
+            # Unwind to the program rule, which parses the declaration.
+            return
+        if isinstance(e, NoViableAltException) and isinstance(recognizer._ctx, TyCParser.StmtContext) \
+                and stream.LA(1) == TyCParser.LBRACE:
+            # Prediction could not tell a block from a struct literal
+            # statement because of an error inside the braces; parse it as
+            # the block it almost always is, to report the errors in it.
+            recognizer.state = _block_in_stmt(recognizer.atn)
+            recognizer.block()
+            return
+        if (
+            self.lastErrorIndex == stream.index
+            and self.lastErrorStates is not None
+            and recognizer.state in self.lastErrorStates
+        ):
+            # Nothing was consumed since the last error in this state.
+            recognizer.consume()
+        self.lastErrorIndex = stream.index
+        if self.lastErrorStates is None:
+            self.lastErrorStates = []
+        self.lastErrorStates.append(recognizer.state)
+        if top_level:
+            while stream.LA(1) != Token.EOF and not _at_top_level_start(stream):
+                recognizer.consume()
+        else:
+            while stream.LA(1) not in SYNC_TOKENS and not _at_decl_start(stream):
+                recognizer.consume()
+
+    def getErrorRecoverySet(self, recognizer):
+        # Used by sync() when it skips tokens in a loop; the loop's own
+        # continuation tokens are added to these.
+        tokens = IntervalSet()
+        if isinstance(recognizer._ctx, TyCParser.ProgramContext):
+            for t in DECL_KEYWORDS | TYPE_TOKENS | {Token.EOF}:
+                tokens.addOne(t)
+        else:
+            # A `;` is a stray token between statements or members.
+            for t in SYNC_TOKENS - {TyCParser.SEMI} | DECL_KEYWORDS:
+                tokens.addOne(t)
+        return tokens
+
+
+class CollectingErrorListener(ErrorListener):
+    """Appends the SyntaxException NewErrorListener would raise to `errors`,
+    except at tokens the lexer already reported and again at the token of
+    the last error."""
+
+    def __init__(self, errors: list):
+        self.errors = errors
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        if getattr(offendingSymbol, "type", None) in LEXER_ERROR_TOKENS:
+            return
+        error = NewErrorListener.error(offendingSymbol, line, column)
+        last = self.errors[-1] if self.errors else None
+        if last is None or (last.line, last.column) != (line, column):
+            self.errors.append(error)
+
+
+@contextmanager
+def recovering(parser):
+    """Put `parser` (already bound to its input) and its lexer in recovering
+    mode within the block; yields the list the errors are collected in."""
+    errors = []
+    lexer = parser.getTokenStream().tokenSource
+    handler, listeners = parser._errHandler, parser._listeners
+    recover_errors = lexer.recoverErrors
+    parser._errHandler = RecoveringErrorStrategy(errors)
+    parser._listeners = [CollectingErrorListener(errors)]
+    lexer.recoverErrors = True
+    lexer.lexerErrors = errors
+    try:
+        yield errors
+    finally:
+        parser._errHandler = handler
+        parser._listeners = listeners
+        lexer.recoverErrors = recover_errors
+        lexer.lexerErrors = None
+
+
+def parse_recovering(parser):
+    """Parse a program with `parser`, collecting all errors.
+
+    Returns (tree, errors): the ProgramContext, with the declarations of
+    every `program` run if an error ended one early, and the SyntaxException
+    and LexerError objects in the order found (empty if the program is valid).
+    """
+    with recovering(parser) as errors:
+        stream = parser.getTokenStream()
+        tree = parser.program()
+        while stream.LA(1) != Token.EOF:
+            index = stream.index
+            rest = parser.program()
+            for child in rest.children or []:
+                if isinstance(child, TyCParser.DeclContext):
+                    child.parentCtx = tree
+                    tree.addChild(child)
+            if stream.index == index:
+                stream.consume()
+    return tree, errors
+
+
+def _has_error(ctx) -> bool:
+    stack = [ctx]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ErrorNode):
+            return True
+        if getattr(node, "exception", None) is not None:
+            return True
+        stack.extend(getattr(node, "children", None) or ())
+    return False
+
+
+def clean_decls(tree) -> list:
+    """The DeclContexts of `tree` parsed without any error."""
+    return [decl for decl in tree.decl() if not _has_error(decl)]
+
+
+def recovered_ast(tree, ast_generator) -> Program:
+    """The Program of the clean declarations of `tree`, built with the
+    ASTGeneration visitor `ast_generator`."""
+    program = Program([ast_generator.visit(decl) for decl in clean_decls(tree)])
+    program.line, program.column = tree.start.line, tree.start.column
+    return program
@@ -0,0 +1,329 @@
+"""
+Warm DFA snapshot of the generated recognizers.
+
+Each generated recognizer class deserializes its ATN at import and starts
+with empty prediction DFAs (`decisionsToDFA`), which the ATN simulators fill
+while parsing: until they are filled, most decisions run full ATN
+simulation, so the first parses of every process are much slower than later
+ones. The build runs a representative corpus through TyCLexer, TyCParser and
+TyCASTParser and pickles their warmed DFAs and (for parsers) shared
+prediction context caches to build/TyC.snapshot, one pickle per class. The
+DFA states refer to ATN states by number, so they are loaded onto the ATN
+the class has just deserialized rather than a second copy of it.
+
+The generated classes load their state themselves, in their class bodies
+(warm_state, called from the grammars' members): every process that
+imports them, a process-pool worker included, starts warm. install() loads
+a snapshot from another directory onto the imported classes.
+
+A snapshot is only used if it was taken from the same grammar files (by
+SHA-256), the same serialized ATN of each class and the same ANTLR runtime
+version; otherwise the classes start cold, as they also do with the
+environment variable TYC_NO_SNAPSHOT set. The snapshot is a pickle, trusted
+like the generated modules next to it.
+
+Build step (the snapshot is written to build_dir):
+    python -m src.parser.snapshot [build_dir [corpus_path ...]]
+
+Corpus paths are source files or directories of them; the default corpus is
+the programs of tests/test_parser.py and generated programs.
+"""
+
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import sys
+from array import array
+
+import antlr4
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.PredictionContext import ArrayPredictionContext, PredictionContext, SingletonPredictionContext
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerAction import LexerMoreAction, LexerPopModeAction, LexerSkipAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+
+from src.utils.files import BUILD_DIR, use_build_dir
+
+SNAPSHOT_NAME = "TyC.snapshot"
+GRAMMARS = ("TyC.g4", "TyCASTParser.g4")
+RECOGNIZERS = ("TyCLexer", "TyCParser", "TyCASTParser")
+
+# Set (to anything non-empty) to start the generated classes cold.
+NO_SNAPSHOT = "TYC_NO_SNAPSHOT"
+
+_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# DFA states and prediction contexts are deep object graphs; pickling
+# them recurses once per level.
+_RECURSION_LIMIT = 20000
+
+# Runtime singletons the simulators compare by identity (`D is self.ERROR`,
+# `ctx is PredictionContext.EMPTY`, ...): pickled by name, loaded as the
+# running process's objects.
+_SINGLETONS = {
+    "ERROR": ATNSimulator.ERROR,
+    "LEXER_ERROR": LexerATNSimulator.ERROR,
+    "EMPTY_CONTEXT": PredictionContext.EMPTY,
+    "NO_SEMANTIC_CONTEXT": SemanticContext.NONE,
+    "MORE": LexerMoreAction.INSTANCE,
+    "POP_MODE": LexerPopModeAction.INSTANCE,
+    "SKIP": LexerSkipAction.INSTANCE,
+}
+_SINGLETON_NAMES = {id(obj): name for name, obj in _SINGLETONS.items()}
+
+
+class _Pickler(pickle.Pickler):
+    """Pickles recognizer state with ATN states by number, and so that cached
+    hash codes are recomputed at load: they derive from str hashes
+    (PredictionContext.EMPTY hashes "", LexerActionExecutor the actions'
+    text), which differ between processes."""
+
+    def persistent_id(self, obj):
+        if isinstance(obj, ATNState):
+            return obj.stateNumber
+        return _SINGLETON_NAMES.get(id(obj))
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        if cls is SingletonPredictionContext:
+            return cls, (obj.parentCtx, obj.returnState)
+        if cls is ArrayPredictionContext:
+            return cls, (obj.parents, obj.returnStates)
+        if cls is LexerActionExecutor:
+            return cls, (obj.lexerActions,)
+        if cls is ATNConfigSet:
+            func, args, (_, slots), *rest = obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+            return (func, args, (None, dict(slots, cachedHashCode=-1)), *rest)
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, atn):
+        super().__init__(file)
+        self.atn = atn
+
+    def persistent_load(self, pid):
+        if type(pid) is int:
+            return self.atn.states[pid]
+        return _SINGLETONS[pid]
+
+
+def grammar_digest(grammar_dir: str) -> str:
+    """SHA-256 over the grammar files the recognizers are generated from."""
+    digest = hashlib.sha256()
+    for name in GRAMMARS:
+        with open(os.path.join(grammar_dir, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _runtime_version() -> str:
+    # The dist-info name next to the antlr4 package; importlib.metadata
+    # scans all of sys.path, which would cost more than the snapshot saves.
+    site = os.path.dirname(os.path.dirname(os.path.abspath(antlr4.__file__)))
+    prefix, suffix = "antlr4_python3_runtime-", ".dist-info"
+    for name in os.listdir(site):
+        if name.startswith(prefix) and name.endswith(suffix):
+            return name[len(prefix) : -len(suffix)]
+    from importlib.metadata import version
+
+    return version("antlr4-python3-runtime")
+
+
+def atn_digest(serialized_atn) -> str:
+    """SHA-256 over a generated module's serializedATN()."""
+    return hashlib.sha256(array("i", serialized_atn).tobytes()).hexdigest()
+
+
+def _recognizer_module(name: str):
+    use_build_dir()
+    return importlib.import_module(f"build.{name}")
+
+
+def _recognizer_class(name: str):
+    return getattr(_recognizer_module(name), name)
+
+
+def _warm(classes, sources):
+    """Lex and parse every source, filling the classes' DFAs."""
+    lexer_class = classes["TyCLexer"]
+    for parser_class in (classes["TyCParser"], classes["TyCASTParser"]):
+        for source in sources:
+            parser = parser_class(CommonTokenStream(lexer_class(InputStream(source))))
+            parser.removeErrorListeners()
+            try:
+                parser.program()
+            except Exception:
+                pass
+
+
+def _dumps(obj) -> bytes:
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, _RECURSION_LIMIT))
+    try:
+        buffer = io.BytesIO()
+        _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        return buffer.getvalue()
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def _loads(data: bytes, atn):
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, _RECURSION_LIMIT))
+    try:
+        return _Unpickler(io.BytesIO(data), atn).load()
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def _state(cls):
+    if hasattr(cls, "sharedContextCache"):
+        return cls.decisionsToDFA, cls.sharedContextCache
+    return (cls.decisionsToDFA,)
+
+
+def write_snapshot(path: str, sources, grammar_dir: str = None) -> dict:
+    """Warm the recognizers on `sources` and write their state to `path`.
+
+    Returns the number of DFA states per recognizer.
+    """
+    grammar_dir = grammar_dir or os.path.join(_root, "src", "grammar")
+    modules = {name: _recognizer_module(name) for name in RECOGNIZERS}
+    classes = {name: getattr(module, name) for name, module in modules.items()}
+    _warm(classes, sources)
+    # One pickle per recognizer (its DFA states point into its own ATN), so
+    # a process loads only the recognizers it has imported.
+    snapshot = {
+        "grammar_sha256": grammar_digest(grammar_dir),
+        "runtime": _runtime_version(),
+        "recognizers": {
+            name: (atn_digest(modules[name].serializedATN()), _dumps(_state(cls)))
+            for name, cls in classes.items()
+        },
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return {
+        name: sum(len(dfa.states) for dfa in cls.decisionsToDFA)
+        for name, cls in classes.items()
+    }
+
+
+def load_snapshot(path: str, grammar_dir: str = None):
+    """The (ATN digest, pickled state) of each recognizer stored at `path`
+    by name, or None if the file is missing, unreadable or taken from other
+    grammar files or another runtime."""
+    grammar_dir = grammar_dir or os.path.join(_root, "src", "grammar")
+    try:
+        digest = grammar_digest(grammar_dir)
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return None
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("grammar_sha256") != digest
+        or snapshot.get("runtime") != _runtime_version()
+    ):
+        return None
+    return snapshot["recognizers"]
+
+
+def _state_for(states, name: str, serialized_atn, atn):
+    entry = states.get(name) if states is not None else None
+    if entry is None or entry[0] != atn_digest(serialized_atn):
+        return None
+    return _loads(entry[1], atn)
+
+
+_build_states = None
+
+
+def warm_state(name: str, serialized_atn, atn, *cold) -> tuple:
+    """The prediction state of the generated class `name` (as `cold`: its
+    decisionsToDFA and, for a parser, sharedContextCache) from the build's
+    snapshot, on the class's `atn`, or `cold` without a valid snapshot.
+
+    Called from the class bodies (see the members of TyC.g4), so it must
+    never fail an import.
+    """
+    global _build_states
+    if os.environ.get(NO_SNAPSHOT):
+        return cold
+    try:
+        if _build_states is None:
+            _build_states = load_snapshot(os.path.join(BUILD_DIR, SNAPSHOT_NAME)) or {}
+        return _state_for(_build_states, name, serialized_atn, atn) or cold
+    except Exception:
+        return cold
+
+
+def install(build_dir: str = None, grammar_dir: str = None) -> bool:
+    """Load the snapshot in `build_dir` onto the recognizer classes that are
+    imported.
+
+    Returns whether the snapshot was valid. Recognizers created before the
+    call keep their DFAs; classes imported after it load the build's own
+    snapshot (see warm_state).
+    """
+    build_dir = build_dir or BUILD_DIR
+    states = load_snapshot(os.path.join(build_dir, SNAPSHOT_NAME), grammar_dir)
+    if states is None:
+        return False
+    for name in states:
+        module = sys.modules.get(f"build.{name}")
+        if module is None:
+            continue
+        cls = getattr(module, name)
+        state = _state_for(states, name, module.serializedATN(), cls.atn)
+        if state is None:
+            continue
+        cls.decisionsToDFA = state[0]
+        if len(state) > 1:
+            cls.sharedContextCache = state[1]
+    return True
+
+
+def _read_corpus(paths):
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(os.listdir(path))
+            sources.extend(_read_corpus(os.path.join(path, n) for n in names))
+        else:
+            with open(path, encoding="utf-8") as f:
+                sources.append(f.read())
+    return sources
+
+
+def _default_corpus():
+    # Every construct (tests/test_parser.py, also invalid programs) and the
+    # shape of typical programs (the benchmarks' generated ones).
+    from benchmarks.common import generate_program, parser_test_sources
+
+    return parser_test_sources() + [generate_program(4, seed) for seed in range(4)]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Warm the classes from cold, not from the snapshot being replaced.
+    os.environ[NO_SNAPSHOT] = "1"
+    build_dir = os.path.abspath(argv[0]) if argv else BUILD_DIR
+    sources = _read_corpus(argv[1:]) if len(argv) > 1 else _default_corpus()
+    path = os.path.join(build_dir, SNAPSHOT_NAME)
+    counts = write_snapshot(path, sources)
+    states = ", ".join(f"{name} {count}" for name, count in counts.items())
+    print(f"Warm DFA snapshot ({states} DFA states) written to {path}")
+
+
+if __name__ == "__main__":
+    main()
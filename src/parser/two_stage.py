@@ -0,0 +1,63 @@
+"""
+Two-stage parsing: SLL with bail-out first, full LL only when that fails.
+
+SLL prediction ignores the full parser call stack, which makes it much
+cheaper than LL, and for a sentence SLL parses without error it builds the
+same tree LL would. It can however reject valid input (a conflict resolved
+to the wrong alternative) and its error positions are not LL's. So the
+first stage runs SLL with a BailErrorStrategy and no error listeners: the
+first syntax error cancels the parse. Only then is the input rewound and
+parsed again in LL mode with the parser's own error strategy and
+listeners, which gives exactly the trees and error messages of a plain LL
+parse.
+
+A lexical error raised during the first stage also falls back: SLL may
+have fetched tokens LL would never reach before its first syntax error. The
+lexer is reset and the tokens are lexed again for the LL stage.
+"""
+
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+
+def parse_two_stage(parser, rule: str = "program"):
+    """Run `parser.<rule>()` in two stages.
+
+    Returns (tree, fallback) where `fallback` tells whether the LL stage
+    ran. Errors of the LL stage propagate as they would from `parser.<rule>()`;
+    the first stage never raises, so an exception means the LL stage ran.
+    The LL stage keeps the parser's prediction mode unless that is SLL; the
+    mode, error strategy and listeners are restored afterwards.
+    """
+    interp = parser._interp
+    mode = interp.predictionMode
+    handler = parser._errHandler
+    listeners = parser._listeners
+    stream = parser.getTokenStream()
+
+    parser._errHandler = BailErrorStrategy()
+    parser._listeners = []
+    interp.predictionMode = PredictionMode.SLL
+    try:
+        return getattr(parser, rule)(), False
+    except ParseCancellationException:
+        relex = False
+    except Exception:
+        relex = True
+    finally:
+        parser._errHandler = handler
+        parser._listeners = listeners
+        interp.predictionMode = mode
+
+    if relex:
+        lexer = stream.tokenSource
+        lexer.reset()
+        stream.setTokenSource(lexer)
+    parser.reset()
+    if mode == PredictionMode.SLL:
+        interp.predictionMode = PredictionMode.LL
+    try:
+        return getattr(parser, rule)(), True
+    finally:
+        interp.predictionMode = mode
@@ -0,0 +1,68 @@
+"""
+Validate-only parsing: syntax checking that builds no parse tree.
+
+`Parser.parse` and parse_many() only need to know whether a source parses,
+yet TyCParser builds the whole parse tree, one context per rule invocation
+with its children and a terminal node per token, before throwing it away.
+validate() runs the same parse with `buildParseTrees` off: each rule
+context is dropped as soon as its rule returns, and only the token buffer
+grows with the source.
+
+The parse stops at the first lexical or syntax error, as the error listener
+raises it, and the result is that of `Parser.parse`: "success" or the
+error message. Checking that the left side of `=` is an lvalue is the one
+grammar action that reads the tree; without one it reads the operand's
+tokens instead (TyCParserBase.isLvalueTokens).
+
+The Parser wrapper in tests/utils.py has validate(), the pool (see
+src/parser/pool.py) validate_many() and validate_file(), and files can be
+checked with
+
+    python -m src.parser.validate files_or_dirs...
+"""
+
+import argparse
+import sys
+
+from src.utils.files import corpus_files, use_build_dir
+
+
+def validate(parser) -> str:
+    """Parse the source bound to `parser` without building a tree.
+
+    Returns "success" or the message of the first error. The parser builds
+    trees again afterwards.
+    """
+    parser.buildParseTrees = False
+    try:
+        parser.program()
+        return "success"
+    except Exception as e:
+        return str(e)
+    finally:
+        parser.buildParseTrees = True
+
+
+def main(argv=None):
+    use_build_dir()
+    from src.parser.pool import pool_for
+
+    args = argparse.ArgumentParser(description="Check the syntax of TyC sources without building parse trees")
+    args.add_argument("paths", nargs="+", help="source files or directories")
+    args.add_argument("--quiet", action="store_true", help="list only the files with errors")
+    args = args.parse_args(argv)
+
+    failed = 0
+    pool = pool_for()
+    for path in corpus_files(args.paths):
+        result = pool.validate_file(path)
+        if result != "success":
+            failed += 1
+            print(f"{path}: {result}")
+        elif not args.quiet:
+            print(f"{path}: ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""
+Flat, struct-of-arrays representation of an AST.
+
+An Arena holds the nodes of a tree of nodes.py objects in parallel typed
+arrays, one entry per node, with integer node IDs in place of object
+references. IDs are given in pre-order (the order BaseVisitor visits the
+nodes), so the subtree of a node is a contiguous range of IDs and a pass
+over the whole program is a loop over the arrays. The arrays are a handful
+of objects however large the program, so they cost the garbage collector
+nothing to scan.
+
+Columns, indexed by node ID:
+
+- `kind`: index of the node's class in KINDS,
+- `first_child`, `next_sibling`: node IDs, -1 for none; the children of a
+  node are the nodes of its node and list fields, in field order,
+- `operator`: index in OPERATORS of the operator of a BinaryOp, PrefixOp or
+  PostfixOp, -1 for other nodes,
+- `literal`: index in `values` of the node's name or literal value (a
+  StringLiteral's (value, pool_index) pair), -1 for nodes without one,
+- `absent`: bit i set if the i-th node or list field of the node is None,
+- `line`, `column`: source position, -1 for None.
+
+`values` holds each distinct name and literal value once.
+
+Arena.from_tree() and to_tree() convert without loss. `arena.node(id)`
+gives a cursor on a node: an instance of a subclass of its nodes.py class
+whose fields are read from the arrays, so visitors (through `accept`),
+walk() and str() work on cursors as on the object tree.
+"""
+
+from array import array
+
+from . import nodes as _nodes
+
+_NODE, _LIST, _VALUE, _OPERATOR = "node", "list", "value", "operator"
+
+# Fields of each node class in constructor (and visit) order, with their
+# role. ASTNode's line and column are kept by every node.
+_FIELDS = {
+    _nodes.Program: (("decls", _LIST),),
+    _nodes.StructDecl: (("name", _VALUE), ("members", _LIST)),
+    _nodes.MemberDecl: (("member_type", _NODE), ("name", _VALUE)),
+    _nodes.FuncDecl: (("return_type", _NODE), ("name", _VALUE), ("params", _LIST), ("body", _NODE)),
+    _nodes.Param: (("param_type", _NODE), ("name", _VALUE)),
+    _nodes.IntType: (),
+    _nodes.FloatType: (),
+    _nodes.StringType: (),
+    _nodes.VoidType: (),
+    _nodes.StructType: (("struct_name", _VALUE),),
+    _nodes.BlockStmt: (("statements", _LIST),),
+    _nodes.VarDecl: (("var_type", _NODE), ("name", _VALUE), ("init_value", _NODE)),
+    _nodes.IfStmt: (("condition", _NODE), ("then_stmt", _NODE), ("else_stmt", _NODE)),
+    _nodes.WhileStmt: (("condition", _NODE), ("body", _NODE)),
+    _nodes.ForStmt: (("init", _NODE), ("condition", _NODE), ("update", _NODE), ("body", _NODE)),
+    _nodes.SwitchStmt: (("expr", _NODE), ("cases", _LIST), ("default_case", _NODE)),
+    _nodes.CaseStmt: (("expr", _NODE), ("statements", _LIST)),
+    _nodes.DefaultStmt: (("statements", _LIST),),
+    _nodes.BreakStmt: (),
+    _nodes.ContinueStmt: (),
+    _nodes.ReturnStmt: (("expr", _NODE),),
+    _nodes.ExprStmt: (("expr", _NODE),),
+    _nodes.BinaryOp: (("left", _NODE), ("operator", _OPERATOR), ("right", _NODE)),
+    _nodes.PrefixOp: (("operator", _OPERATOR), ("operand", _NODE)),
+    _nodes.PostfixOp: (("operator", _OPERATOR), ("operand", _NODE)),
+    _nodes.AssignExpr: (("lhs", _NODE), ("rhs", _NODE)),
+    _nodes.MemberAccess: (("obj", _NODE), ("member", _VALUE)),
+    _nodes.FuncCall: (("name", _VALUE), ("args", _LIST)),
+    _nodes.Identifier: (("name", _VALUE),),
+    _nodes.StructLiteral: (("values", _LIST),),
+    _nodes.IntLiteral: (("value", _VALUE),),
+    _nodes.FloatLiteral: (("value", _VALUE),),
+    _nodes.StringLiteral: (("value", _VALUE), ("pool_index", _VALUE)),
+}
+
+# Node classes by kind code.
+KINDS = tuple(_FIELDS)
+
+OPERATORS = ("+", "-", "*", "/", "%", "==", "!=", "<", "<=", ">", ">=", "&&", "||", "!", "++", "--")
+
+_KIND_CODES = {cls: code for code, cls in enumerate(KINDS)}
+_OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS)}
+
+
+class _Layout:
+    """How the fields of one node class map to the columns."""
+
+    __slots__ = ("cls", "fields", "children", "values", "operator")
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fields = _FIELDS[cls]
+        # Node and list fields, in order: (name, is_list).
+        self.children = tuple((name, role == _LIST) for name, role in self.fields if role in (_NODE, _LIST))
+        self.values = tuple(name for name, role in self.fields if role == _VALUE)
+        self.operator = next((name for name, role in self.fields if role == _OPERATOR), None)
+
+
+_LAYOUTS = tuple(_Layout(cls) for cls in KINDS)
+
+
+def _kind_code(cls) -> int:
+    """The kind of node class `cls` (that of its nearest ancestor in KINDS)."""
+    code = _KIND_CODES.get(cls)
+    if code is None:
+        base = next((base for base in cls.__mro__ if base in _FIELDS), None)
+        if base is None:
+            raise TypeError(f"{cls.__name__} is not a TyC AST node class")
+        code = _KIND_CODES[cls] = _KIND_CODES[base]
+    return code
+
+
+def _value_key(value):
+    # Equal values share an entry, unless their types differ (1, 1.0, True)
+    # or they are floats that print differently (0.0, -0.0).
+    if type(value) is float:
+        return (float, value.hex())
+    return (type(value), value)
+
+
+def _position(value: int):
+    return None if value < 0 else value
+
+
+def _split(layout, child_ids: list, absent: int) -> list:
+    """The value of each node and list field of a node with children
+    `child_ids`: None, a child, or a list of children."""
+    result = []
+    pos = 0
+    fields = layout.children
+    for i, (_, is_list) in enumerate(fields):
+        if absent >> i & 1:
+            result.append(None)
+        elif is_list:
+            later = sum(1 for j in range(i + 1, len(fields)) if not fields[j][1] and not absent >> j & 1)
+            end = len(child_ids) - later
+            result.append(child_ids[pos:end])
+            pos = end
+        else:
+            result.append(child_ids[pos])
+            pos += 1
+    return result
+
+
+class Arena:
+    """An AST as parallel arrays indexed by node ID (see the module doc).
+
+    The arrays are filled by from_tree() and not changed afterwards.
+    """
+
+    def __init__(self):
+        self.kind = array("B")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.operator = array("b")
+        self.literal = array("i")
+        self.absent = array("B")
+        self.line = array("i")
+        self.column = array("i")
+        self.values = []
+
+    @classmethod
+    def from_tree(cls, root: "_nodes.ASTNode") -> "Arena":
+        """The arena of the tree under `root`, which gets ID 0."""
+        arena = cls()
+        kind, first_child, next_sibling = arena.kind, arena.first_child, arena.next_sibling
+        operator, literal, absent = arena.operator, arena.literal, arena.absent
+        line, column, values = arena.line, arena.column, arena.values
+        value_ids = {}
+        last_child = array("i")
+        stack = [(root, -1)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node, parent = pop()
+            node_id = len(kind)
+            code = _kind_code(type(node))
+            layout = _LAYOUTS[code]
+            kind.append(code)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            last_child.append(-1)
+            line.append(-1 if node.line is None else node.line)
+            column.append(-1 if node.column is None else node.column)
+            if parent >= 0:
+                previous = last_child[parent]
+                if previous < 0:
+                    first_child[parent] = node_id
+                else:
+                    next_sibling[previous] = node_id
+                last_child[parent] = node_id
+            operator.append(-1 if layout.operator is None else _OPERATOR_CODES[getattr(node, layout.operator)])
+            if not layout.values:
+                literal.append(-1)
+            else:
+                if len(layout.values) == 1:
+                    value = getattr(node, layout.values[0])
+                else:
+                    value = tuple(getattr(node, name) for name in layout.values)
+                key = _value_key(value)
+                index = value_ids.get(key)
+                if index is None:
+                    index = value_ids[key] = len(values)
+                    values.append(value)
+                literal.append(index)
+            children = []
+            bits = 0
+            for i, (name, is_list) in enumerate(layout.children):
+                child = getattr(node, name)
+                if child is None:
+                    bits |= 1 << i
+                elif is_list:
+                    children.extend(child)
+                else:
+                    children.append(child)
+            absent.append(bits)
+            for child in reversed(children):
+                push((child, node_id))
+        return arena
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def kind_of(self, node_id: int) -> type:
+        """The nodes.py class of node `node_id`."""
+        return KINDS[self.kind[node_id]]
+
+    def ids_of(self, cls) -> list:
+        """The IDs of the nodes of class `cls`, in pre-order."""
+        code = _KIND_CODES[cls]
+        return [i for i, kind in enumerate(self.kind) if kind == code]
+
+    def children(self, node_id: int) -> list:
+        """The IDs of the children of node `node_id`, in order."""
+        result = []
+        child = self.first_child[node_id]
+        next_sibling = self.next_sibling
+        while child >= 0:
+            result.append(child)
+            child = next_sibling[child]
+        return result
+
+    def subtree(self, node_id: int = 0) -> range:
+        """The IDs of node `node_id` and all nodes below it, in pre-order."""
+        last = node_id
+        child = self.first_child[last]
+        while child >= 0:
+            # Follow the last child down to the last node of the subtree.
+            while child >= 0:
+                last = child
+                child = self.next_sibling[child]
+            child = self.first_child[last]
+        return range(node_id, last + 1)
+
+    def fields(self, node_id: int) -> dict:
+        """The fields of node `node_id` by name: values and operators, and
+        child IDs (None, an ID or a list of IDs) for node and list fields."""
+        layout = _LAYOUTS[self.kind[node_id]]
+        result = {}
+        if layout.values:
+            value = self.values[self.literal[node_id]]
+            result.update(zip(layout.values, value if len(layout.values) > 1 else (value,)))
+        if layout.operator is not None:
+            result[layout.operator] = OPERATORS[self.operator[node_id]]
+        if layout.children:
+            split = _split(layout, self.children(node_id), self.absent[node_id])
+            result.update(zip((name for name, _ in layout.children), split))
+        return result
+
+    def node(self, node_id: int = 0) -> "_nodes.ASTNode":
+        """A cursor on node `node_id` (see the module doc)."""
+        cls = _CURSORS[self.kind[node_id]]
+        cursor = cls.__new__(cls)
+        cursor.arena = self
+        cursor.id = node_id
+        return cursor
+
+    def to_tree(self, node_id: int = 0) -> "_nodes.ASTNode":
+        """The nodes.py tree of node `node_id`, equal to the one converted."""
+        ids = self.subtree(node_id)
+        built = [None] * len(ids)
+        start = ids.start
+        kind, literal, operator, absent = self.kind, self.literal, self.operator, self.absent
+        line, column, values = self.line, self.column, self.values
+        for i in reversed(ids):
+            layout = _LAYOUTS[kind[i]]
+            node = layout.cls.__new__(layout.cls)
+            node.line = _position(line[i])
+            node.column = _position(column[i])
+            if layout.values:
+                value = values[literal[i]]
+                if len(layout.values) == 1:
+                    setattr(node, layout.values[0], value)
+                else:
+                    for name, item in zip(layout.values, value):
+                        setattr(node, name, item)
+            if layout.operator is not None:
+                setattr(node, layout.operator, OPERATORS[operator[i]])
+            if layout.children:
+                split = _split(layout, self.children(i), absent[i])
+                for (name, is_list), child in zip(layout.children, split):
+                    if child is None:
+                        setattr(node, name, None)
+                    elif is_list:
+                        setattr(node, name, [built[c - start] for c in child])
+                    else:
+                        setattr(node, name, built[child - start])
+            built[i - start] = node
+        return built[0]
+
+    def nbytes(self) -> int:
+        """Bytes taken by the columns (not counting `values`)."""
+        columns = (
+            self.kind, self.first_child, self.next_sibling, self.operator,
+            self.literal, self.absent, self.line, self.column,
+        )
+        return sum(c.itemsize * len(c) for c in columns)
+
+
+def _cursor_class(layout):
+    """A subclass of `layout.cls` whose instances read their fields from an
+    arena, and cannot be changed."""
+
+    def position(column):
+        return property(lambda self: _position(getattr(self.arena, column)[self.id]))
+
+    def child(index):
+        def get(self):
+            split = _split(layout, self.arena.children(self.id), self.arena.absent[self.id])
+            ids = split[index]
+            if ids is None:
+                return None
+            if type(ids) is list:
+                return [self.arena.node(i) for i in ids]
+            return self.arena.node(ids)
+
+        return property(get)
+
+    def value(index):
+        if len(layout.values) == 1:
+            return property(lambda self: self.arena.values[self.arena.literal[self.id]])
+        return property(lambda self: self.arena.values[self.arena.literal[self.id]][index])
+
+    namespace = {
+        "__slots__": ("arena", "id"),
+        "__module__": __name__,
+        "__doc__": f"Cursor on a {layout.cls.__name__} node of an Arena.",
+        "line": position("line"),
+        "column": position("column"),
+    }
+    for index, (name, _) in enumerate(layout.children):
+        namespace[name] = child(index)
+    for index, name in enumerate(layout.values):
+        namespace[name] = value(index)
+    if layout.operator is not None:
+        namespace[layout.operator] = property(lambda self: OPERATORS[self.arena.operator[self.id]])
+    return type(layout.cls.__name__, (layout.cls,), namespace)
+
+
+# Cursor classes by kind code.
+_CURSORS = tuple(_cursor_class(layout) for layout in _LAYOUTS)
@@ -2,17 +2,37 @@ from antlr4.error.ErrorListener import ConsoleErrorListener
 
 
 class SyntaxException(Exception):
+    # Position and text of the offending token: character offset, line
+    # (1-based) and column (0-based). Set by NewErrorListener.
+    offset = None
+    line = None
+    column = None
+    token = None
+
     def __init__(self, msg):
         self.message = msg
         super().__init__(msg)
 
+    def at(self, offset, line, column, token):
+        self.offset = offset
+        self.line = line
+        self.column = column
+        self.token = token
+        return self
+
 
 class NewErrorListener(ConsoleErrorListener):
     INSTANCE = None
 
     def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        raise self.error(offendingSymbol, line, column)
+
+    @staticmethod
+    def error(offendingSymbol, line, column) -> SyntaxException:
+        """The SyntaxException reported for `offendingSymbol`."""
         text = getattr(offendingSymbol, "text", str(offendingSymbol))
-        raise SyntaxException(f"Error on line {line} col {column}: {text}")
+        offset = getattr(offendingSymbol, "start", None)
+        return SyntaxException(f"Error on line {line} col {column}: {text}").at(offset, line, column, text)
 
 
 NewErrorListener.INSTANCE = NewErrorListener()
@@ -0,0 +1,33 @@
+"""
+Files of the project shared by the command-line tools: the build directory
+the generated recognizers are imported from, and the source files of a
+corpus given as files and directories.
+"""
+
+import os
+import sys
+
+_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BUILD_DIR = os.path.join(_root, "build")
+
+
+def use_build_dir() -> None:
+    """Make the generated modules in build/ importable: the generated lexer
+    imports lexererr and stringpool as top-level modules."""
+    if BUILD_DIR not in sys.path:
+        sys.path.insert(0, BUILD_DIR)
+
+
+def corpus_files(paths) -> list:
+    """Source files under `paths` (files, or directories searched
+    recursively), sorted within each directory."""
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            files.extend(os.path.join(root, n) for n in sorted(names))
+    return files
@@ -2,30 +2,62 @@
 AST Node classes for TyC programming language.
 This module defines all the AST node types used to represent
 the abstract syntax tree for TyC programs.
+
+Every class declares the fields its constructor sets in `__slots__`, so
+nodes have no per-instance `__dict__` (about a third less memory per node).
+Subclasses that do not declare `__slots__` get a `__dict__` again.
+
+Nodes compare and hash by identity; structural.py compares and hashes
+trees by their fields.
 """
 
 from abc import ABC, abstractmethod
 from typing import Any, List, Optional, Union, TYPE_CHECKING
 
+from .printer import render
+
 if TYPE_CHECKING:
     from .visitor import ASTVisitor
 
 
+def _joined(nodes) -> list:
+    """`nodes` separated by ", ", as parts of a string (see str_parts)."""
+    parts = []
+    for node in nodes or ():
+        parts += (node, ", ")
+    return parts[:-1]
+
+
 class ASTNode(ABC):
     """Base class for all AST nodes."""
 
+    # `_hashes`: structural hashes cached by structural_hash().
+    __slots__ = ("line", "column", "_hashes")
+
     def __init__(self):
         self.line = None
         self.column = None
+        self._hashes = None
 
     @abstractmethod
     def accept(self, visitor: "ASTVisitor", o: Any = None):
         """Accept a visitor for the Visitor pattern."""
         pass
 
-    def __str__(self):
-        """Default string representation."""
-        return f"{self.__class__.__name__}()"
+    # Printed from str_parts() on an explicit stack (see printer.py), so that
+    # deeply nested nodes print without recursion.
+    __str__ = render
+
+    def str_parts(self) -> list:
+        """Strings and child nodes that make up str(self), in order."""
+        return [f"{self.__class__.__name__}()"]
+
+    def __getstate__(self):
+        # Cached hashes are only valid in this process.
+        state = super().__getstate__()
+        if type(state) is tuple and state[1].get("_hashes") is not None:
+            state = (state[0], {**state[1], "_hashes": None})
+        return state
 
 
 # ============================================================================
@@ -36,6 +68,8 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire TyC program."""
 
+    __slots__ = ("decls",)
+
     def __init__(self, decls: List["Decl"]):
         super().__init__()
         self.decls = decls
@@ -43,19 +77,21 @@ class Program(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_program(self, o)
 
-    def __str__(self):
-        decls_str = ", ".join(str(d) for d in self.decls) if self.decls else ""
-        return f"Program([{decls_str}])"
+    def str_parts(self):
+        return ["Program([", *_joined(self.decls), "])"]
 
 
 class Decl(ASTNode):
     """Base class for declarations (struct or function)."""
-    pass
+
+    __slots__ = ()
 
 
 class StructDecl(Decl):
     """Struct declaration node."""
 
+    __slots__ = ("name", "members")
+
     def __init__(self, name: str, members: List["MemberDecl"]):
         super().__init__()
         self.name = name
@@ -64,14 +100,15 @@ class StructDecl(Decl):
     def accept(self, visitor, o=None):
         return visitor.visit_struct_decl(self, o)
 
-    def __str__(self):
-        members_str = ", ".join(str(m) for m in self.members) if self.members else ""
-        return f"StructDecl({self.name}, [{members_str}])"
+    def str_parts(self):
+        return ["StructDecl(", self.name, ", [", *_joined(self.members), "])"]
 
 
 class MemberDecl(ASTNode):
     """Struct member declaration node."""
 
+    __slots__ = ("member_type", "name")
+
     def __init__(self, member_type: "Type", name: str):
         super().__init__()
         self.member_type = member_type
@@ -80,13 +117,15 @@ class MemberDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_member_decl(self, o)
 
-    def __str__(self):
-        return f"MemberDecl({self.member_type}, {self.name})"
+    def str_parts(self):
+        return ["MemberDecl(", self.member_type, ", ", self.name, ")"]
 
 
 class FuncDecl(Decl):
     """Function declaration node."""
 
+    __slots__ = ("return_type", "name", "params", "body")
+
     def __init__(
         self,
         return_type: Optional["Type"],
@@ -103,15 +142,16 @@ class FuncDecl(Decl):
     def accept(self, visitor, o=None):
         return visitor.visit_func_decl(self, o)
 
-    def __str__(self):
-        return_type_str = str(self.return_type) if self.return_type else "auto"
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        return f"FuncDecl({return_type_str}, {self.name}, [{params_str}], {self.body})"
+    def str_parts(self):
+        return_type = self.return_type if self.return_type else "auto"
+        return ["FuncDecl(", return_type, ", ", self.name, ", [", *_joined(self.params), "], ", self.body, ")"]
 
 
 class Param(ASTNode):
     """Function parameter node."""
 
+    __slots__ = ("param_type", "name")
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
@@ -120,8 +160,8 @@ class Param(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_param(self, o)
 
-    def __str__(self):
-        return f"Param({self.param_type}, {self.name})"
+    def str_parts(self):
+        return ["Param(", self.param_type, ", ", self.name, ")"]
 
 
 # ============================================================================
@@ -130,13 +170,24 @@ class Param(ASTNode):
 
 
 class Type(ASTNode):
-    """Base class for type annotations."""
-    pass
+    """Base class for type annotations.
+
+    `type_id` is the ID of a primitive type in every TypeTable (see
+    type_table.py); StructType's is None, its ID depends on the table.
+    """
+
+    __slots__ = ()
+
+    type_id = None
 
 
 class IntType(Type):
     """Integer type node."""
 
+    __slots__ = ()
+
+    type_id = 0
+
     def __init__(self):
         super().__init__()
 
@@ -150,6 +201,10 @@ class IntType(Type):
 class FloatType(Type):
     """Float type node."""
 
+    __slots__ = ()
+
+    type_id = 1
+
     def __init__(self):
         super().__init__()
 
@@ -163,6 +218,10 @@ class FloatType(Type):
 class StringType(Type):
     """String type node."""
 
+    __slots__ = ()
+
+    type_id = 2
+
     def __init__(self):
         super().__init__()
 
@@ -176,6 +235,10 @@ class StringType(Type):
 class VoidType(Type):
     """Void type node."""
 
+    __slots__ = ()
+
+    type_id = 3
+
     def __init__(self):
         super().__init__()
 
@@ -189,6 +252,8 @@ class VoidType(Type):
 class StructType(Type):
     """Struct type node."""
 
+    __slots__ = ("struct_name",)
+
     def __init__(self, struct_name: str):
         super().__init__()
         self.struct_name = struct_name
@@ -207,12 +272,15 @@ class StructType(Type):
 
 class Stmt(ASTNode):
     """Base class for all statement nodes."""
-    pass
+
+    __slots__ = ()
 
 
 class BlockStmt(Stmt):
     """Block statement containing statements."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -220,9 +288,8 @@ class BlockStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_block_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"BlockStmt([{stmts_str}])"
+    def str_parts(self):
+        return ["BlockStmt([", *_joined(self.statements), "])"]
 
 
 class VarDecl(Stmt):
@@ -230,6 +297,8 @@ class VarDecl(Stmt):
     If var_type is None, it means 'auto' (type inference).
     """
 
+    __slots__ = ("var_type", "name", "init_value")
+
     def __init__(
         self,
         var_type: Optional["Type"],
@@ -244,15 +313,17 @@ class VarDecl(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_var_decl(self, o)
 
-    def __str__(self):
-        type_str = "auto" if self.var_type is None else str(self.var_type)
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"VarDecl({type_str}, {self.name}{init_str})"
+    def str_parts(self):
+        var_type = "auto" if self.var_type is None else self.var_type
+        init = (" = ", self.init_value) if self.init_value else ()
+        return ["VarDecl(", var_type, ", ", self.name, *init, ")"]
 
 
 class IfStmt(Stmt):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+
     def __init__(
         self, condition: "Expr", then_stmt: Stmt, else_stmt: Optional[Stmt] = None
     ):
@@ -264,14 +335,16 @@ class IfStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_if_stmt(self, o)
 
-    def __str__(self):
-        else_str = f", else {self.else_stmt}" if self.else_stmt else ""
-        return f"IfStmt(if {self.condition} then {self.then_stmt}{else_str})"
+    def str_parts(self):
+        other = (", else ", self.else_stmt) if self.else_stmt else ()
+        return ["IfStmt(if ", self.condition, " then ", self.then_stmt, *other, ")"]
 
 
 class WhileStmt(Stmt):
     """While statement."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "Expr", body: Stmt):
         super().__init__()
         self.condition = condition
@@ -280,13 +353,15 @@ class WhileStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_while_stmt(self, o)
 
-    def __str__(self):
-        return f"WhileStmt(while {self.condition} do {self.body})"
+    def str_parts(self):
+        return ["WhileStmt(while ", self.condition, " do ", self.body, ")"]
 
 
 class ForStmt(Stmt):
     """For statement."""
 
+    __slots__ = ("init", "condition", "update", "body")
+
     def __init__(
         self,
         init: Optional[Union["VarDecl", "ExprStmt"]],
@@ -303,16 +378,18 @@ class ForStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_for_stmt(self, o)
 
-    def __str__(self):
-        init_str = str(self.init) if self.init else "None"
-        cond_str = str(self.condition) if self.condition else "None"
-        update_str = str(self.update) if self.update else "None"
-        return f"ForStmt(for {init_str}; {cond_str}; {update_str} do {self.body})"
+    def str_parts(self):
+        init = self.init if self.init else "None"
+        cond = self.condition if self.condition else "None"
+        update = self.update if self.update else "None"
+        return ["ForStmt(for ", init, "; ", cond, "; ", update, " do ", self.body, ")"]
 
 
 class SwitchStmt(Stmt):
     """Switch statement."""
 
+    __slots__ = ("expr", "cases", "default_case")
+
     def __init__(
         self,
         expr: "Expr",
@@ -327,15 +404,16 @@ class SwitchStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_switch_stmt(self, o)
 
-    def __str__(self):
-        cases_str = ", ".join(str(c) for c in self.cases) if self.cases else ""
-        default_str = f", default {self.default_case}" if self.default_case else ""
-        return f"SwitchStmt(switch {self.expr} cases [{cases_str}]{default_str})"
+    def str_parts(self):
+        default = (", default ", self.default_case) if self.default_case else ()
+        return ["SwitchStmt(switch ", self.expr, " cases [", *_joined(self.cases), "]", *default, ")"]
 
 
 class CaseStmt(ASTNode):
     """Case statement in switch."""
 
+    __slots__ = ("expr", "statements")
+
     def __init__(self, expr: "Expr", statements: List[Stmt]):
         super().__init__()
         self.expr = expr
@@ -344,14 +422,15 @@ class CaseStmt(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_case_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"CaseStmt(case {self.expr}: [{stmts_str}])"
+    def str_parts(self):
+        return ["CaseStmt(case ", self.expr, ": [", *_joined(self.statements), "])"]
 
 
 class DefaultStmt(ASTNode):
     """Default statement in switch."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -359,14 +438,15 @@ class DefaultStmt(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_default_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = ", ".join(str(s) for s in self.statements) if self.statements else ""
-        return f"DefaultStmt(default: [{stmts_str}])"
+    def str_parts(self):
+        return ["DefaultStmt(default: [", *_joined(self.statements), "])"]
 
 
 class BreakStmt(Stmt):
     """Break statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -380,6 +460,8 @@ class BreakStmt(Stmt):
 class ContinueStmt(Stmt):
     """Continue statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -393,6 +475,8 @@ class ContinueStmt(Stmt):
 class ReturnStmt(Stmt):
     """Return statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Optional["Expr"] = None):
         super().__init__()
         self.expr = expr
@@ -400,14 +484,16 @@ class ReturnStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_return_stmt(self, o)
 
-    def __str__(self):
-        expr_str = f" {self.expr}" if self.expr else ""
-        return f"ReturnStmt(return{expr_str})"
+    def str_parts(self):
+        value = (" ", self.expr) if self.expr else ()
+        return ["ReturnStmt(return", *value, ")"]
 
 
 class ExprStmt(Stmt):
     """Expression statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: "Expr"):
         super().__init__()
         self.expr = expr
@@ -415,8 +501,8 @@ class ExprStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_expr_stmt(self, o)
 
-    def __str__(self):
-        return f"ExprStmt({self.expr})"
+    def str_parts(self):
+        return ["ExprStmt(", self.expr, ")"]
 
 
 # ============================================================================
@@ -426,12 +512,15 @@ class ExprStmt(Stmt):
 
 class Expr(ASTNode):
     """Base class for all expression nodes."""
-    pass
+
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -441,13 +530,15 @@ class BinaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_binary_op(self, o)
 
-    def __str__(self):
-        return f"BinaryOp({self.left}, {self.operator}, {self.right})"
+    def str_parts(self):
+        return ["BinaryOp(", self.left, ", ", self.operator, ", ", self.right, ")"]
 
 
 class PrefixOp(Expr):
     """Prefix unary operation expression (++x, --x, +x, -x, !x)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--', '+', '-', '!'
@@ -456,13 +547,15 @@ class PrefixOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_prefix_op(self, o)
 
-    def __str__(self):
-        return f"PrefixOp({self.operator}{self.operand})"
+    def str_parts(self):
+        return ["PrefixOp(", self.operator, self.operand, ")"]
 
 
 class PostfixOp(Expr):
     """Postfix unary operation expression (x++, x--)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--'
@@ -471,8 +564,8 @@ class PostfixOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_op(self, o)
 
-    def __str__(self):
-        return f"PostfixOp({self.operand}{self.operator})"
+    def str_parts(self):
+        return ["PostfixOp(", self.operand, self.operator, ")"]
 
 
 class AssignExpr(Expr):
@@ -480,6 +573,8 @@ class AssignExpr(Expr):
     lhs can be Identifier or MemberAccess.
     """
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs: "Expr", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs  # Identifier or MemberAccess
@@ -488,8 +583,8 @@ class AssignExpr(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_assign_expr(self, o)
 
-    def __str__(self):
-        return f"AssignExpr({self.lhs} = {self.rhs})"
+    def str_parts(self):
+        return ["AssignExpr(", self.lhs, " = ", self.rhs, ")"]
 
 
 class MemberAccess(Expr):
@@ -498,6 +593,8 @@ class MemberAccess(Expr):
     Can be nested: MemberAccess(MemberAccess(obj, "member1"), "member2")
     """
 
+    __slots__ = ("obj", "member")
+
     def __init__(self, obj: Expr, member: str):
         super().__init__()
         self.obj = obj
@@ -506,13 +603,15 @@ class MemberAccess(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_member_access(self, o)
 
-    def __str__(self):
-        return f"MemberAccess({self.obj}.{self.member})"
+    def str_parts(self):
+        return ["MemberAccess(", self.obj, ".", self.member, ")"]
 
 
 class FuncCall(Expr):
     """Function call expression."""
 
+    __slots__ = ("name", "args")
+
     def __init__(self, name: str, args: List[Expr]):
         super().__init__()
         self.name = name
@@ -521,14 +620,15 @@ class FuncCall(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_func_call(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f"FuncCall({self.name}, [{args_str}])"
+    def str_parts(self):
+        return ["FuncCall(", self.name, ", [", *_joined(self.args), "])"]
 
 
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -543,6 +643,8 @@ class Identifier(Expr):
 class StructLiteral(Expr):
     """Struct literal expression (initialization with {})."""
 
+    __slots__ = ("values",)
+
     def __init__(self, values: List[Expr]):
         super().__init__()
         self.values = values
@@ -550,9 +652,8 @@ class StructLiteral(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_struct_literal(self, o)
 
-    def __str__(self):
-        values_str = ", ".join(str(v) for v in self.values) if self.values else ""
-        return f"StructLiteral({{{values_str}}})"
+    def str_parts(self):
+        return ["StructLiteral({", *_joined(self.values), "})"]
 
 
 # ============================================================================
@@ -563,6 +664,8 @@ class StructLiteral(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -571,6 +674,8 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
@@ -584,6 +689,8 @@ class IntLiteral(Literal):
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
@@ -595,10 +702,17 @@ class FloatLiteral(Literal):
 
 
 class StringLiteral(Literal):
-    """String literal expression."""
+    """String literal expression.
+
+    `value` is the literal as written, without quotes. `pool_index` is the
+    index of its decoded value in the lexer's string pool, if known.
+    """
+
+    __slots__ = ("pool_index",)
 
-    def __init__(self, value: str):
+    def __init__(self, value: str, pool_index: Optional[int] = None):
         super().__init__(value)
+        self.pool_index = pool_index
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_literal(self, o)
@@ -0,0 +1,64 @@
+"""
+Printing of AST nodes without recursion.
+
+The string of a node with children is its `str_parts()`: literal strings
+and child nodes (or other values) in output order. `write` expands the
+parts on an explicit work stack, so printing a deeply nested AST (a long
+else-if chain, a deep expression) takes no Python stack, and writes the
+text to a file-like object in chunks as it goes: the whole string of a
+large AST is never held in memory. `render` (ASTNode.__str__) writes into
+a list of chunks and joins them.
+
+Leaf nodes, and nodes of classes that define their own `__str__`, are
+printed with `str()`.
+"""
+
+
+# Whether nodes of a class are expanded (True) or printed with str().
+_EXPANDED = {}
+
+# Pieces joined into one stream.write() call.
+CHUNK_PIECES = 4096
+
+
+def write(node, stream, chunk_pieces: int = CHUNK_PIECES) -> None:
+    """Write the string of `node` to `stream` (anything with a `write(str)`
+    method: a text file, io.StringIO), about `chunk_pieces` pieces per call."""
+    out = []
+    append = out.append
+    stack = [node]
+    pop = stack.pop
+    extend = stack.extend
+    expanded = _EXPANDED
+    while stack:
+        item = pop()
+        cls = type(item)
+        if cls is str:
+            append(item)
+            continue
+        expand = expanded.get(cls)
+        if expand is None:
+            expand = expanded[cls] = cls.__str__ is render
+        if expand:
+            # Flushed between nodes rather than after every piece.
+            if len(out) >= chunk_pieces:
+                stream.write("".join(out))
+                out.clear()
+            parts = item.str_parts()
+            parts.reverse()
+            extend(parts)
+        else:
+            append(str(item))
+    if out:
+        stream.write("".join(out))
+
+
+class _Chunks(list):
+    write = list.append
+
+
+def render(node) -> str:
+    """The string of `node`; ASTNode.__str__."""
+    chunks = _Chunks()
+    write(node, chunks)
+    return "".join(chunks)
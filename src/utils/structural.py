@@ -0,0 +1,137 @@
+"""
+Structural equality and hashing of AST nodes.
+
+Two nodes are structurally equal if they are of the same node class (the
+nearest class of nodes.py: a LazyFuncDecl compares as a FuncDecl, an arena
+cursor as the class it reads) and have equal fields, child nodes compared
+the same way. Positions (`line`, `column`) are compared unless
+`positions=False`; scalar fields (names, operators, literal values,
+`pool_index`) must also be of the same type, so that IntLiteral(1) is not
+IntLiteral(True). Nodes themselves keep identity `==` and hash(): nodes are
+mutable, and a structural hash would change under a dict or set holding
+the node.
+
+Both work on explicit stacks, so deep trees take no Python stack, and in
+O(size) without building strings. A node's hash is computed from its
+fields and the hashes of its children, and cached on the node: hashing an
+unchanged subtree again is O(1), and after a change only the changed node
+and its ancestors need clear_hash() for the next hash to be right.
+Equality never reads the cached hashes, so structural_equal is right
+after a change even before clear_hash(). Like str hashes, structural
+hashes differ between processes; pickles do not keep them.
+"""
+
+from . import nodes as _nodes
+
+_NOT_FIELDS = ("line", "column", "_hashes")
+
+# (node class of nodes.py, field names) of each class.
+_LAYOUTS = {}
+
+
+def _layout(cls) -> tuple:
+    layout = _LAYOUTS.get(cls)
+    if layout is None:
+        kind = next(c for c in cls.__mro__ if c.__module__ == _nodes.__name__)
+        fields = tuple(
+            name
+            for c in reversed(kind.__mro__)
+            for name in c.__dict__.get("__slots__", ())
+            if name not in _NOT_FIELDS
+        )
+        layout = _LAYOUTS[cls] = (kind, fields)
+    return layout
+
+
+def _cached(node, slot: int):
+    hashes = getattr(node, "_hashes", None)
+    return None if hashes is None else hashes[slot]
+
+
+def _same_value(a, b) -> bool:
+    return type(a) is type(b) and a == b
+
+
+def structural_equal(a, b, positions: bool = True) -> bool:
+    """Whether the trees under nodes `a` and `b` are equal (see the module doc)."""
+    ASTNode = _nodes.ASTNode
+    stack = [(a, b)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        x, y = pop()
+        if x is y:
+            continue
+        kind, fields = _layout(type(x))
+        if _layout(type(y))[0] is not kind:
+            return False
+        if positions and (x.line != y.line or x.column != y.column):
+            return False
+        for name in fields:
+            u, v = getattr(x, name), getattr(y, name)
+            if isinstance(u, ASTNode):
+                if not isinstance(v, ASTNode):
+                    return False
+                push((u, v))
+            elif type(u) is list:
+                if type(v) is not list or len(u) != len(v):
+                    return False
+                for p, q in zip(u, v):
+                    if isinstance(p, ASTNode) and isinstance(q, ASTNode):
+                        push((p, q))
+                    elif not _same_value(p, q):
+                        return False
+            elif not _same_value(u, v):
+                return False
+    return True
+
+
+def structural_hash(node, positions: bool = True) -> int:
+    """The hash of the tree under `node`, consistent with structural_equal."""
+    slot = 0 if positions else 1
+    cached = _cached(node, slot)
+    if cached is not None:
+        return cached
+    ASTNode = _nodes.ASTNode
+    # Post-order: a node is pushed again, with its field values, above its
+    # children. The values are read once, as reading a field of an arena
+    # cursor gives a new cursor.
+    stack = [(node, None)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        item, values = pop()
+        kind, fields = _layout(type(item))
+        if values is None:
+            if _cached(item, slot) is not None:
+                continue
+            values = [getattr(item, name) for name in fields]
+            push((item, values))
+            for value in values:
+                if isinstance(value, ASTNode):
+                    push((value, None))
+                elif type(value) is list:
+                    stack.extend((v, None) for v in value if isinstance(v, ASTNode))
+            continue
+        parts = [kind]
+        if positions:
+            parts += (item.line, item.column)
+        for value in values:
+            if isinstance(value, ASTNode):
+                parts.append(_cached(value, slot))
+            elif type(value) is list:
+                parts.append(
+                    tuple(_cached(v, slot) if isinstance(v, ASTNode) else (type(v), v) for v in value)
+                )
+            else:
+                parts.append((type(value), value))
+        value = hash(tuple(parts))
+        hashes = getattr(item, "_hashes", None)
+        if hashes is None:
+            hashes = item._hashes = [None, None]
+        hashes[slot] = value
+    return _cached(node, slot)
+
+
+def clear_hash(node):
+    """Forget the cached hashes of `node` (not of its children): call it on
+    a changed node and each of its ancestors."""
+    node._hashes = None
@@ -0,0 +1,105 @@
+"""
+Canonical type table: one shared type node and a small integer ID for each
+distinct type.
+
+Type nodes in an AST are created per occurrence, since each carries its
+own position, so comparing two of them means comparing their classes and,
+for structs, their names. A TypeTable maps every type node to the ID of its
+type and to a canonical node, the same object for equal types:
+
+- IntType, FloatType, StringType and VoidType have the fixed IDs INT,
+  FLOAT, STRING and VOID in every table (their `type_id` class attribute),
+- StructType(name) gets the next ID the first time the table sees `name`.
+  TypeTable(program) registers the StructDecls of `program` in order, and
+  decl_of() gives a struct type's declaration back.
+
+Equal types then have equal IDs, and a set of types is an int with bit
+`1 << id` set for each type (mask(), in_mask()), so that type inference can
+union and intersect candidate sets with `|` and `&`.
+
+Canonical nodes are shared and have no position: they must not be changed
+or put into an AST, whose type nodes stay one per occurrence.
+
+The table is an index, not a faster comparison: an id_of() call per check
+costs more than comparing the node classes. The IDs pay off for a pass that
+resolves them once per occurrence and then compares, masks or groups the
+ints (see benchmarks/bench_type_table.py).
+"""
+
+from typing import Iterable, Optional
+
+from .nodes import FloatType, IntType, Program, StringType, StructDecl, StructType, Type, VoidType
+
+INT = IntType.type_id
+FLOAT = FloatType.type_id
+STRING = StringType.type_id
+VOID = VoidType.type_id
+
+# Mask of the numeric types.
+NUMERIC = 1 << INT | 1 << FLOAT
+
+# Canonical primitive type nodes, by ID.
+PRIMITIVES = (IntType(), FloatType(), StringType(), VoidType())
+
+
+class TypeTable:
+    """Type IDs and canonical type nodes of one program (see the module doc)."""
+
+    def __init__(self, program: Optional[Program] = None):
+        # Canonical node and StructDecl (None for primitive and undeclared
+        # types) of each ID.
+        self.types = list(PRIMITIVES)
+        self.decls = [None] * len(PRIMITIVES)
+        self._struct_ids = {}
+        if program is not None:
+            for decl in program.decls:
+                if isinstance(decl, StructDecl):
+                    self.declare(decl)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def declare(self, decl: StructDecl) -> int:
+        """Register the struct type of `decl` and return its ID. A name
+        declared twice keeps its first declaration."""
+        type_id = self.struct_id(decl.name)
+        if self.decls[type_id] is None:
+            self.decls[type_id] = decl
+        return type_id
+
+    def struct_id(self, name: str) -> int:
+        """The ID of the struct type named `name`, registered if new."""
+        type_id = self._struct_ids.get(name)
+        if type_id is None:
+            type_id = self._struct_ids[name] = len(self.types)
+            self.types.append(StructType(name))
+            self.decls.append(None)
+        return type_id
+
+    def id_of(self, node: Type) -> int:
+        """The ID of the type of `node`."""
+        type_id = node.type_id
+        if type_id is None:
+            type_id = self._struct_ids.get(node.struct_name)
+            if type_id is None:
+                type_id = self.struct_id(node.struct_name)
+        return type_id
+
+    def canonical(self, node: Type) -> Type:
+        """The shared node of the type of `node`."""
+        return self.types[self.id_of(node)]
+
+    def decl_of(self, node: Type) -> Optional[StructDecl]:
+        """The StructDecl of a struct type, None for other and undeclared types."""
+        return self.decls[self.id_of(node)]
+
+    def mask(self, nodes: Iterable[Type]) -> int:
+        """The set of the types of `nodes`, as a bit mask."""
+        result = 0
+        for node in nodes:
+            result |= 1 << self.id_of(node)
+        return result
+
+    def in_mask(self, node: Type, mask: int) -> bool:
+        """Whether the type of `node` is in the set `mask`."""
+        return bool(mask >> self.id_of(node) & 1)
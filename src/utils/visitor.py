@@ -7,10 +7,93 @@ and processing AST nodes.
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from . import nodes as _nodes
+
 if TYPE_CHECKING:
     from .nodes import *
 
 
+def _optional(node) -> tuple:
+    return (node,) if node else ()
+
+
+def _none(node) -> tuple:
+    return ()
+
+
+# Visit method and children of each node class, in the order BaseVisitor
+# visits them.
+_CHILDREN = {
+    _nodes.Program: ("visit_program", lambda n: n.decls),
+    _nodes.StructDecl: ("visit_struct_decl", lambda n: n.members),
+    _nodes.MemberDecl: ("visit_member_decl", lambda n: (n.member_type,)),
+    _nodes.FuncDecl: ("visit_func_decl", lambda n: (*_optional(n.return_type), *n.params, n.body)),
+    _nodes.Param: ("visit_param", lambda n: (n.param_type,)),
+    _nodes.IntType: ("visit_int_type", _none),
+    _nodes.FloatType: ("visit_float_type", _none),
+    _nodes.StringType: ("visit_string_type", _none),
+    _nodes.VoidType: ("visit_void_type", _none),
+    _nodes.StructType: ("visit_struct_type", _none),
+    _nodes.BlockStmt: ("visit_block_stmt", lambda n: n.statements),
+    _nodes.VarDecl: ("visit_var_decl", lambda n: (*_optional(n.var_type), *_optional(n.init_value))),
+    _nodes.IfStmt: ("visit_if_stmt", lambda n: (n.condition, n.then_stmt, *_optional(n.else_stmt))),
+    _nodes.WhileStmt: ("visit_while_stmt", lambda n: (n.condition, n.body)),
+    _nodes.ForStmt: (
+        "visit_for_stmt",
+        lambda n: (*_optional(n.init), *_optional(n.condition), *_optional(n.update), n.body),
+    ),
+    _nodes.SwitchStmt: ("visit_switch_stmt", lambda n: (n.expr, *n.cases, *_optional(n.default_case))),
+    _nodes.CaseStmt: ("visit_case_stmt", lambda n: (n.expr, *n.statements)),
+    _nodes.DefaultStmt: ("visit_default_stmt", lambda n: n.statements),
+    _nodes.BreakStmt: ("visit_break_stmt", _none),
+    _nodes.ContinueStmt: ("visit_continue_stmt", _none),
+    _nodes.ReturnStmt: ("visit_return_stmt", lambda n: _optional(n.expr)),
+    _nodes.ExprStmt: ("visit_expr_stmt", lambda n: (n.expr,)),
+    _nodes.BinaryOp: ("visit_binary_op", lambda n: (n.left, n.right)),
+    _nodes.PrefixOp: ("visit_prefix_op", lambda n: (n.operand,)),
+    _nodes.PostfixOp: ("visit_postfix_op", lambda n: (n.operand,)),
+    _nodes.AssignExpr: ("visit_assign_expr", lambda n: (n.lhs, n.rhs)),
+    _nodes.MemberAccess: ("visit_member_access", lambda n: (n.obj,)),
+    _nodes.FuncCall: ("visit_func_call", lambda n: n.args),
+    _nodes.Identifier: ("visit_identifier", _none),
+    _nodes.StructLiteral: ("visit_struct_literal", lambda n: n.values),
+    _nodes.IntLiteral: ("visit_int_literal", _none),
+    _nodes.FloatLiteral: ("visit_float_literal", _none),
+    _nodes.StringLiteral: ("visit_string_literal", _none),
+}
+
+
+# Children functions by node class, with subclasses of the classes above.
+_children_by_class = {cls: children for cls, (_, children) in _CHILDREN.items()}
+
+
+def _children_of(cls):
+    """The children function of node class `cls` (that of its nearest
+    ancestor in _CHILDREN)."""
+    children = _children_by_class.get(cls)
+    if children is None:
+        children = next((_CHILDREN[base][1] for base in cls.__mro__ if base in _CHILDREN), _none)
+        _children_by_class[cls] = children
+    return children
+
+
+def walk(node):
+    """Yield `node` and all nodes below it in pre-order (the order BaseVisitor
+    visits them), using an explicit stack."""
+    yield node
+    stack = [iter(_children_of(type(node))(node))]
+    children_by_class = _children_by_class
+    while stack:
+        for node in stack[-1]:
+            yield node
+            children = children_by_class.get(type(node)) or _children_of(type(node))
+            if children is not _none:
+                stack.append(iter(children(node)))
+                break
+        else:
+            stack.pop()
+
+
 class ASTVisitor(ABC):
     """Abstract base class for AST visitors."""
 
@@ -162,7 +245,39 @@ class ASTVisitor(ABC):
 
 class BaseVisitor(ASTVisitor):
     """Base visitor that provides default implementations for all visit methods.
-    Subclasses can override only the methods they need to customize."""
+    Subclasses can override only the methods they need to customize.
+
+    The default methods only visit the children of a node. `visit` does
+    that itself for nodes whose method a subclass does not override, with
+    an explicit work stack instead of recursion, so visiting a deeply
+    nested AST only recurses as deep as the overridden methods do.
+    """
+
+    # Children functions of the node classes each visitor class leaves to
+    # the defaults.
+    _defaults = {}
+
+    def visit(self, node: "ASTNode", o: Any = None):
+        cls = type(self)
+        defaults = BaseVisitor._defaults.get(cls)
+        if defaults is None:
+            defaults = BaseVisitor._defaults[cls] = _default_children(cls)
+        children = defaults.get(type(node))
+        if children is None:
+            return node.accept(self, o)
+        # One iterator over the remaining children per level.
+        stack = [iter(children(node))]
+        while stack:
+            for node in stack[-1]:
+                children = defaults.get(type(node))
+                if children is None:
+                    node.accept(self, o)
+                elif children is not _none:
+                    stack.append(iter(children(node)))
+                    break
+            else:
+                stack.pop()
+        return None
 
     def visit_program(self, node: "Program", o: Any = None):
         for decl in node.decls:
@@ -297,3 +412,15 @@ class BaseVisitor(ASTVisitor):
 
     def visit_string_literal(self, node: "StringLiteral", o: Any = None):
         pass
+
+
+def _default_children(cls) -> dict:
+    """Node classes whose visit method `cls` inherits from BaseVisitor, with
+    their children functions; none if `cls` overrides `visit`."""
+    if cls.visit is not BaseVisitor.visit:
+        return {}
+    return {
+        node_class: children
+        for node_class, (name, children) in _CHILDREN.items()
+        if getattr(cls, name) is getattr(BaseVisitor, name)
+    }
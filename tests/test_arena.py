@@ -0,0 +1,149 @@
+"""
+Test cases for the flat AST representation (src/utils/arena.py): lossless
+conversion to and from the object tree, pre-order IDs, and cursors that
+visitors, walk() and str() accept as nodes.
+"""
+
+import pytest
+from tests.test_deep_nesting import Recorder
+from tests.test_descent import PROGRAM, shape
+from tests.test_pool import corpus
+from tests.utils import ASTGenerator
+from src.utils.arena import KINDS, Arena
+from src.utils.nodes import *
+from src.utils.visitor import walk
+
+
+def parse(source):
+    ast = ASTGenerator(source).generate()
+    assert not isinstance(ast, str), ast
+    return ast
+
+
+# ============================================================================
+# CONVERSION (Tests 1-3)
+# ============================================================================
+
+def test_01_round_trip():
+    """Test parsed programs convert to an arena and back unchanged"""
+    for source in [PROGRAM] + corpus():
+        ast = ASTGenerator(source).generate()
+        if isinstance(ast, str):
+            continue
+        tree = Arena.from_tree(ast).to_tree()
+        assert shape(tree) == shape(ast), source
+        assert type(tree.decls) is list
+
+
+def test_02_lossless_fields():
+    """Test None fields and positions, empty lists and look-alike values survive"""
+    default = DefaultStmt([])
+    default.line = 0
+    cases = [
+        Program([]),
+        FuncDecl(None, "f", [], BlockStmt([])),
+        FuncDecl(IntType(), "g", [Param(FloatType(), "a"), Param(StructType("S"), "b")], BlockStmt([])),
+        SwitchStmt(Identifier("x"), [CaseStmt(IntLiteral(1), [])], None),
+        SwitchStmt(Identifier("x"), [], default),
+        ForStmt(None, None, PostfixOp("++", Identifier("i")), BreakStmt()),
+        FuncCall("f", None),
+        StructLiteral([IntLiteral(1), FloatLiteral(1.0), IntLiteral(True), FloatLiteral(-0.0), FloatLiteral(0.0)]),
+        BlockStmt([ExprStmt(StringLiteral("s")), ExprStmt(StringLiteral("s", 0)), ReturnStmt()]),
+    ]
+    for node in cases:
+        assert shape(Arena.from_tree(node).to_tree()) == shape(node)
+    arena = Arena.from_tree(cases[-2])
+    assert [repr(v.value) for v in arena.to_tree().values] == ["1", "1.0", "True", "-0.0", "0.0"]
+    assert len(arena.values) == 5
+
+
+def test_03_subtrees():
+    """Test any node converts back on its own, and non-nodes are rejected"""
+    ast = parse(PROGRAM)
+    arena = Arena.from_tree(ast)
+    for node_id, node in enumerate(walk(ast)):
+        assert shape(arena.to_tree(node_id)) == shape(node)
+    with pytest.raises(TypeError):
+        Arena.from_tree(Program(["not a node"]))
+
+
+# ============================================================================
+# LAYOUT (Tests 4-6)
+# ============================================================================
+
+def test_04_preorder_ids():
+    """Test IDs follow walk() order and subtrees are ID ranges"""
+    ast = parse(PROGRAM)
+    arena = Arena.from_tree(ast)
+    nodes = list(walk(ast))
+    assert len(arena) == len(nodes)
+    assert [arena.kind_of(i) for i in range(len(arena))] == [type(n) for n in nodes]
+    for node_id, node in enumerate(nodes):
+        assert len(arena.subtree(node_id)) == sum(1 for _ in walk(node))
+    assert arena.ids_of(FuncDecl) == [i for i, n in enumerate(nodes) if type(n) is FuncDecl]
+
+
+def test_05_links_and_columns():
+    """Test child links, operator and literal columns, and column sizes"""
+    ast = Program([FuncDecl(None, "f", [], BlockStmt([ExprStmt(BinaryOp(Identifier("a"), "+", IntLiteral(2)))]))])
+    ast.decls[0].body.statements[0].expr.line = 3
+    arena = Arena.from_tree(ast)
+    assert arena.children(0) == [1] and arena.children(1) == [2]
+    assert arena.children(4) == [5, 6] and arena.next_sibling[5] == 6
+    assert arena.fields(1) == {"return_type": None, "name": "f", "params": [], "body": 2}
+    assert arena.fields(4) == {"left": 5, "operator": "+", "right": 6}
+    assert list(arena.line) == [-1, -1, -1, -1, 3, -1, -1]
+    assert arena.values == ["f", "a", 2]
+    assert arena.nbytes() == 23 * len(arena)
+    assert len(KINDS) == len(set(KINDS)) < 256
+
+
+def test_06_deep_tree():
+    """Test converting a 100k deep tree and printing it through a cursor"""
+    node = Identifier("x")
+    for i in range(100_000):
+        node = PrefixOp("-", node)
+    arena = Arena.from_tree(node)
+    assert len(arena) == 100_001 and arena.subtree(0) == range(100_001)
+    assert str(arena.node()) == str(node)
+    assert isinstance(arena.to_tree(99_999).operand, Identifier)
+
+
+# ============================================================================
+# CURSORS (Tests 7-9)
+# ============================================================================
+
+def test_07_cursor_fields():
+    """Test cursors are nodes of the original classes with the original fields"""
+    ast = parse(PROGRAM)
+    arena = Arena.from_tree(ast)
+    for node_id, node in enumerate(walk(ast)):
+        cursor = arena.node(node_id)
+        assert isinstance(cursor, type(node)) and type(cursor).__name__ == type(node).__name__
+        assert (cursor.line, cursor.column) == (node.line, node.column)
+        assert str(cursor) == str(node)
+    last = ast.decls[-1]
+    cursor = arena.node(arena.ids_of(FuncDecl)[-1])
+    assert cursor.name == last.name and cursor.body.statements[0].line == last.body.statements[0].line
+    assert [p.name for p in cursor.params] == [p.name for p in last.params]
+
+
+def test_08_visitors():
+    """Test visitors and walk() see a cursor tree as the object tree"""
+    ast = parse(PROGRAM)
+    root = Arena.from_tree(ast).node()
+    on_tree, on_cursor = Recorder(), Recorder()
+    on_tree.visit(ast)
+    on_cursor.visit(root)
+    assert on_cursor.events == on_tree.events
+    assert [str(n) for n in walk(root)] == [str(n) for n in walk(ast)]
+    assert shape(Arena.from_tree(root).to_tree()) == shape(ast)
+
+
+def test_09_read_only():
+    """Test cursor fields cannot be assigned"""
+    cursor = Arena.from_tree(Identifier("x")).node()
+    with pytest.raises(AttributeError):
+        cursor.name = "y"
+    with pytest.raises(AttributeError):
+        cursor.tag = 1
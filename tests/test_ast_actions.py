@@ -0,0 +1,98 @@
+"""
+Differential test cases for the TyCASTParser backend, which builds the AST
+in grammar actions without a parse tree. It must build the same AST, with
+the same node positions, as TyCParser with the ASTGeneration visitor, and
+report the same errors.
+"""
+
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCASTParser import TyCASTParser
+from tests.test_descent import PROGRAM, random_mutations, shape
+from tests.utils import ASTGenerator, TyCDFALexer, TyCLexer
+
+
+def assert_same(source, **kwargs):
+    expected = ASTGenerator(source, **kwargs).generate()
+    actual = ASTGenerator(source, backend="actions", **kwargs).generate()
+    assert shape(actual) == shape(expected), source
+    return expected
+
+
+# ============================================================================
+# SAME AST (Tests 1-5)
+# ============================================================================
+
+def test_01_full_program():
+    """Test a program using every construct gives the visitor's AST"""
+    result = assert_same(PROGRAM)
+    assert not isinstance(result, str)
+
+
+def test_02_no_parse_tree():
+    """Test the parser does not keep a parse tree"""
+    parser = TyCASTParser(CommonTokenStream(TyCLexer(InputStream(PROGRAM))))
+    ctx = parser.program()
+    assert parser.buildParseTrees is False
+    assert ctx.children is None
+    assert len(ctx.node.decls) == 4
+
+
+def test_03_parser_test_programs():
+    """Test every program of tests/test_parser.py"""
+    from benchmarks.common import parser_test_sources
+
+    for source in parser_test_sources():
+        assert_same(source)
+
+
+def test_04_two_stage():
+    """Test the backend under two-stage parsing"""
+    for source in (PROGRAM, "void main() { {} - x; }", "void main() { int x = ; }"):
+        expected = ASTGenerator(source).generate()
+        generator = ASTGenerator(source, backend="actions", two_stage=True)
+        assert shape(generator.generate()) == shape(expected)
+
+
+def test_05_string_pool_indexes():
+    """Test string literals get the lexer's pool index"""
+    generator = ASTGenerator('void main() { f("a", "b", "a"); }', backend="actions")
+    args = generator.generate().decls[0].body.statements[0].expr.args
+    assert [a.pool_index for a in args] == [0, 1, 0]
+    assert generator.string_pool[1] == "b"
+
+
+# ============================================================================
+# ERRORS (Tests 6-8)
+# ============================================================================
+
+def test_06_lvalue_rules():
+    """Test assignments to non-lvalues are rejected like the grammar does"""
+    for target in ("f(x)", "a + b", "(a + b)", "-a", "(a).b", "x++", "{}", "(f(x))"):
+        assert assert_same(f"void main() {{ {target} = 1; }}").startswith("AST Generation Error")
+    for target in ("(a)", "((a.b))", "f(x).y", "(f(x).y)"):
+        assert not isinstance(assert_same(f"void main() {{ {target} = 1; }}"), str)
+
+
+def test_07_syntax_and_lexical_errors():
+    """Test syntax and lexical errors give TyCParser's message"""
+    for source in (
+        "void main() { int x = ; }", "void main() {", "int f( { }", "struct S { int x; }",
+        'void main() { s = "a\\q"; }', "void main() { x = 1 $ 2; }", 'void main() { x = ; "abc',
+    ):
+        assert assert_same(source).startswith("AST Generation Error")
+
+
+def test_08_random_mutations():
+    """Test random token deletions and insertions give the same AST or error"""
+    for source in random_mutations(300, 13):
+        assert_same(source)
+
+
+# ============================================================================
+# OTHER LEXERS (Test 9)
+# ============================================================================
+
+def test_09_other_lexers():
+    """Test the backend over TyCDFALexer"""
+    for source in [PROGRAM] + list(random_mutations(30, 14)):
+        assert_same(source, lexer_class=TyCDFALexer)
@@ -0,0 +1,210 @@
+"""
+Test cases for deeply nested input: parsing with the descent backend (and
+the other backends falling back to it), and traversal (BaseVisitor, walk)
+and printing (str) of the AST, at nesting depths far past Python's
+recursion limit.
+"""
+
+import sys
+
+from tests.test_descent import PROGRAM
+from tests.utils import ASTGenerator
+from src.utils.nodes import *
+from src.utils.visitor import BaseVisitor, walk
+
+DEPTH = 10_000
+
+
+def parse(source):
+    ast = ASTGenerator(source, backend="descent").generate()
+    assert not isinstance(ast, str), ast
+    return ast
+
+
+def init_of(ast):
+    """The value assigned by `x = ...;`, the first statement of main."""
+    return ast.decls[0].body.statements[0].expr.rhs
+
+
+def main_with(expr):
+    return f"void main() {{ x = {expr}; }}"
+
+
+class Recorder(BaseVisitor):
+    """Records the identifiers and integers visited, and the blocks entered
+    and left."""
+
+    def __init__(self):
+        self.events = []
+
+    def visit_identifier(self, node, o=None):
+        self.events.append(node.name)
+
+    def visit_int_literal(self, node, o=None):
+        self.events.append(node.value)
+
+    def visit_block_stmt(self, node, o=None):
+        self.events.append("{")
+        super().visit_block_stmt(node, o)
+        self.events.append("}")
+
+
+class RecursiveRecorder(Recorder):
+    """Recorder that visits every node through accept(), by recursion."""
+
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+# ============================================================================
+# PARSING (Tests 1-5)
+# ============================================================================
+
+def test_01_parentheses():
+    """Test 10k nested parentheses"""
+    ast = parse(main_with("(" * DEPTH + "a" + ")" * DEPTH + ".b"))
+    assert str(init_of(ast)) == "MemberAccess(Identifier(a).b)"
+    assert parse(f"void main() {{ {'(' * DEPTH}a{')' * DEPTH} = 1; }}")
+
+
+def test_02_operators():
+    """Test 10k nested prefix operators, assignments and binary operands"""
+    ast = parse(main_with("- " * DEPTH + "1"))
+    assert str(init_of(ast)) == "PrefixOp(-" * DEPTH + "IntLiteral(1)" + ")" * DEPTH
+    ast = parse("void main() { " + "x = " * DEPTH + "1; }")
+    assert str(ast.decls[0].body.statements[0]).count("AssignExpr(Identifier(x) = ") == DEPTH
+    ast = parse(main_with("1 + (" * DEPTH + "2" + ")" * DEPTH))
+    assert sum(isinstance(n, BinaryOp) for n in walk(ast)) == DEPTH
+    ast = parse(main_with("1 * 2 + " * DEPTH + "3"))
+    assert sum(isinstance(n, BinaryOp) for n in walk(ast)) == 2 * DEPTH
+
+
+def test_03_calls_and_literals():
+    """Test 10k nested calls and struct literals"""
+    ast = parse(main_with("f(a, " * DEPTH + "1" + ")" * DEPTH))
+    assert str(init_of(ast)) == "FuncCall(f, [Identifier(a), " * DEPTH + "IntLiteral(1)" + "])" * DEPTH
+    ast = parse(main_with("{" * DEPTH + "1" + "}" * DEPTH))
+    assert str(init_of(ast)) == "StructLiteral({" * DEPTH + "IntLiteral(1)" + "})" * DEPTH
+
+
+def test_04_else_if_chain():
+    """Test an else-if chain of 10k branches"""
+    source = "void main() { if (a) x = 0; " + "".join(f"else if (a) x = {i}; " for i in range(DEPTH)) + "else y = 1; }"
+    ast = parse(source)
+    chain = [n for n in walk(ast) if isinstance(n, IfStmt)]
+    assert len(chain) == DEPTH + 1
+    assert all(a.else_stmt is b for a, b in zip(chain, chain[1:]))
+    assert chain[-1].line == 1 and chain[-1].column == source.rindex("if (a)")
+    assert str(chain[-1].else_stmt) == "ExprStmt(AssignExpr(Identifier(y) = IntLiteral(1)))"
+
+
+def test_05_recursion_limit_untouched():
+    """Test deep input is parsed without raising the recursion limit"""
+    limit = sys.getrecursionlimit()
+    parse(main_with("(" * DEPTH + "1" + ")" * DEPTH))
+    assert sys.getrecursionlimit() == limit < DEPTH
+
+
+# ============================================================================
+# TRAVERSAL AND PRINTING (Tests 6-10)
+# ============================================================================
+
+def test_06_visitor_order():
+    """Test BaseVisitor visits nodes in the order of a recursive visit"""
+    ast = parse(PROGRAM)
+    iterative, recursive = Recorder(), RecursiveRecorder()
+    iterative.visit(ast)
+    recursive.visit(ast)
+    assert iterative.events == recursive.events
+    assert iterative.events.count("{") == iterative.events.count("}") > 3
+
+
+def test_07_walk_order():
+    """Test walk yields the nodes in the order BaseVisitor visits them"""
+    ast = parse(PROGRAM)
+    visited = []
+
+    class All(BaseVisitor):
+        def visit(self, node, o=None):
+            visited.append(node)
+            return node.accept(self, o)
+
+    All().visit(ast)
+    assert list(walk(ast)) == visited
+
+
+def test_08_deep_statements():
+    """Test visiting and printing 100k nested blocks and loops (methods a
+    visitor overrides recurse as they visit)"""
+    depth = 100_000
+    node = ExprStmt(Identifier("x"))
+    for i in range(depth):
+        node = BlockStmt([node]) if i % 2 else WhileStmt(IntLiteral(i), node)
+    ast = Program([FuncDecl(None, "main", [], BlockStmt([node]))])
+    leaves = []
+
+    class Leaves(BaseVisitor):
+        def visit_identifier(self, node, o=None):
+            leaves.append(node.name)
+
+        def visit_int_literal(self, node, o=None):
+            leaves.append(node.value)
+
+    Leaves().visit(ast)
+    assert leaves == list(range(depth - 2, -1, -2)) + ["x"]
+    text = str(ast)
+    assert text.startswith("Program([FuncDecl(auto, main, [], BlockStmt([BlockStmt([WhileStmt(while IntLiteral(99998)")
+    assert text.count("WhileStmt(") == depth // 2
+    assert sum(1 for _ in walk(ast)) == depth * 3 // 2 + 5
+
+
+def test_09_printing_unchanged():
+    """Test str() of nodes with and without optional children"""
+    cases = [
+        (VarDecl(None, "a", None), "VarDecl(auto, a)"),
+        (VarDecl(IntType(), "a", IntLiteral(1)), "VarDecl(IntType(), a = IntLiteral(1))"),
+        (ForStmt(None, None, None, BlockStmt([])), "ForStmt(for None; None; None do BlockStmt([]))"),
+        (ReturnStmt(), "ReturnStmt(return)"),
+        (IfStmt(Identifier("c"), BreakStmt(), ContinueStmt()), "IfStmt(if Identifier(c) then BreakStmt(), else ContinueStmt())"),
+        (SwitchStmt(IntLiteral(1), [CaseStmt(IntLiteral(1), [])], DefaultStmt([])),
+         "SwitchStmt(switch IntLiteral(1) cases [CaseStmt(case IntLiteral(1): [])], default DefaultStmt(default: []))"),
+        (StructLiteral([]), "StructLiteral({})"),
+        (FuncCall("f", [StringLiteral("s"), FloatLiteral(1.5)]), "FuncCall(f, [StringLiteral('s'), FloatLiteral(1.5)])"),
+    ]
+    for node, text in cases:
+        assert str(node) == text
+
+
+def test_10_custom_str():
+    """Test nodes of classes with their own __str__ are printed with it"""
+
+    class Hole(Expr):
+        def accept(self, visitor, o=None):
+            return None
+
+        def __str__(self):
+            return "<hole>"
+
+    assert str(ExprStmt(BinaryOp(Hole(), "+", IntLiteral(1)))) == "ExprStmt(BinaryOp(<hole>, +, IntLiteral(1)))"
+
+
+# ============================================================================
+# OTHER BACKENDS (Test 11)
+# ============================================================================
+
+def test_11_default_backend_falls_back():
+    """Test input too deep for the ANTLR backends gives the descent AST, and
+    too deep input with an error still gives an error message"""
+    source = main_with("(" * DEPTH + "a + 1" + ")" * DEPTH)
+    expected = str(parse(source))
+    for backend in ("antlr", "actions"):
+        ast = ASTGenerator(source, backend=backend).generate()
+        assert not isinstance(ast, str), ast
+        assert str(ast) == expected
+    assert str(ASTGenerator(source, two_stage=True).generate()) == expected
+    assert [str(ast) for ast in ASTGenerator.compile_many([source, PROGRAM])] == [
+        expected,
+        str(parse(PROGRAM)),
+    ]
+    assert ASTGenerator(main_with("(" * DEPTH + "a +")).generate().startswith("AST Generation Error: ")
+    assert ASTGenerator("void main() { x = 1; }").generate().decls[0].name == "main"
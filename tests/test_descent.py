@@ -0,0 +1,196 @@
+"""
+Differential test cases for the hand-written DescentParser backend.
+It must build the same AST, with the same node positions, as TyCParser with
+the ASTGeneration visitor, and report the same errors.
+"""
+
+import random
+
+import pytest
+
+from antlr4 import InputStream
+from tests.utils import ASTGenerator, TyCDFALexer, TyCLexer
+from src.parser.descent import DescentParser
+from src.utils.nodes import ASTNode
+
+
+def shape(node):
+    """Node types, fields and positions, recursively."""
+    if isinstance(node, ASTNode):
+        names = {name for cls in type(node).__mro__ for name in getattr(cls, "__slots__", ())}
+        names.update(getattr(node, "__dict__", ()))
+        names = {name for name in names if not name.startswith("_")}
+        fields = tuple((k, shape(getattr(node, k))) for k in sorted(names))
+        return (type(node).__name__, fields)
+    if isinstance(node, list):
+        return [shape(n) for n in node]
+    return node
+
+
+def assert_same(source, **kwargs):
+    expected = ASTGenerator(source, **kwargs).generate()
+    actual = ASTGenerator(source, backend="descent", **kwargs).generate()
+    assert shape(actual) == shape(expected), source
+    return expected
+
+
+def descent(source):
+    parser = DescentParser(TyCLexer(InputStream(source)))
+    return parser, parser.parse()
+
+
+PROGRAM = """struct Point {
+    int x;
+    float y;
+};
+
+Point origin() { return {0, 0.0}; }
+
+dist(Point a, Point b) {
+    int dx = a.x - b.x * 2 + -b.x;
+    return dx * dx % 7 / (dx || !a.y && dx != 1);
+}
+
+void main() {
+    auto p = origin();
+    p.x = origin().y = (p.y) = 3;
+    string s = "a\\tb";
+    for (int i = 0; i < 10; ++i) { if (i >= 5) break; else continue; }
+    for (p.x = 0; ; p.x++) while (p.x <= 3) p.x--;
+    for (;; origin().x = 1) {}
+    switch (p.x) { case 1: case -(2 + 3) * 4: p.x = 1; default: { } case 2 % 2: }
+    {};
+    {1, {2}}.x;
+}
+"""
+
+
+# ============================================================================
+# SAME AST (Tests 1-5)
+# ============================================================================
+
+def test_01_full_program():
+    """Test a program using every construct gives the visitor's AST"""
+    parser, program = descent(PROGRAM)
+    assert parser.fallback is False
+    assert shape(program) == shape(assert_same(PROGRAM))
+
+
+def test_02_expected_string():
+    """Test precedence, associativity and node shapes of the backend"""
+    source = "void main() { a = b = 1 + 2 * 3 - 4 < 5 == !c || d && e; ++f(x).y; (a).b--; }"
+    assert str(descent(source)[1]) == (
+        "Program([FuncDecl(VoidType(), main, [], BlockStmt(["
+        "ExprStmt(AssignExpr(Identifier(a) = AssignExpr(Identifier(b) = "
+        "BinaryOp(BinaryOp(BinaryOp(BinaryOp(BinaryOp(IntLiteral(1), +, BinaryOp(IntLiteral(2), *, IntLiteral(3))), "
+        "-, IntLiteral(4)), <, IntLiteral(5)), ==, PrefixOp(!Identifier(c))), ||, "
+        "BinaryOp(Identifier(d), &&, Identifier(e)))))), "
+        "ExprStmt(PrefixOp(++MemberAccess(FuncCall(f, [Identifier(x)]).y))), "
+        "ExprStmt(PostfixOp(MemberAccess(Identifier(a).b)--))]))])"
+    )
+
+
+def test_03_positions():
+    """Test node positions are those of the first token of each construct"""
+    _, program = descent("void main() {\n  x = (a).b + c;\n}")
+    assign = program.decls[0].body.statements[0].expr
+    assert (assign.line, assign.column) == (2, 2)
+    assert (assign.rhs.line, assign.rhs.column) == (2, 6)
+    assert (assign.rhs.left.line, assign.rhs.left.column) == (2, 6)
+    assert (assign.rhs.left.obj.line, assign.rhs.left.obj.column) == (2, 7)
+
+
+def test_04_parser_test_programs():
+    """Test every program of tests/test_parser.py"""
+    from benchmarks.common import parser_test_sources
+
+    for source in parser_test_sources():
+        assert_same(source)
+
+
+def test_05_string_pool_indexes():
+    """Test string literals get the lexer's pool index"""
+    generator = ASTGenerator('void main() { f("a", "b", "a"); }', backend="descent")
+    args = generator.generate().decls[0].body.statements[0].expr.args
+    assert [a.pool_index for a in args] == [0, 1, 0]
+    assert generator.string_pool[1] == "b"
+
+
+# ============================================================================
+# BLOCK OR STRUCT LITERAL (Tests 6-7)
+# ============================================================================
+
+def test_06_brace_statements():
+    """Test `{` at statement start is decided as TyCParser decides it"""
+    for body in (
+        "{};", "{} - x;", "{ {} } + 1;", "{ {} }", "{} ++x;", "{}++;", "{ {} } ;", "{a = 1, b};",
+        "if (a) {} - x;", "if (a) {} - x; else y;", "if (a) while (b) {} - x; else y;",
+        "if (a) if (b) c; else {} - x; else y;", "while (a) {} - x;", "switch (a) { case 1: {} - x; }",
+    ):
+        source = f"void main() {{ {body} }}"
+        parser, _ = descent(source)
+        assert parser.fallback is False, source
+        assert_same(source)
+
+
+def test_07_lvalue_rules():
+    """Test assignments to non-lvalues are rejected like the grammar does"""
+    for target in ("f(x)", "a + b", "(a + b)", "-a", "(a).b", "x++", "{}", "(f(x))"):
+        assert_same(f"void main() {{ {target} = 1; }}")
+    for target in ("(a)", "((a.b))", "f(x).y", "(f(x).y)"):
+        assert_same(f"void main() {{ {target} = 1; }}")
+
+
+# ============================================================================
+# ERRORS (Tests 8-10)
+# ============================================================================
+
+def test_08_syntax_errors():
+    """Test syntax errors give TyCParser's message"""
+    for source in ("void main() { int x = ; }", "void main() {", "int f( { }", "struct S { int x; }", "void main() { else; }"):
+        result = assert_same(source)
+        assert result.startswith("AST Generation Error: Error on line")
+
+
+def test_09_lexical_errors():
+    """Test lexical errors, also past a syntax error, as with TyCParser"""
+    for source in ('void main() { s = "a\\q"; }', "void main() { x = 1 $ 2; }", 'void main() { x = ; "abc'):
+        assert_same(source)
+
+
+def test_10_unknown_backend():
+    """Test an unknown backend name is rejected"""
+    with pytest.raises(ValueError):
+        ASTGenerator("void main() {}", backend="yacc")
+
+
+# ============================================================================
+# RANDOM MUTATIONS (Tests 11-12)
+# ============================================================================
+
+def random_mutations(count, seed):
+    lexer = TyCLexer(InputStream(PROGRAM))
+    words = [t.text if t.type != TyCLexer.STRING_LITERAL else f'"{t.text}"' for t in lexer.getAllTokens()]
+    extra = [";", "(", ")", "{", "}", "=", "++", "-", ".", "x", "1", ",", "else", "case", "default", ":", "int"]
+    rng = random.Random(seed)
+    for _ in range(count):
+        mutated = list(words)
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(mutated))
+            if rng.random() < 0.5:
+                del mutated[i]
+            else:
+                mutated.insert(i, rng.choice(extra))
+        yield " ".join(mutated)
+
+
+def test_11_random_mutations():
+    """Test random token deletions and insertions give the same AST or error"""
+    for source in random_mutations(300, 11):
+        assert_same(source)
+
+
+def test_12_other_lexers():
+    """Test the backend over TyCDFALexer"""
+    for source in [PROGRAM] + list(random_mutations(30, 12)):
+        assert_same(source, lexer_class=TyCDFALexer)
@@ -0,0 +1,182 @@
+"""
+Differential tests for the table-driven TyCDFALexer.
+Every input is lexed by both TyCLexer and TyCDFALexer and the token
+streams (type, text, offsets, line, column) and errors must be identical.
+"""
+
+import random
+
+import pytest
+from antlr4 import InputStream, CommonTokenStream, Token
+from tests.utils import Tokenizer, Parser, TyCLexer, TyCDFALexer
+from src.grammar.lexererr import UncloseString, IllegalEscape, ErrorToken
+
+
+def lex_all(lexer_class, source):
+    """Lex `source` fully, returning token tuples and the error raised (if any)."""
+    lexer = lexer_class(InputStream(source))
+    tokens = []
+    try:
+        while True:
+            tok = lexer.nextToken()
+            tokens.append((tok.type, tok.text, tok.start, tok.stop, tok.line, tok.column))
+            if tok.type == Token.EOF:
+                break
+    except Exception as err:
+        tokens.append((type(err).__name__, str(err)))
+    return tokens
+
+
+def assert_same(source):
+    assert lex_all(TyCDFALexer, source) == lex_all(TyCLexer, source)
+
+
+# ============================================================================
+# TOKENS (Tests 1-8)
+# ============================================================================
+
+def test_01_keywords_and_identifiers():
+    """Test keywords win over ID and longer identifiers stay IDs"""
+    assert_same("auto break case continue default else float for if int return "
+                "string struct switch void while autox _if int1 __")
+
+
+def test_02_operators():
+    """Test every operator and separator, including maximal munch"""
+    assert_same("|| && == != <= >= ! ++ -- + - * / % = < > . ( ) { } ; , : +++ ---- ===")
+
+
+def test_03_numbers():
+    """Test integer and float literal forms"""
+    assert_same("0 42 3.14 1. .5 1e10 1E-5 2.5e+3 .5e2 1e 1.e 007 1..2 1.2.3")
+
+
+def test_04_strings_with_escapes():
+    """Test string literals with every legal escape"""
+    assert_same(r'"" "abc" "a\bb\ff\nn\rr\tt\"q\\s" "tab	inside"')
+
+
+def test_05_comments_and_whitespace():
+    """Test comments are skipped and line/column tracking across them"""
+    assert_same("a // line comment\n/* block\n * comment */ b\r\n\t\fc /**/ d /* x */*/")
+
+
+def test_06_line_and_column_tracking():
+    """Test positions after multi-line tokens and CRLF"""
+    assert_same('int x;\r\n  /* a\nb\nc */ float y = "s";\n\n\n   z')
+
+
+def test_07_non_ascii_input():
+    """Test non-ASCII characters are error tokens outside strings"""
+    assert_same('"héllo wörld \U0001F600" x')
+    assert_same("x é y")
+
+
+def test_08_empty_and_blank_input():
+    """Test empty input and input with only skipped tokens"""
+    assert_same("")
+    assert_same("   \n\t ")
+    assert_same("// only a comment")
+    assert_same("/* only a block */")
+
+
+# ============================================================================
+# LEXICAL ERRORS (Tests 9-14)
+# ============================================================================
+
+def test_09_error_char():
+    """Test unrecognized characters raise ErrorToken"""
+    assert_same("int x = 5 @ y;")
+    with pytest.raises(ErrorToken):
+        Tokenizer("a # b", lexer_class=TyCDFALexer).tokenize()
+
+
+def test_10_unclosed_string_newline():
+    """Test unclosed string terminated by newline and CRLF"""
+    assert_same('x = "hello\nworld"')
+    assert_same('x = "hello\r\nworld"')
+    with pytest.raises(UncloseString):
+        Tokenizer('"hello\r', lexer_class=TyCDFALexer).tokenize()
+
+
+def test_11_unclosed_string_eof():
+    """Test unclosed string terminated by end of input"""
+    assert_same('"abc')
+    assert_same('"abc\\n')
+    assert_same('"')
+
+
+def test_12_illegal_escape():
+    """Test illegal escapes report the text up to the bad escape"""
+    assert_same(r'"hello\kworld"')
+    assert_same(r'"ok\n then \q"')
+    with pytest.raises(IllegalEscape):
+        Tokenizer(r'"a\x"', lexer_class=TyCDFALexer).tokenize()
+
+
+def test_13_unterminated_block_comment():
+    """Test an unterminated block comment falls back to DIV/MUL tokens"""
+    assert_same("a /* never closed")
+    assert_same("/*/")
+
+
+def test_14_backslash_before_newline():
+    """Test a backslash before a newline in a string"""
+    assert_same('"abc\\\nxyz"')
+    assert (
+        Tokenizer('"abc\\\n', lexer_class=TyCDFALexer).get_tokens_as_string()
+        == Tokenizer('"abc\\\n').get_tokens_as_string()
+    )
+
+
+# ============================================================================
+# INTEGRATION (Tests 15-18)
+# ============================================================================
+
+def test_15_tokenizer_wrapper_matches():
+    """Test the Tokenizer wrapper gives identical token lists"""
+    source = """
+    struct Point { int x; int y; };
+    void main() { Point p = {1, 2}; p.x = p.y + 3.5e1; printString("x\\n"); }
+    """
+    expected = [(t.type, t.text) for t in Tokenizer(source).tokenize()]
+    actual = [(t.type, t.text) for t in Tokenizer(source, lexer_class=TyCDFALexer).tokenize()]
+    assert actual == expected
+
+
+def test_16_parser_with_dfa_lexer():
+    """Test TyCParser accepts a CommonTokenStream fed by TyCDFALexer"""
+    source = "int add(int a, int b) { return a + b; } void main() { auto x = add(1, 2); }"
+    assert Parser(source, lexer_class=TyCDFALexer).parse() == "success"
+
+
+def test_17_parser_errors_with_dfa_lexer():
+    """Test syntax error messages are unchanged with TyCDFALexer"""
+    source = "void main() {\n  int x = ;\n}"
+    assert Parser(source, lexer_class=TyCDFALexer).parse() == Parser(source).parse()
+
+
+def test_18_token_stream_fill():
+    """Test CommonTokenStream buffers the same tokens"""
+    source = "void main() { for (int i = 0; i < 3; i++) { } }"
+    streams = []
+    for lexer_class in (TyCLexer, TyCDFALexer):
+        stream = CommonTokenStream(lexer_class(InputStream(source)))
+        stream.fill()
+        streams.append([(t.type, t.text, t.tokenIndex) for t in stream.tokens])
+    assert streams[0] == streams[1]
+
+
+# ============================================================================
+# RANDOMIZED DIFFERENTIAL (Test 19)
+# ============================================================================
+
+def test_19_random_inputs():
+    """Test random snippets built from lexically interesting fragments"""
+    fragments = list('az_09 .eE+-*/"\\\n\r\t!=<>&|(){};,:%@#') + [
+        "/*", "*/", "//", '"a\\n"', "int", "if", "é", "1e5", ".5", "\\q",
+    ]
+    rng = random.Random(2024)
+    for _ in range(3000):
+        source = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 30)))
+        assert lex_all(TyCDFALexer, source) == lex_all(TyCLexer, source), repr(source)
@@ -0,0 +1,163 @@
+"""
+Test cases for the left-factored assignment, lvalue, for-update and switch
+rules. They accept the same language as before, report errors at the same
+tokens (unless a lexical error follows the first syntax error, Test 10),
+and predict their alternatives with a bounded number of tokens.
+"""
+
+from antlr4 import CommonTokenStream, InputStream
+from tests.utils import ASTGenerator, Parser, TyCLexer, TyCParser
+from src.utils.error_listener import NewErrorListener
+
+
+class LookaheadStream(CommonTokenStream):
+    furthest = 0
+
+    def consume(self):
+        super().consume()
+        self.furthest = max(self.furthest, self.index)
+
+
+def max_lookahead(source):
+    """Most tokens any adaptivePredict call looked at while parsing `source`."""
+    stream = LookaheadStream(TyCLexer(InputStream(source)))
+    parser = TyCParser(stream)
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    predict = parser._interp.adaptivePredict
+    depths = [0]
+
+    def adaptive_predict(input, decision, outerContext):
+        start = stream.furthest = input.index
+        alt = predict(input, decision, outerContext)
+        depths.append(stream.furthest - start + 1)
+        return alt
+
+    parser._interp.adaptivePredict = adaptive_predict
+    parser.program()
+    return max(depths)
+
+
+# ============================================================================
+# ASSIGNMENTS (Tests 1-4)
+# ============================================================================
+
+def test_01_assignment_targets():
+    """Test member, call-chain and parenthesized lvalues are assignable"""
+    source = "void main() { (a) = 1; ((a.b)) = 3; f(x).y = 1; (f(x).y) = 2; f(x).y.z = g(1).w = 2; }"
+    assert Parser(source).parse() == "success"
+
+
+def test_02_non_lvalue_targets():
+    """Test assigning to a non-lvalue is reported at the ="""
+    cases = {
+        "void main() { f(x) = 1; }": "Error on line 1 col 19: =",
+        "void main() { a + b = c; }": "Error on line 1 col 20: =",
+        "void main() { (a + b) = 1; }": "Error on line 1 col 22: =",
+        "void main() { -a = 1; }": "Error on line 1 col 17: =",
+        "void main() { (f(x)) = 1; }": "Error on line 1 col 21: =",
+        "void main() { x++ = 1; }": "Error on line 1 col 18: =",
+        "void main() { ++f(a, b).c; (a).b = 1; }": "Error on line 1 col 33: =",
+    }
+    for source, expected in cases.items():
+        assert Parser(source).parse() == expected, source
+
+
+def test_03_chained_assignment():
+    """Test assignment chains stay right-associative and check each target"""
+    assert Parser("void main() { a = b.c = (d) = 1 + 2; }").parse() == "success"
+    assert Parser("void main() { a = b + c = d; }").parse() == "Error on line 1 col 24: ="
+
+
+def test_04_assignment_in_expressions():
+    """Test assignments nested in arguments, initializers and struct literals"""
+    source = "void main() { int q = b.x = 1; g(c.y = 2, (a) = 3); P p = {a.z = 1, 2}; }"
+    assert Parser(source).parse() == "success"
+
+
+# ============================================================================
+# FOR UPDATES AND SWITCH (Tests 5-7)
+# ============================================================================
+
+def test_05_for_updates():
+    """Test the factored for-update alternatives"""
+    source = "void main() { for (i = 0; i < 3; f(i).x++) {} for (;;--a.b) {} for (;; (a) = 2) {} for (;; (a)++) {} }"
+    assert Parser(source).parse() == "success"
+
+
+def test_06_invalid_for_updates():
+    """Test for updates that are not assignments or increments"""
+    assert Parser("void main() { for (;; a + 1) {} }").parse() == "Error on line 1 col 24: +"
+    assert Parser("void main() { for (;; f(x)++) {} }").parse() == "Error on line 1 col 26: ++"
+
+
+def test_07_switch_default_position():
+    """Test the default section may appear once, anywhere among the cases"""
+    source = "void main() { switch (a) { case 1: x = 1; default: y = 2; case 2: z = 3; } }"
+    assert Parser(source).parse() == "success"
+    source = "void main() { switch (a) { default: default: } }"
+    assert Parser(source).parse() == "Error on line 1 col 36: default"
+
+
+# ============================================================================
+# BOUNDED LOOKAHEAD (Test 8)
+# ============================================================================
+
+def test_08_bounded_lookahead():
+    """Test long lvalues and call chains need no more lookahead than short ones"""
+    chain = ".m" * 50
+    args = ", ".join(f"g(h{i}(1){chain}, 2)" for i in range(20))
+    source = (
+        "void main() {\n"
+        f"    f({args}){chain} = (((a{chain}))) = 1;\n"
+        f"    ++f({args}){chain};\n"
+        f"    for (a{chain} = 0; a < 1; f({args}){chain}--) {{ }}\n"
+        "}\n"
+    )
+    assert max_lookahead(source) <= 3
+
+
+# ============================================================================
+# ERRORS IN NESTED BODIES (Test 9)
+# ============================================================================
+
+def test_09_non_lvalue_in_nested_bodies():
+    """Test an invalid = inside a braced body is reported at the =, also when
+    a later error ends the block-or-struct-literal prediction"""
+    cases = {
+        "void main(){ if (x) { g() = ; } }": "Error on line 1 col 26: =",
+        "void main(){ while (x) { a + b = 3 +; } }": "Error on line 1 col 31: =",
+        "void main(){ for (;;) { ++a = 1 } }": "Error on line 1 col 28: =",
+        "void main(){ { x = 1; (a + b) = ; } }": "Error on line 1 col 30: =",
+        "void main(){ if (x) { y = {1, 2} = 3; } }": "Error on line 1 col 33: =",
+        "void main(){ { a = 1; } f(x).y = (1; }": "Error on line 1 col 35: ;",
+    }
+    for source, expected in cases.items():
+        assert Parser(source).parse() == expected, source
+        assert Parser(source).validate() == expected, source
+        assert Parser(source).parse_recovering()[0].message == expected, source
+        for backend in ("antlr", "actions", "descent"):
+            assert ASTGenerator(source, backend=backend).generate() == f"AST Generation Error: {expected}"
+
+
+# ============================================================================
+# LEXICAL ERRORS AFTER A SYNTAX ERROR (Test 10)
+# ============================================================================
+
+def test_10_lexical_error_after_syntax_error():
+    """Test a syntax error is reported before a lexical error after it.
+
+    The grammar before left-factoring reported these with the lexical error:
+    the runtime lexes the rest of the source to format a no-viable-alternative
+    message, and the left-factored rules fail in a match instead.
+    """
+    cases = {
+        "void main() { x = (a for > 0) ? 1 : 2; }": "Error on line 1 col 21: for",
+        "void main() { switch (x) { case 1: z = break; default: @ y = 0; } }": "Error on line 1 col 39: break",
+        "void main() { ? x = (a for > 0); }": "Error Token ?",
+    }
+    for source, expected in cases.items():
+        assert Parser(source).parse() == expected, source
+        assert Parser(source).validate() == expected, source
+        for backend in ("antlr", "actions", "descent"):
+            assert ASTGenerator(source, backend=backend).generate() == f"AST Generation Error: {expected}"
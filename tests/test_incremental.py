@@ -0,0 +1,209 @@
+"""
+Test cases for incremental relexing and reparsing.
+After every edit the tokens, parse tree and result of IncrementalParser must
+match a full TyCLexer + TyCParser run over the new text.
+"""
+
+import random
+
+from antlr4 import InputStream, CommonTokenStream
+from tests.utils import Parser, TyCLexer, TyCDFALexer, TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.parser.incremental import IncrementalParser
+
+
+PROGRAM = """struct Point {
+    int x;
+    int y;
+};
+
+// distance helper
+int dist(Point a, Point b) {
+    int dx = a.x - b.x;
+    return dx * dx;
+}
+
+/* entry
+   point */
+void main() {
+    Point p = {1, 2};
+    auto d = dist(p, p);
+    printString("done");
+}
+"""
+
+
+def token_tuples(tokens):
+    return [(t.type, t.text, t.start, t.stop, t.line, t.column, t.tokenIndex) for t in tokens]
+
+
+def pool_indices(tokens):
+    return [getattr(t, "poolIndex", None) for t in tokens]
+
+
+def assert_matches_full_parse(inc):
+    assert inc.result == Parser(inc.text).parse()
+    if inc.result != "success":
+        return
+    stream = CommonTokenStream(TyCLexer(InputStream(inc.text)))
+    parser = TyCParser(stream)
+    tree = parser.program()
+    assert token_tuples(inc.tokens) == token_tuples(stream.tokens)
+    assert pool_indices(inc.tokens) == pool_indices(stream.tokens)
+    pool = stream.tokenSource.stringPool
+    assert inc.string_pool.values == (pool.values if pool is not None else [])
+    assert inc.tree.toStringTree(recog=parser) == tree.toStringTree(recog=parser)
+    assert inc.tree.start is inc.tokens[0]
+
+
+def edit(inc, anchor, removed, inserted, after=0):
+    result = inc.edit(inc.text.index(anchor) + after, removed, inserted)
+    assert_matches_full_parse(inc)
+    return result
+
+
+# ============================================================================
+# LOCAL EDITS (Tests 1-5)
+# ============================================================================
+
+def test_01_edit_inside_function():
+    """Test an edit inside one function reparses only that declaration"""
+    inc = IncrementalParser(PROGRAM)
+    assert edit(inc, "dx * dx", 2, "dx + 1") == "success"
+    assert not inc.stats.full
+    assert inc.stats.reparsed == 1
+
+
+def test_02_extend_identifier():
+    """Test typing at the end of a token relexes that token"""
+    inc = IncrementalParser(PROGRAM)
+    edit(inc, "p, p", 0, "q", after=1)
+    edit(inc, "pq, p", 1, "", after=1)
+    assert not inc.stats.full
+
+
+def test_03_insert_and_delete_declarations():
+    """Test adding and removing whole top-level declarations"""
+    inc = IncrementalParser(PROGRAM)
+    new_func = "float half(float v) {\n    return v / 2.0;\n}\n\n"
+    edit(inc, "/* entry", 0, new_func)
+    assert not inc.stats.full
+    assert len(inc.decls) == 4
+    edit(inc, "float half", len(new_func), "")
+    assert len(inc.decls) == 3
+
+
+def test_04_line_and_column_shifts():
+    """Test tokens after the edit get shifted lines and columns"""
+    inc = IncrementalParser(PROGRAM)
+    edit(inc, "int dx", 0, "int pad;\n    ")
+    edit(inc, "Point p", 0, "  ")
+    edit(inc, "struct Point", 0, "\n\n")
+
+
+def test_05_edits_in_comments_and_whitespace():
+    """Test edits inside comments and between declarations"""
+    inc = IncrementalParser(PROGRAM)
+    edit(inc, "entry", 5, "start")
+    edit(inc, "helper", 0, "tiny ")
+    edit(inc, "};\n", 0, "\n\n", after=3)
+    assert not inc.stats.full
+
+
+# ============================================================================
+# ERRORS AND FALLBACKS (Tests 6-9)
+# ============================================================================
+
+def test_06_syntax_error_and_recovery():
+    """Test a breaking edit reports the full-parse error, then recovers"""
+    inc = IncrementalParser(PROGRAM)
+    assert edit(inc, "dx * dx;", 1, "", after=7) == "Error on line 10 col 0: }"
+    assert edit(inc, "dx * dx", 0, ";", after=7) == "success"
+
+
+def test_07_lexical_error():
+    """Test a lexical error in the edited region"""
+    inc = IncrementalParser(PROGRAM)
+    assert edit(inc, '"done"', 0, '"bad\\q" + ') == "Illegal Escape In String: bad\\q"
+    assert edit(inc, '"bad', 10, "") == "success"
+
+
+def test_08_comment_opener_falls_back():
+    """Test opening or closing a block comment across declarations"""
+    inc = IncrementalParser(PROGRAM)
+    edit(inc, "int dist", 0, "/* ")
+    edit(inc, "void main", 0, "*/ ")
+    edit(inc, "/* int dist", 3, "")
+    edit(inc, "*/ void", 3, "")
+
+
+def test_09_dfa_lexer():
+    """Test incremental relexing with TyCDFALexer"""
+    inc = IncrementalParser(PROGRAM, lexer_class=TyCDFALexer)
+    edit(inc, "dx * dx", 2, "dx + 1")
+    assert not inc.stats.full
+
+
+# ============================================================================
+# RANDOM EDIT SEQUENCES (Test 10)
+# ============================================================================
+
+def test_10_random_edit_sequences():
+    """Test random insertions and deletions against full parses"""
+    fragments = [
+        " ", "\n", "x", "1", ";", "}", "{", "(", ")", "/*", "*/", "//", '"', "+",
+        "int y = 2;\n", "void g() { }\n", "struct S { int a; };\n", "a.x", "1e5", "\\q",
+    ]
+    rng = random.Random(3)
+    for _ in range(8):
+        inc = IncrementalParser(PROGRAM)
+        for _ in range(25):
+            offset = rng.randint(0, len(inc.text))
+            if rng.random() < 0.5:
+                removed = min(rng.randint(0, 6), len(inc.text) - offset)
+                inc.edit(offset, removed, "")
+            else:
+                inc.edit(offset, 0, rng.choice(fragments))
+            assert_matches_full_parse(inc)
+
+
+# ============================================================================
+# STRING POOL (Tests 11-12)
+# ============================================================================
+
+def test_11_string_pool_does_not_grow():
+    """Test literals edited away leave the pool, and earlier pools stay valid
+    for earlier ASTs"""
+    inc = IncrementalParser(PROGRAM)
+    first = inc.string_pool
+    literal = '"done"'
+    for i in range(50):
+        edit(inc, literal, len(literal), f'"v{i}"')
+        literal = f'"v{i}"'
+    assert inc.string_pool.values == ["v49"]
+    assert first[0] == "done"
+    edit(inc, '"v49"', 0, '"a" + "v49" + "a" + ')
+    assert inc.string_pool.values == ["a", "v49"]
+    pool = inc.string_pool
+    edit(inc, "int dx", 0, "x = 1;\n    ")
+    assert inc.string_pool is pool
+
+
+def test_12_string_pool_contract():
+    """Test a rebuild re-indexes the reused tokens into the new pool, while an
+    AST built before the edit still resolves in the pool of its time"""
+    inc = IncrementalParser(PROGRAM)
+    first = inc.string_pool
+    before = ASTGeneration().visit(inc.tree)
+    done = next(t for t in inc.tokens if t.text == "done")
+    assert done.poolIndex == 0
+    edit(inc, "int dx", 0, 'f("x");\n    ')
+    assert inc.string_pool is not first
+    assert inc.string_pool.values == ["x", "done"]
+    # The token past the edit is reused and now indexes the new pool.
+    assert done in inc.tokens and done.poolIndex == 1
+    assert inc.string_pool[done.poolIndex] == "done"
+    call = before.decls[2].body.statements[2].expr
+    assert call.args[0].pool_index == 0 and first[call.args[0].pool_index] == "done"
+    after = ASTGeneration().visit(inc.tree).decls[2].body.statements[2].expr
+    assert inc.string_pool[after.args[0].pool_index] == "done"
@@ -0,0 +1,158 @@
+"""
+Test cases for lazy function-body parsing (src/parser/lazy.py).
+Declarations and function headers are parsed at once; each function body
+is parsed on the first access to `FuncDecl.body`, into the body a full
+parse builds, and raises the errors in it then.
+"""
+
+import pytest
+from tests.test_descent import random_mutations, shape
+from tests.test_pool import corpus
+from tests.utils import ASTGenerator, TyCDFALexer
+from src.parser.lazy import LazyFuncDecl, parse_lazy, split_bodies
+from src.utils.nodes import BlockStmt, FuncDecl, StructDecl
+
+SOURCE = """struct Point { int x; int y; };
+int twice(int n) { if (n) { return n * 2; } return 0; }
+Point origin() { Point p = {0, 0}; string s = "{"; return p; }
+void main() { Point p = origin(); p.x = twice(p.y); }
+"""
+
+
+def force(ast):
+    """`ast` with every body parsed, or the message of the first body error."""
+    for decl in ast.decls:
+        if isinstance(decl, FuncDecl):
+            try:
+                decl.body
+            except Exception as e:
+                return f"AST Generation Error: {str(e)}"
+    return ast
+
+
+# ============================================================================
+# SKELETON (Tests 1-2)
+# ============================================================================
+
+def test_01_split_bodies():
+    """Test bodies are cut out by brace matching, struct bodies are kept"""
+    generator = ASTGenerator(SOURCE)
+    tokens = generator.token_stream
+    tokens.fill()
+    skeleton, bodies = split_bodies(tokens.tokens)
+    assert len(bodies) == 3
+    assert [t.text for t in bodies[0][0]][:3] == ["{", "if", "("]
+    assert bodies[0][1].text == "Point"
+    text = " ".join(t.text for t in skeleton)
+    assert text.startswith("struct Point { int x ; int y ; } ;")
+    assert "int twice ( int n ) { } Point origin ( ) { }" in text
+
+
+def test_02_unparsed_until_accessed():
+    """Test outline queries leave bodies unparsed; `body` parses one once"""
+    ast = ASTGenerator(SOURCE).generate_lazy()
+    funcs = [d for d in ast.decls if isinstance(d, FuncDecl)]
+    assert all(isinstance(f, LazyFuncDecl) for f in funcs)
+    assert [(f.name, str(f.return_type), [p.name for p in f.params]) for f in funcs] == [
+        ("twice", "IntType()", ["n"]),
+        ("origin", "StructType(Point)", []),
+        ("main", "VoidType()", []),
+    ]
+    assert [m.name for m in ast.decls[0].members] == ["x", "y"]
+    assert not any(f.body_parsed for f in funcs)
+    body = funcs[1].body
+    assert type(body) is BlockStmt and funcs[1].body is body
+    assert [f.body_parsed for f in funcs] == [False, True, False]
+
+
+# ============================================================================
+# SAME AST (Tests 3-5)
+# ============================================================================
+
+def test_03_same_ast():
+    """Test forced bodies, positions and all, are those of a full parse"""
+    for kwargs in ({}, dict(lexer_class=TyCDFALexer)):
+        expected = ASTGenerator(SOURCE, **kwargs).generate()
+        ast = ASTGenerator(SOURCE, **kwargs).generate_lazy()
+        for full, lazy in zip(expected.decls, ast.decls):
+            assert (full.line, full.column) == (lazy.line, lazy.column)
+            if isinstance(full, FuncDecl):
+                assert shape(lazy.body) == shape(full.body)
+                assert shape(lazy.params) == shape(full.params)
+        assert str(ast) == str(expected)
+
+
+def test_04_string_pool():
+    """Test literals in unparsed bodies keep the pool indices of a full parse"""
+    generator = ASTGenerator(SOURCE)
+    ast = generator.generate_lazy()
+    assert generator.string_pool.values == ["{"]
+    literal = ast.decls[2].body.statements[1].init_value
+    assert literal.pool_index == 0
+
+
+def test_05_corpus():
+    """Test valid programs give the full AST once forced"""
+    for source in corpus():
+        expected = ASTGenerator(source).generate()
+        if not isinstance(expected, str):
+            assert str(ASTGenerator(source).generate_lazy()) == str(expected)
+
+
+# ============================================================================
+# ERRORS (Tests 6-10)
+# ============================================================================
+
+def test_06_header_errors():
+    """Test errors outside bodies are raised by the parse, before body errors"""
+    source = "void f() { x = ; }\nint g(int) { return 1; }\nstruct S { int a };"
+    assert ASTGenerator(source).generate_lazy() == "AST Generation Error: Error on line 2 col 9: )"
+    assert ASTGenerator("struct S { int a };").generate_lazy() == "AST Generation Error: Error on line 1 col 17: }"
+
+
+def test_07_body_errors():
+    """Test a body error is raised on access, every time, and other bodies parse"""
+    source = "void f() { x = 1; }\nvoid g() {\n  y = 2 +;\n}\nvoid h() { z = 3; }"
+    ast = ASTGenerator(source).generate_lazy()
+    assert ast.decls[2].body.statements[0].expr.rhs.value == 3
+    for _ in range(2):
+        with pytest.raises(Exception) as error:
+            ast.decls[1].body
+        assert str(error.value) == "Error on line 3 col 9: ;"
+        assert not ast.decls[1].body_parsed
+    assert force(ast) == ASTGenerator(source).generate()
+
+
+def test_08_lexical_errors():
+    """Test lexical errors in bodies are deferred, others raised at once"""
+    source = 'void f() { s = "a\\q"; }\nvoid g() { t = 1 @ 2; }'
+    ast = ASTGenerator(source).generate_lazy()
+    with pytest.raises(Exception, match=r"Illegal Escape In String: a\\q"):
+        ast.decls[0].body
+    with pytest.raises(Exception, match="Error Token @"):
+        ast.decls[1].body
+    assert ASTGenerator("void f() @ { }").generate_lazy() == "AST Generation Error: Error Token @"
+
+
+def test_09_unbalanced_braces():
+    """Test a body without its `}` is parsed at once and fails as a full parse"""
+    for source in ("void f() { if (x) { y = 1; }\nvoid g() { }", "void f() { } }", "void f() { { }"):
+        assert ASTGenerator(source).generate_lazy() == ASTGenerator(source).generate()
+
+
+def test_10_mutations():
+    """Test random edits: forcing every body in order gives the full parse
+    result when the skeleton parses, and an earlier full parse error otherwise"""
+    for source in random_mutations(200, 23):
+        expected = ASTGenerator(source).generate()
+        generator = ASTGenerator(source, lexer_class=TyCDFALexer)
+        try:
+            ast = parse_lazy(generator.lexer)
+        except Exception as e:
+            full = ASTGenerator(source).parser
+            with pytest.raises(Exception) as error:
+                full.program()
+            assert (error.value.line, error.value.column) <= (e.line, e.column), source
+            continue
+        assert str(force(ast)) == str(expected), source
+        assert all(isinstance(d, (StructDecl, LazyFuncDecl)) for d in ast.decls)
@@ -0,0 +1,122 @@
+"""
+Test cases for the recovering (multi-error) lexing mode.
+With `recoverErrors` set, the lexer records every lexical error with its
+position and keeps emitting tokens; by default it still raises on the first.
+"""
+
+import pytest
+from antlr4 import InputStream
+from tests.utils import Tokenizer, TyCLexer, TyCDFALexer
+from src.grammar.lexererr import UncloseString, IllegalEscape, ErrorToken
+
+
+def errors_of(source, lexer_class=TyCLexer):
+    _, errors = Tokenizer(source, lexer_class).tokenize_recovering()
+    return [(type(e).__name__, str(e), e.offset, e.line, e.column) for e in errors]
+
+
+# ============================================================================
+# DEFAULT MODE (Tests 1-2)
+# ============================================================================
+
+def test_01_default_still_raises_first_error():
+    """Test the default lexer raises on the first bad token"""
+    with pytest.raises(ErrorToken):
+        Tokenizer("a @ b # c").tokenize()
+
+
+def test_02_raised_error_carries_position():
+    """Test errors raised in default mode also carry offset/line/column"""
+    lexer = TyCLexer(InputStream("int x;\n  y = @;"))
+    with pytest.raises(Exception) as info:
+        while lexer.nextToken().type != -1:
+            pass
+    assert (info.value.offset, info.value.line, info.value.column) == (13, 2, 6)
+
+
+# ============================================================================
+# RECOVERING MODE (Tests 3-11)
+# ============================================================================
+
+def test_03_collects_every_error_char():
+    """Test all unrecognized characters are collected in one pass"""
+    assert errors_of("a @ b\n# c $") == [
+        ("ErrorToken", "Error Token @", 2, 1, 2),
+        ("ErrorToken", "Error Token #", 6, 2, 0),
+        ("ErrorToken", "Error Token $", 10, 2, 4),
+    ]
+
+
+def test_04_mixed_error_kinds():
+    """Test illegal escapes, unclosed strings and error chars together"""
+    source = 'x = "a\\qb";\ny = "open\nz = 1 ~ 2;'
+    assert errors_of(source) == [
+        ("IllegalEscape", "Illegal Escape In String: a\\q", 4, 1, 4),
+        ("UncloseString", "Unclosed String: open", 16, 2, 4),
+        ("ErrorToken", "Error Token ~", 28, 3, 6),
+    ]
+
+
+def test_05_tokens_keep_flowing():
+    """Test tokens after an error are still produced"""
+    tokens, errors = Tokenizer("int x = 5 @ y;").tokenize_recovering()
+    assert [t.type for t in tokens] == ["INT", "ID", "ASSIGN", "INT_LITERAL", "ERROR_CHAR", "ID", "SEMI"]
+    assert len(errors) == 1
+
+
+def test_06_error_classes_match_default_mode():
+    """Test recorded errors use the same classes as the raised ones"""
+    _, errors = Tokenizer('"bad\\k" "open').tokenize_recovering()
+    assert isinstance(errors[0], IllegalEscape)
+    assert isinstance(errors[1], UncloseString)
+
+
+def test_07_backslash_before_newline_is_unclosed_string():
+    """Test a string ending in a backslash before newline is one UncloseString"""
+    tokens, errors = Tokenizer('x = "abc\\\ny @').tokenize_recovering()
+    assert [(type(e).__name__, str(e)) for e in errors] == [
+        ("UncloseString", "Unclosed String: abc\\"),
+        ("ErrorToken", "Error Token @"),
+    ]
+    assert [t.type for t in tokens] == ["ID", "ASSIGN", "UNCLOSE_STRING", "ID", "ERROR_CHAR"]
+
+
+def test_08_no_errors():
+    """Test a clean source yields an empty error list"""
+    tokens, errors = Tokenizer("void main() { }").tokenize_recovering()
+    assert errors == []
+    assert len(tokens) == 6
+
+
+def test_09_dfa_lexer_recovers_identically():
+    """Test TyCDFALexer records the same errors and tokens"""
+    source = 'a @ "x\\y" b\n"open\n# "c\\\n$'
+    expected = Tokenizer(source).tokenize_recovering()
+    actual = Tokenizer(source, TyCDFALexer).tokenize_recovering()
+    assert [(t.type, t.text) for t in actual[0]] == [(t.type, t.text) for t in expected[0]]
+    assert errors_of(source, TyCDFALexer) == errors_of(source)
+
+
+def test_10_illegal_escape_swallows_rest_of_string():
+    """Test the tail of a string after an illegal escape is not lexed as code"""
+    for lexer_class in (TyCLexer, TyCDFALexer):
+        tokens, _ = Tokenizer('s = "a\\qb \\" c" + t @;', lexer_class).tokenize_recovering()
+        assert [t.type for t in tokens] == ["ID", "ASSIGN", "ILLEGAL_ESCAPE", "PLUS", "ID", "ERROR_CHAR", "SEMI"]
+        assert errors_of('s = "a\\qb \\" c" + t @;', lexer_class)[1] == ("ErrorToken", "Error Token @", 20, 1, 20)
+
+
+def test_11_structured_fields():
+    """Test errors carry their lexeme, and a stray quote stays an ErrorToken
+    unless `strayQuoteUnclosed` is set"""
+    _, errors = Tokenizer('a @ "x\\y" "c\\\n').tokenize_recovering()
+    assert [e.token for e in errors] == ["@", "x\\y", "c\\"]
+    for lexer_class in (TyCLexer, TyCDFALexer):
+        lexer = lexer_class(InputStream('"c\\\nb @'))
+        lexer.recoverErrors = True
+        types = []
+        while (tok := lexer.nextToken()).type != -1:
+            types.append(tok.type)
+        assert types == [lexer.ERROR_CHAR, lexer.ID, lexer.ERROR_CHAR, lexer.ID, lexer.ERROR_CHAR]
+        assert [(type(e).__name__, e.token, e.offset) for e in lexer.lexerErrors] == [
+            ("ErrorToken", '"', 0), ("ErrorToken", "\\", 2), ("ErrorToken", "@", 6)
+        ]
@@ -0,0 +1,141 @@
+"""
+Test cases for the memory-mapped MappedCharStream.
+Lexing and parsing a file through the mapped stream must give the same
+tokens, positions and results as an InputStream over the decoded text.
+"""
+
+from antlr4 import InputStream, Token
+from tests.utils import ASTGenerator, Parser, TyCLexer, TyCDFALexer
+from src.lexer.mapped_stream import MappedCharStream
+from src.lexer.token_buffer import TokenBuffer
+
+
+SOURCE = """struct P { int x; float y; };
+// comment
+void main() {
+    P p = {1, 2.5};
+    string s = "tab\\there";
+    /* block
+       comment */
+    p.x = p.x + 3;
+}
+"""
+
+
+def write(tmp_path, text, name="prog.tyc"):
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def lex(lexer_class, stream):
+    lexer = lexer_class(stream)
+    tokens = []
+    while True:
+        tok = lexer.nextToken()
+        tokens.append((tok.type, tok.text, tok.start, tok.stop, tok.line, tok.column))
+        if tok.type == Token.EOF:
+            return tokens
+
+
+# ============================================================================
+# CHARACTER STREAM (Tests 1-4)
+# ============================================================================
+
+def test_01_ascii_fast_path(tmp_path):
+    """Test pure-ASCII files index the mapped bytes directly"""
+    stream = MappedCharStream(write(tmp_path, SOURCE))
+    assert stream.ascii
+    assert stream.strdata is None
+    assert stream.size == len(SOURCE)
+    assert stream.LA(1) == ord("s")
+    assert stream.getText(7, 7) == "P"
+    assert stream.getText(0, 10 ** 9) == SOURCE
+    stream.close()
+
+
+def test_02_non_ascii_fallback(tmp_path):
+    """Test files with non-ASCII bytes are decoded like InputStream"""
+    text = 'string s = "héllo \U0001F600";'
+    stream = MappedCharStream(write(tmp_path, text))
+    assert not stream.ascii
+    assert stream.size == len(text)
+    assert stream.getText(0, 5) == "string"
+    assert lex(TyCLexer, stream) == lex(TyCLexer, InputStream(text))
+
+
+def test_03_empty_file(tmp_path):
+    """Test an empty file yields only EOF"""
+    with MappedCharStream(write(tmp_path, "")) as stream:
+        assert stream.size == 0
+        assert stream.LA(1) == Token.EOF
+        assert [t[0] for t in lex(TyCLexer, stream)] == [Token.EOF]
+
+
+def test_04_close_releases_mapping(tmp_path):
+    """Test close() drops the mapping and leaves an empty stream"""
+    stream = MappedCharStream(write(tmp_path, SOURCE))
+    stream.close()
+    assert stream.size == 0
+    assert stream.LA(1) == Token.EOF
+
+
+# ============================================================================
+# LEXING AND PARSING (Tests 5-10)
+# ============================================================================
+
+def test_05_same_tokens_as_input_stream(tmp_path):
+    """Test both lexers produce identical tokens from the mapped stream"""
+    path = write(tmp_path, SOURCE)
+    for lexer_class in (TyCLexer, TyCDFALexer):
+        with MappedCharStream(path) as stream:
+            assert lex(lexer_class, stream) == lex(lexer_class, InputStream(SOURCE))
+
+
+def test_06_token_buffer_line_index(tmp_path):
+    """Test TokenBuffer computes line/column from the mapped bytes"""
+    with MappedCharStream(write(tmp_path, SOURCE)) as stream:
+        buffer = TokenBuffer(TyCDFALexer(stream))
+        buffer.fill()
+        expected = TokenBuffer(TyCDFALexer(InputStream(SOURCE)))
+        expected.fill()
+        positions = [(buffer.get(i).line, buffer.get(i).column) for i in range(buffer.size)]
+        assert positions == [(expected.get(i).line, expected.get(i).column) for i in range(expected.size)]
+
+
+def test_07_parser_from_file(tmp_path):
+    """Test Parser.from_file parses a file like Parser does its text"""
+    assert Parser.from_file(write(tmp_path, SOURCE)).parse() == "success"
+    bad = "void main() {\n  int x = ;\n}"
+    assert Parser.from_file(write(tmp_path, bad, "bad.tyc")).parse() == Parser(bad).parse()
+
+
+def test_08_parser_from_file_options(tmp_path):
+    """Test from_file forwards lexer and token stream selection"""
+    parser = Parser.from_file(write(tmp_path, SOURCE), lexer_class=TyCDFALexer, token_stream_class=TokenBuffer)
+    assert parser.parse() == "success"
+    assert parser.parse() == "success"
+
+
+def test_09_ast_generator_from_file(tmp_path):
+    """Test ASTGenerator.from_file gives the same result as from text"""
+    program = "int add(int a, int b) { return a + b; }\nvoid main() { auto x = add(1, 2); }"
+    actual = ASTGenerator.from_file(write(tmp_path, program)).generate()
+    assert str(actual) == str(ASTGenerator(program).generate())
+
+
+def test_10_from_file_closes(tmp_path):
+    """Test the from_file wrappers release the file on close() and on exit"""
+    path = write(tmp_path, SOURCE)
+    with Parser.from_file(path) as parser:
+        assert parser.parse() == "success"
+        assert parser.input_stream._file is not None
+    assert parser.input_stream._file is None and parser.input_stream._map is None
+    with ASTGenerator.from_file(path) as generator:
+        assert not isinstance(generator.generate(), str)
+    assert generator.input_stream._file is None
+    parser = Parser.from_file(path)
+    parser.close()
+    parser.close()
+    assert parser.input_stream._file is None
+    Parser(SOURCE).close()
@@ -0,0 +1,90 @@
+"""
+Test cases for the slotted AST node classes (src/utils/nodes.py): no
+per-instance __dict__, with the constructors, attributes, visitors and
+printing of before.
+"""
+
+import inspect
+import pickle
+
+import pytest
+from tests.test_descent import PROGRAM, shape
+from tests.utils import ASTGenerator
+from src.utils import nodes
+from src.utils.nodes import *
+from src.utils.visitor import walk
+
+NODE_CLASSES = [
+    cls for cls in vars(nodes).values() if inspect.isclass(cls) and issubclass(cls, ASTNode)
+]
+
+
+def parse(source):
+    ast = ASTGenerator(source, backend="descent").generate()
+    assert not isinstance(ast, str), ast
+    return ast
+
+
+# ============================================================================
+# LAYOUT (Tests 1-3)
+# ============================================================================
+
+def test_01_no_instance_dict():
+    """Test no node of a parsed program has a __dict__"""
+    for backend in ("antlr", "actions", "descent"):
+        ast = ASTGenerator(PROGRAM, backend=backend).generate()
+        for node in walk(ast):
+            assert not hasattr(node, "__dict__"), type(node).__name__
+
+
+def test_02_slots_are_constructor_fields():
+    """Test each class declares the fields its constructor sets, once"""
+    for cls in NODE_CLASSES:
+        assert "__slots__" in cls.__dict__, cls.__name__
+        names = [n for base in cls.__mro__ for n in base.__dict__.get("__slots__", ())]
+        assert len(names) == len(set(names)), cls.__name__
+        assert names[-3:] == ["line", "column", "_hashes"]
+    assert IntLiteral.__slots__ == () and Literal.__slots__ == ("value",)
+    assert StringLiteral.__slots__ == ("pool_index",)
+
+
+def test_03_unknown_attributes():
+    """Test setting an undeclared attribute fails, unset optional fields read None"""
+    node = Identifier("x")
+    with pytest.raises(AttributeError):
+        node.type = IntType()
+    assert (node.line, node.column) == (None, None)
+    assert VarDecl(None, "a").init_value is None
+
+
+# ============================================================================
+# SAME BEHAVIOUR (Tests 4-6)
+# ============================================================================
+
+def test_04_constructors_and_printing():
+    """Test constructor keywords, attribute names and str() are unchanged"""
+    decl = FuncDecl(return_type=IntType(), name="f", params=[Param(param_type=FloatType(), name="p")],
+                    body=BlockStmt(statements=[ReturnStmt(expr=StringLiteral("s", pool_index=0))]))
+    assert decl.params[0].param_type.__class__ is FloatType
+    assert decl.body.statements[0].expr.pool_index == 0
+    assert str(decl) == "FuncDecl(IntType(), f, [Param(FloatType(), p)], BlockStmt([ReturnStmt(return StringLiteral('s'))]))"
+
+
+def test_05_pickle():
+    """Test ASTs survive pickling (as across the parallel parser's processes)"""
+    ast = parse(PROGRAM)
+    copy = pickle.loads(pickle.dumps(ast))
+    assert shape(copy) == shape(ast)
+    assert str(copy) == str(ast)
+
+
+def test_06_subclasses():
+    """Test subclasses without __slots__ still take extra attributes"""
+
+    class Tagged(Identifier):
+        pass
+
+    node = Tagged("x")
+    node.tag = "t"
+    assert str(node) == "Identifier(x)" and vars(node) == {"tag": "t"}
+    assert shape(node) == ("Tagged", (("column", None), ("line", None), ("name", "x"), ("tag", "t")))
@@ -0,0 +1,138 @@
+"""
+Test cases for parallel chunked lexing.
+Tokens stitched from chunks must be identical to a single TyCLexer pass,
+and lexical errors must be raised at their global positions.
+"""
+
+import random
+
+import pytest
+from antlr4 import InputStream, CommonTokenStream, Token
+from tests.utils import Parser, TyCLexer, TyCDFALexer
+from src.lexer.parallel import ParallelLexer, split_points
+
+
+def lex_all(lexer):
+    tokens = []
+    try:
+        while True:
+            t = lexer.nextToken()
+            tokens.append((t.type, t.text, t.channel, t.start, t.stop, t.line, t.column))
+            if t.type == Token.EOF:
+                break
+    except Exception as err:
+        tokens.append((type(err).__name__, str(err), err.offset, err.line, err.column))
+    return tokens
+
+
+def assert_same(source, workers=1, min_chunk=1, lexer_class=TyCLexer):
+    expected = lex_all(TyCLexer(InputStream(source)))
+    parallel = ParallelLexer(InputStream(source), lexer_class, workers=workers, min_chunk=min_chunk)
+    assert lex_all(parallel) == expected, repr(source)
+
+
+# ============================================================================
+# SPLIT POINTS (Tests 1-4)
+# ============================================================================
+
+def test_01_splits_after_newlines():
+    """Test chunks start right after a newline"""
+    text = "a;\nb;\nc;\nd;\n"
+    points = split_points(text, parts=4, min_chunk=1)
+    assert points[0] == 0
+    assert all(text[p - 1] == "\n" for p in points[1:])
+    assert len(points) > 1
+
+
+def test_02_no_split_inside_block_comment():
+    """Test newlines inside a block comment are never split points"""
+    text = "a;\n/* x\ny\nz */ b;\nc;\n"
+    comment = range(text.index("/*"), text.index("*/") + 2)
+    for parts in range(1, 10):
+        assert all(p not in comment for p in split_points(text, parts, min_chunk=1))
+
+
+def test_03_comment_opener_in_string_or_line_comment():
+    """Test "/*" inside strings and line comments does not open a comment"""
+    text = 'a = "/*";\n// /*\nb;\n"x\\"/*"\nc;\n*/\n'
+    points = split_points(text, parts=20, min_chunk=1)
+    assert text.index("b;") in points
+    assert text.index("c;") in points
+
+
+def test_04_small_input_is_one_chunk():
+    """Test inputs below min_chunk are not split"""
+    assert split_points("int x;\nint y;\n", parts=8) == [0]
+
+
+# ============================================================================
+# STITCHED TOKENS (Tests 5-8)
+# ============================================================================
+
+def test_05_same_tokens_as_tyc_lexer():
+    """Test a multi-line program lexes identically in chunks"""
+    source = (
+        "struct P {\n  int x;\n};\n/* header\n * comment */\nvoid main() {\n"
+        '  string s = "a/*b";\n  // note /*\n  P p = {1};\n  p.x = 2.5e1;\n}\n'
+    )
+    for min_chunk in (1, 5, 17, 1000):
+        assert_same(source, min_chunk=min_chunk)
+
+
+def test_06_dfa_lexer_chunks():
+    """Test TyCDFALexer as the chunk lexer"""
+    source = "int a;\r\nfloat b = .5;\r\n/* x\r\n */ string c = \"q\";\r\n"
+    assert_same(source, lexer_class=TyCDFALexer)
+
+
+def test_07_process_pool():
+    """Test chunks lexed in worker processes stitch back identically"""
+    source = "".join(f"int v{i} = {i}; // line {i}\n/* c\n{i} */\n" for i in range(200))
+    assert_same(source, workers=3, min_chunk=64)
+
+
+def test_08_parser_over_parallel_lexer():
+    """Test TyCParser accepts a CommonTokenStream fed by ParallelLexer"""
+    from build.TyCParser import TyCParser
+
+    source = "int f(int a) {\n  return a;\n}\nvoid main() {\n  f(1);\n}\n" * 20
+    parser = TyCParser(CommonTokenStream(ParallelLexer(InputStream(source), TyCLexer, workers=2, min_chunk=32)))
+    parser.program()
+    assert parser.getNumberOfSyntaxErrors() == 0
+    assert Parser(source).parse() == "success"
+
+
+# ============================================================================
+# LEXICAL ERRORS (Tests 9-11)
+# ============================================================================
+
+def test_09_error_at_global_position():
+    """Test a lexical error in a later chunk reports its global position"""
+    source = "int a;\nint b;\nint c;\n  x = @;\nint d;\n"
+    parallel = ParallelLexer(InputStream(source), TyCLexer, workers=1, min_chunk=1)
+    with pytest.raises(Exception, match="Error Token @") as info:
+        lex_all_raising(parallel)
+    assert (info.value.offset, info.value.line, info.value.column) == (27, 4, 6)
+    assert_same(source)
+
+
+def test_10_first_error_wins():
+    """Test only the first error is raised when several chunks fail"""
+    assert_same('a;\n"unclosed\nb;\nc = "bad\\q";\n@\n')
+    assert_same('a;\nb;\n"x\\\n/* y\n*/ z\n')
+
+
+def test_11_random_multiline_inputs():
+    """Test random multi-line snippets against a single-pass lexer"""
+    fragments = list('az_09 .eE+-*/"\\\n\n\r\t!=<>(){};,') + [
+        "/*", "*/", "//", '"a\\n"', "int", "\n/* x\n*/\n", '"/*"', "1e5",
+    ]
+    rng = random.Random(7)
+    for _ in range(1500):
+        source = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 40)))
+        assert_same(source, min_chunk=rng.randint(1, 8))
+
+
+def lex_all_raising(lexer):
+    while lexer.nextToken().type != Token.EOF:
+        pass
@@ -0,0 +1,106 @@
+"""
+Test cases for parallel parsing of top-level declarations (src/parser/parallel.py).
+The merged AST, its positions and string pool, and the first error must be
+those of a sequential parse.
+"""
+
+from tests.test_descent import PROGRAM, random_mutations, shape
+from tests.utils import ASTGenerator, TyCDFALexer
+from src.parser.parallel import scan, split_points
+
+SOURCE = """struct A { int x; };
+int f(int n) { string s = "}{;"; return n; } // } {
+/* { */ struct B { A a; } ;
+void g() { f(1); } void main() { A a = {1}; a.x = f(a.x); }
+"""
+
+
+def assert_same(source, workers=1, min_chunk=1, **kwargs):
+    sequential = ASTGenerator(source, **kwargs)
+    expected = sequential.generate()
+    parallel = ASTGenerator(source, **kwargs)
+    actual = parallel.generate_parallel(workers, min_chunk)
+    assert shape(actual) == shape(expected), source
+    if not isinstance(expected, str):
+        assert parallel.string_pool.values == (sequential.string_pool.values if sequential.string_pool else [])
+    return actual
+
+
+# ============================================================================
+# SPLITTING (Tests 1-3)
+# ============================================================================
+
+def test_01_boundaries():
+    """Test boundaries are the `}` and `;` at depth 0 outside strings and comments"""
+    boundaries, pool = scan(SOURCE)
+    ends = [SOURCE[end - 1] for end, _ in boundaries]
+    assert ends == ["}", ";", "}", "}", ";", "}", "}"]
+    assert pool.values == ["}{;"]
+
+
+def test_02_split_between_declarations():
+    """Test cuts fall after functions and after the `;` of structs"""
+    boundaries, _ = scan(SOURCE)
+    points = split_points(SOURCE, boundaries, 100, 1)
+    assert [SOURCE[p:].split()[0] for p in points] == ["struct", "int", "//", "void", "void"]
+    assert split_points(SOURCE, boundaries, 100, len(SOURCE)) == [0]
+
+
+def test_03_unbalanced():
+    """Test unbalanced braces are not split"""
+    assert scan("void f() { } }")[0] is None
+    assert scan("void f() { {")[0] is None
+
+
+# ============================================================================
+# SAME AST (Tests 4-6)
+# ============================================================================
+
+def test_04_same_ast():
+    """Test the merged AST, positions and string pool equal a sequential parse"""
+    assert len(assert_same(SOURCE).decls) == 5
+    assert_same(SOURCE, lexer_class=TyCDFALexer)
+    assert_same("\n".join([PROGRAM] * 5).replace("main", "m"))
+
+
+def test_05_process_pool():
+    """Test chunks parsed in worker processes merge in source order"""
+    source = "\n".join(PROGRAM.replace("main", f"m{i}") for i in range(6))
+    ast = assert_same(source, workers=3, min_chunk=200)
+    assert [d.name for d in ast.decls][-1] == "m5"
+
+
+def test_06_empty_and_single():
+    """Test sources without declarations or cuts"""
+    assert_same("")
+    assert_same("// nothing\n")
+    assert_same(PROGRAM, workers=4, min_chunk=10**6)
+
+
+# ============================================================================
+# ERRORS (Tests 7-9)
+# ============================================================================
+
+def test_07_global_positions():
+    """Test a syntax error in a later chunk has its global line and column"""
+    source = SOURCE + "void h() {\n  int x = ;\n}\n"
+    assert assert_same(source) == "AST Generation Error: Error on line 6 col 10: ;"
+
+
+def test_08_errors_at_cuts():
+    """Test errors that a cut would change are those of a sequential parse"""
+    for source in (
+        "struct A { int x; }\nvoid f() {}",
+        "void f() {} ; void g() {}",
+        "void f() {} 5 void g() {}",
+        'void f() {} void g() { s = "\\q"; }',
+        "void f() {} void g() { x = 1 @ 2; } void h() { y = ; }",
+    ):
+        assert assert_same(source).startswith("AST Generation Error")
+
+
+def test_09_mutations():
+    """Test random edits of programs between valid declarations"""
+    head = "struct H { int h; };\nint k() { return 1; }\n"
+    for source in random_mutations(150, 17):
+        assert_same(head + source.replace("main", "m2") + "\nvoid tail() { k(); }")
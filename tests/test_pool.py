@@ -0,0 +1,139 @@
+"""
+Test cases for the pooled lexer/parser instances (src/parser/pool.py)
+"""
+
+import threading
+
+from antlr4 import CommonTokenStream, InputStream
+from tests.test_descent import random_mutations, shape
+from tests.utils import ASTGenerator, Parser, TokenBuffer, TyCDFALexer, TyCLexer, TyCParser
+from src.parser.pool import RecognizerPool, parse_many, pool_for
+from src.utils.error_listener import NewErrorListener
+
+VALID = "void main() { int x = 1; f(x).y = x++; }"
+
+
+def fresh_parse(source, lexer_class=TyCLexer, token_stream_class=CommonTokenStream):
+    parser = TyCParser(token_stream_class(lexer_class(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        parser.program()
+        return "success"
+    except Exception as e:
+        return str(e)
+
+
+def corpus():
+    from benchmarks.common import parser_test_sources
+
+    return parser_test_sources() + list(random_mutations(100, 14))
+
+
+# ============================================================================
+# SAME RESULTS (Tests 1-4)
+# ============================================================================
+
+def test_01_compile_many():
+    """Test compile_many gives the AST or error of a fresh ASTGenerator"""
+    sources = corpus()
+    results = ASTGenerator.compile_many(sources)
+    assert [shape(r) for r in results] == [shape(ASTGenerator(s).generate()) for s in sources]
+
+
+def test_02_compile_many_two_stage():
+    """Test compile_many in two-stage mode"""
+    sources = corpus()[:60]
+    results = ASTGenerator.compile_many(sources, two_stage=True)
+    assert [shape(r) for r in results] == [shape(ASTGenerator(s).generate()) for s in sources]
+
+
+def test_03_parse_many():
+    """Test parse_many and Parser give the results of fresh instances"""
+    sources = corpus()
+    expected = [fresh_parse(s) for s in sources]
+    assert parse_many(sources) == expected
+    assert [Parser(s).parse() for s in sources] == expected
+    assert [Parser(s, two_stage=True).parse() for s in sources] == expected
+
+
+def test_04_other_classes():
+    """Test pools for other lexer and token stream classes"""
+    sources = corpus()[:60]
+    for lexer_class, stream_class in ((TyCDFALexer, CommonTokenStream), (TyCLexer, TokenBuffer)):
+        expected = [fresh_parse(s, lexer_class, stream_class) for s in sources]
+        actual = [Parser(s, lexer_class=lexer_class, token_stream_class=stream_class).parse() for s in sources]
+        assert actual == expected
+
+
+# ============================================================================
+# REUSE (Tests 5-8)
+# ============================================================================
+
+def test_05_same_instances():
+    """Test the pool rebinds the same recognizers to each source"""
+    pool = pool_for()
+    assert pool_for() is pool
+    parser = pool.acquire(VALID)
+    lexer = pool.lexer
+    assert pool.acquire("void f() {}") is parser
+    assert pool.lexer is lexer
+
+
+def test_06_after_errors():
+    """Test a syntax or lexical error does not leak into the next parse"""
+    pool = RecognizerPool()
+    for bad in ("void main() { int x = ; }", 'void main() { s = "a\\q"; }', "void main() { x = 1 $ 2; }", "{"):
+        assert pool.compile(bad).startswith("AST Generation Error")
+        assert str(pool.compile(VALID)) == str(ASTGenerator(VALID).generate())
+
+
+def test_07_string_pool_per_source():
+    """Test every source gets its own string pool"""
+    pool = RecognizerPool()
+    first = pool.compile('void main() { f("a", "b"); }')
+    second = pool.compile('void main() { f("b"); }')
+    assert [a.pool_index for a in first.decls[0].body.statements[0].expr.args] == [0, 1]
+    assert second.decls[0].body.statements[0].expr.args[0].pool_index == 0
+    assert pool.lexer.stringPool[0] == "b"
+
+
+def test_08_thread_local():
+    """Test each thread gets its own recognizers with the same results"""
+    sources = corpus()[:40]
+    expected = [str(ASTGenerator(s).generate()) for s in sources]
+    pool = RecognizerPool()
+    parsers, results = {}, {}
+
+    def work(i):
+        parsers[i] = pool.acquire(VALID)
+        results[i] = [str(pool.compile(s)) for s in sources]
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(p) for p in parsers.values()}) == 3
+    assert all(r == expected for r in results.values())
+
+
+# ============================================================================
+# AST GENERATOR (Test 9)
+# ============================================================================
+
+def test_09_ast_generator():
+    """Test ASTGenerator uses the pooled recognizers, and generators alive at
+    the same time still give their own ASTs and string pools"""
+    pool = pool_for()
+    a = ASTGenerator('void main() { f("a"); }')
+    assert a.parser is pool.parser and a.lexer is pool.lexer and a.ast_generator is pool.visitor()
+    assert ASTGenerator(VALID, backend="actions").parser is ASTGenerator(VALID, backend="actions").parser
+    b = ASTGenerator('void main() { g("b", "c"); }', backend="actions")
+    c = ASTGenerator('void main() { h("d"); }', backend="descent")
+    asts = [g.generate() for g in (a, b, c)]
+    assert [ast.decls[0].body.statements[0].expr.name for ast in asts] == ["f", "g", "h"]
+    assert [g.string_pool.values for g in (a, b, c)] == [["a"], ["b", "c"], ["d"]]
+    for source in corpus()[:40]:
+        expected = str(pool.compile(source))
+        assert all(str(ASTGenerator(source, backend=b).generate()) == expected for b in ("antlr", "actions", "descent"))
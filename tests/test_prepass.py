@@ -0,0 +1,131 @@
+"""
+Test cases for the character-class prepass and TyCPrepassLexer.
+The lexer that jumps over prepass regions must produce exactly the tokens,
+positions and errors of TyCLexer; the NumPy and regex passes must agree.
+"""
+
+import random
+
+import pytest
+from antlr4 import InputStream, Token
+from tests.utils import Tokenizer, Parser, TyCLexer, TyCDFALexer, TyCPrepassLexer
+from src.lexer.prepass import Prepass, PrepassMixin
+
+
+def lex_all(lexer_class, source):
+    lexer = lexer_class(InputStream(source))
+    tokens = []
+    try:
+        while True:
+            t = lexer.nextToken()
+            tokens.append((t.type, t.text, t.start, t.stop, t.line, t.column))
+            if t.type == Token.EOF:
+                break
+    except Exception as err:
+        tokens.append((type(err).__name__, str(err)))
+    return tokens
+
+
+def assert_same(source, lexer_class=TyCPrepassLexer):
+    assert lex_all(lexer_class, source) == lex_all(TyCLexer, source), repr(source)
+
+
+def spans(prepass):
+    return (
+        list(zip(prepass.skip_starts, prepass.skip_ends)),
+        list(zip(prepass.string_starts, prepass.string_ends)),
+        list(prepass.line_starts),
+    )
+
+
+FRAGMENTS = list('az_09 .eE+-*/"\\\n\r\t\f!=<>(){};,@') + [
+    "/*", "*/", "//", '"a\\n"', '"/*"', "\\q", "  ", "\n/* x\n*/\n", "é",
+]
+
+
+# ============================================================================
+# PREPASS (Tests 1-4)
+# ============================================================================
+
+def test_01_regions():
+    """Test WS and comments merge into one skipped region"""
+    text = 'a  /* c */ // d\n  b = "s t";'
+    prepass = Prepass(text, use_numpy=False)
+    skipped, strings, lines = spans(prepass)
+    assert skipped == [(1, 18), (19, 20), (21, 22)]
+    assert strings == [(22, 27)]
+    assert lines == [0, 16]
+
+
+def test_02_errors_are_not_regions():
+    """Test unclosed strings, illegal escapes and open comments stay out"""
+    text = 'x "open\ny "a\\qb c" /* never'
+    skipped, strings, _ = spans(Prepass(text, use_numpy=False))
+    assert strings == []
+    assert all(start != text.index("/*") for start, _ in skipped)
+
+
+def test_03_line_column():
+    """Test line/column lookup from the line-start table"""
+    prepass = Prepass("ab\ncd\r\n\nx", use_numpy=False)
+    assert [prepass.line_column(i) for i in (0, 1, 3, 7, 8)] == [(1, 0), (1, 1), (2, 0), (3, 0), (4, 0)]
+
+
+def test_04_numpy_matches_regex():
+    """Test the vectorized pass finds the same spans as the regex pass"""
+    pytest.importorskip("numpy")
+    rng = random.Random(11)
+    for _ in range(1500):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        assert spans(Prepass(text, use_numpy=True)) == spans(Prepass(text, use_numpy=False)), repr(text)
+
+
+# ============================================================================
+# LEXER (Tests 5-10)
+# ============================================================================
+
+def test_05_program_tokens():
+    """Test a program lexes identically with the prepass"""
+    assert_same(
+        "struct P { int x; };\n// line\n/* block\n comment */\nvoid main() {\n"
+        '  string s = "a\\tb /* no */";\n  P p = {1};\n  p.x = 2.5e1; \f\r\n}\n'
+    )
+
+
+def test_06_unclosed_string_error():
+    """Test unclosed strings raise the same error"""
+    assert_same('x = "ok";\n  y = "open\n')
+    with pytest.raises(Exception, match="Unclosed String: open"):
+        Tokenizer('y = "open', TyCPrepassLexer).tokenize()
+
+
+def test_07_unterminated_block_comment():
+    """Test an unterminated block comment still lexes as DIV and MUL"""
+    assert_same("a /* never closed\n b")
+    assert [t.type for t in Tokenizer("a /* b", TyCPrepassLexer).tokenize()] == ["ID", "DIV", "MUL", "ID"]
+
+
+def test_08_trailing_regions():
+    """Test EOF position after a trailing skipped region or string"""
+    assert_same("x  \n\n")
+    assert_same("x // end")
+    assert_same('"tail"')
+    assert_same("")
+
+
+def test_09_dfa_lexer_mixin():
+    """Test the mixin on TyCDFALexer and through the parser"""
+
+    class TyCPrepassDFALexer(PrepassMixin, TyCDFALexer):
+        pass
+
+    source = 'void main() {\n  /* c */ string s = "x";\n  printString(s);\n}'
+    assert_same(source, TyCPrepassDFALexer)
+    assert Parser(source, lexer_class=TyCPrepassLexer).parse() == "success"
+
+
+def test_10_random_inputs():
+    """Test random snippets against TyCLexer"""
+    rng = random.Random(5)
+    for _ in range(1500):
+        assert_same("".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30))))
@@ -0,0 +1,127 @@
+"""
+Test cases for streaming printing of ASTs (src/utils/printer.py): write()
+gives the text of str() in chunks, to any object with a write method.
+"""
+
+import io
+import tracemalloc
+
+from benchmarks.common import generate_program_of_size
+from tests.test_descent import PROGRAM
+from tests.test_pool import corpus
+from tests.utils import ASTGenerator
+from src.utils.arena import Arena
+from src.utils.nodes import *
+from src.utils.printer import render, write
+
+
+def parse(source, **kwargs):
+    ast = ASTGenerator(source, **kwargs).generate()
+    assert not isinstance(ast, str), ast
+    return ast
+
+
+def written(node, **kwargs) -> str:
+    buffer = io.StringIO()
+    write(node, buffer, **kwargs)
+    return buffer.getvalue()
+
+
+class Recorder:
+    """A stream that keeps the strings written to it."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+
+
+class Counter:
+    """A stream that keeps only the number of characters written to it."""
+
+    def __init__(self):
+        self.length = 0
+
+    def write(self, text):
+        self.length += len(text)
+
+
+# ============================================================================
+# SAME TEXT (Tests 1-3)
+# ============================================================================
+
+def test_01_same_as_str():
+    """Test write() gives str() for every backend's AST and any chunk size"""
+    asts = [parse(PROGRAM, backend=b) for b in ("antlr", "actions", "descent")]
+    asts.append(ASTGenerator(PROGRAM).generate_lazy())
+    asts.append(Arena.from_tree(asts[0]).node())
+    for ast in asts:
+        assert ASTNode.__str__ is render
+        for chunk_pieces in (1, 7, 4096):
+            assert written(ast, chunk_pieces=chunk_pieces) == str(asts[0])
+
+
+def test_02_corpus():
+    """Test write() gives str() for the programs of the test suite"""
+    for source in corpus()[:200]:
+        ast = ASTGenerator(source).generate()
+        if not isinstance(ast, str):
+            assert written(ast, chunk_pieces=16) == str(ast)
+
+
+def test_03_file_and_custom_str(tmp_path):
+    """Test writing to a text file, with nodes that print themselves"""
+
+    class Hole(Expr):
+        def accept(self, visitor, o=None):
+            return None
+
+        def __str__(self):
+            return "<hole>"
+
+    node = ExprStmt(BinaryOp(Hole(), "+", StringLiteral("s")))
+    path = tmp_path / "ast.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        write(node, f)
+    assert path.read_text(encoding="utf-8") == "ExprStmt(BinaryOp(<hole>, +, StringLiteral('s')))"
+
+
+# ============================================================================
+# STREAMING (Tests 4-6)
+# ============================================================================
+
+def test_04_chunks():
+    """Test the text is written in non-empty chunks of about the given size"""
+    ast = parse(generate_program_of_size(16 * 1024), backend="descent")
+    stream = Recorder()
+    write(ast, stream, chunk_pieces=256)
+    assert "".join(stream.chunks) == str(ast)
+    assert len(stream.chunks) > 10 and all(stream.chunks)
+    small = Recorder()
+    write(Identifier("x"), small)
+    assert small.chunks == ["Identifier(x)"]
+
+
+def test_05_deep_tree():
+    """Test a 100k deep expression streams without recursion"""
+    node = IntLiteral(1)
+    for _ in range(100_000):
+        node = PrefixOp("-", node)
+    text = written(node, chunk_pieces=64)
+    assert text == str(node)
+    assert text.startswith("PrefixOp(-PrefixOp(-") and text.endswith("IntLiteral(1)" + ")" * 100_000)
+
+
+def test_06_memory():
+    """Test streaming keeps far less than the whole text in memory"""
+    ast = parse(generate_program_of_size(256 * 1024), backend="descent")
+    stream = Counter()
+    tracemalloc.start()
+    try:
+        write(ast, stream)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert stream.length == len(str(ast))
+    assert peak < stream.length // 4
@@ -0,0 +1,148 @@
+"""
+Test cases for the decision-level prediction profile (src/parser/profiling.py)
+"""
+
+import json
+
+import pytest
+
+from tests.test_pool import corpus
+from tests.utils import ASTGenerator, Parser, TyCASTParser, TyCParser
+from src.parser.pool import pool_for
+from src.parser.profiling import ParseProfile, main
+
+PROGRAM = """
+struct P { int x; };
+int f(int n) { return n; }
+void main() {
+    P p = {1};
+    p.x = f(p.x) + 1;
+    f(p).x++;
+    for (int i = 0; i < 3; ++i) { if (i) continue; else break; }
+    switch (p.x) { case 1: p.x = 2; break; default: ; }
+}
+"""
+
+
+def profiled(sources, **kwargs):
+    profile = ParseProfile()
+    results = [Parser(s, profile=profile, **kwargs).parse() for s in sources]
+    return profile, results
+
+
+# ============================================================================
+# STATISTICS (Tests 1-4)
+# ============================================================================
+
+def test_01_rule_names():
+    """Test predicted decisions are reported under their rule names"""
+    profile, _ = profiled([PROGRAM])
+    rules = {row["rule"] for row in profile.rows()}
+    assert {"stmt", "postfixPrimary", "ifStmt", "forInit"} <= rules
+    assert all(rule in TyCParser.ruleNames for rule in rules)
+    assert profile.parses == 1
+
+
+def test_02_counts():
+    """Test lookahead and transition counts are consistent"""
+    profile, _ = profiled([PROGRAM])
+    for row in profile.rows():
+        assert row["invocations"] > 0
+        assert 1 <= row["sll_min_look"] <= row["sll_max_look"]
+        assert row["sll_total_look"] >= row["invocations"]
+        assert row["ll_fallbacks"] <= row["invocations"]
+        assert row["sll_atn_transitions"] + row["sll_dfa_transitions"] == row["sll_total_look"]
+
+
+def test_03_ll_fallback():
+    """Test the dangling else falls back to full-context prediction"""
+    profile, _ = profiled(["void main() { if (a) if (b) x = 1; else x = 2; }"])
+    row = next(r for r in profile.rows() if r["rule"] == "ifStmt")
+    assert row["ll_fallbacks"] >= 1
+    assert row["ll_max_look"] >= 1
+
+
+def test_04_errors():
+    """Test a prediction that fails is counted as an error"""
+    profile, results = profiled(["struct P { int x; }; P } f() {}"])
+    assert results == ["Error on line 1 col 23: }"]
+    assert [(row["rule"], row["errors"]) for row in profile.rows()] == [("funcDecl", 1)]
+
+
+# ============================================================================
+# MERGING AND REPORTS (Tests 5-7)
+# ============================================================================
+
+def test_05_merge():
+    """Test merged profiles equal one profile of all the sources"""
+    sources = corpus()[:40]
+    whole, _ = profiled(sources)
+    first, _ = profiled(sources[:20])
+    second, _ = profiled(sources[20:])
+    first.merge(second)
+    drop_time = lambda rows: [{k: v for k, v in r.items() if k != "time"} for r in rows]
+    assert drop_time(first.rows("invocations")) == drop_time(whole.rows("invocations"))
+    assert first.parses == whole.parses == 40
+
+
+def test_06_report_sorted():
+    """Test the text report lists decisions in the requested order"""
+    profile, _ = profiled(corpus()[:40])
+    rows = profile.rows("invocations")
+    assert [r["invocations"] for r in rows] == sorted((r["invocations"] for r in rows), reverse=True)
+    lines = profile.report("invocations", top=2).splitlines()
+    assert lines[0].startswith("TyCParser: 40 parses")
+    assert len(lines) == 5
+    assert lines[3].split()[0] == rows[0]["rule"]
+
+
+def test_07_corpus_json(tmp_path, capsys):
+    """Test the command line profiles a directory tree and writes JSON"""
+    sources = corpus()[:12]
+    (tmp_path / "src" / "sub").mkdir(parents=True)
+    for i, source in enumerate(sources):
+        folder = tmp_path / "src" / ("sub" if i % 2 else "")
+        (folder / f"{i:02}.tyc").write_text(source, encoding="utf-8")
+    out = tmp_path / "profile.json"
+    main([str(tmp_path / "src"), "--json", str(out), "--sort", "invocations"])
+    data = json.loads(out.read_text(encoding="utf-8"))
+    expected, results = profiled(sources)
+    assert data["parser"] == "TyCParser"
+    assert data["parses"] == 12
+    assert len(data["files"]) == 12
+    assert sorted(f["result"] for f in data["files"]) == sorted(results)
+    assert [(d["rule"], d["invocations"]) for d in data["decisions"]] == [
+        (r["rule"], r["invocations"]) for r in expected.rows("invocations")
+    ]
+    assert "Slowest files:" in capsys.readouterr().out
+
+
+# ============================================================================
+# PARSING (Tests 8-10)
+# ============================================================================
+
+def test_08_same_results():
+    """Test profiling does not change results, in either prediction mode"""
+    sources = corpus()
+    for two_stage in (False, True):
+        _, results = profiled(sources, two_stage=two_stage)
+        assert results == [Parser(s, two_stage=two_stage).parse() for s in sources]
+
+
+def test_09_pool_restored():
+    """Test the pooled parser gets its own simulator back"""
+    interp = pool_for().parser._interp
+    profiled([PROGRAM, "void main() { int x = ; }"])
+    assert pool_for().parser._interp is interp
+
+
+def test_10_ast_generator():
+    """Test ASTGenerator profiles its backend's parser class"""
+    profile = ParseProfile(TyCASTParser)
+    ast = ASTGenerator(PROGRAM, backend="actions", profile=profile).generate()
+    assert str(ast) == str(ASTGenerator(PROGRAM).generate())
+    assert profile.rows()
+    with pytest.raises(ValueError):
+        ASTGenerator(PROGRAM, profile=profile)
+    with pytest.raises(ValueError):
+        ASTGenerator(PROGRAM, backend="descent", profile=ParseProfile())
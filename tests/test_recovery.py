@@ -0,0 +1,162 @@
+"""
+Test cases for the recovering parse (src/parser/recovery.py).
+In recovering mode one parse reports every syntax and lexical error and
+still builds the AST of the declarations without errors; the first error
+is the one a normal parse stops at.
+"""
+
+import pytest
+from tests.test_pool import corpus
+from tests.utils import ASTGenerator, Parser, TokenBuffer, TyCDFALexer
+from src.parser.pool import pool_for
+from src.utils.error_listener import NewErrorListener
+
+PROGRAM = """struct Point { int x; int y; };
+int twice(int n) { return n * 2; }
+void broken() { int a = ; a = 2 +; }
+float half(float f) { return f / 2; }
+void main() { Point p = {1, 2}; p.x = twice(p.y) }
+"""
+
+
+def errors_of(source, **kwargs):
+    return [str(e) for e in Parser(source, **kwargs).parse_recovering()]
+
+
+# ============================================================================
+# FIRST ERROR (Tests 1-3)
+# ============================================================================
+
+def test_01_first_error_unchanged():
+    """Test the first error is the message of a normal parse"""
+    for source in corpus():
+        errors = errors_of(source)
+        assert (errors[0] if errors else "success") == Parser(source).parse()
+
+
+def test_02_first_error_other_streams():
+    """Test the first error with the DFA lexer and TokenBuffer"""
+    for source in corpus()[:80]:
+        kwargs = dict(lexer_class=TyCDFALexer, token_stream_class=TokenBuffer)
+        errors = errors_of(source, **kwargs)
+        assert (errors[0] if errors else "success") == Parser(source, **kwargs).parse()
+
+
+def test_03_valid_program():
+    """Test a valid program has no errors and its whole AST"""
+    source = PROGRAM.replace("= ;", "= 1;").replace("2 +;", "2;").replace("p.y) }", "p.y); }")
+    ast, errors = ASTGenerator(source).generate_recovering()
+    assert errors == []
+    assert str(ast) == str(ASTGenerator(source).generate())
+
+
+# ============================================================================
+# ALL ERRORS (Tests 4-9)
+# ============================================================================
+
+def test_04_every_statement():
+    """Test errors in consecutive statements are all reported"""
+    assert errors_of("void main() { int x = ; y = 2 +; z = 3; w = (1; }") == [
+        "Error on line 1 col 22: ;",
+        "Error on line 1 col 31: ;",
+        "Error on line 1 col 46: ;",
+    ]
+
+
+def test_05_every_declaration():
+    """Test errors in several declarations are all reported"""
+    assert errors_of(PROGRAM) == [
+        "Error on line 3 col 24: ;",
+        "Error on line 3 col 33: ;",
+        "Error on line 5 col 49: }",
+    ]
+
+
+def test_06_unclosed_body():
+    """Test a body left open ends at the next declaration"""
+    source = "void f() { x = ; \nvoid g() { y = 1 }\nstruct S { int a;\nint h() { return 1; }"
+    assert errors_of(source) == [
+        "Error on line 1 col 15: ;",
+        "Error on line 2 col 0: void",
+        "Error on line 2 col 17: }",
+        "Error on line 4 col 0: int",
+    ]
+
+
+def test_07_stray_tokens():
+    """Test stray tokens between declarations and statements are skipped"""
+    assert errors_of("} ; int f() { ; ; x = 1; y = ; } 5 6 void g() { ) }") == [
+        "Error on line 1 col 0: }",
+        "Error on line 1 col 14: ;",
+        "Error on line 1 col 29: ;",
+        "Error on line 1 col 33: 5",
+        "Error on line 1 col 48: )",
+    ]
+
+
+def test_08_nested_blocks():
+    """Test errors in conditions and nested blocks are all reported"""
+    source = "void f() { if (x = ) { a = ; } { { c = ; } } while (1) { b = * 2; } }"
+    assert errors_of(source) == [
+        "Error on line 1 col 19: )",
+        "Error on line 1 col 27: ;",
+        "Error on line 1 col 39: ;",
+        "Error on line 1 col 61: *",
+    ]
+
+
+def test_09_lexical_errors():
+    """Test lexical errors are reported once, among the syntax errors"""
+    source = 'void f() { s = "a\\q"; t = ; u = 1 @ 2; }'
+    errors = Parser(source).parse_recovering()
+    assert [str(e) for e in errors] == [
+        "Illegal Escape In String: a\\q",
+        "Error on line 1 col 26: ;",
+        "Error Token @",
+    ]
+    assert (errors[2].line, errors[2].column) == (1, 34)
+
+
+# ============================================================================
+# POSITIONS AND PARTIAL AST (Tests 10-11)
+# ============================================================================
+
+def test_10_positions():
+    """Test syntax errors carry their line, column, offset and token"""
+    errors = Parser(PROGRAM).parse_recovering()
+    assert [(e.line, e.column, e.token) for e in errors] == [(3, 24, ";"), (3, 33, ";"), (5, 49, "}")]
+    assert PROGRAM[errors[2].offset] == "}"
+
+
+def test_11_partial_ast():
+    """Test the AST holds the declarations without errors"""
+    ast, errors = ASTGenerator(PROGRAM).generate_recovering()
+    clean = "\n".join(line for line in PROGRAM.splitlines() if "broken" not in line and "main" not in line)
+    assert str(ast) == str(ASTGenerator(clean).generate())
+    assert [d.name for d in ast.decls] == ["Point", "twice", "half"]
+    assert ast.decls[2].line == 4
+    assert len(errors) == 3
+
+
+# ============================================================================
+# MODES (Tests 12-13)
+# ============================================================================
+
+def test_12_pool_restored():
+    """Test a recovering parse leaves the pooled recognizers as they were"""
+    errors_of(PROGRAM)
+    pool = pool_for()
+    assert pool.parser._listeners == [NewErrorListener.INSTANCE]
+    assert type(pool.parser._errHandler).__name__ == "DefaultErrorStrategy"
+    assert pool.lexer.recoverErrors is False
+    assert Parser(PROGRAM).parse() == "Error on line 3 col 24: ;"
+    assert Parser('void f() { s = "a\\q"; }').parse() == "Illegal Escape In String: a\\q"
+
+
+def test_13_backends():
+    """Test only the visitor backend recovers"""
+    for backend in ("actions", "descent"):
+        with pytest.raises(ValueError):
+            ASTGenerator(PROGRAM, backend=backend).generate_recovering()
+    ast, errors = ASTGenerator(PROGRAM, lexer_class=TyCDFALexer).generate_recovering()
+    assert len(ast.decls) == 3 and len(errors) == 3
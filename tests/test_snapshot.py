@@ -0,0 +1,183 @@
+"""
+Test cases for the warm DFA snapshot (src/parser/snapshot.py)
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+from antlr4 import CommonTokenStream, InputStream
+from tests.utils import ASTGenerator, TyCASTParser, TyCLexer, TyCParser, project_root
+from src.parser import snapshot
+
+SOURCES = [
+    "struct P { int x; }; void main() { P p = {1}; p.x = p.x + 1; f(p).x++; }",
+    "int f(int n) { for (int i = 0; i < n; ++i) { if (i) return i; else continue; } return -1; }",
+    "void main() { switch (x) { case 1: y = 2; break; default: ; } }",
+    "void main() { int x = ; }",
+]
+
+GRAMMAR_DIR = f"{project_root}/src/grammar"
+
+
+def write(tmp_path, sources=SOURCES):
+    path = str(tmp_path / snapshot.SNAPSHOT_NAME)
+    snapshot.write_snapshot(path, sources)
+    return path
+
+
+def keep_class_state(monkeypatch):
+    """Restore the recognizer classes' ATN and DFAs after the test."""
+    for cls in (TyCLexer, TyCParser, TyCASTParser):
+        for name in ("atn", "decisionsToDFA", "sharedContextCache"):
+            if hasattr(cls, name):
+                monkeypatch.setattr(cls, name, getattr(cls, name))
+
+
+def dfa_states(cls):
+    return sum(len(dfa.states) for dfa in cls.decisionsToDFA)
+
+
+# ============================================================================
+# WRITE AND LOAD (Tests 1-2)
+# ============================================================================
+
+def test_01_round_trip(tmp_path):
+    """Test a written snapshot loads with a state for every recognizer"""
+    states = snapshot.load_snapshot(write(tmp_path))
+    assert sorted(states) == sorted(snapshot.RECOGNIZERS)
+
+
+def test_02_install_starts_warm(tmp_path, monkeypatch):
+    """Test installed DFAs already hold every state the corpus needs"""
+    keep_class_state(monkeypatch)
+    write(tmp_path)
+    assert snapshot.install(str(tmp_path)) is True
+    before = dfa_states(TyCParser), dfa_states(TyCLexer)
+    expected = [str(ASTGenerator(s).generate()) for s in SOURCES]
+    assert (dfa_states(TyCParser), dfa_states(TyCLexer)) == before
+    assert expected[3].startswith("AST Generation Error: Error on line 1")
+    assert "FuncCall(f, [Identifier(p)])" in expected[0]
+
+
+# ============================================================================
+# INVALIDATION (Tests 3-6)
+# ============================================================================
+
+def test_03_grammar_changed(tmp_path):
+    """Test a snapshot of another TyC.g4 is not used"""
+    path = write(tmp_path)
+    grammar_dir = tmp_path / "grammar"
+    shutil.copytree(GRAMMAR_DIR, grammar_dir)
+    assert snapshot.load_snapshot(path, str(grammar_dir)) is not None
+    with open(grammar_dir / "TyC.g4", "a", encoding="utf-8") as f:
+        f.write("\n// changed\n")
+    assert snapshot.load_snapshot(path, str(grammar_dir)) is None
+    assert snapshot.install(str(tmp_path), str(grammar_dir)) is False
+
+
+def test_04_runtime_changed(tmp_path, monkeypatch):
+    """Test a snapshot of another ANTLR runtime is not used"""
+    path = write(tmp_path)
+    monkeypatch.setattr(snapshot, "_runtime_version", lambda: "0.0.0")
+    assert snapshot.load_snapshot(path) is None
+
+
+def test_05_missing_or_corrupt(tmp_path):
+    """Test a missing or unreadable snapshot leaves the recognizers cold"""
+    assert snapshot.install(str(tmp_path)) is False
+    (tmp_path / snapshot.SNAPSHOT_NAME).write_bytes(b"not a pickle")
+    assert snapshot.install(str(tmp_path)) is False
+
+
+def test_06_only_imported_recognizers(tmp_path, monkeypatch):
+    """Test install() leaves recognizers that are not imported alone, and
+    loads the DFAs of the others onto their own ATN"""
+    keep_class_state(monkeypatch)
+    write(tmp_path)
+    monkeypatch.delitem(sys.modules, "build.TyCASTParser")
+    ast_parser_dfas, parser_dfas, parser_atn = TyCASTParser.decisionsToDFA, TyCParser.decisionsToDFA, TyCParser.atn
+    assert snapshot.install(str(tmp_path)) is True
+    assert TyCASTParser.decisionsToDFA is ast_parser_dfas
+    assert TyCParser.decisionsToDFA is not parser_dfas
+    assert TyCParser.atn is parser_atn
+    assert all(dfa.atnStartState is parser_atn.decisionToState[dfa.decision] for dfa in TyCParser.decisionsToDFA)
+
+
+# ============================================================================
+# PARSING (Tests 7-8)
+# ============================================================================
+
+def test_07_same_results(tmp_path, monkeypatch):
+    """Test parsing with installed DFAs gives the same trees"""
+    expected = []
+    for source in SOURCES:
+        parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        expected.append(parser.program().toStringTree(recog=parser))
+    keep_class_state(monkeypatch)
+    write(tmp_path)
+    snapshot.install(str(tmp_path))
+    for source, tree in zip(SOURCES, expected):
+        parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        assert parser.program().toStringTree(recog=parser) == tree
+
+
+def test_08_written_by_another_process(tmp_path, monkeypatch):
+    """Test a snapshot from a process with other str hashes parses the same"""
+    from benchmarks.common import parser_test_sources
+    from tests.test_descent import PROGRAM
+
+    sources = [PROGRAM] + parser_test_sources()
+    expected = [str(ASTGenerator(s).generate()) for s in sources]
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    for i, source in enumerate(sources):
+        (corpus / f"{i:03}.tyc").write_text(source, encoding="utf-8")
+    code = "import sys; from src.parser import snapshot; snapshot.main(sys.argv[1:])"
+    env = dict(os.environ, PYTHONHASHSEED="12345")
+    subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path), str(corpus)],
+        cwd=project_root, env=env, check=True, capture_output=True,
+    )
+    keep_class_state(monkeypatch)
+    assert snapshot.install(str(tmp_path)) is True
+    before = dfa_states(TyCParser)
+    assert [str(ASTGenerator(s).generate()) for s in sources] == expected
+    assert dfa_states(TyCParser) == before
+
+
+# ============================================================================
+# OTHER ATN (Test 9)
+# ============================================================================
+
+def test_09_other_atn(tmp_path):
+    """Test a recognizer state taken from another serialized ATN is not used"""
+    states = snapshot.load_snapshot(write(tmp_path))
+    serialized = sys.modules[TyCParser.__module__].serializedATN()
+    assert snapshot._state_for(states, "TyCParser", serialized, TyCParser.atn) is not None
+    changed = serialized[:-1] + [serialized[-1] + 1]
+    assert snapshot._state_for(states, "TyCParser", changed, TyCParser.atn) is None
+
+
+# ============================================================================
+# LOADED AT IMPORT (Test 10)
+# ============================================================================
+
+def test_10_warm_at_import():
+    """Test a fresh process that imports the generated classes directly (as a
+    process-pool worker does) starts warm, and cold with TYC_NO_SNAPSHOT"""
+    code = (
+        "from src.utils.files import use_build_dir; use_build_dir(); "
+        "from build.TyCLexer import TyCLexer; from build.TyCParser import TyCParser; "
+        "print([sum(len(dfa.states) for dfa in c.decisionsToDFA) > 0 for c in (TyCLexer, TyCParser)])"
+    )
+    env = {k: v for k, v in os.environ.items() if k != snapshot.NO_SNAPSHOT}
+    for extra, expected in (({}, "[True, True]"), ({snapshot.NO_SNAPSHOT: "1"}, "[False, False]")):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=project_root, env=dict(env, **extra), check=True, capture_output=True, text=True,
+        ).stdout
+        assert out.strip() == expected
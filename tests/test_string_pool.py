@@ -0,0 +1,148 @@
+"""
+Test cases for the decoded string-literal pool.
+Every STRING_LITERAL token must carry a poolIndex whose pool value is the
+literal with its escapes decoded; equal values share one pool entry.
+"""
+
+from antlr4 import InputStream, Token
+from tests.utils import ASTGenerator, TyCLexer, TyCDFALexer, TyCPrepassLexer
+from src.grammar.stringpool import StringPool, decode
+from src.lexer.parallel import ParallelLexer
+from src.lexer.token_buffer import TokenBuffer
+from src.parser.incremental import IncrementalParser
+from src.utils.nodes import StringLiteral
+
+
+SOURCE = r'''void main() {
+    printString("hello");
+    printString("tab\tend");
+    printString("hello");
+    printString("say \"hi\"\n");
+    printString("");
+    printString("back\\slash");
+}
+'''
+
+
+def string_tokens(lexer):
+    tokens = []
+    while True:
+        t = lexer.nextToken()
+        if t.type == Token.EOF:
+            return tokens
+        if t.type == TyCLexer.STRING_LITERAL:
+            tokens.append(t)
+
+
+def pooled(lexer_class, source=SOURCE):
+    lexer = lexer_class(InputStream(source))
+    tokens = string_tokens(lexer)
+    return [(t.text, lexer.stringPool[t.poolIndex]) for t in tokens], lexer.stringPool
+
+
+EXPECTED = [
+    ("hello", "hello"),
+    ("tab\\tend", "tab\tend"),
+    ("hello", "hello"),
+    ('say \\"hi\\"\\n', 'say "hi"\n'),
+    ("", ""),
+    ("back\\\\slash", "back\\slash"),
+]
+
+
+# ============================================================================
+# DECODING AND INTERNING (Tests 1-4)
+# ============================================================================
+
+def test_01_decode_escapes():
+    """Test every TyC escape sequence is decoded"""
+    assert decode(r"\b\f\r\n\t\"\\") == '\b\f\r\n\t"\\'
+    assert decode(r"\\n") == "\\n"
+    assert decode("plain") == "plain"
+
+
+def test_02_intern_shares_values():
+    """Test equal values get one index, even when spelled differently"""
+    pool = StringPool()
+    a = pool.intern("a\\tb")
+    assert pool.intern("x") == 1
+    assert pool.intern("a\\tb") == a
+    assert pool.intern("a\tb") == a
+    assert len(pool) == 2
+    assert pool.values == ["a\tb", "x"]
+
+
+def test_03_lexer_pool():
+    """Test string tokens keep their raw text and index decoded values"""
+    values, pool = pooled(TyCLexer)
+    assert values == EXPECTED
+    assert len(pool) == 5
+
+
+def test_04_same_object_per_literal():
+    """Test repeated literals resolve to the same pooled object"""
+    lexer = TyCLexer(InputStream(SOURCE))
+    tokens = string_tokens(lexer)
+    assert tokens[0].poolIndex == tokens[2].poolIndex
+    assert lexer.stringPool[tokens[0].poolIndex] is lexer.stringPool[tokens[2].poolIndex]
+
+
+# ============================================================================
+# OTHER TOKEN SOURCES (Tests 5-8)
+# ============================================================================
+
+def test_05_dfa_and_prepass_lexers():
+    """Test TyCDFALexer and TyCPrepassLexer fill the pool the same way"""
+    for lexer_class in (TyCDFALexer, TyCPrepassLexer):
+        values, pool = pooled(lexer_class)
+        assert values == EXPECTED
+        assert pool.values == pooled(TyCLexer)[1].values
+
+
+def test_06_shared_pool():
+    """Test lexers given the same pool share its indices"""
+    pool = StringPool()
+    first = TyCLexer(InputStream('"a\\n" "b"'))
+    first.stringPool = pool
+    second = TyCDFALexer(InputStream('"b" "a\\n"'))
+    second.stringPool = pool
+    a = [t.poolIndex for t in string_tokens(first)]
+    b = [t.poolIndex for t in string_tokens(second)]
+    assert a == b[::-1]
+    assert len(pool) == 2
+
+
+def test_07_parallel_lexer_and_token_buffer():
+    """Test pool indices survive ParallelLexer and TokenBuffer"""
+    source = SOURCE * 50
+    lexer = ParallelLexer(InputStream(source), TyCLexer, workers=1, min_chunk=64)
+    values = [(t.text, lexer.stringPool[t.poolIndex]) for t in string_tokens(lexer)]
+    assert values == EXPECTED * 50
+    buffer = TokenBuffer(TyCLexer(InputStream(SOURCE)))
+    buffer.fill()
+    pool = buffer.tokenSource.stringPool
+    strings = [buffer.get(i) for i in range(len(buffer.types)) if buffer.types[i] == TyCLexer.STRING_LITERAL]
+    assert [(t.text, pool[t.poolIndex]) for t in strings] == EXPECTED
+
+
+def test_08_incremental_parser_keeps_one_pool():
+    """Test relexed and reused tokens index the IncrementalParser's pool"""
+    inc = IncrementalParser(SOURCE)
+    inc.edit(SOURCE.index("tab"), 3, "TAB")
+    pool = inc.string_pool
+    strings = [t for t in inc.tokens if t.type == TyCLexer.STRING_LITERAL]
+    assert [pool[t.poolIndex] for t in strings][:3] == ["hello", "TAB\tend", "hello"]
+
+
+# ============================================================================
+# AST NODES (Test 9)
+# ============================================================================
+
+def test_09_string_literal_node():
+    """Test StringLiteral carries a pool index without changing its output"""
+    node = StringLiteral("a\\n", pool_index=3)
+    assert node.pool_index == 3
+    assert str(node) == str(StringLiteral("a\\n")) == "StringLiteral('a\\\\n')"
+    generator = ASTGenerator(SOURCE)
+    generator.generate()
+    assert generator.string_pool.values == pooled(TyCLexer)[1].values
@@ -0,0 +1,184 @@
+"""
+Test cases for structural equality and hashing of AST nodes
+(src/utils/structural.py).
+"""
+
+import pickle
+
+from tests.test_descent import PROGRAM, shape
+from tests.test_pool import corpus
+from tests.utils import ASTGenerator
+from src.utils.arena import Arena
+from src.utils.nodes import *
+from src.utils.structural import clear_hash, structural_equal, structural_hash
+from src.utils.visitor import walk
+
+
+def parse(source, **kwargs):
+    ast = ASTGenerator(source, **kwargs).generate()
+    assert not isinstance(ast, str), ast
+    return ast
+
+
+def deep(depth, leaf="x"):
+    node = Identifier(leaf)
+    for _ in range(depth):
+        node = PrefixOp("-", node)
+    return node
+
+
+# ============================================================================
+# EQUALITY (Tests 1-4)
+# ============================================================================
+
+def test_01_equal_parses():
+    """Test every backend's AST of a program is equal, with equal hashes"""
+    asts = [parse(PROGRAM, backend=b) for b in ("antlr", "actions", "descent")]
+    asts.append(ASTGenerator(PROGRAM).generate_lazy())
+    asts.append(Arena.from_tree(asts[0]).node())
+    for ast in asts:
+        assert structural_equal(ast, asts[0]) and structural_equal(asts[0], ast)
+        assert structural_hash(ast) == structural_hash(asts[0])
+
+
+def test_02_agrees_with_shape():
+    """Test parsed programs are equal exactly when their shapes are"""
+    asts = [a for a in (ASTGenerator(s).generate() for s in corpus()[:80]) if not isinstance(a, str)]
+    shapes = [shape(a) for a in asts]
+    for a, sa in zip(asts, shapes):
+        for b, sb in zip(asts, shapes):
+            assert structural_equal(a, b) == (sa == sb)
+            if sa == sb:
+                assert structural_hash(a) == structural_hash(b)
+
+
+def test_03_positions():
+    """Test positions count unless ignored"""
+    a, b = parse(PROGRAM), parse("\n\n" + PROGRAM)
+    assert not structural_equal(a, b)
+    assert structural_equal(a, b, positions=False)
+    assert structural_hash(a, positions=False) == structural_hash(b, positions=False)
+    assert structural_hash(a) != structural_hash(b)
+
+
+def test_04_fields_and_kinds():
+    """Test field values must be of the same type, and nodes of the same class"""
+    differ = [
+        (IntLiteral(1), IntLiteral(True)),
+        (IntLiteral(1), FloatLiteral(1.0)),
+        (StringLiteral("s", 0), StringLiteral("s")),
+        (BinaryOp(Identifier("a"), "+", Identifier("b")), BinaryOp(Identifier("a"), "-", Identifier("b"))),
+        (FuncCall("f", [Identifier("a")]), FuncCall("f", [Identifier("a"), Identifier("a")])),
+        (VarDecl(None, "a", None), VarDecl(IntType(), "a", None)),
+        (BreakStmt(), ContinueStmt()),
+    ]
+    for a, b in differ:
+        assert not structural_equal(a, b) and not structural_equal(b, a)
+    assert structural_equal(BreakStmt(), BreakStmt())
+
+
+
+# ============================================================================
+# HASHING (Tests 5-7)
+# ============================================================================
+
+def test_05_cached():
+    """Test hashes are cached on every node and reused by their parents"""
+    ast = parse(PROGRAM)
+    value = structural_hash(ast)
+    assert all(n._hashes[0] is not None and n._hashes[1] is None for n in walk(ast))
+    assert structural_hash(ast) == value
+    ast.decls[0]._hashes[0] += 1
+    clear_hash(ast)
+    assert structural_hash(ast) != value
+
+
+def test_06_incremental():
+    """Test clearing the changed node and its ancestors rehashes the change"""
+    ast = parse(PROGRAM)
+    before = structural_hash(ast)
+    func = next(d for d in ast.decls if isinstance(d, FuncDecl))
+    stmt = func.body.statements[0]
+    func.body.statements[0] = ExprStmt(IntLiteral(7))
+    assert structural_hash(ast) == before
+    for node in (func.body, func, ast):
+        clear_hash(node)
+    after = structural_hash(ast)
+    assert after != before and after == structural_hash(pickle.loads(pickle.dumps(ast)))
+    func.body.statements[0] = stmt
+    for node in (func.body, func, ast):
+        clear_hash(node)
+    assert structural_hash(ast) == before
+
+
+def test_07_pickle():
+    """Test pickles do not carry cached hashes"""
+    ast = parse(PROGRAM)
+    structural_hash(ast)
+    copy = pickle.loads(pickle.dumps(ast))
+    assert all(n._hashes is None for n in walk(copy))
+    assert structural_equal(copy, ast) and structural_hash(copy) == structural_hash(ast)
+
+
+# ============================================================================
+# SCALE (Tests 8-9)
+# ============================================================================
+
+def test_08_deep_trees():
+    """Test 100k deep trees compare and hash without recursion"""
+    a, b = deep(100_000), deep(100_000)
+    assert structural_equal(a, b) and structural_hash(a) == structural_hash(b)
+    assert not structural_equal(deep(100_000), deep(100_000, "y"))
+    assert structural_hash(deep(100_000), positions=False) == structural_hash(a, positions=False)
+
+
+def test_09_dedup_bodies():
+    """Test identical function bodies at different positions hash alike"""
+    body = "{ int s = 0; for (int i = 0; i < n; i++) s = s + i; return s; }"
+    submissions = [
+        f"int f(int n) {body}",
+        f"\n\nint g(int n)\n{body}",
+        "int h(int n) { return n; }",
+        f"int k(int n) {body.replace('s + i', 's + 1')}",
+    ]
+    groups = {}
+    for source in submissions:
+        func = parse(source).decls[0]
+        groups.setdefault(structural_hash(func.body, positions=False), []).append(func.name)
+    assert sorted(groups.values()) == [["f", "g"], ["h"], ["k"]]
+
+
+# ============================================================================
+# MUTATION (Test 10)
+# ============================================================================
+
+def test_10_equal_after_mutation():
+    """Test equality compares fields, not stale cached hashes, after changes"""
+    a, b = Identifier("x"), Identifier("y")
+    structural_hash(a), structural_hash(b)
+    a.name = "y"
+    assert structural_equal(a, b) and structural_equal(a, b, positions=False)
+    x = BinaryOp(Identifier("a"), "+", IntLiteral(1))
+    y = BinaryOp(Identifier("a"), "+", IntLiteral(2))
+    structural_hash(x), structural_hash(y), structural_hash(x, positions=False), structural_hash(y, positions=False)
+    y.right.value = 1
+    assert structural_equal(x, y) and structural_equal(x, y, positions=False)
+    y.right.value = 3
+    assert not structural_equal(x, y)
+
+
+# ============================================================================
+# IDENTITY (Test 11)
+# ============================================================================
+
+def test_11_identity():
+    """Test nodes keep identity == and hash(), so a node stays findable in a
+    dict or set after it changes"""
+    a, b = Identifier("x"), Identifier("x")
+    assert a != b and a == a and structural_equal(a, b)
+    seen = {a}
+    structural_hash(a)
+    a.name = "y"
+    clear_hash(a)
+    assert a in seen and b not in seen
+    assert hash(a) == object.__hash__(a)
@@ -0,0 +1,131 @@
+"""
+Test cases for the array-backed TokenBuffer.
+The buffer must expose the same tokens as CommonTokenStream and drive
+TyCParser to the same results and error messages.
+"""
+
+import pytest
+from antlr4 import InputStream, CommonTokenStream, Token
+from tests.utils import Tokenizer, Parser, TyCLexer, TyCDFALexer
+from src.lexer.token_buffer import TokenBuffer
+
+
+def token_tuples(stream):
+    stream.fill()
+    result = []
+    i = 0
+    while True:
+        tok = stream.get(i)
+        result.append((tok.type, tok.text, tok.start, tok.stop, tok.line, tok.column, tok.tokenIndex))
+        if tok.type == Token.EOF:
+            return result
+        i += 1
+
+
+# ============================================================================
+# TOKEN CONTENTS (Tests 1-5)
+# ============================================================================
+
+def test_01_same_tokens_as_common_token_stream():
+    """Test type, text, offsets and positions match CommonTokenStream"""
+    source = 'struct P { int x; };\n// c\nvoid main() {\n  P p = {1};\n  p.x = 2.5e1; string s = "a\\tb";\n}'
+    expected = token_tuples(CommonTokenStream(TyCLexer(InputStream(source))))
+    actual = token_tuples(TokenBuffer(TyCLexer(InputStream(source))))
+    assert actual == expected
+
+
+def test_02_string_literal_text_override():
+    """Test STRING_LITERAL text is stored without quotes"""
+    buffer = Tokenizer('x = "hello";').token_buffer()
+    assert buffer.get(2).text == "hello"
+    assert buffer.get(2).start == 4
+    assert buffer.overrides == {2: "hello"}
+
+
+def test_03_line_column_from_offset_index():
+    """Test line and column are computed lazily from offsets"""
+    buffer = Tokenizer("a\n  b\r\n\n    c").token_buffer()
+    assert buffer._line_starts is None
+    assert [(buffer.get(i).line, buffer.get(i).column) for i in range(3)] == [(1, 0), (2, 2), (4, 4)]
+    assert buffer._line_starts is not None
+
+
+def test_04_eof_token():
+    """Test the EOF token text and position"""
+    buffer = Tokenizer("x\n").token_buffer()
+    eof = buffer.get(buffer.size - 1)
+    assert eof.type == Token.EOF
+    assert eof.text == "<EOF>"
+    assert (eof.line, eof.column) == (2, 0)
+
+
+def test_05_columns_are_compact_arrays():
+    """Test token columns are array('i') with 12 bytes per token"""
+    buffer = Tokenizer("int a = 1 + 2;").token_buffer()
+    assert buffer.size == 8
+    assert buffer.types.typecode == buffer.starts.typecode == buffer.stops.typecode == "i"
+    assert buffer.nbytes() >= 8 * 12
+
+
+# ============================================================================
+# TOKEN STREAM INTERFACE (Tests 6-8)
+# ============================================================================
+
+def test_06_lookahead_and_consume():
+    """Test LA/LT/consume/seek behave like BufferedTokenStream"""
+    buffer = TokenBuffer(TyCLexer(InputStream("a + b")))
+    assert buffer.LA(1) == TyCLexer.ID
+    assert buffer.LT(2).text == "+"
+    assert buffer.LT(-1) is None
+    buffer.consume()
+    assert buffer.index == 1
+    assert buffer.LT(-1).text == "a"
+    buffer.seek(3)
+    assert buffer.LA(1) == Token.EOF
+    assert buffer.LA(5) == Token.EOF
+
+
+def test_07_get_text():
+    """Test getText over token indices and tokens"""
+    buffer = TokenBuffer(TyCLexer(InputStream("int  x =  3;")))
+    assert buffer.getText() == "intx=3;"
+    assert buffer.getText(buffer.get(1), buffer.get(2)) == "x="
+
+
+def test_08_lazy_fetch_defers_lexer_errors():
+    """Test tokens are fetched on demand so later lexer errors wait"""
+    buffer = TokenBuffer(TyCLexer(InputStream('a b "unclosed')))
+    assert buffer.LA(2) == TyCLexer.ID
+    with pytest.raises(Exception, match="Unclosed String: unclosed"):
+        buffer.fill()
+
+
+# ============================================================================
+# PARSER INTEGRATION (Tests 9-11)
+# ============================================================================
+
+def test_09_parse_success():
+    """Test TyCParser accepts a program over TokenBuffer"""
+    source = "int f(int a) { for (int i = 0; i < a; i++) { a = a - 1; } return a; } void main() { f(3); }"
+    assert Parser(source, token_stream_class=TokenBuffer).parse() == "success"
+
+
+def test_10_parse_errors_match():
+    """Test syntax error messages are identical to CommonTokenStream"""
+    sources = [
+        "void main() {\n  int x = ;\n}",
+        "void main( { }",
+        "struct S { int x; }",
+        "int f() { return 1 }",
+    ]
+    for source in sources:
+        expected = Parser(source).parse()
+        assert Parser(source, token_stream_class=TokenBuffer).parse() == expected
+
+
+def test_11_lexer_errors_match():
+    """Test lexer errors surface the same way during parsing"""
+    for source in ['void main() { x = "abc\\q"; }', "void main() { a @ b; }"]:
+        expected = Parser(source).parse()
+        actual = Parser(source, lexer_class=TyCDFALexer, token_stream_class=TokenBuffer).parse()
+        assert actual == expected
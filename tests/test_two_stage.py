@@ -0,0 +1,150 @@
+"""
+Test cases for two-stage (SLL, then LL on failure) parsing.
+The two-stage mode must give the same trees and error messages as a plain
+LL parse, and fall back to LL only when the SLL stage fails.
+"""
+
+import random
+
+import pytest
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from tests.utils import ASTGenerator, Parser, TyCLexer, TyCDFALexer, TyCParser
+from src.lexer.token_buffer import TokenBuffer
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+
+
+PROGRAM = """struct Point {
+    int x;
+    int y;
+};
+
+int dist(Point a, Point b) {
+    int dx = a.x - b.x;
+    return dx * dx;
+}
+
+void main() {
+    Point p = {1, 2};
+    auto d = dist(p, p);
+    p.x = d = 3;
+    for (int i = 0; i < 10; ++i) { d = d + i; }
+    printString("done");
+}
+"""
+
+
+def new_parser(source, lexer_class=TyCLexer, token_stream_class=CommonTokenStream):
+    parser = TyCParser(token_stream_class(lexer_class(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def assert_same_as_ll(source, fallback=None, **kwargs):
+    expected = Parser(source, **kwargs).parse()
+    parser = Parser(source, two_stage=True, **kwargs)
+    assert parser.parse() == expected, repr(source)
+    if fallback is not None:
+        assert parser.ll_fallback is fallback
+    return expected
+
+
+# ============================================================================
+# VALID PROGRAMS (Tests 1-3)
+# ============================================================================
+
+def test_01_valid_program_stays_in_sll():
+    """Test a valid program parses in the SLL stage alone"""
+    assert assert_same_as_ll(PROGRAM, fallback=False) == "success"
+
+
+def test_02_same_parse_tree():
+    """Test the two-stage tree matches the LL tree"""
+    ll = new_parser(PROGRAM)
+    expected = ll.program().toStringTree(recog=ll)
+    parser = new_parser(PROGRAM)
+    tree, fallback = parse_two_stage(parser)
+    assert not fallback
+    assert tree.toStringTree(recog=parser) == expected
+
+
+def test_03_parser_state_restored():
+    """Test the prediction mode, error strategy and listeners are restored,
+    also when set by the caller, and a caller's SLL mode still falls back to LL"""
+    parser = new_parser("void main() { int x = ; }")
+    handler = parser._errHandler
+    with pytest.raises(Exception, match="Error on line 1 col 22: ;"):
+        parse_two_stage(parser)
+    assert parser._errHandler is handler
+    assert parser._listeners == [NewErrorListener.INSTANCE]
+    assert parser._interp.predictionMode == PredictionMode.LL
+    for mode in (PredictionMode.SLL, PredictionMode.LL_EXACT_AMBIG_DETECTION):
+        parser = new_parser("void main() { int x = ; }")
+        parser._interp.predictionMode = mode
+        handler = parser._errHandler = DefaultErrorStrategy()
+        with pytest.raises(Exception, match="Error on line 1 col 22: ;"):
+            parse_two_stage(parser)
+        assert parser._errHandler is handler
+        assert parser._interp.predictionMode == mode
+        parser = new_parser(PROGRAM)
+        parser._interp.predictionMode = mode
+        assert not parse_two_stage(parser)[1]
+        assert parser._interp.predictionMode == mode
+
+
+# ============================================================================
+# ERRORS AND FALLBACK (Tests 4-7)
+# ============================================================================
+
+def test_04_syntax_errors_fall_back():
+    """Test syntax errors are reported by the LL stage, unchanged"""
+    for source in ("void main() { int x = ; }", "void main() {", "int f() { return 1 }", "struct S { int x; }"):
+        assert assert_same_as_ll(source, fallback=True) != "success"
+
+
+def test_05_lexical_errors():
+    """Test a lexical error in the SLL stage relexes for the LL stage"""
+    for source in ('void main() { printString("a\\q"); }', "void main() { int x = 1 $ 2; }", 'void main() { "abc'):
+        assert assert_same_as_ll(source, fallback=True) == Parser(source).parse()
+
+
+def test_06_other_token_sources():
+    """Test two-stage parsing over TyCDFALexer and TokenBuffer"""
+    for source in (PROGRAM, PROGRAM.replace("dx * dx", "dx dx"), PROGRAM.replace('"done"', '"do\\ne"$')):
+        assert_same_as_ll(source, lexer_class=TyCDFALexer)
+        assert_same_as_ll(source, token_stream_class=TokenBuffer)
+
+
+def test_07_ast_generator():
+    """Test ASTGenerator records whether the LL stage ran"""
+    generator = ASTGenerator(PROGRAM, two_stage=True)
+    assert str(generator.generate()) == str(ASTGenerator(PROGRAM).generate())
+    assert generator.ll_fallback is False
+    generator = ASTGenerator("void main() { x = ; }", two_stage=True)
+    assert generator.generate() == "AST Generation Error: Error on line 1 col 18: ;"
+    assert generator.ll_fallback is True
+
+
+# ============================================================================
+# RANDOM MUTATIONS (Test 8)
+# ============================================================================
+
+def test_08_random_mutations():
+    """Test random token deletions and insertions give the LL results"""
+    lexer = TyCLexer(InputStream(PROGRAM))
+    words = [t.text for t in lexer.getAllTokens()]
+    extra = [";", "(", ")", "{", "}", "=", "++", ".", "x", "1", ",", "auto"]
+    rng = random.Random(5)
+    for _ in range(150):
+        mutated = list(words)
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(mutated))
+            if rng.random() < 0.5:
+                del mutated[i]
+            else:
+                mutated.insert(i, rng.choice(extra))
+        assert_same_as_ll(" ".join(mutated))
@@ -0,0 +1,93 @@
+"""
+Test cases for the canonical type table (src/utils/type_table.py): one ID
+and one shared node per distinct type, struct types resolved to their
+declarations, and type sets as bit masks.
+"""
+
+from tests.utils import ASTGenerator
+from src.utils.arena import Arena
+from src.utils.nodes import *
+from src.utils.type_table import FLOAT, INT, NUMERIC, PRIMITIVES, STRING, VOID, TypeTable
+from src.utils.visitor import walk
+
+SOURCE = """struct Point { int x; float y; };
+struct Line { Point a; Point b; string name; };
+Point mid(Line l, float t) { Point p = {0, t}; return p; }
+void main() { int n = 1; Line l; float f = 2.0; }
+"""
+
+
+def types_of(ast):
+    return [n for n in walk(ast) if isinstance(n, Type)]
+
+
+# ============================================================================
+# IDS (Tests 1-3)
+# ============================================================================
+
+def test_01_primitive_ids():
+    """Test primitive types have the same fixed IDs in every table"""
+    for table in (TypeTable(), TypeTable(ASTGenerator(SOURCE).generate())):
+        assert [table.id_of(t) for t in (IntType(), FloatType(), StringType(), VoidType())] == [INT, FLOAT, STRING, VOID]
+        assert table.canonical(IntType()) is PRIMITIVES[INT] is table.canonical(IntType())
+    assert PRIMITIVES[INT].line is None
+
+
+def test_02_struct_ids():
+    """Test struct types get IDs in declaration order and resolve to their decls"""
+    ast = ASTGenerator(SOURCE).generate()
+    table = TypeTable(ast)
+    assert len(table) == 6
+    point, line = StructType("Point"), StructType("Line")
+    assert (table.id_of(point), table.id_of(line)) == (4, 5)
+    assert table.decl_of(point) is ast.decls[0] and table.decl_of(line) is ast.decls[1]
+    assert table.decl_of(IntType()) is None
+    assert table.canonical(point) is table.canonical(StructType("Point")) is not point
+    assert str(table.canonical(point)) == "StructType(Point)"
+
+
+def test_03_undeclared_and_redeclared():
+    """Test undeclared struct names get IDs without a decl; redeclarations keep the first"""
+    first, second = StructDecl("S", []), StructDecl("S", [MemberDecl(IntType(), "x")])
+    table = TypeTable(Program([first, second]))
+    assert len(table) == 5 and table.decl_of(StructType("S")) is first
+    unknown = table.id_of(StructType("Unknown"))
+    assert unknown == 5 and table.decl_of(StructType("Unknown")) is None
+    assert table.id_of(StructType("Unknown")) == unknown and len(table) == 6
+
+
+# ============================================================================
+# COMPARISON (Tests 4-6)
+# ============================================================================
+
+def test_04_equal_types_equal_ids():
+    """Test occurrences of one type share its ID and canonical node, others differ"""
+    ast = ASTGenerator(SOURCE).generate()
+    table = TypeTable(ast)
+    occurrences = types_of(ast)
+    assert len(occurrences) == 13
+    for a in occurrences:
+        for b in occurrences:
+            same = type(a) is type(b) and getattr(a, "struct_name", None) == getattr(b, "struct_name", None)
+            assert (table.id_of(a) == table.id_of(b)) == same
+            assert (table.canonical(a) is table.canonical(b)) == same
+
+
+def test_05_masks():
+    """Test type sets as masks"""
+    table = TypeTable(ASTGenerator(SOURCE).generate())
+    assert table.mask([IntType(), FloatType(), IntType()]) == NUMERIC
+    assert table.in_mask(FloatType(), NUMERIC) and not table.in_mask(StringType(), NUMERIC)
+    structs = table.mask([StructType("Point"), StructType("Line")])
+    assert structs & NUMERIC == 0 and table.in_mask(StructType("Line"), structs | NUMERIC)
+    assert not table.in_mask(StructType("Other"), structs)
+
+
+def test_06_positions_per_occurrence():
+    """Test type nodes in the AST keep their own positions, cursors included"""
+    ast = ASTGenerator(SOURCE).generate()
+    ints = [t for t in types_of(ast) if type(t) is IntType]
+    assert [(t.line, t.column) for t in ints] == [(1, 15), (4, 14)]
+    table = TypeTable(ast)
+    cursors = [n for n in walk(Arena.from_tree(ast).node()) if isinstance(n, Type)]
+    assert [table.id_of(c) for c in cursors] == [table.id_of(t) for t in types_of(ast)]
@@ -0,0 +1,163 @@
+"""
+Test cases for validate-only parsing (src/parser/validate.py): the results
+of `Parser.parse`, with no parse tree built.
+"""
+
+import gc
+import subprocess
+import sys
+import warnings
+
+from antlr4 import CommonTokenStream, InputStream, ParserRuleContext
+
+from tests.test_descent import random_mutations
+from tests.test_pool import corpus
+from tests.utils import Parser, TokenBuffer, TyCDFALexer, TyCLexer, TyCParser, project_root
+from src.parser.pool import parse_many, pool_for, validate_many
+from src.parser.validate import main, validate
+from src.utils.error_listener import NewErrorListener
+
+TARGETS = [
+    "void main() { (a) = 1; ((a.b)) = 3; f(x).y = 1; (f(x).y) = 2; f(x).y.z = g(1).w = 2; }",
+    "void main() { f((a), g(b).c).d = (x) = ((y.z)); }",
+    "void main() { f(x) = 1; }",
+    "void main() { a + b = c; }",
+    "void main() { (a + b) = 1; }",
+    "void main() { -a = 1; }",
+    "void main() { (f(x)) = 1; }",
+    "void main() { x++ = 1; }",
+    "void main() { ++f(a, b).c; (a).b = 1; }",
+    "void main() { (a) + (b) = 1; }",
+    "void main() { f(x)(y) = 1; }",
+    "void main() { a = b + c = d; }",
+    "void main() { {1, 2} = a; }",
+    "void main() { 1 = a; }",
+    "void main() { a.b.c = (((d))).e; }",
+]
+
+
+# ============================================================================
+# SAME RESULTS (Tests 1-4)
+# ============================================================================
+
+def test_01_assignment_targets():
+    """Test lvalues are checked on tokens with the parse tree's verdict"""
+    results = [Parser(s).validate() for s in TARGETS]
+    assert results == [Parser(s).parse() for s in TARGETS]
+    assert results[:2] == ["success", "success"]
+    assert results[2:5] == ["Error on line 1 col 19: =", "Error on line 1 col 20: =", "Error on line 1 col 22: ="]
+
+
+def test_02_corpus():
+    """Test the corpus validates to the results of `parse()`"""
+    for source in corpus():
+        assert Parser(source).validate() == Parser(source).parse(), source
+
+
+def test_03_mutations():
+    """Test random edits, with the default and the buffered token classes"""
+    for source in random_mutations(200, 29):
+        expected = Parser(source).parse()
+        assert Parser(source).validate() == expected, source
+        assert Parser(source, lexer_class=TyCDFALexer, token_stream_class=TokenBuffer).validate() == expected, source
+
+
+def test_04_validate_many():
+    """Test validate_many gives the results of parse_many"""
+    sources = corpus()
+    assert validate_many(sources) == parse_many(sources)
+
+
+# ============================================================================
+# NO TREES (Tests 5-6)
+# ============================================================================
+
+def test_05_no_tree_built(monkeypatch):
+    """Test no child is attached to any context"""
+    added = []
+    monkeypatch.setattr(ParserRuleContext, "addChild", lambda self, child: added.append(child))
+    monkeypatch.setattr(ParserRuleContext, "addTokenNode", lambda self, token: added.append(token))
+    assert Parser(TARGETS[0]).validate() == "success"
+    assert Parser(TARGETS[2]).validate() == "Error on line 1 col 19: ="
+    assert added == []
+
+
+def test_06_pool_restored():
+    """Test the pooled parser builds trees again after validating, even after an error"""
+    assert Parser("void main() { 1 = a; }").validate() == "Error on line 1 col 16: ="
+    parser = pool_for().acquire("void main() { a = 1; }")
+    assert parser.buildParseTrees
+    assert parser.program().getChildCount() == 2
+
+
+# ============================================================================
+# FILES (Tests 7-8)
+# ============================================================================
+
+def test_07_from_file(tmp_path):
+    """Test memory-mapped files validate like strings"""
+    for i, source in enumerate(TARGETS):
+        path = tmp_path / f"{i}.tyc"
+        path.write_text(source, encoding="utf-8")
+        with Parser.from_file(str(path)) as parser:
+            assert parser.validate() == Parser(source).parse()
+
+
+def test_08_command_line(tmp_path, capsys):
+    """Test the command line lists every file, fails on errors and closes the files"""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "ok.tyc").write_text(TARGETS[0], encoding="utf-8")
+    (tmp_path / "sub" / "bad.tyc").write_text('void main() { s = "a\\q"; }', encoding="utf-8")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        assert main([str(tmp_path)]) == 1
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+    out = capsys.readouterr().out.splitlines()
+    assert out == [f"{tmp_path / 'ok.tyc'}: ok", f"{tmp_path / 'sub' / 'bad.tyc'}: Illegal Escape In String: a\\q"]
+    assert main([str(tmp_path / "ok.tyc"), "--quiet"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+# ============================================================================
+# DEEP PARENTHESES (Test 9)
+# ============================================================================
+
+def test_09_parenthesized_targets_linear():
+    """Test nested parentheses around a target are matched in one pass"""
+    depth = 60
+    for target, expected in (("a.b", "success"), ("a + b", f"Error on line 1 col {14 + 2 * depth + 6}: =")):
+        source = "void main() { " + "(" * depth + target + ")" * depth + " = 1; }"
+        stream = CommonTokenStream(TyCLexer(InputStream(source)))
+        parser = TyCParser(stream)
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        calls = [0]
+        get = stream.get
+
+        def counting_get(index):
+            calls[0] += 1
+            return get(index)
+
+        stream.get = counting_get
+        assert validate(parser) == expected == Parser(source).validate()
+        assert calls[0] < 10 * len(stream.tokens)
+
+
+# ============================================================================
+# STANDALONE COMMAND LINE (Test 10)
+# ============================================================================
+
+def test_10_command_line_standalone(tmp_path):
+    """Test the command line imports neither the test helpers nor the profiler"""
+    (tmp_path / "ok.tyc").write_text(TARGETS[0], encoding="utf-8")
+    code = (
+        "import sys; from src.parser.validate import main; status = main(sys.argv[1:]); "
+        "print(sorted(m for m in sys.modules if m.startswith('tests') or m == 'src.parser.profiling')); "
+        "sys.exit(status)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path)],
+        cwd=project_root, check=True, capture_output=True, text=True,
+    ).stdout
+    assert out.splitlines() == [f"{tmp_path / 'ok.tyc'}: ok", "[]"]
@@ -12,55 +12,237 @@ sys.path.insert(0, project_root)
 sys.path.insert(0, build_dir)
 
 from build.TyCLexer import TyCLexer
+from build.TyCDFALexer import TyCDFALexer
 from build.TyCParser import TyCParser
+from build.TyCASTParser import TyCASTParser
 from antlr4 import InputStream, CommonTokenStream
 from src.utils.error_listener import NewErrorListener
+from src.lexer.token_buffer import TokenBuffer
+from src.lexer.mapped_stream import MappedCharStream
+from src.lexer.prepass import PrepassMixin
+from src.parser.two_stage import parse_two_stage
+from src.parser.pool import compile_many, pool_for
+from src.parser.recovery import parse_recovering, recovered_ast
+from src.parser.parallel import MIN_CHUNK as PARALLEL_MIN_CHUNK, parse_parallel
+from src.parser.lazy import parse_lazy
+from src.parser.validate import validate
+
+try:
+    from src.astgen.ast_generation import ASTGeneration
+    from src.parser.descent import DescentParser
+except ImportError:
+    ASTGeneration = None
+
+
+class TyCPrepassLexer(PrepassMixin, TyCLexer):
+    """TyCLexer that jumps over whitespace, comments and string literals
+    found by a character-class prepass."""
 
 
 class ASTGenerator:
-    """Class to generate AST from TyC source code."""
+    """Class to generate AST from TyC source code.
+
+    With `two_stage=True` the program is parsed with SLL prediction first and
+    reparsed in full LL mode only if that fails (see src/parser/two_stage.py);
+    `ll_fallback` then tells whether the LL stage ran.
+
+    `backend` selects how the AST is built: "antlr" (TyCParser and the
+    ASTGeneration visitor), "actions" (TyCASTParser, which builds the nodes
+    in grammar actions without a parse tree, see src/grammar/TyCASTParser.g4)
+    or "descent" (DescentParser, which builds the nodes directly and leaves
+    errors to TyCParser, see src/parser/descent.py). All give the same AST
+    and error messages. Input nested too deeply for the recursion of the
+    "antlr" and "actions" backends is generated by the descent backend
+    instead.
 
-    def __init__(self, input_string: str):
+    With `profile` (a ParseProfile of the backend's parser class, see
+    src/parser/profiling.py) the prediction statistics of each decision are
+    added to it; the descent backend cannot be profiled.
+
+    The lexer, token stream, parser and visitor are this thread's pooled
+    ones for `lexer_class` and `token_stream_class` (see src/parser/pool.py),
+    bound to the source on construction and again by each generate method.
+    """
+
+    def __init__(
+        self,
+        input_string: str,
+        lexer_class=TyCLexer,
+        token_stream_class=CommonTokenStream,
+        input_stream=None,
+        two_stage: bool = False,
+        backend: str = "antlr",
+        profile=None,
+    ):
+        if backend not in ("antlr", "actions", "descent"):
+            raise ValueError(f"unknown parser backend: {backend!r}")
+        if profile is not None and backend == "descent":
+            raise ValueError("the descent backend has no ANTLR decisions to profile")
+        parser_class = TyCASTParser if backend == "actions" else TyCParser
+        if profile is not None and profile.parser_class is not parser_class:
+            raise ValueError(f"profile of {profile.parser_class.__name__} used with {parser_class.__name__}")
         self.input_string = input_string
-        self.input_stream = InputStream(input_string)
-        self.lexer = TyCLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
-        self.parser = TyCParser(self.token_stream)
-        self.parser.removeErrorListeners()
-        self.parser.addErrorListener(NewErrorListener.INSTANCE)
-        # Import here to avoid circular dependency issues during build
+        self.two_stage = two_stage
+        self.backend = backend
+        self.profile = profile
+        self.ll_fallback = None
+        self._string_pool = None
+        self.input_stream = input_stream if input_stream is not None else InputStream(input_string)
+        self.pool = pool_for(lexer_class, token_stream_class)
+        self._bind()
+        self.ast_generator = self.pool.visitor() if ASTGeneration is not None else None
+
+    def _bind(self):
+        """Rebind the pooled recognizers to this source (another generator
+        may have used them since) and return the parser."""
+        pool = self.pool
+        self.parser = pool.acquire(input_stream=self.input_stream, actions=self.backend == "actions")
+        self.lexer = pool.lexer
+        self.token_stream = pool.token_stream
+        return self.parser
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs):
+        """Generate from a source file, read through a memory-mapped CharStream.
+
+        `close()` it, or use it as a context manager, to release the file.
+        """
+        return cls(None, input_stream=MappedCharStream(path), **kwargs)
+
+    def close(self):
+        """Close the input stream if it holds a file (see `from_file`). A
+        lazily generated AST cannot parse its bodies afterwards."""
+        close = getattr(self.input_stream, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def compile_many(sources, two_stage: bool = False) -> list:
+        """Generate the AST (or error message) of every source, in order.
+
+        Reuses this thread's pooled recognizers (see src/parser/pool.py)
+        instead of building new ones per source.
+        """
+        return compile_many(sources, two_stage)
+
+    @property
+    def string_pool(self):
+        """Decoded string literals of the last generation; StringLiteral.pool_index
+        indexes into it."""
+        return self._string_pool
+
+    def generate_recovering(self):
+        """Generate the AST of the declarations that parse, and collect every
+        error instead of stopping at the first (see src/parser/recovery.py).
+
+        Returns (program, errors): a Program of the declarations without
+        errors and the errors as `Parser.parse_recovering` lists them, so
+        `generate()` gives "AST Generation Error: " and the first one. Only
+        the "antlr" backend recovers.
+        """
+        if self.backend != "antlr":
+            raise ValueError(f"the {self.backend} backend has no recovering mode")
+        parser = self._bind()
+        try:
+            tree, errors = parse_recovering(parser)
+        finally:
+            self._string_pool = self.lexer.stringPool
+        return recovered_ast(tree, self.ast_generator), errors
+
+    def generate_parallel(self, workers: int = None, min_chunk: int = PARALLEL_MIN_CHUNK):
+        """Generate the AST with the top-level declarations parsed in chunks
+        on `workers` processes (see src/parser/parallel.py).
+
+        Gives the AST (and string pool) or error message of `generate()`.
+        """
+        if self.ast_generator is None:
+            return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+        text = self.input_stream.getText(0, self.input_stream.size - 1)
         try:
-            from src.astgen.ast_generation import ASTGeneration
+            ast, self._string_pool = parse_parallel(text, type(self.lexer), workers, min_chunk)
+            return ast
+        except Exception as e:
+            return f"AST Generation Error: {str(e)}"
 
-            self.ast_generator = ASTGeneration()
-        except ImportError:
-            self.ast_generator = None
+    def generate_lazy(self):
+        """Generate the AST with function bodies parsed on first access to
+        `FuncDecl.body` (see src/parser/lazy.py).
+
+        Gives the error message of the first error outside function bodies;
+        accessing a body raises the first error in it.
+        """
+        if self.ast_generator is None:
+            return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+        self._bind()
+        try:
+            return parse_lazy(self.lexer)
+        except Exception as e:
+            return f"AST Generation Error: {str(e)}"
+        finally:
+            self._string_pool = self.lexer.stringPool
 
     def generate(self):
         """Generate AST from the input string."""
         if self.ast_generator is None:
             return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+        parser = self._bind()
         try:
-            # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            if self.backend == "descent":
+                return DescentParser(self.lexer).parse()
+            try:
+                # Parse the program starting from the entry point
+                if self.profile is not None:
+                    with self.profile.attached(parser):
+                        parse_tree = self._parse(parser)
+                else:
+                    parse_tree = self._parse(parser)
+                if self.backend == "actions":
+                    return parse_tree.node
 
-            # Generate AST using the visitor
-            ast = self.ast_generator.visit(parse_tree)
-            return ast
+                # Generate AST using the visitor
+                ast = self.ast_generator.visit(parse_tree)
+                return ast
+            except RecursionError:
+                # Nested deeper than the generated parser or the visitor can
+                # recurse: DescentParser builds the same AST on explicit
+                # stacks (its errors still come from TyCParser).
+                self._bind()
+                return DescentParser(self.lexer).parse()
         except Exception as e:
+            if self.two_stage and self.ll_fallback is None:
+                self.ll_fallback = True
             return f"AST Generation Error: {str(e)}"
+        finally:
+            self._string_pool = self.lexer.stringPool
+
+    def _parse(self, parser):
+        if self.two_stage:
+            parse_tree, self.ll_fallback = parse_two_stage(parser)
+            return parse_tree
+        return parser.program()
 
 
 class Tokenizer:
-    """Lexer wrapper for testing"""
+    """Lexer wrapper for testing.
 
-    def __init__(self, source_code: str):
+    `lexer_class` selects the lexer: the ANTLR-generated TyCLexer (default) or
+    the table-driven TyCDFALexer, which produces the same tokens and errors.
+    """
+
+    def __init__(self, source_code: str, lexer_class=TyCLexer):
         self.source_code = source_code
+        self.lexer_class = lexer_class
 
     def get_tokens_as_string(self) -> str:
         """Get tokens as comma-separated string (only token text)"""
         input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
+        lexer = self.lexer_class(input_stream)
 
         tokens = []
         try:
@@ -80,6 +262,15 @@ class Tokenizer:
 
         return ",".join(tokens)
 
+    def token_buffer(self) -> TokenBuffer:
+        """Return all tokens in a compact, array-backed TokenBuffer.
+
+        Lexer exceptions propagate to the caller, as in `tokenize`.
+        """
+        buffer = TokenBuffer(self.lexer_class(InputStream(self.source_code)))
+        buffer.fill()
+        return buffer
+
     def tokenize(self):
         """Return a list of token-like objects with `.type` (symbolic name) and `.text`.
 
@@ -91,7 +282,7 @@ class Tokenizer:
         from src.grammar.lexererr import ErrorToken, IllegalEscape, UncloseString
 
         input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
+        lexer = self.lexer_class(input_stream)
 
         def extract_unclosed_text() -> str:
             start = self.source_code.find('"')
@@ -137,24 +328,132 @@ class Tokenizer:
 
         return result
 
+    def tokenize_recovering(self):
+        """Lex the whole source in one pass, collecting every lexical error.
+
+        Returns `(tokens, errors)`. `tokens` are token-like objects as in
+        `tokenize`, including the offending error tokens. `errors` lists the
+        ErrorToken / UncloseString / IllegalEscape errors in source order, each
+        with `.offset`, `.line`, `.column` and `.token`.
+
+        As in `tokenize`, a stray `"` that starts a string which cannot be
+        closed on its line is reported as UncloseString; the rest of that
+        line is one UNCLOSE_STRING token (the lexer's `strayQuoteUnclosed`).
+        """
+        from types import SimpleNamespace
+        from src.grammar import lexererr
+
+        lexer = self.lexer_class(InputStream(self.source_code))
+        lexer.recoverErrors = True
+        lexer.strayQuoteUnclosed = True
+        tokens = []
+        while True:
+            tok = lexer.nextToken()
+            if tok.type == -1:
+                break
+            try:
+                type_name = TyCLexer.symbolicNames[tok.type]
+            except Exception:
+                type_name = str(tok.type)
+            tokens.append(SimpleNamespace(type=type_name, text=(tok.text or "")))
+        # The lexer raises the classes of build/lexererr.py; give the same
+        # errors as the src.grammar.lexererr classes that tokenize raises.
+        errors = [
+            getattr(lexererr, type(err).__name__)(err.token).at(err.offset, err.line, err.column, err.token)
+            for err in lexer.lexerErrors or []
+        ]
+        return tokens, errors
+
 
 class Parser:
-    """Parser wrapper for testing"""
+    """Parser wrapper for testing
+
+    Parses with this thread's pooled lexer and parser for `lexer_class` and
+    `token_stream_class` (see src/parser/pool.py).
+
+    `two_stage=True` parses with SLL prediction first and falls back to full
+    LL only on failure, with the same results; `ll_fallback` tells whether
+    the last parse needed the LL stage.
+
+    With `profile` (a ParseProfile, see src/parser/profiling.py) the
+    prediction statistics of each decision are added to it.
+    """
 
-    def __init__(self, source_code: str):
+    def __init__(
+        self,
+        source_code: str,
+        lexer_class=TyCLexer,
+        token_stream_class=CommonTokenStream,
+        input_stream=None,
+        two_stage: bool = False,
+        profile=None,
+    ):
         self.source_code = source_code
+        self.lexer_class = lexer_class
+        self.token_stream_class = token_stream_class
+        self.input_stream = input_stream
+        self.two_stage = two_stage
+        self.profile = profile
+        self.ll_fallback = None
+        self._string_pool = None
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs):
+        """Parse a source file, read through a memory-mapped CharStream.
+
+        `close()` it, or use it as a context manager, to release the file.
+        """
+        return cls(None, input_stream=MappedCharStream(path), **kwargs)
+
+    def close(self):
+        """Close the input stream if it holds a file (see `from_file`)."""
+        close = getattr(self.input_stream, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def parse(self) -> str:
         """Parse source code and return result"""
-        input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
-        token_stream = CommonTokenStream(lexer)
-        parser = TyCParser(token_stream)
-        parser.removeErrorListeners()
-        parser.addErrorListener(NewErrorListener.INSTANCE)
+        pool = pool_for(self.lexer_class, self.token_stream_class)
+        parser = pool.acquire(self.source_code, self.input_stream)
+        if self.profile is not None:
+            with self.profile.attached(parser):
+                return self._parse(parser)
+        return self._parse(parser)
+
+    def validate(self) -> str:
+        """Check the syntax without building a parse tree (see
+        src/parser/validate.py); the same result as `parse()`."""
+        pool = pool_for(self.lexer_class, self.token_stream_class)
+        return validate(pool.acquire(self.source_code, self.input_stream))
 
+    def parse_recovering(self) -> list:
+        """Parse the whole source, recovering from errors (see
+        src/parser/recovery.py).
+
+        Returns every syntax error (SyntaxException, with `line`, `column`
+        and offending `token`) and lexical error (LexerError) in the order
+        found, an empty list for a valid program. The first error's message
+        is what `parse()` returns.
+        """
+        pool = pool_for(self.lexer_class, self.token_stream_class)
+        parser = pool.acquire(self.source_code, self.input_stream)
+        return parse_recovering(parser)[1]
+
+    def _parse(self, parser) -> str:
         try:
-            tree = parser.program()
+            if self.two_stage:
+                tree, self.ll_fallback = parse_two_stage(parser)
+            else:
+                tree = parser.program()
             return "success"
         except Exception as e:
+            if self.two_stage:
+                # The SLL stage never raises: the error comes from the LL stage.
+                self.ll_fallback = True
             return str(e)